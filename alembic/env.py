@@ -18,13 +18,14 @@ from app.models.base import Base
 # IMPORTANT: Import all models so Alembic can detect them
 # These imports register models with Base.metadata for autogenerate
 from app.models.channel import Channel, Persona
+from app.models.generation_job import GenerationJob
 from app.models.script import Script
 from app.models.source import Source
 from app.models.topic import Topic
 from app.models.video import Video
 
 # Ensure models are registered with metadata (prevents unused import warnings)
-_MODELS = (Channel, Persona, Script, Source, Topic, Video)
+_MODELS = (Channel, GenerationJob, Persona, Script, Source, Topic, Video)
 
 # this is the Alembic Config object
 config = context.config
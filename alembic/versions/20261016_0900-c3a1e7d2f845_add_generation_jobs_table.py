@@ -0,0 +1,77 @@
+"""add_generation_jobs_table
+
+Revision ID: c3a1e7d2f845
+Revises: 9f679109b2c8
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a1e7d2f845"
+down_revision: Union[str, None] = "9f679109b2c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "generation_jobs",
+        sa.Column("script_id", sa.Uuid(), nullable=False),
+        sa.Column("channel_id", sa.Uuid(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("checkpoints", sa.JSON(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("locked_by", sa.String(length=100), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["channel_id"],
+            ["channels.id"],
+            name=op.f("fk_generation_jobs_channel_id_channels"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["script_id"],
+            ["scripts.id"],
+            name=op.f("fk_generation_jobs_script_id_scripts"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_generation_jobs")),
+        sa.UniqueConstraint("script_id", name=op.f("uq_generation_jobs_script_id")),
+    )
+    op.create_index(
+        "idx_generation_job_claim", "generation_jobs", ["status", "locked_until"], unique=False
+    )
+    op.create_index(
+        op.f("ix_generation_jobs_channel_id"), "generation_jobs", ["channel_id"], unique=False
+    )
+    op.create_index(op.f("ix_generation_jobs_id"), "generation_jobs", ["id"], unique=False)
+    op.create_index(op.f("ix_generation_jobs_status"), "generation_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_generation_jobs_status"), table_name="generation_jobs")
+    op.drop_index(op.f("ix_generation_jobs_id"), table_name="generation_jobs")
+    op.drop_index(op.f("ix_generation_jobs_channel_id"), table_name="generation_jobs")
+    op.drop_index("idx_generation_job_claim", table_name="generation_jobs")
+    op.drop_table("generation_jobs")
@@ -0,0 +1,44 @@
+"""add_series_detection_state
+
+Revision ID: 5d2b8e41a9c7
+Revises: c3a1e7d2f845
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2b8e41a9c7"
+down_revision: Union[str, None] = "c3a1e7d2f845"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "series",
+        sa.Column("term_counts", sa.JSON(), server_default=sa.text("'{}'"), nullable=False),
+    )
+    op.add_column(
+        "series",
+        sa.Column("measured_episodes", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "series",
+        sa.Column("measured_uploads", sa.JSON(), server_default=sa.text("'[]'"), nullable=False),
+    )
+    op.add_column(
+        "series",
+        sa.Column("recent_engagement", sa.Float(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("series", "recent_engagement")
+    op.drop_column("series", "measured_uploads")
+    op.drop_column("series", "measured_episodes")
+    op.drop_column("series", "term_counts")
@@ -14,7 +14,7 @@ from app.config.content import (
     TopicCollectionConfig,
     UploadConfig,
 )
-from app.config.filtering import FilteringConfig
+from app.config.filtering import FilteringConfig, TermMatchMode
 from app.config.operation import (
     AutoApproveConfig,
     NotificationConfig,
@@ -76,6 +76,7 @@ __all__ = [
     "YouTubeConfig",
     # Filtering
     "FilteringConfig",
+    "TermMatchMode",
     # Persona
     "PersonaConfig",
     "VoiceConfig",
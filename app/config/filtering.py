@@ -3,10 +3,16 @@
 All terms are automatically lowercased on load.
 """
 
+from typing import Literal
+
 from pydantic import BaseModel, Field, field_validator
 
 from app.config.validators import normalize_string_list
 
+# How filter terms must align with words: anywhere, whole words, or whole
+# words that may carry Korean particles/endings
+TermMatchMode = Literal["substring", "word", "hangul"]
+
 
 class FilteringConfig(BaseModel):
     """Topic filtering configuration.
@@ -14,10 +20,16 @@ class FilteringConfig(BaseModel):
     Attributes:
         include: Terms that must be matched (at least one)
         exclude: Terms that must NOT be matched (any)
+        match_mode: Term matching mode (substring, word or hangul)
     """
 
     include: list[str] = Field(default_factory=list)
     exclude: list[str] = Field(default_factory=list)
+    match_mode: TermMatchMode = Field(
+        default="substring",
+        description="substring: anywhere, word: whole words, "
+        "hangul: whole words that may be followed by Korean particles",
+    )
 
     @field_validator("include", mode="before")
     @classmethod
@@ -32,4 +44,4 @@ class FilteringConfig(BaseModel):
         return normalize_string_list(v)
 
 
-__all__ = ["FilteringConfig"]
+__all__ = ["FilteringConfig", "TermMatchMode"]
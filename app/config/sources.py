@@ -16,6 +16,7 @@ class RedditConfig(BaseModel):
         sort: Sort method (hot, new, top, rising)
         time: Time filter for top posts
         request_timeout: HTTP request timeout in seconds
+        max_concurrent_requests: Subreddits fetched at once
     """
 
     subreddits: list[str] = Field(default_factory=list)
@@ -24,6 +25,7 @@ class RedditConfig(BaseModel):
     sort: str = Field(default="hot", pattern="^(hot|new|top|rising)$")
     time: str = Field(default="day", pattern="^(hour|day|week|month|year|all)$")
     request_timeout: float = Field(default=10.0, ge=1.0, le=60.0)
+    max_concurrent_requests: int = Field(default=4, ge=1, le=16)
 
 
 class RSSConfig(BaseModel):
@@ -50,12 +52,18 @@ class GoogleTrendsConfig(BaseModel):
         limit: Maximum trends to fetch per region
         timeframe: Timeframe for trends
         category: Google Trends category ID (0 = all)
+        request_timeout: HTTP request timeout in seconds for pytrends
+        fetch_timeout: Overall timeout in seconds for one region's fetch
+        max_concurrent_regions: Regions fetched at once
     """
 
     regions: list[str] = Field(default_factory=list)
     limit: int = Field(default=20, ge=1, le=50)
     timeframe: str = Field(default="now 1-d")
     category: int = Field(default=0, ge=0)
+    request_timeout: float = Field(default=10.0, ge=1.0, le=60.0)
+    fetch_timeout: float = Field(default=30.0, gt=0, le=300.0)
+    max_concurrent_regions: int = Field(default=4, ge=1, le=16)
 
 
 __all__ = [
@@ -13,6 +13,52 @@ from typing import Literal
 from pydantic import BaseModel, Field
 
 
+class TTSConcurrencyConfig(BaseModel):
+    """Per-provider limits for concurrent TTS synthesis.
+
+    Attributes:
+        max_concurrency: Maximum in-flight synthesis requests
+        requests_per_second: Sustained request rate (0 = unlimited)
+    """
+
+    max_concurrency: int = Field(default=4, ge=1, le=32, description="Max in-flight requests")
+    requests_per_second: float = Field(
+        default=0.0, ge=0.0, le=100.0, description="Request rate limit (0 = unlimited)"
+    )
+
+
+class TTSCacheConfig(BaseModel):
+    """Content-addressed TTS audio cache configuration.
+
+    Attributes:
+        enabled: Serve repeated synthesis requests from disk
+        cache_dir: Directory holding cached audio and timestamps
+        max_size_mb: Total cache size before LRU eviction
+        max_age_days: Entries unused for longer than this are evicted
+    """
+
+    enabled: bool = Field(default=True, description="Enable TTS audio cache")
+    cache_dir: str = Field(default="data/cache/tts", description="Cache directory")
+    max_size_mb: int = Field(default=2048, ge=16, le=102400, description="Max cache size (MB)")
+    max_age_days: int = Field(default=30, ge=1, le=365, description="Max entry age (days)")
+
+
+class WhisperAlignerConfig(BaseModel):
+    """Whisper word-timestamp alignment configuration (ElevenLabs).
+
+    Attributes:
+        model_size: Whisper model name (tiny, base, small, ...)
+        device: Torch device; "cpu" disables fp16 for CPU-only hosts
+        num_threads: Torch intra-op threads (None = torch default)
+        max_queue_size: Maximum alignment jobs waiting for the worker
+    """
+
+    model_size: str = Field(default="base", description="Whisper model size")
+    device: str = Field(default="cpu", description="Torch device")
+    num_threads: int | None = Field(default=None, ge=1, le=64, description="Torch threads")
+    max_queue_size: int = Field(default=32, ge=1, le=1024, description="Max pending jobs")
+
+
 class TTSProviderConfig(BaseModel):
     """TTS provider configuration.
 
@@ -28,6 +74,11 @@ class TTSProviderConfig(BaseModel):
         speed: Default speech rate (1.0 = normal)
         pitch: Default pitch adjustment in Hz (0 = no change)
         volume: Default volume adjustment (0 = no change)
+        concurrent_scenes: Synthesize scenes in parallel instead of one by one
+        edge_tts_concurrency: Concurrency limits for Edge TTS
+        elevenlabs_concurrency: Concurrency limits for ElevenLabs
+        cache: Synthesized audio cache settings
+        whisper: Whisper aligner settings for ElevenLabs word timestamps
     """
 
     provider: Literal["edge-tts", "elevenlabs"] = Field(
@@ -43,6 +94,17 @@ class TTSProviderConfig(BaseModel):
     speed: float = Field(default=1.0, ge=0.5, le=2.0, description="Speech rate multiplier")
     pitch: int = Field(default=0, ge=-50, le=50, description="Pitch adjustment in Hz")
     volume: int = Field(default=0, ge=-50, le=50, description="Volume adjustment")
+    concurrent_scenes: bool = Field(default=True, description="Synthesize scenes concurrently")
+    edge_tts_concurrency: TTSConcurrencyConfig = Field(
+        default_factory=lambda: TTSConcurrencyConfig(max_concurrency=4, requests_per_second=5.0),
+        description="Edge TTS concurrency limits",
+    )
+    elevenlabs_concurrency: TTSConcurrencyConfig = Field(
+        default_factory=lambda: TTSConcurrencyConfig(max_concurrency=2, requests_per_second=2.0),
+        description="ElevenLabs concurrency limits",
+    )
+    cache: TTSCacheConfig = Field(default_factory=TTSCacheConfig)
+    whisper: WhisperAlignerConfig = Field(default_factory=WhisperAlignerConfig)
 
 
 class SubtitleStyleConfig(BaseModel):
@@ -158,7 +220,9 @@ class WanConfig(BaseModel):
     Attributes:
         service_url: Wan service HTTP endpoint
         enabled: Whether to use Wan for video generation
-        timeout: Request timeout in seconds (longer than SD, video takes more time)
+        timeout: Max seconds to wait for a generation job (longer than SD, video
+            takes more time)
+        poll_wait_seconds: Long-poll duration per job status request
         model_id: HuggingFace model ID to load
         default_duration_seconds: Default video clip duration
         default_fps: Default frames per second
@@ -171,6 +235,9 @@ class WanConfig(BaseModel):
     service_url: str = Field(default="http://wan:7861", description="Wan service URL")
     enabled: bool = Field(default=True, description="Enable Wan generation")
     timeout: float = Field(default=300.0, ge=30.0, le=900.0, description="Request timeout")
+    poll_wait_seconds: float = Field(
+        default=30.0, ge=1.0, le=60.0, description="Long-poll duration per status request"
+    )
     model_id: str = Field(default="Wan-AI/Wan2.2-T2V-1.3B", description="HuggingFace model ID")
     default_duration_seconds: float = Field(
         default=5.0, ge=2.0, le=10.0, description="Default clip duration"
@@ -197,9 +264,16 @@ class VisualConfig(BaseModel):
         wan: Wan 2.2 video generation configuration
         fallback_color: Fallback solid color (hex)
         fallback_gradient: Fallback gradient colors
-        cache_enabled: Enable visual caching
-        cache_ttl_hours: Cache TTL in hours
+        cache_enabled: Enable the stock search/download cache
+        cache_ttl_hours: Lifetime of cached search responses in hours
+        cache_dir: Directory for cached search responses and media
+        cache_max_size_mb: Total size limit for cached media (LRU eviction)
         metadata_score_threshold: Minimum metadata matching score
+        reuse_previous_visual_types: Scene types that reuse the previous visual
+        concurrent_scenes: Source all scenes in parallel instead of one by one
+        max_concurrent_searches: Maximum in-flight stock searches (and downloads)
+        clip_rerank_top_n: Stock candidates per scene re-ranked by CLIP preview
+            similarity on the Wan service (0 = metadata score only)
     """
 
     source_priority: list[str] = Field(
@@ -226,6 +300,10 @@ class VisualConfig(BaseModel):
     )
     cache_enabled: bool = Field(default=True, description="Enable caching")
     cache_ttl_hours: int = Field(default=24, ge=1, le=168, description="Cache TTL")
+    cache_dir: str = Field(default="data/cache/visual", description="Visual cache directory")
+    cache_max_size_mb: int = Field(
+        default=4096, ge=0, le=1048576, description="Max cached media size in MB (0 = unlimited)"
+    )
     metadata_score_threshold: float = Field(
         default=0.3,
         ge=0.0,
@@ -237,6 +315,13 @@ class VisualConfig(BaseModel):
         description="Scene types that reuse previous visual instead of sourcing new one. "
         "Use lowercase scene type names: hook, content, commentary, cta, etc.",
     )
+    concurrent_scenes: bool = Field(default=True, description="Source scene visuals concurrently")
+    max_concurrent_searches: int = Field(
+        default=4, ge=1, le=32, description="Max in-flight stock searches/downloads"
+    )
+    clip_rerank_top_n: int = Field(
+        default=5, ge=0, le=20, description="Candidates re-ranked by CLIP (0 = disabled)"
+    )
 
 
 class CompositionConfig(BaseModel):
@@ -359,6 +444,8 @@ class VideoGenerationConfig(BaseModel):
 
 __all__ = [
     "VideoGenerationConfig",
+    "TTSCacheConfig",
+    "TTSConcurrencyConfig",
     "TTSProviderConfig",
     "SubtitleConfig",
     "SubtitleStyleConfig",
@@ -366,6 +453,7 @@ __all__ = [
     "VisualSourceConfig",
     "PixabayConfig",
     "WanConfig",
+    "WhisperAlignerConfig",
     "CompositionConfig",
     "ThumbnailConfig",
 ]
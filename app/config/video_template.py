@@ -476,11 +476,17 @@ class VideoTemplateConfig(BaseModel):
         subtitle: Subtitle style settings
         visual_effects: Visual effects settings
         audio: Audio settings
+        compositor: Rendering backend ("remotion" for rich animation,
+            "ffmpeg" for fast single-pass rendering of simple layouts)
     """
 
     name: str
     extends: str | None = None
     description: str = ""
+    compositor: Literal["remotion", "ffmpeg"] = Field(
+        default="remotion",
+        description="Rendering backend",
+    )
 
     layout: LayoutConfig = Field(default_factory=LayoutConfig)
     subtitle: SubtitleTemplateConfig = Field(default_factory=SubtitleTemplateConfig)
@@ -79,6 +79,9 @@ class AnalyticsConfig(BaseModel):
         performance_percentile: Percentile threshold for high performers
         min_sample_size: Minimum videos for reliable time analysis
         engagement_weight: Weight for engagement in scoring (vs views)
+        bulk_page_size: Videos per Analytics report in bulk syncs
+        recency_half_life_days: Half-life of upload weights in time analysis
+            (None weights all uploads equally)
     """
 
     sync_interval_hours: int = Field(
@@ -96,6 +99,12 @@ class AnalyticsConfig(BaseModel):
     engagement_weight: float = Field(
         default=0.4, ge=0.0, le=1.0, description="Engagement weight in scoring"
     )
+    bulk_page_size: int = Field(
+        default=200, ge=1, le=200, description="Videos per bulk Analytics report"
+    )
+    recency_half_life_days: float | None = Field(
+        default=None, gt=0, description="Recency weight half-life for time analysis"
+    )
 
 
 class YouTubeUploadPipelineConfig(BaseModel):
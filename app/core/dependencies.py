@@ -5,6 +5,7 @@ Each factory creates a fully-wired service instance.
 """
 
 import threading
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,26 +18,38 @@ from app.config.video import (
     WanConfig,
 )
 from app.core.config import get_config
+from app.core.config_loader import load_defaults
 from app.core.database import async_session_maker
 from app.core.logging import get_logger
 from app.core.template_loader import VideoTemplateLoader
 from app.core.types import SessionFactory
 from app.infrastructure.http_client import HTTPClient
 from app.infrastructure.llm import LLMClient
+from app.infrastructure.llm_cache import (
+    LLMResponseCache,
+    MemoryLLMCacheBackend,
+    SQLiteLLMCacheBackend,
+)
+from app.infrastructure.resource_pools import ResourcePools
 from app.infrastructure.youtube_api import YouTubeAPIClient
 from app.infrastructure.youtube_auth import YouTubeAuthClient
 from app.prompts.manager import PromptManager
 from app.services.analytics.collector import YouTubeAnalyticsCollector
 from app.services.analytics.optimal_time import OptimalTimeAnalyzer
+from app.services.collector.near_duplicates import NearDuplicateDetector, NearDuplicateStore
 from app.services.collector.normalizer import TopicNormalizer
 from app.services.collector.pipeline import TopicCollectionPipeline
+from app.services.collector.series_detector import SeriesDetector
 from app.services.generator.bgm import BGMManager
 from app.services.generator.ffmpeg import FFmpegWrapper
+from app.services.generator.ffmpeg_compositor import FFmpegCompositor
+from app.services.generator.job_queue import GenerationJobQueue
 from app.services.generator.pipeline import VideoGenerationPipeline
 from app.services.generator.remotion_compositor import RemotionCompositor
 from app.services.generator.subtitle import SubtitleGenerator
 from app.services.generator.templates import ASSTemplateLoader
 from app.services.generator.tts.factory import TTSEngineFactory
+from app.services.generator.visual.cache import VisualAssetCache
 from app.services.generator.visual.manager import VisualSourcingManager
 from app.services.generator.visual.pexels import PexelsClient
 from app.services.generator.visual.wan_video_source import WanVideoSource
@@ -49,8 +62,11 @@ logger = get_logger(__name__)
 
 # Singleton cache for shared resources
 _http_client: HTTPClient | None = None
+_ffmpeg_wrapper: FFmpegWrapper | None = None
+_remotion_compositor: RemotionCompositor | None = None
 _llm_client: LLMClient | None = None
 _prompt_manager: PromptManager | None = None
+_near_duplicate_store: NearDuplicateStore | None = None
 _singleton_lock = threading.Lock()
 
 
@@ -78,16 +94,37 @@ def create_llm_client() -> LLMClient:
                 base_url=config.llm_api_base,
                 api_key=config.llm_api_key,
                 default_model=config.llm_model,
+                cache=_create_llm_cache(),
             )
         return _llm_client
 
 
+def _create_llm_cache() -> LLMResponseCache | None:
+    """Create the LLM response cache configured in defaults.yaml (llm.cache)."""
+    llm_defaults = load_defaults().get("llm", {})
+    cache_config = llm_defaults.get("cache", {}) if isinstance(llm_defaults, dict) else {}
+    if not isinstance(cache_config, dict) or not cache_config.get("enabled", False):
+        return None
+
+    max_entries = int(cache_config.get("max_entries", 50000))
+    if cache_config.get("backend", "sqlite") == "memory":
+        return LLMResponseCache(MemoryLLMCacheBackend(max_entries=max_entries))
+    return LLMResponseCache(
+        SQLiteLLMCacheBackend(
+            Path(cache_config.get("path", "data/cache/llm.sqlite3")),
+            max_entries=max_entries,
+        )
+    )
+
+
 def create_prompt_manager() -> PromptManager:
     """Get or create prompt manager (singleton)."""
     global _prompt_manager
     with _singleton_lock:
         if _prompt_manager is None:
-            _prompt_manager = PromptManager()
+            prompts = load_defaults().get("prompts", {})
+            module_dir = prompts.get("module_dir") if isinstance(prompts, dict) else None
+            _prompt_manager = PromptManager(module_dir=Path(module_dir) if module_dir else None)
         return _prompt_manager
 
 
@@ -113,6 +150,40 @@ def create_normalizer(
     )
 
 
+def create_near_duplicate_detector() -> NearDuplicateDetector | None:
+    """Create the near-duplicate detector configured in defaults.yaml.
+
+    The SQLite store (collector.near_duplicates.path) is shared by all
+    pipelines so channels collecting concurrently reuse one connection.
+
+    Returns:
+        NearDuplicateDetector, or None if disabled
+    """
+    global _near_duplicate_store
+    collector = load_defaults().get("collector", {})
+    settings = collector.get("near_duplicates", {}) if isinstance(collector, dict) else {}
+    if not isinstance(settings, dict) or not settings.get("enabled", False):
+        return None
+
+    with _singleton_lock:
+        if _near_duplicate_store is None and settings.get("path"):
+            _near_duplicate_store = NearDuplicateStore(Path(settings["path"]))
+        store = _near_duplicate_store
+    return NearDuplicateDetector(store=store)
+
+
+def create_series_detector() -> SeriesDetector | None:
+    """Create the series detector configured in defaults.yaml.
+
+    Returns:
+        SeriesDetector, or None if series_detection is disabled
+    """
+    settings = load_defaults().get("series_detection", {})
+    if not isinstance(settings, dict) or not settings.get("enabled", False):
+        return None
+    return SeriesDetector()
+
+
 async def create_collector_pipeline(
     session: AsyncSession,
     http_client: HTTPClient | None = None,
@@ -138,12 +209,21 @@ async def create_collector_pipeline(
         session=session,
         http_client=http_client or create_http_client(),
         normalizer=normalizer,
+        near_duplicates=create_near_duplicate_detector(),
+        series_detector=create_series_detector(),
     )
 
 
 def create_ffmpeg_wrapper() -> FFmpegWrapper:
-    """Create FFmpeg wrapper."""
-    return FFmpegWrapper()
+    """Get or create shared FFmpeg wrapper (singleton).
+
+    Sharing one wrapper makes its worker pool bound FFmpeg jobs process-wide.
+    """
+    global _ffmpeg_wrapper
+    with _singleton_lock:
+        if _ffmpeg_wrapper is None:
+            _ffmpeg_wrapper = FFmpegWrapper()
+        return _ffmpeg_wrapper
 
 
 def create_tts_factory(
@@ -165,12 +245,23 @@ def create_visual_manager(
     config = get_config()
     _http = http_client or create_http_client()
 
-    pexels_client = PexelsClient(api_key=config.pexels_api_key)
+    visual_config = VisualConfig()
+
+    visual_cache = (
+        VisualAssetCache(
+            Path(visual_config.cache_dir),
+            ttl_hours=visual_config.cache_ttl_hours,
+            max_size_mb=visual_config.cache_max_size_mb,
+        )
+        if visual_config.cache_enabled
+        else None
+    )
+    pexels_client = PexelsClient(api_key=config.pexels_api_key, cache=visual_cache)
     wan_source = WanVideoSource(http_client=_http, config=WanConfig())
 
     return VisualSourcingManager(
         http_client=_http,
-        config=VisualConfig(),
+        config=visual_config,
         pexels_client=pexels_client,
         wan_video_source=wan_source,
     )
@@ -188,10 +279,32 @@ def create_subtitle_generator() -> SubtitleGenerator:
 
 
 def create_remotion_compositor() -> RemotionCompositor:
-    """Create Remotion compositor."""
+    """Get or create shared Remotion compositor (singleton).
+
+    Sharing one compositor reuses its warm bundle and makes its render
+    pool bound Remotion renders process-wide.
+    """
+    from app.config.video import CompositionConfig
+
+    global _remotion_compositor
+    with _singleton_lock:
+        if _remotion_compositor is None:
+            _remotion_compositor = RemotionCompositor(config=CompositionConfig())
+        return _remotion_compositor
+
+
+def create_ffmpeg_compositor(ffmpeg_wrapper: FFmpegWrapper | None = None) -> FFmpegCompositor:
+    """Create single-pass FFmpeg compositor.
+
+    Args:
+        ffmpeg_wrapper: FFmpeg wrapper (shared wrapper if not provided)
+    """
     from app.config.video import CompositionConfig
 
-    return RemotionCompositor(config=CompositionConfig())
+    return FFmpegCompositor(
+        config=CompositionConfig(),
+        ffmpeg_wrapper=ffmpeg_wrapper or create_ffmpeg_wrapper(),
+    )
 
 
 def create_bgm_manager() -> BGMManager:
@@ -202,12 +315,14 @@ def create_bgm_manager() -> BGMManager:
 def create_video_pipeline(
     http_client: HTTPClient | None = None,
     ffmpeg_wrapper: FFmpegWrapper | None = None,
+    resource_pools: ResourcePools | None = None,
 ) -> VideoGenerationPipeline:
     """Create video generation pipeline with all dependencies.
 
     Args:
         http_client: Shared HTTP client (created if not provided)
         ffmpeg_wrapper: FFmpeg wrapper (created if not provided)
+        resource_pools: Shared resource-class pools (unbounded if not provided)
 
     Returns:
         Configured VideoGenerationPipeline
@@ -224,6 +339,19 @@ def create_video_pipeline(
         config=VideoGenerationConfig(),
         template_loader=VideoTemplateLoader(),
         bgm_manager=create_bgm_manager(),
+        resource_pools=resource_pools,
+        ffmpeg_compositor=create_ffmpeg_compositor(ffmpeg_wrapper=_ffmpeg),
+    )
+
+
+def create_generation_job_queue() -> GenerationJobQueue:
+    """Create the durable video generation job queue."""
+    generator = load_defaults().get("generator", {})
+    jobs = generator.get("jobs", {}) if generator else {}
+    return GenerationJobQueue(
+        session_factory=get_session_factory(),
+        lease_seconds=int(jobs.get("lease_seconds", 1800)),
+        max_attempts=int(jobs.get("max_attempts", 3)),
     )
 
 
@@ -309,18 +437,39 @@ def create_upload_scheduler() -> UploadScheduler:
 async def close_singletons() -> None:
     """Close and reset all singleton instances.
 
-    Ensures HTTPClient is properly closed before clearing references.
+    Ensures HTTPClient, the LLM cache and the near-duplicate store are
+    properly closed before clearing references.
     Use this for production shutdown to avoid resource leaks.
     """
-    global _http_client, _llm_client, _prompt_manager
+    global _http_client, _ffmpeg_wrapper, _remotion_compositor, _llm_client, _prompt_manager
+    global _near_duplicate_store
     with _singleton_lock:
+        closers: list[tuple[str, Callable[[], Awaitable[None]]]] = []
+        if _http_client is not None:
+            closers.append(("http_client", _http_client.close))
+        if _llm_client is not None and _llm_client.cache is not None:
+            closers.append(("llm_cache", _llm_client.cache.close))
+        if _near_duplicate_store is not None:
+            closers.append(("near_duplicate_store", _near_duplicate_store.close))
+
+        # Close every resource even if an earlier one fails; re-raise the first error
+        first_error: Exception | None = None
         try:
-            if _http_client is not None:
-                await _http_client.close()
+            for name, close in closers:
+                try:
+                    await close()
+                except Exception as e:
+                    logger.error("singleton_close_failed", resource=name, error=str(e))
+                    first_error = first_error or e
         finally:
             _http_client = None
+            _ffmpeg_wrapper = None
+            _remotion_compositor = None
             _llm_client = None
             _prompt_manager = None
+            _near_duplicate_store = None
+        if first_error is not None:
+            raise first_error
 
 
 def reset_singletons() -> None:
@@ -329,17 +478,22 @@ def reset_singletons() -> None:
     WARNING: Call ``await close_singletons()`` first if the HTTP client
     may be open, otherwise the underlying connection will leak.
     """
-    global _http_client, _llm_client, _prompt_manager
+    global _http_client, _ffmpeg_wrapper, _remotion_compositor, _llm_client, _prompt_manager
+    global _near_duplicate_store
     with _singleton_lock:
         _http_client = None
+        _ffmpeg_wrapper = None
+        _remotion_compositor = None
         _llm_client = None
         _prompt_manager = None
+        _near_duplicate_store = None
 
 
 __all__ = [
     "create_analytics_collector",
     "create_bgm_manager",
     "create_collector_pipeline",
+    "create_ffmpeg_compositor",
     "create_ffmpeg_wrapper",
     "create_http_client",
     "create_llm_client",
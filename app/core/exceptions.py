@@ -680,6 +680,38 @@ class BGMNotFoundError(BGMError):
         super().__init__(message, context=context)
 
 
+class JobLeaseLostError(VideoError):
+    """Raised when a worker no longer holds the lease on a generation job.
+
+    Another worker has reclaimed the job (e.g. after the lease expired),
+    so the current worker must stop instead of duplicating its work.
+
+    Attributes:
+        job_id: Generation job ID
+    """
+
+    def __init__(
+        self,
+        message: str = "Generation job lease lost",
+        job_id: str | None = None,
+        context: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize JobLeaseLostError.
+
+        Args:
+            message: Error message
+            job_id: Generation job ID
+            context: Additional context
+        """
+        ctx = context or {}
+        if job_id:
+            ctx["job_id"] = job_id
+
+        self.job_id = job_id
+
+        super().__init__(message, context=ctx)
+
+
 # ============================================
 # Upload Errors
 # ============================================
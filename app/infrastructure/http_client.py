@@ -4,6 +4,8 @@ This module provides a managed httpx.AsyncClient for reusing
 HTTP connections across the application.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
@@ -68,6 +70,22 @@ class HTTPClient:
         """Send POST request."""
         return await self._client.post(url, **kwargs)
 
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send DELETE request."""
+        return await self._client.delete(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Send a request without reading the body up front.
+
+        Example:
+            >>> async with http_client.stream("GET", url) as response:
+            ...     async for chunk in response.aiter_bytes():
+            ...         f.write(chunk)
+        """
+        async with self._client.stream(method, url, **kwargs) as response:
+            yield response
+
     async def close(self) -> None:
         """Close the HTTP client and release resources."""
         await self._client.aclose()
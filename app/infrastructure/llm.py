@@ -10,7 +10,8 @@ Benefits:
 - Consistent response format
 """
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Any, cast
 
 import litellm
@@ -18,6 +19,7 @@ from litellm import ModelResponse, acompletion
 
 from app.core.exceptions import ServiceError
 from app.core.logging import get_logger
+from app.infrastructure.llm_cache import CachedCompletion, LLMResponseCache
 
 if TYPE_CHECKING:
     from app.prompts.manager import LLMSettings
@@ -40,12 +42,15 @@ class LLMConfig:
         max_tokens: Maximum tokens in response
         temperature: Sampling temperature (0-1)
         timeout: Request timeout in seconds
+        cache_ttl: Response cache lifetime in seconds (0 disables caching
+            and coalescing for this request)
     """
 
     model: str
     max_tokens: int = 1000
     temperature: float = 0.7
     timeout: int = 60
+    cache_ttl: int = 0
 
     def __post_init__(self) -> None:
         if self.timeout <= 0:
@@ -67,6 +72,7 @@ class LLMConfig:
             max_tokens=llm_settings.max_tokens,
             temperature=llm_settings.temperature,
             timeout=timeout,
+            cache_ttl=llm_settings.cache_ttl_seconds,
         )
 
 
@@ -91,6 +97,9 @@ class LLMClient:
     """Unified LLM client using LiteLLM with a single gateway.
 
     Routes all LLM calls through a configured base URL with a single API key.
+    With a response cache, requests whose config has a positive ``cache_ttl``
+    are served from the cache when possible, and concurrent identical
+    requests are coalesced into a single LLM call.
 
     Example:
         >>> client = LLMClient(
@@ -110,6 +119,7 @@ class LLMClient:
         base_url: str = "",
         api_key: str = "",
         default_model: str = "",
+        cache: LLMResponseCache | None = None,
     ) -> None:
         """Initialize LLM client with gateway settings.
 
@@ -117,10 +127,13 @@ class LLMClient:
             base_url: LLM gateway base URL
             api_key: API key for the gateway
             default_model: Default model to use when not specified in config
+            cache: Optional response cache
         """
         self.base_url = base_url
         self.api_key = api_key
         self.default_model = default_model
+        self.cache = cache
+        self._in_flight: dict[str, asyncio.Future[LLMResponse]] = {}
 
         logger.info("LLMClient initialized", base_url=base_url)
 
@@ -143,14 +156,85 @@ class LLMClient:
         Raises:
             LLMError: If generation fails
         """
+        model = self._resolve_model(config)
+
+        if self.cache is None or config.cache_ttl <= 0:
+            return await self._complete(model, config, messages, **kwargs)
+
+        key = self.cache.make_key(model, messages, config.temperature, config.max_tokens, kwargs)
+
+        # Join an identical request that is already in flight
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            response = await asyncio.shield(in_flight)
+            self.cache.record_coalesced(response.usage)
+            logger.debug("llm_request_coalesced", model=model)
+            return replace(response)
+
+        task = asyncio.ensure_future(
+            self._complete_cached(self.cache, key, model, config, messages, **kwargs)
+        )
+        self._in_flight[key] = task
+        task.add_done_callback(lambda t: self._forget_in_flight(key, t))
+        return await asyncio.shield(task)
+
+    def _resolve_model(self, config: LLMConfig) -> str:
+        """Get the model name to send, adding a provider prefix for proxies."""
         model = config.model or self.default_model
-        try:
-            # When using a proxy (api_base), LiteLLM needs a provider prefix
-            # to route correctly. Only add if model has no provider prefix yet.
-            if self.base_url and model and not model.startswith(_KNOWN_PROVIDER_PREFIXES):
-                logger.debug("auto_prefixed_model", original=model, prefixed=f"openai/{model}")
-                model = f"openai/{model}"
+        # When using a proxy (api_base), LiteLLM needs a provider prefix
+        # to route correctly. Only add if model has no provider prefix yet.
+        if self.base_url and model and not model.startswith(_KNOWN_PROVIDER_PREFIXES):
+            logger.debug("auto_prefixed_model", original=model, prefixed=f"openai/{model}")
+            model = f"openai/{model}"
+        return model
+
+    def _forget_in_flight(self, key: str, task: "asyncio.Future[LLMResponse]") -> None:
+        """Drop a finished request from the in-flight table."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved when every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _complete_cached(
+        self,
+        cache: LLMResponseCache,
+        key: str,
+        model: str,
+        config: LLMConfig,
+        messages: list[dict[str, str]],
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Serve a request from the cache, or complete and store it."""
+        cached = await cache.get(key)
+        if cached is not None:
+            logger.debug("llm_cache_hit", model=model, hit_ratio=round(cache.stats.hit_ratio, 3))
+            return LLMResponse(content=cached.content, model=cached.model, usage=cached.usage)
+
+        response = await self._complete(model, config, messages, **kwargs)
+        if response.content:
+            await cache.set(
+                key,
+                CachedCompletion(
+                    content=response.content, model=response.model, usage=response.usage
+                ),
+                config.cache_ttl,
+            )
+        return response
 
+    async def _complete(
+        self,
+        model: str,
+        config: LLMConfig,
+        messages: list[dict[str, str]],
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Send a completion request to the gateway.
+
+        Raises:
+            LLMError: If generation fails
+        """
+        try:
             logger.debug(
                 "LLM request",
                 model=model,
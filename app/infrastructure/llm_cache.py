@@ -0,0 +1,318 @@
+"""Response cache for LLM completions.
+
+Identical translation/classification prompts are sent repeatedly across
+channels and scheduler runs. This module caches completed responses keyed
+by everything that affects the output (model, messages, temperature,
+max_tokens and extra parameters), with a per-request TTL taken from the
+prompt template.
+
+Backends:
+- MemoryLLMCacheBackend: in-process LRU, lost on restart
+- SQLiteLLMCacheBackend: on-disk, shared across runs and processes
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CachedCompletion:
+    """A cached LLM completion.
+
+    Attributes:
+        content: Generated text content
+        model: Model that produced the response
+        usage: Token usage of the original request
+    """
+
+    content: str
+    model: str
+    usage: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class LLMCacheStats:
+    """Counters for an LLMResponseCache.
+
+    Attributes:
+        hits: Requests served from the cache
+        misses: Requests sent to the LLM
+        coalesced: Requests that joined an identical in-flight request
+        tokens_saved: Total tokens not spent thanks to hits and coalescing
+    """
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    tokens_saved: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of cacheable requests that did not reach the LLM."""
+        total = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+class LLMCacheBackend(ABC):
+    """Storage backend for cached completions."""
+
+    @abstractmethod
+    async def get(self, key: str) -> CachedCompletion | None:
+        """Get an unexpired entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached completion, or None on miss/expiry
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: CachedCompletion, ttl_seconds: int) -> None:
+        """Store an entry.
+
+        Args:
+            key: Cache key
+            value: Completion to store
+            ttl_seconds: Entry lifetime
+        """
+
+    async def close(self) -> None:  # noqa: B027
+        """Release backend resources."""
+
+
+class MemoryLLMCacheBackend(LLMCacheBackend):
+    """In-memory LRU backend with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 5000) -> None:
+        """Initialize MemoryLLMCacheBackend.
+
+        Args:
+            max_entries: Maximum entries kept before evicting least recently used
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, CachedCompletion]] = OrderedDict()
+
+    async def get(self, key: str) -> CachedCompletion | None:
+        """Get an unexpired entry, marking it recently used."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: CachedCompletion, ttl_seconds: int) -> None:
+        """Store an entry, evicting the least recently used beyond max_entries."""
+        self._entries[key] = (time.time() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SQLiteLLMCacheBackend(LLMCacheBackend):
+    """On-disk SQLite backend.
+
+    Queries run in a worker thread so the event loop is never blocked on
+    disk I/O. Expired rows are purged opportunistically on write, and the
+    least recently used rows are trimmed beyond ``max_entries``.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 50000) -> None:
+        """Initialize SQLiteLLMCacheBackend.
+
+        Args:
+            path: SQLite database file
+            max_entries: Maximum rows kept
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, content TEXT NOT NULL, model TEXT NOT NULL, "
+                "usage TEXT NOT NULL, expires_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_used ON llm_cache(last_used)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get_sync(self, key: str) -> CachedCompletion | None:
+        with self._lock:
+            conn = self._connect()
+            now = time.time()
+            row = conn.execute(
+                "SELECT content, model, usage FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (now, key))
+            conn.commit()
+        return CachedCompletion(content=row[0], model=row[1], usage=json.loads(row[2]))
+
+    def _set_sync(self, key: str, value: CachedCompletion, ttl_seconds: int) -> None:
+        with self._lock:
+            conn = self._connect()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value.content, value.model, json.dumps(value.usage), now + ttl_seconds, now),
+            )
+            conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache "
+                "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            conn.commit()
+
+    async def get(self, key: str) -> CachedCompletion | None:
+        """Get an unexpired entry, refreshing its recency."""
+        try:
+            return await asyncio.to_thread(self._get_sync, key)
+        except sqlite3.Error as e:
+            logger.warning("llm_cache_read_failed", error=str(e))
+            return None
+
+    async def set(self, key: str, value: CachedCompletion, ttl_seconds: int) -> None:
+        """Store an entry; failures are logged and ignored."""
+        try:
+            await asyncio.to_thread(self._set_sync, key, value, ttl_seconds)
+        except sqlite3.Error as e:
+            logger.warning("llm_cache_write_failed", error=str(e))
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class LLMResponseCache:
+    """LLM completion cache with hit/token statistics.
+
+    Example:
+        >>> cache = LLMResponseCache(MemoryLLMCacheBackend())
+        >>> client = LLMClient(base_url=..., cache=cache)
+        >>> cache.stats.hit_ratio
+    """
+
+    def __init__(self, backend: LLMCacheBackend) -> None:
+        """Initialize LLMResponseCache.
+
+        Args:
+            backend: Storage backend
+        """
+        self.backend = backend
+        self.stats = LLMCacheStats()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        extra: dict[str, Any] | None = None,
+    ) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            model: Resolved model identifier
+            messages: Chat messages
+            temperature: Sampling temperature
+            max_tokens: Maximum response tokens
+            extra: Additional model parameters
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "extra": extra or {},
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> CachedCompletion | None:
+        """Look up a completion, updating statistics.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached completion, or None on miss
+        """
+        value = await self.backend.get(key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self.stats.tokens_saved += value.usage.get("total_tokens", 0)
+        return value
+
+    async def set(self, key: str, value: CachedCompletion, ttl_seconds: int) -> None:
+        """Store a completion.
+
+        Args:
+            key: Cache key from make_key()
+            value: Completion to store
+            ttl_seconds: Entry lifetime
+        """
+        await self.backend.set(key, value, ttl_seconds)
+
+    def record_coalesced(self, usage: dict[str, int]) -> None:
+        """Record a request that was served by an identical in-flight request.
+
+        Args:
+            usage: Token usage of the shared response
+        """
+        self.stats.coalesced += 1
+        self.stats.tokens_saved += usage.get("total_tokens", 0)
+
+    async def close(self) -> None:
+        """Close the backend."""
+        await self.backend.close()
+
+
+__all__ = [
+    "CachedCompletion",
+    "LLMCacheStats",
+    "LLMCacheBackend",
+    "MemoryLLMCacheBackend",
+    "SQLiteLLMCacheBackend",
+    "LLMResponseCache",
+]
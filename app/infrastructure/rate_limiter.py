@@ -0,0 +1,74 @@
+"""Async rate limiting for outbound API calls.
+
+This module provides a small token-bucket limiter shared by services that
+fan out concurrent requests to rate-limited providers (TTS, stock media, LLM).
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """Token-bucket rate limiter for asyncio code.
+
+    Allows bursts of up to ``burst`` calls, then refills at
+    ``requests_per_second``. Waiters are served in FIFO order.
+
+    Example:
+        >>> limiter = AsyncRateLimiter(requests_per_second=2.0)
+        >>> async with limiter:
+        ...     await client.get(url)
+    """
+
+    def __init__(self, requests_per_second: float | None, burst: int = 1) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_second: Sustained request rate (None or <= 0 disables limiting)
+            burst: Maximum number of calls allowed back-to-back
+        """
+        self.requests_per_second = (
+            requests_per_second if requests_per_second and requests_per_second > 0 else None
+        )
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether this limiter actually throttles calls."""
+        return self.requests_per_second is not None
+
+    async def acquire(self) -> None:
+        """Wait until a call is allowed under the configured rate."""
+        if self.requests_per_second is None:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._tokens = min(
+                    float(self.burst), self._tokens + elapsed * self.requests_per_second
+                )
+                self._last_refill = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                wait_seconds = (1.0 - self._tokens) / self.requests_per_second
+                await asyncio.sleep(wait_seconds)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        """Acquire a slot on context entry."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        """Nothing to release; tokens refill over time."""
+        return None
+
+
+__all__ = ["AsyncRateLimiter"]
@@ -0,0 +1,221 @@
+"""Bounded worker pools per resource class.
+
+The orchestrator runs topics from every channel through one staged
+pipeline. Each stage is bounded by the resource it saturates rather than
+by channel:
+
+- LLM: script generation (gateway rate limits / token throughput)
+- NETWORK: TTS synthesis and stock media search/download
+- CPU: FFmpeg and Remotion rendering
+
+Slots are shared round-robin between tenants (channels), so a channel
+with many topics cannot starve the others: when a slot frees up it goes
+to the next waiting channel, not to whoever queued first.
+
+Work holding a slot can be bounded by a stage deadline. The deadline
+starts once the slot is acquired, so time spent queued behind other
+channels never counts against it.
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Any
+
+from app.core.config_loader import load_defaults
+
+# Tenant (channel) that work in the current task is attributed to
+current_tenant: ContextVar[str] = ContextVar("resource_tenant", default="default")
+
+
+class ResourceClass(StrEnum):
+    """Resource a pipeline stage is bound by."""
+
+    LLM = "llm"
+    NETWORK = "network"
+    CPU = "cpu"
+
+
+class FairSemaphore:
+    """Semaphore whose waiters are served round-robin by tenant.
+
+    Within one tenant waiters are FIFO. A released slot is handed directly
+    to the chosen waiter, so late arrivals cannot barge in.
+
+    Example:
+        >>> sem = FairSemaphore(2)
+        >>> async with sem.slot("channel-a"):
+        ...     await render()
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize FairSemaphore.
+
+        Args:
+            limit: Maximum concurrent holders
+        """
+        self.limit = max(1, limit)
+        self._active = 0
+        self._waiters: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+
+    @property
+    def in_use(self) -> int:
+        """Number of slots currently held."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of pending acquirers."""
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self, tenant: str) -> None:
+        """Wait for a slot.
+
+        Args:
+            tenant: Tenant the caller belongs to
+        """
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(tenant, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation; pass it on
+                self.release()
+            else:
+                self._discard(tenant, future)
+            raise
+
+    def release(self) -> None:
+        """Release a slot, handing it to the next tenant in turn."""
+        while self._waiters:
+            tenant, queue = next(iter(self._waiters.items()))
+            future = queue.popleft()
+            if queue:
+                self._waiters.move_to_end(tenant)
+            else:
+                del self._waiters[tenant]
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self, tenant: str) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block.
+
+        Args:
+            tenant: Tenant the caller belongs to
+        """
+        await self.acquire(tenant)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _discard(self, tenant: str, future: asyncio.Future[None]) -> None:
+        """Remove a cancelled waiter."""
+        queue = self._waiters.get(tenant)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            return
+        if not queue:
+            del self._waiters[tenant]
+
+
+class ResourcePools:
+    """One fair, bounded pool per resource class.
+
+    Example:
+        >>> pools = ResourcePools.from_defaults()
+        >>> current_tenant.set(str(channel.id))
+        >>> async with pools.slot(ResourceClass.LLM):
+        ...     await script_generator.generate(...)
+    """
+
+    def __init__(
+        self,
+        llm: int = 4,
+        network: int = 8,
+        cpu: int = 2,
+        stage_timeout: float | None = None,
+    ) -> None:
+        """Initialize ResourcePools.
+
+        Args:
+            llm: Concurrent LLM-bound stages
+            network: Concurrent network-bound stages
+            cpu: Concurrent CPU-bound stages
+            stage_timeout: Seconds a stage may hold its slot, counted from
+                acquisition (None for no deadline)
+        """
+        self.stage_timeout = stage_timeout
+        self._pools = {
+            ResourceClass.LLM: FairSemaphore(llm),
+            ResourceClass.NETWORK: FairSemaphore(network),
+            ResourceClass.CPU: FairSemaphore(cpu),
+        }
+
+    @classmethod
+    def from_defaults(cls) -> "ResourcePools":
+        """Create pools sized from ``orchestrator.pools`` in config/defaults.yaml."""
+        orchestrator = load_defaults().get("orchestrator", {}) or {}
+        pools: dict[str, Any] = orchestrator.get("pools", {})
+        stage_timeout_minutes = orchestrator.get("stage_timeout_minutes", 15)
+        return cls(
+            llm=int(pools.get("llm", 4)),
+            network=int(pools.get("network", 8)),
+            cpu=int(pools.get("cpu", 2)),
+            stage_timeout=float(stage_timeout_minutes) * 60 if stage_timeout_minutes else None,
+        )
+
+    def pool(self, resource: ResourceClass) -> FairSemaphore:
+        """Get the pool for a resource class."""
+        return self._pools[resource]
+
+    @asynccontextmanager
+    async def slot(self, resource: ResourceClass) -> AsyncIterator[None]:
+        """Hold a slot of ``resource`` for the current tenant.
+
+        The block raises TimeoutError if it runs longer than
+        ``stage_timeout`` after the slot was acquired.
+
+        Args:
+            resource: Resource class the stage is bound by
+        """
+        async with self._pools[resource].slot(current_tenant.get()):
+            async with asyncio.timeout(self.stage_timeout):
+                yield
+
+
+def resource_slot(
+    pools: ResourcePools | None, resource: ResourceClass
+) -> AbstractAsyncContextManager[None]:
+    """Hold a slot of ``resource`` if pools are configured, otherwise do nothing.
+
+    Args:
+        pools: Shared pools (None when running without a scheduler)
+        resource: Resource class the stage is bound by
+    """
+    if pools is None:
+        return nullcontext()
+    return pools.slot(resource)
+
+
+__all__ = [
+    "FairSemaphore",
+    "ResourceClass",
+    "ResourcePools",
+    "current_tenant",
+    "resource_slot",
+]
@@ -29,6 +29,15 @@ RETRIABLE_STATUS_CODES = [500, 502, 503, 504]
 # Maximum retry attempts
 MAX_RETRIES = 3
 
+# Metrics requested for video reports, in row order
+VIDEO_METRICS = (
+    "views,likes,dislikes,comments,shares,estimatedMinutesWatched,"
+    "averageViewDuration,averageViewPercentage,subscribersGained,subscribersLost"
+)
+
+# Maximum video IDs in one Analytics report (top-videos reports cap maxResults at 200)
+MAX_VIDEOS_PER_REPORT = 200
+
 
 @dataclass
 class UploadMetadata:
@@ -432,37 +441,101 @@ class YouTubeAPIClient:
                     ids="channel==MINE",
                     startDate=start_date,
                     endDate=end_date,
-                    metrics="views,likes,dislikes,comments,shares,estimatedMinutesWatched,"
-                    "averageViewDuration,averageViewPercentage,subscribersGained,"
-                    "subscribersLost",
+                    metrics=VIDEO_METRICS,
                     filters=f"video=={video_id}",
                 )
                 .execute
             )
 
             rows = response.get("rows", [[]])
-            row = rows[0] if rows else [0] * 10
+            return self._parse_video_metrics(video_id, rows[0] if rows else [])
 
-            return VideoAnalytics(
+        except HttpError as e:
+            raise YouTubeAPIError(
+                message=f"Analytics fetch failed: {e}",
                 video_id=video_id,
-                views=int(row[0]) if len(row) > 0 else 0,
-                likes=int(row[1]) if len(row) > 1 else 0,
-                dislikes=int(row[2]) if len(row) > 2 else 0,
-                comments=int(row[3]) if len(row) > 3 else 0,
-                shares=int(row[4]) if len(row) > 4 else 0,
-                watch_time_minutes=int(row[5]) if len(row) > 5 else 0,
-                avg_view_duration_seconds=float(row[6]) if len(row) > 6 else 0.0,
-                avg_view_percentage=float(row[7]) if len(row) > 7 else 0.0,
-                subscribers_gained=int(row[8]) if len(row) > 8 else 0,
-                subscribers_lost=int(row[9]) if len(row) > 9 else 0,
+            ) from e
+
+    async def get_videos_analytics(
+        self,
+        video_ids: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> dict[str, VideoAnalytics]:
+        """Get analytics for several videos with a single report.
+
+        Queries one report with ``dimensions=video`` filtered to all IDs,
+        instead of one report per video.
+
+        Args:
+            video_ids: YouTube video IDs (at most MAX_VIDEOS_PER_REPORT)
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            VideoAnalytics per video ID; videos without data have zero metrics
+
+        Raises:
+            ValueError: If too many video IDs are given
+            YouTubeAPIError: If analytics fetch fails
+        """
+        unique_ids = list(dict.fromkeys(video_ids))
+        if len(unique_ids) > MAX_VIDEOS_PER_REPORT:
+            raise ValueError(
+                f"At most {MAX_VIDEOS_PER_REPORT} videos per report, got {len(unique_ids)}"
             )
+        if not unique_ids:
+            return {}
+
+        analytics = await self.auth_client.get_analytics_service()
 
+        try:
+            response = await asyncio.to_thread(
+                analytics.reports()
+                .query(
+                    ids="channel==MINE",
+                    startDate=start_date,
+                    endDate=end_date,
+                    metrics=VIDEO_METRICS,
+                    dimensions="video",
+                    filters="video==" + ",".join(unique_ids),
+                    maxResults=len(unique_ids),
+                    sort="-views",
+                )
+                .execute
+            )
         except HttpError as e:
             raise YouTubeAPIError(
-                message=f"Analytics fetch failed: {e}",
-                video_id=video_id,
+                message=f"Bulk analytics fetch failed for {len(unique_ids)} videos: {e}",
             ) from e
 
+        # Rows are [video, *metrics]; videos without activity are omitted
+        results = {
+            str(row[0]): self._parse_video_metrics(str(row[0]), row[1:])
+            for row in response.get("rows", [])
+            if row
+        }
+        for video_id in unique_ids:
+            results.setdefault(video_id, VideoAnalytics(video_id=video_id))
+        return results
+
+    @staticmethod
+    def _parse_video_metrics(video_id: str, row: list[Any]) -> VideoAnalytics:
+        """Build VideoAnalytics from a row of VIDEO_METRICS values."""
+        return VideoAnalytics(
+            video_id=video_id,
+            views=int(row[0]) if len(row) > 0 else 0,
+            likes=int(row[1]) if len(row) > 1 else 0,
+            dislikes=int(row[2]) if len(row) > 2 else 0,
+            comments=int(row[3]) if len(row) > 3 else 0,
+            shares=int(row[4]) if len(row) > 4 else 0,
+            watch_time_minutes=int(row[5]) if len(row) > 5 else 0,
+            avg_view_duration_seconds=float(row[6]) if len(row) > 6 else 0.0,
+            avg_view_percentage=float(row[7]) if len(row) > 7 else 0.0,
+            subscribers_gained=int(row[8]) if len(row) > 8 else 0,
+            subscribers_lost=int(row[9]) if len(row) > 9 else 0,
+        )
+
     async def get_channel_analytics(
         self,
         start_date: str,
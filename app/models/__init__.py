@@ -5,10 +5,12 @@ Models are organized by feature and created incrementally:
 - Phase 4: Script
 - Phase 5: Video
 - Phase 6: Upload, Performance, Series
+- GenerationJob: durable, checkpointed video generation queue
 """
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
 from app.models.channel import Channel, ChannelStatus, Persona, TTSService
+from app.models.generation_job import GenerationJob, GenerationStage, JobStatus
 from app.models.performance import Performance
 from app.models.script import Script, ScriptStatus
 from app.models.series import Series, SeriesStatus
@@ -45,4 +47,8 @@ __all__ = [
     "Performance",
     "Series",
     "SeriesStatus",
+    # Generation queue
+    "GenerationJob",
+    "GenerationStage",
+    "JobStatus",
 ]
@@ -0,0 +1,112 @@
+"""Generation job ORM model.
+
+This module defines the GenerationJob model: a durable, database-backed
+work item for turning a script into a video. Jobs record the completion
+of each pipeline stage with its artifact paths and checksums, so a
+restarted worker resumes from the last completed stage instead of
+re-paying for TTS and visuals.
+"""
+
+import enum
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base, TimestampMixin, UUIDMixin
+
+if TYPE_CHECKING:
+    from app.models.script import Script
+
+
+class JobStatus(enum.StrEnum):
+    """Generation job lifecycle status."""
+
+    QUEUED = "queued"  # Waiting for a worker (new or retrying)
+    RUNNING = "running"  # Leased by a worker
+    COMPLETED = "completed"  # Video generated
+    FAILED = "failed"  # Gave up after max_attempts
+
+
+class GenerationStage(enum.StrEnum):
+    """Checkpointed stages of video generation, in execution order."""
+
+    TTS = "tts"
+    CONCAT = "concat"
+    SUBTITLES = "subtitles"
+    VISUALS = "visuals"
+    COMPOSE = "compose"
+    THUMBNAIL = "thumbnail"
+
+
+class GenerationJob(Base, UUIDMixin, TimestampMixin):
+    """Durable video generation job with per-stage checkpoints.
+
+    Uses only portable column types so the queue works on PostgreSQL and
+    SQLite alike.
+
+    Attributes:
+        script_id: Foreign key to scripts table (one job per script)
+        channel_id: Foreign key to channels table
+        status: Current job status
+        payload: Generation parameters (voice_id, tts_provider, template_name)
+        checkpoints: Completed stages keyed by stage name, each with
+            ``artifacts`` ({name: {path, sha256, size}}), ``data`` and
+            ``completed_at``
+        attempts: Number of times the job has been claimed
+        max_attempts: Attempts before the job is marked failed
+        locked_by: Worker currently holding the lease
+        locked_until: Lease expiry; a running job past it can be reclaimed
+        last_error: Error message from the last failed attempt
+        script: Associated script
+    """
+
+    __tablename__ = "generation_jobs"
+
+    # Foreign Keys
+    script_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("scripts.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    channel_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("channels.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    # Status
+    status: Mapped[JobStatus] = mapped_column(
+        String(20), nullable=False, default=JobStatus.QUEUED, index=True
+    )
+
+    # Work definition and progress
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    checkpoints: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+
+    # Leasing and retries
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    locked_by: Mapped[str | None] = mapped_column(String(100))
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_error: Mapped[str | None] = mapped_column(Text)
+
+    # Relationships
+    script: Mapped["Script"] = relationship("Script")
+
+    # Composite Indexes
+    __table_args__ = (Index("idx_generation_job_claim", "status", "locked_until"),)
+
+    @property
+    def completed_stages(self) -> list[GenerationStage]:
+        """Checkpointed stages, in execution order."""
+        return [stage for stage in GenerationStage if stage.value in (self.checkpoints or {})]
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<GenerationJob(id={self.id}, script_id={self.script_id}, status={self.status})>"
+
+
+__all__ = [
+    "GenerationJob",
+    "GenerationStage",
+    "JobStatus",
+]
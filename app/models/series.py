@@ -8,7 +8,7 @@ import enum
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import JSON, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -40,9 +40,13 @@ class Series(Base, UUIDMixin, TimestampMixin):
         criteria_keywords: Keywords for matching topics to series
         criteria_categories: Categories for matching topics
         min_similarity: Minimum similarity for topic clustering
+        term_counts: Episodes containing each term (sparse term centroid)
         episode_count: Number of episodes in series
+        measured_episodes: Episodes with performance data
+        measured_uploads: Upload IDs counted in the performance averages
         avg_views: Average views across episodes
         avg_engagement: Average engagement rate
+        recent_engagement: Exponentially weighted recent engagement rate
         trend: Performance trend (up, down, stable)
         status: Current series status
         auto_detected: Whether series was auto-detected
@@ -68,11 +72,15 @@ class Series(Base, UUIDMixin, TimestampMixin):
     criteria_keywords: Mapped[list[str] | None] = mapped_column(ARRAY(String))
     criteria_categories: Mapped[list[str] | None] = mapped_column(ARRAY(String))
     min_similarity: Mapped[float] = mapped_column(Float, nullable=False, default=0.6)
+    term_counts: Mapped[dict[str, int]] = mapped_column(JSON, nullable=False, default=dict)
 
     # Aggregated Performance
     episode_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    measured_episodes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    measured_uploads: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
     avg_views: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     avg_engagement: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    recent_engagement: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     trend: Mapped[str] = mapped_column(String(20), nullable=False, default="stable")
 
     # Status
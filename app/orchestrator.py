@@ -1,9 +1,19 @@
 """Main automation orchestrator.
 
-Replaces Celery workers with a simple sequential pipeline:
+Replaces Celery workers with a simple staged pipeline:
 collect topics → generate script → generate video → upload
 
-Each channel is processed independently. Each topic produces one video.
+Channels run concurrently, each under its own timeout. Each topic produces
+one video, and topics from all channels flow through shared bounded pools
+per resource class (LLM, network, CPU) that are shared round-robin between
+channels, so rendering one topic overlaps with scripting the next. Each
+pooled stage also runs under a shorter deadline that starts once it holds
+its slot.
+
+Video generation runs as durable jobs (see GenerationJobQueue): every
+completed stage is checkpointed in the database, and jobs left unfinished
+by a crashed or stopped run are resumed from their last completed stage
+on the channel's next run.
 """
 
 from __future__ import annotations
@@ -13,10 +23,13 @@ import contextlib
 import signal
 import uuid
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from app.services.generator.pipeline import VideoGenerationPipeline
+    from app.models.generation_job import GenerationJob
+    from app.models.scene import SceneScript
+    from app.services.generator.job_queue import GenerationJobQueue
+    from app.services.generator.pipeline import VideoGenerationPipeline, VideoGenerationResult
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,19 +37,28 @@ from sqlalchemy.orm import selectinload
 
 from app.config.persona import PersonaConfig
 from app.core.config import get_config
+from app.core.config_loader import load_defaults
 from app.core.database import async_session_maker, close_db
 from app.core.dependencies import (
     close_singletons,
     create_collector_pipeline,
+    create_generation_job_queue,
     create_http_client,
     create_llm_client,
     create_prompt_manager,
     create_script_generator,
     create_video_pipeline,
 )
+from app.core.exceptions import JobLeaseLostError
 from app.core.logging import get_logger
 from app.infrastructure.http_client import HTTPClient
 from app.infrastructure.llm import LLMClient
+from app.infrastructure.resource_pools import (
+    ResourceClass,
+    ResourcePools,
+    current_tenant,
+    resource_slot,
+)
 from app.models.channel import Channel, ChannelStatus
 from app.models.script import Script, ScriptStatus
 from app.models.topic import Topic
@@ -47,6 +69,12 @@ from app.services.script_generator import ScriptGenerator
 logger = get_logger(__name__)
 
 
+def _get_orchestrator_defaults() -> dict[str, Any]:
+    """Get orchestrator defaults from config/defaults.yaml."""
+    orchestrator = load_defaults().get("orchestrator", {})
+    return orchestrator if isinstance(orchestrator, dict) else {}
+
+
 async def get_active_channels(session: AsyncSession) -> list[Channel]:
     """Load all active channels with their personas."""
     result = await session.execute(
@@ -57,15 +85,21 @@ async def get_active_channels(session: AsyncSession) -> list[Channel]:
     return list(result.scalars().all())
 
 
-async def process_channel(channel: Channel) -> int:
+async def process_channel(channel: Channel, resource_pools: ResourcePools | None = None) -> int:
     """Run the full pipeline for one channel.
 
     Steps:
     1. Collect topics
-    2. For each new topic: generate script → generate video → upload
+    2. Resume this channel's unfinished generation jobs
+    3. For each new topic: generate script → generate video → upload
+
+    Topics and resumed jobs are processed concurrently; how many actually
+    run each stage at once is bounded by ``resource_pools``.
 
     Args:
         channel: Active channel to process
+        resource_pools: Pools shared with other channels (created from
+            defaults if not provided)
 
     Returns:
         Number of videos produced
@@ -76,42 +110,77 @@ async def process_channel(channel: Channel) -> int:
     http_client = create_http_client()
     llm_client = create_llm_client()
     prompt_manager = create_prompt_manager()
-
-    videos_produced = 0
+    job_queue = create_generation_job_queue()
 
     # Step 1: Collect topics
     topics = await _collect_topics(channel, http_client, llm_client, prompt_manager)
 
-    if not topics:
+    # Step 2: Find jobs a previous run left unfinished
+    pending_job_ids = await job_queue.pending_job_ids(channel.id)
+
+    if not topics and not pending_job_ids:
         logger.info("no_new_topics", channel=channel.name)
         return 0
 
-    # Step 2: Process each topic individually (1 topic = 1 video)
+    if pending_job_ids:
+        logger.info("resuming_generation_jobs", channel=channel.name, count=len(pending_job_ids))
+
+    # Step 3: Process each topic individually (1 topic = 1 video)
+    pools = resource_pools or ResourcePools.from_defaults()
     script_generator = create_script_generator(llm_client=llm_client, prompt_manager=prompt_manager)
-    video_pipeline = create_video_pipeline(http_client=http_client)
+    video_pipeline = create_video_pipeline(http_client=http_client, resource_pools=pools)
 
     try:
-        for topic in topics:
-            try:
-                produced = await _process_topic(
+        results = await asyncio.gather(
+            *(
+                _resume_job(
+                    channel=channel,
+                    job_id=job_id,
+                    job_queue=job_queue,
+                    video_pipeline=video_pipeline,
+                )
+                for job_id in pending_job_ids
+            ),
+            *(
+                _process_topic(
                     channel=channel,
                     topic=topic,
                     script_generator=script_generator,
                     http_client=http_client,
                     video_pipeline=video_pipeline,
+                    resource_pools=pools,
+                    job_queue=job_queue,
                 )
-                if produced:
-                    videos_produced += 1
-            except Exception:
-                logger.exception(
-                    "topic_processing_failed",
-                    channel=channel.name,
-                    topic=topic.title_normalized,
-                )
-                continue
+                for topic in topics
+            ),
+            return_exceptions=True,
+        )
     finally:
         await video_pipeline.close()
 
+    videos_produced = 0
+    for job_id, result in zip(pending_job_ids, results[: len(pending_job_ids)], strict=True):
+        if isinstance(result, BaseException):
+            logger.error(
+                "generation_job_resume_failed",
+                channel=channel.name,
+                job_id=str(job_id),
+                exc_info=result,
+            )
+        elif result:
+            videos_produced += 1
+
+    for topic, result in zip(topics, results[len(pending_job_ids) :], strict=True):
+        if isinstance(result, BaseException):
+            logger.error(
+                "topic_processing_failed",
+                channel=channel.name,
+                topic=topic.title_normalized,
+                exc_info=result,
+            )
+        elif result:
+            videos_produced += 1
+
     logger.info(
         "channel_processing_complete",
         channel=channel.name,
@@ -166,9 +235,15 @@ async def _process_topic(
     script_generator: ScriptGenerator,
     http_client: HTTPClient,
     video_pipeline: VideoGenerationPipeline,
+    resource_pools: ResourcePools | None = None,
+    job_queue: GenerationJobQueue | None = None,
 ) -> bool:
     """Process a single topic: script → video → upload.
 
+    Script generation holds an LLM slot; the video pipeline acquires
+    network and CPU slots per stage. With a ``job_queue``, the video is
+    generated as a durable, checkpointed job.
+
     Returns True if video generation succeeded.  Upload is not yet
     implemented (Phase 6) so True only indicates a rendered file exists.
     """
@@ -185,12 +260,13 @@ async def _process_topic(
 
     persona_config = _build_persona_config(channel)
 
-    script_result = await script_generator.generate(
-        topic_title=topic.title_normalized,
-        topic_summary=topic.summary or "",
-        topic_terms=topic.terms or [],
-        persona=persona_config,
-    )
+    async with resource_slot(resource_pools, ResourceClass.LLM):
+        script_result = await script_generator.generate(
+            topic_title=topic.title_normalized,
+            topic_summary=topic.summary or "",
+            topic_terms=topic.terms or [],
+            persona=persona_config,
+        )
 
     # Save script to DB
     async with async_session_maker() as session:
@@ -221,12 +297,24 @@ async def _process_topic(
     voice_id = _get_voice_id(channel)
     tts_provider = _get_tts_provider(channel)
 
-    video_result = await video_pipeline.generate(
-        script=script,
-        scene_script=script_result.scene_script,
-        voice_id=voice_id,
-        tts_provider=tts_provider,
-    )
+    if job_queue is None:
+        video_result = await video_pipeline.generate(
+            script=script,
+            scene_script=script_result.scene_script,
+            voice_id=voice_id,
+            tts_provider=tts_provider,
+        )
+    else:
+        job = await job_queue.enqueue(
+            script, payload={"voice_id": voice_id, "tts_provider": tts_provider}
+        )
+        claimed = await job_queue.claim(job_id=job.id)
+        if claimed is None:
+            logger.warning("generation_job_not_claimed", job_id=str(job.id))
+            return False
+        video_result = await _run_job(
+            job_queue, claimed, script, script_result.scene_script, video_pipeline
+        )
 
     logger.info(
         "video_generated",
@@ -239,6 +327,83 @@ async def _process_topic(
     return True
 
 
+async def _resume_job(
+    channel: Channel,
+    job_id: uuid.UUID,
+    job_queue: GenerationJobQueue,
+    video_pipeline: VideoGenerationPipeline,
+) -> bool:
+    """Resume an unfinished generation job from its last completed stage.
+
+    Returns True if the video was generated, False if another worker got
+    the job first or its script cannot be rendered.
+    """
+    job = await job_queue.claim(job_id=job_id)
+    if job is None:
+        return False
+
+    scene_script = job.script.get_scene_script()
+    if scene_script is None:
+        await job_queue.fail(job.id, "Script has no scenes")
+        return False
+
+    logger.info(
+        "generation_job_resuming",
+        channel=channel.name,
+        job_id=str(job.id),
+        attempt=job.attempts,
+        completed_stages=[stage.value for stage in job.completed_stages],
+    )
+    video_result = await _run_job(job_queue, job, job.script, scene_script, video_pipeline)
+
+    logger.info(
+        "video_generated",
+        job_id=str(job.id),
+        duration=video_result.duration_seconds,
+        path=str(video_result.video_path),
+    )
+    return True
+
+
+async def _run_job(
+    job_queue: GenerationJobQueue,
+    job: GenerationJob,
+    script: Script,
+    scene_script: SceneScript,
+    video_pipeline: VideoGenerationPipeline,
+) -> VideoGenerationResult:
+    """Generate a claimed job's video, checkpointing each stage.
+
+    The job is completed on success and failed (requeued until attempts
+    run out) on error. When cancelled (shutdown, channel timeout) the job
+    is released for the next run without counting the attempt.
+    """
+    payload = job.payload or {}
+    try:
+        # Stages can wait for pool slots and run long; keep the lease alive
+        async with job_queue.heartbeat(job.id):
+            video_result = await video_pipeline.generate(
+                script=script,
+                scene_script=scene_script,
+                voice_id=payload.get("voice_id"),
+                tts_provider=payload.get("tts_provider"),
+                template_name=payload.get("template_name"),
+                checkpointer=job_queue.checkpointer(job),
+            )
+    except asyncio.CancelledError:
+        await asyncio.shield(job_queue.release(job.id))
+        raise
+    except JobLeaseLostError:
+        # Another worker owns the job now
+        raise
+    except Exception as e:
+        await job_queue.fail(job.id, str(e) or type(e).__name__)
+        raise
+
+    await job_queue.complete(job.id)
+    return video_result
+
+
 def _build_persona_config(channel: Channel) -> PersonaConfig | None:
     """Build PersonaConfig from channel's persona model."""
     from app.config.persona import CommunicationStyle, Perspective, VoiceConfig
@@ -317,22 +482,19 @@ async def run_once() -> None:
 
     logger.info("active_channels_found", count=len(channels))
 
-    channel_timeout = 30 * 60  # 30 minutes per channel
+    settings = _get_orchestrator_defaults()
+    channel_timeout = int(settings.get("channel_timeout_minutes", 30)) * 60
+    channel_slots = asyncio.Semaphore(int(settings.get("max_concurrent_channels", 4)))
+    pools = ResourcePools.from_defaults()
 
-    total_videos = 0
-    failed_channels: list[str] = []
-    for channel in channels:
-        try:
-            count = await asyncio.wait_for(process_channel(channel), timeout=channel_timeout)
-            total_videos += count
-        except TimeoutError:
-            logger.error("channel_timeout", channel=channel.name, timeout_s=channel_timeout)
-            failed_channels.append(channel.name)
-            continue
-        except Exception:
-            logger.exception("channel_failed", channel=channel.name)
-            failed_channels.append(channel.name)
-            continue
+    counts = await asyncio.gather(
+        *(_run_channel(channel, pools, channel_slots, channel_timeout) for channel in channels)
+    )
+
+    total_videos = sum(count for count in counts if count is not None)
+    failed_channels = [
+        channel.name for channel, count in zip(channels, counts, strict=True) if count is None
+    ]
 
     elapsed = (datetime.now(tz=UTC) - start).total_seconds()
     if failed_channels:
@@ -350,6 +512,38 @@ async def run_once() -> None:
     )
 
 
+async def _run_channel(
+    channel: Channel,
+    resource_pools: ResourcePools,
+    channel_slots: asyncio.Semaphore,
+    channel_timeout: float,
+) -> int | None:
+    """Process one channel under its timeout as a tenant of the shared pools.
+
+    The channel timeout starts once the channel gets a channel slot and
+    bounds everything the channel does. Stage deadlines are enforced
+    separately by ``resource_pools`` once a stage holds its slot.
+
+    Returns:
+        Number of videos produced, or None if the channel failed or timed out
+    """
+    async with channel_slots:
+        # Runs in its own task, so this only tags this channel's work
+        current_tenant.set(str(channel.id))
+        deadline = asyncio.timeout(channel_timeout)
+        try:
+            async with deadline:
+                return await process_channel(channel, resource_pools)
+        except TimeoutError:
+            if deadline.expired():
+                logger.error("channel_timeout", channel=channel.name, timeout_s=channel_timeout)
+            else:
+                logger.exception("channel_failed", channel=channel.name)
+        except Exception:
+            logger.exception("channel_failed", channel=channel.name)
+    return None
+
+
 _shutdown_event: asyncio.Event | None = None
 
 
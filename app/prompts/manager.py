@@ -2,14 +2,25 @@
 
 Loads and renders prompts from YAML files with Mako templating.
 Each template can specify its own LLM settings (model, max_tokens, temperature).
+
+Templates are compiled once and cached until their YAML file changes (by
+mtime). With a module directory, the Python modules Mako generates are also
+written to disk, keyed by a hash of the template source, so restarts skip
+Mako's code generation.
 """
 
+import hashlib
+import importlib.util
+import os
+import time
+from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
+import mako
 import yaml
-from mako.template import Template
+from mako.template import ModuleTemplate, Template
 from pydantic import BaseModel
 
 from app.core.logging import get_logger
@@ -22,6 +33,7 @@ class PromptType(StrEnum):
 
     TRANSLATION = "translation"
     CLASSIFICATION = "classification"
+    BATCH_NORMALIZATION = "batch_normalization"
     CONTENT_CLASSIFICATION = "content_classification"
     SCRIPT_GENERATION = "scene_script_generation"
     QUERY_EXPANSION = "query_expansion"
@@ -40,6 +52,7 @@ class LLMSettings(BaseModel):
     model: str = ""
     max_tokens: int = 500
     temperature: float = 0.3
+    cache_ttl_seconds: int = 0
 
     class Config:
         """Pydantic config."""
@@ -63,6 +76,15 @@ class PromptTemplate(BaseModel):
         frozen = True
 
 
+@dataclass
+class _CachedPrompt:
+    """A loaded template, its compiled form and the YAML mtime it was read at."""
+
+    template: PromptTemplate
+    compiled: Template
+    mtime_ns: int
+
+
 class PromptManager:
     """Manages prompt templates with Mako rendering.
 
@@ -76,23 +98,30 @@ class PromptManager:
         ... )
     """
 
-    def __init__(self, prompts_dir: Path | None = None):
+    def __init__(self, prompts_dir: Path | None = None, module_dir: Path | None = None):
         """Initialize prompt manager.
 
         Args:
             prompts_dir: Directory containing prompt YAML files
                         (defaults to app/prompts/templates/)
+            module_dir: Directory for compiled template modules that survive
+                        restarts (None = compile in memory only)
         """
         if prompts_dir is None:
             prompts_dir = Path(__file__).parent / "templates"
 
         self.prompts_dir = prompts_dir
         self.prompts_dir.mkdir(parents=True, exist_ok=True)
+        self.module_dir = module_dir
 
-        # Cache loaded templates
-        self._cache: dict[PromptType, PromptTemplate] = {}
+        # Cache loaded and compiled templates
+        self._cache: dict[PromptType, _CachedPrompt] = {}
 
-        logger.info("PromptManager initialized", prompts_dir=str(self.prompts_dir))
+        logger.info(
+            "PromptManager initialized",
+            prompts_dir=str(self.prompts_dir),
+            module_dir=str(module_dir) if module_dir else None,
+        )
 
     def load(self, prompt_type: PromptType) -> PromptTemplate:
         """Load prompt template from YAML file.
@@ -105,19 +134,26 @@ class PromptManager:
 
         Raises:
             FileNotFoundError: If prompt file doesn't exist
-            ValueError: If YAML is invalid
+            ValueError: If YAML is invalid or the template does not compile
         """
-        # Check cache
-        if prompt_type in self._cache:
-            return self._cache[prompt_type]
+        return self._load(prompt_type).template
 
+    def _load(self, prompt_type: PromptType) -> _CachedPrompt:
+        """Load and compile a template, reusing the cache while its file is unchanged."""
         yaml_file = self.prompts_dir / f"{prompt_type.value}.yaml"
 
-        if not yaml_file.exists():
+        try:
+            mtime_ns = yaml_file.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Prompt file not found: {yaml_file}\n"
                 f"Expected location: {self.prompts_dir}/{prompt_type.value}.yaml"
-            )
+            ) from None
+
+        # Check cache
+        cached = self._cache.get(prompt_type)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached
 
         try:
             with open(yaml_file, encoding="utf-8") as f:
@@ -131,6 +167,7 @@ class PromptManager:
                 model=data.get("model", ""),
                 max_tokens=data.get("max_tokens", 500),
                 temperature=data.get("temperature", 0.3),
+                cache_ttl_seconds=data.get("cache_ttl_seconds", 0),
             )
 
             template = PromptTemplate(
@@ -141,24 +178,83 @@ class PromptManager:
                 llm_settings=llm_settings,
                 example_variables=data.get("example_variables", {}),
             )
-
-            # Cache it
-            self._cache[prompt_type] = template
-
-            logger.debug(
-                "Loaded prompt template",
-                type=prompt_type.value,
-                version=template.version,
-                model=llm_settings.model,
-            )
-
-            return template
-
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {yaml_file}: {e}") from e
         except KeyError as e:
             raise ValueError(f"Missing required field in {yaml_file}: {e}") from e
 
+        # Cache it
+        cached = _CachedPrompt(
+            template=template,
+            compiled=self._compile(prompt_type, template.template),
+            mtime_ns=mtime_ns,
+        )
+        self._cache[prompt_type] = cached
+
+        logger.debug(
+            "Loaded prompt template",
+            type=prompt_type.value,
+            version=template.version,
+            model=llm_settings.model,
+        )
+
+        return cached
+
+    def _compile(self, prompt_type: PromptType, source: str) -> Template:
+        """Compile template source, through the module directory when configured.
+
+        Raises:
+            ValueError: If the template does not compile
+        """
+        started = time.perf_counter()
+        try:
+            if self.module_dir is None:
+                compiled, from_disk = Template(source), False
+            else:
+                compiled, from_disk = self._compile_module(self.module_dir, prompt_type, source)
+        except Exception as e:
+            raise ValueError(f"Failed to compile {prompt_type.value} template: {e}") from e
+
+        logger.debug(
+            "Compiled prompt template",
+            type=prompt_type.value,
+            from_disk=from_disk,
+            compile_ms=round((time.perf_counter() - started) * 1000, 3),
+        )
+        return compiled
+
+    @staticmethod
+    def _compile_module(
+        module_dir: Path, prompt_type: PromptType, source: str
+    ) -> tuple[Template, bool]:
+        """Load the compiled module for a template source, generating it if needed.
+
+        Modules are named by a hash of the source (and Mako version), so an
+        edited template gets a new module and stale ones are removed.
+
+        Returns:
+            Compiled template and whether it was loaded from an existing module
+        """
+        key = f"{mako.__version__}\0{source}".encode()
+        name = f"{prompt_type.value}_{hashlib.sha256(key).hexdigest()[:16]}"
+        module_file = module_dir / f"{name}.py"
+
+        from_disk = module_file.exists()
+        if not from_disk:
+            module_dir.mkdir(parents=True, exist_ok=True)
+            for stale in module_dir.glob(f"{prompt_type.value}_*.py"):
+                stale.unlink(missing_ok=True)
+            partial = module_file.with_suffix(f".{os.getpid()}.tmp")
+            partial.write_text(Template(source).code, encoding="utf-8")
+            os.replace(partial, module_file)
+
+        spec = importlib.util.spec_from_file_location(f"_prompt_{name}", module_file)
+        if spec is None or spec.loader is None:
+            raise ValueError(f"Cannot load compiled template module {module_file}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return ModuleTemplate(module), from_disk
+
     def render(self, prompt_type: PromptType, **variables: Any) -> str:
         """Render prompt template with variables.
 
@@ -173,17 +269,17 @@ class PromptManager:
             FileNotFoundError: If prompt template doesn't exist
             ValueError: If template rendering fails
         """
-        template_obj = self.load(prompt_type)
+        cached = self._load(prompt_type)
 
         try:
-            # Create Mako template and render
-            mako_template = Template(template_obj.template)
-            rendered = mako_template.render(**variables)
+            started = time.perf_counter()
+            rendered = cached.compiled.render(**variables)
 
             logger.debug(
                 "Rendered prompt",
                 type=prompt_type.value,
                 variables=list(variables.keys()),
+                render_ms=round((time.perf_counter() - started) * 1000, 3),
             )
 
             return str(rendered).strip()  # Explicit cast to str
@@ -10,18 +10,29 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import JSONB, Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.config.youtube_upload import AnalyticsConfig
 from app.core.logging import get_logger
 from app.core.types import SessionFactory
-from app.infrastructure.youtube_api import YouTubeAPIClient
+from app.infrastructure.youtube_api import VideoAnalytics, YouTubeAPIClient
 from app.models.performance import Performance
+from app.models.script import Script
+from app.models.series import Series
+from app.models.topic import Topic
 from app.models.upload import Upload, UploadStatus
+from app.models.video import Video
+from app.services.collector.series_detector import record_episode_performance
 
 logger = get_logger(__name__)
 
+# Performance rows per upsert statement; at under 20 bind parameters per row
+# this stays well under asyncpg's limit of 32767 per statement
+_UPSERT_CHUNK_ROWS = 1000
+
 
 @dataclass
 class PerformanceSnapshot:
@@ -164,9 +175,12 @@ class YouTubeAnalyticsCollector:
 
             # Update or create performance record
             performance = upload.performance
+            previous: tuple[int, float] | None = None
             if not performance:
                 performance = Performance(upload_id=upload_id)
                 session.add(performance)
+            else:
+                previous = (performance.views, performance.engagement_rate)
 
             # Update performance fields
             performance.views = snapshot.views
@@ -195,6 +209,13 @@ class YouTubeAnalyticsCollector:
             else:
                 performance.daily_snapshots = [daily_snapshot]
 
+            # Fold the episode into its series' aggregates
+            series = await self._episode_series(session, upload.video_id)
+            if series is not None:
+                record_episode_performance(
+                    series, upload_id, snapshot.views, engagement_rate, previous
+                )
+
             await session.commit()
 
             logger.info(
@@ -205,6 +226,19 @@ class YouTubeAnalyticsCollector:
 
             return snapshot
 
+    @staticmethod
+    async def _episode_series(session: AsyncSession, video_id: uuid.UUID) -> Series | None:
+        """Series of the topic a video was made from, if any."""
+        result = await session.execute(
+            select(Series)
+            .join(Topic, Topic.series_id == Series.id)
+            .join(Script, Script.topic_id == Topic.id)
+            .join(Video, Video.script_id == Script.id)
+            .where(Video.id == video_id)
+        )
+        series: Series | None = result.scalar_one_or_none()
+        return series
+
     async def sync_channel_uploads(
         self,
         channel_id: uuid.UUID,
@@ -212,6 +246,11 @@ class YouTubeAnalyticsCollector:
     ) -> list[uuid.UUID]:
         """Sync performance for all recent uploads in a channel.
 
+        Fetches metrics with one Analytics report per page of
+        ``bulk_page_size`` videos and upserts the performance records in
+        statements of at most ``_UPSERT_CHUNK_ROWS`` rows. Traffic sources
+        are only refreshed by collect_video_performance().
+
         Args:
             channel_id: Database channel ID
             since_days: Days to look back (default from config)
@@ -220,7 +259,8 @@ class YouTubeAnalyticsCollector:
             List of upload IDs that were synced
         """
         since_days = since_days or self.config.metrics_lookback_days
-        cutoff = datetime.now(tz=UTC) - timedelta(days=since_days)
+        now = datetime.now(tz=UTC)
+        cutoff = now - timedelta(days=since_days)
 
         logger.info(
             "Syncing channel uploads",
@@ -229,29 +269,98 @@ class YouTubeAnalyticsCollector:
         )
 
         async with self.db_session_factory() as session:
-            # Find all completed uploads for the channel
+            # Completed uploads with their current metrics and series, if any
             result = await session.execute(
-                select(Upload)
-                .join(Upload.video)
+                select(
+                    Upload.id,
+                    Upload.youtube_video_id,
+                    Performance.views,
+                    Performance.engagement_rate,
+                    Series,
+                )
+                .join(Video, Upload.video_id == Video.id)
+                .outerjoin(Performance, Performance.upload_id == Upload.id)
+                .outerjoin(Script, Script.id == Video.script_id)
+                .outerjoin(Topic, Topic.id == Script.topic_id)
+                .outerjoin(Series, Series.id == Topic.series_id)
                 .where(
+                    Video.channel_id == channel_id,
                     Upload.upload_status == UploadStatus.COMPLETED,
                     Upload.youtube_video_id.isnot(None),
                     Upload.uploaded_at >= cutoff,
                 )
             )
-            uploads = result.scalars().all()
+            uploads = result.all()
+            if not uploads:
+                logger.info("Channel sync completed", channel_id=str(channel_id), synced_count=0)
+                return []
+
+            end_date = now.strftime("%Y-%m-%d")
+            start_date = (now - timedelta(days=self.config.metrics_lookback_days)).strftime(
+                "%Y-%m-%d"
+            )
 
+            page_size = self.config.bulk_page_size
+            rows: list[dict[str, Any]] = []
             synced_ids: list[uuid.UUID] = []
-            for upload in uploads:
+            for offset in range(0, len(uploads), page_size):
+                page = uploads[offset : offset + page_size]
                 try:
-                    await self.collect_video_performance(upload.id)
-                    synced_ids.append(upload.id)
+                    metrics = await self.youtube_api.get_videos_analytics(
+                        video_ids=[str(video_id) for _, video_id, *_ in page],
+                        start_date=start_date,
+                        end_date=end_date,
+                    )
                 except Exception as e:
                     logger.warning(
-                        "Failed to sync upload",
-                        upload_id=str(upload.id),
+                        "Failed to sync upload page",
+                        channel_id=str(channel_id),
+                        upload_count=len(page),
                         error=str(e),
                     )
+                    continue
+
+                for upload_id, video_id, views, engagement, series in page:
+                    analytics = metrics[str(video_id)]
+                    engagement_rate = _engagement_rate(analytics)
+                    rows.append(
+                        {
+                            "id": uuid.uuid4(),
+                            "upload_id": upload_id,
+                            "views": analytics.views,
+                            "likes": analytics.likes,
+                            "dislikes": analytics.dislikes,
+                            "comments": analytics.comments,
+                            "shares": analytics.shares,
+                            "watch_time_seconds": analytics.watch_time_minutes * 60,
+                            "avg_view_duration": analytics.avg_view_duration_seconds,
+                            "avg_view_percentage": analytics.avg_view_percentage,
+                            "engagement_rate": engagement_rate,
+                            "subscribers_gained": analytics.subscribers_gained,
+                            "subscribers_lost": analytics.subscribers_lost,
+                            "daily_snapshots": [
+                                {
+                                    "date": end_date,
+                                    "views": analytics.views,
+                                    "likes": analytics.likes,
+                                    "engagement_rate": engagement_rate,
+                                }
+                            ],
+                            "last_synced_at": now,
+                        }
+                    )
+                    if series is not None:
+                        previous = None if views is None else (views, engagement)
+                        record_episode_performance(
+                            series, upload_id, analytics.views, engagement_rate, previous
+                        )
+                    synced_ids.append(upload_id)
+
+            if rows:
+                for start in range(0, len(rows), _UPSERT_CHUNK_ROWS):
+                    chunk = rows[start : start + _UPSERT_CHUNK_ROWS]
+                    await session.execute(_performance_upsert(chunk))
+                await session.commit()
 
             logger.info(
                 "Channel sync completed",
@@ -333,6 +442,32 @@ class YouTubeAnalyticsCollector:
             return high_performer_ids
 
 
+def _engagement_rate(analytics: VideoAnalytics) -> float:
+    """Likes and comments per view."""
+    if analytics.views <= 0:
+        return 0.0
+    return (analytics.likes + analytics.comments) / analytics.views
+
+
+def _performance_upsert(rows: list[dict[str, Any]]) -> Insert:
+    """Insert performance rows, updating existing ones by upload.
+
+    Existing daily snapshots are kept and the new snapshot appended.
+    """
+    statement = insert(Performance).values(rows)
+    excluded = statement.excluded
+    updated: dict[str, Any] = {
+        column: excluded[column]
+        for column in rows[0]
+        if column not in ("id", "upload_id", "daily_snapshots")
+    }
+    updated["daily_snapshots"] = func.coalesce(Performance.daily_snapshots, literal([], JSONB)).op(
+        "||"
+    )(excluded.daily_snapshots)
+    updated["updated_at"] = func.now()
+    return statement.on_conflict_do_update(index_elements=[Performance.upload_id], set_=updated)
+
+
 __all__ = [
     "YouTubeAnalyticsCollector",
     "PerformanceSnapshot",
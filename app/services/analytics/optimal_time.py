@@ -1,23 +1,40 @@
 """Optimal upload time analysis service.
 
 This module provides the OptimalTimeAnalyzer for analyzing historical data
-to find the best times for uploading videos.
+to find the best times for uploading videos. Per-slot aggregates are
+computed in the database with a single GROUPING SETS query per channel.
 """
 
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol, Self, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Integer, Select, cast, extract, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.youtube_upload import AnalyticsConfig
 from app.core.logging import get_logger
 from app.core.types import SessionFactory
 from app.models.performance import Performance
 from app.models.upload import Upload, UploadStatus
+from app.models.video import Video
 
 logger = get_logger(__name__)
 
+
+class _Joinable(Protocol):
+    """Select statement of any column types (parametrized differently across SQLAlchemy 2.x)."""
+
+    def join(
+        self, target: Any, onclause: Any = ..., *, isouter: bool = ..., full: bool = ...
+    ) -> Self: ...
+
+    def where(self, *whereclause: Any) -> Self: ...
+
+
+_SelectT = TypeVar("_SelectT", bound=_Joinable)
+
 # Default golden hours for Korean YouTube Shorts
 KOREAN_GOLDEN_HOURS = {
     "weekday": [7, 12, 18, 21],  # Mon-Fri
@@ -46,6 +63,25 @@ class TimeSlot:
     score: float = 0.0
 
 
+@dataclass(frozen=True)
+class SlotStats:
+    """Aggregated performance of the uploads in a time slot.
+
+    Attributes:
+        sample_count: Number of videos
+        avg_views: Average views
+        avg_engagement: Average engagement rate
+        weighted_views: Recency-weighted average views
+        weighted_engagement: Recency-weighted average engagement rate
+    """
+
+    sample_count: int
+    avg_views: float = 0.0
+    avg_engagement: float = 0.0
+    weighted_views: float = 0.0
+    weighted_engagement: float = 0.0
+
+
 @dataclass
 class TimeSlotAnalysis:
     """Analysis of optimal upload time slots.
@@ -94,6 +130,8 @@ class OptimalTimeAnalyzer:
         """
         self.db_session_factory = db_session_factory
         self.config = config or AnalyticsConfig()
+        # (channel, lookback days) -> (data stamp, analysis)
+        self._cache: dict[tuple[uuid.UUID, int], tuple[tuple[Any, ...], TimeSlotAnalysis]] = {}
 
         logger.info("OptimalTimeAnalyzer initialized")
 
@@ -104,6 +142,9 @@ class OptimalTimeAnalyzer:
     ) -> TimeSlotAnalysis:
         """Analyze channel's historical performance by upload time.
 
+        Results are cached per channel and recomputed once the channel's
+        performance data changes (or the day rolls over).
+
         Args:
             channel_id: Database channel ID
             days_lookback: Days of data to analyze (default from config)
@@ -112,166 +153,178 @@ class OptimalTimeAnalyzer:
             TimeSlotAnalysis with best/worst times
         """
         days = days_lookback or self.config.metrics_lookback_days
-        cutoff = datetime.now(tz=UTC) - timedelta(days=days)
-
-        logger.info(
-            "Analyzing channel",
-            channel_id=str(channel_id),
-            days_lookback=days,
-        )
+        now = datetime.now(tz=UTC)
+        cutoff = now - timedelta(days=days)
+        key = (channel_id, days)
 
         async with self.db_session_factory() as session:
-            # Get uploads with performance data
-            result = await session.execute(
-                select(Upload, Performance)
-                .join(Performance, Upload.id == Performance.upload_id)
-                .join(Upload.video)
-                .where(
-                    Upload.upload_status == UploadStatus.COMPLETED,
-                    Upload.uploaded_at >= cutoff,
-                    Upload.uploaded_at.isnot(None),
-                )
-            )
-            rows = result.all()
-
-            if len(rows) < self.config.min_sample_size:
-                logger.info(
-                    "Insufficient data, using defaults",
-                    sample_count=len(rows),
-                    min_required=self.config.min_sample_size,
-                )
-                return self._get_default_analysis(len(rows), days)
-
-            # Aggregate by time slot
-            hour_data: dict[int, list[tuple[float, float]]] = {}
-            day_data: dict[int, list[tuple[float, float]]] = {}
-            slot_data: dict[tuple[int, int], list[tuple[float, float]]] = {}
-
-            for upload, performance in rows:
-                if not upload.uploaded_at:
-                    continue
-
-                hour = upload.uploaded_at.hour
-                day = upload.uploaded_at.weekday()
-                views = float(performance.views)
-                engagement = performance.engagement_rate
-
-                # Aggregate by hour
-                if hour not in hour_data:
-                    hour_data[hour] = []
-                hour_data[hour].append((views, engagement))
-
-                # Aggregate by day
-                if day not in day_data:
-                    day_data[day] = []
-                day_data[day].append((views, engagement))
+            stamp = await self._data_stamp(session, channel_id, cutoff)
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
 
-                # Aggregate by slot (hour, day)
-                slot = (hour, day)
-                if slot not in slot_data:
-                    slot_data[slot] = []
-                slot_data[slot].append((views, engagement))
+            logger.info(
+                "Analyzing channel",
+                channel_id=str(channel_id),
+                days_lookback=days,
+            )
 
-            # Calculate scores
-            analysis = self._calculate_scores(hour_data, day_data, slot_data, len(rows), days)
+            result = await session.execute(self._slot_query(channel_id, cutoff))
+            rows = result.all()
 
+        # GROUPING SETS rows: (hour, day) slots, hour totals (day NULL) and
+        # day totals (hour NULL)
+        hour_stats: dict[int, SlotStats] = {}
+        day_stats: dict[int, SlotStats] = {}
+        slot_stats: dict[tuple[int, int], SlotStats] = {}
+        for hour, day, count, *averages in rows:
+            stats = SlotStats(int(count), *(float(value or 0.0) for value in averages))
+            if hour is not None and day is not None:
+                slot_stats[(int(hour), int(day))] = stats
+            elif hour is not None:
+                hour_stats[int(hour)] = stats
+            elif day is not None:
+                day_stats[int(day)] = stats
+
+        sample_size = sum(stats.sample_count for stats in hour_stats.values())
+        if sample_size < self.config.min_sample_size:
+            logger.info(
+                "Insufficient data, using defaults",
+                sample_count=sample_size,
+                min_required=self.config.min_sample_size,
+            )
+            analysis = self._get_default_analysis(sample_size, days)
+        else:
+            analysis = self._calculate_scores(hour_stats, day_stats, slot_stats, sample_size, days)
             logger.info(
                 "Analysis complete",
                 channel_id=str(channel_id),
-                sample_size=len(rows),
+                sample_size=sample_size,
                 best_hours=analysis.best_hours[:3],
             )
 
-            return analysis
+        self._cache[key] = (stamp, analysis)
+        return analysis
+
+    @staticmethod
+    def _channel_uploads(statement: _SelectT, channel_id: uuid.UUID, cutoff: datetime) -> _SelectT:
+        """Restrict a query to the channel's measured uploads since cutoff."""
+        return (
+            statement.join(Performance, Upload.id == Performance.upload_id)
+            .join(Video, Upload.video_id == Video.id)
+            .where(
+                Video.channel_id == channel_id,
+                Upload.upload_status == UploadStatus.COMPLETED,
+                Upload.uploaded_at >= cutoff,
+                Upload.uploaded_at.isnot(None),
+            )
+        )
+
+    async def _data_stamp(
+        self, session: AsyncSession, channel_id: uuid.UUID, cutoff: datetime
+    ) -> tuple[Any, ...]:
+        """Cheap fingerprint of the data an analysis depends on.
+
+        Changes when performance records are added, synced or removed, and
+        at least daily as the lookback window moves.
+        """
+        result = await session.execute(
+            self._channel_uploads(
+                select(func.count(), func.max(Performance.updated_at)).select_from(Upload),
+                channel_id,
+                cutoff,
+            )
+        )
+        count, last_updated = result.one()
+        return (cutoff.date(), count, last_updated)
+
+    def _slot_query(self, channel_id: uuid.UUID, cutoff: datetime) -> Select[tuple[Any, ...]]:
+        """Aggregate views/engagement by hour, day and (hour, day) in one query.
+
+        Hours and days are taken in UTC, days numbered 0=Monday like
+        ``datetime.weekday()``. Weighted averages decay each upload's weight
+        by its age when ``recency_half_life_days`` is configured.
+        """
+        uploaded_at = func.timezone("UTC", Upload.uploaded_at)
+        weight: ColumnElement[Any] = literal(1.0)
+        if self.config.recency_half_life_days:
+            age_days = extract("epoch", func.now() - Upload.uploaded_at) / 86400.0
+            weight = func.power(0.5, age_days / self.config.recency_half_life_days)
+
+        uploads = self._channel_uploads(
+            select(
+                cast(extract("hour", uploaded_at), Integer).label("hour"),
+                (cast(extract("isodow", uploaded_at), Integer) - 1).label("day"),
+                Performance.views.label("views"),
+                Performance.engagement_rate.label("engagement"),
+                weight.label("weight"),
+            ).select_from(Upload),
+            channel_id,
+            cutoff,
+        ).subquery()
+
+        total_weight = func.nullif(func.sum(uploads.c.weight), 0)
+        return select(
+            uploads.c.hour,
+            uploads.c.day,
+            func.count().label("sample_count"),
+            func.avg(uploads.c.views).label("avg_views"),
+            func.avg(uploads.c.engagement).label("avg_engagement"),
+            (func.sum(uploads.c.weight * uploads.c.views) / total_weight).label("weighted_views"),
+            (func.sum(uploads.c.weight * uploads.c.engagement) / total_weight).label(
+                "weighted_engagement"
+            ),
+        ).group_by(
+            func.grouping_sets(
+                tuple_(uploads.c.hour, uploads.c.day), tuple_(uploads.c.hour), tuple_(uploads.c.day)
+            )
+        )
 
     def _calculate_scores(
         self,
-        hour_data: dict[int, list[tuple[float, float]]],
-        day_data: dict[int, list[tuple[float, float]]],
-        slot_data: dict[tuple[int, int], list[tuple[float, float]]],
+        hour_stats: dict[int, SlotStats],
+        day_stats: dict[int, SlotStats],
+        slot_stats: dict[tuple[int, int], SlotStats],
         sample_size: int,
         days: int,
     ) -> TimeSlotAnalysis:
         """Calculate scores from aggregated data.
 
+        Scores use the (recency-weighted) averages, normalized by the best
+        hour, and are scaled down for slots with few samples.
+
         Args:
-            hour_data: Views/engagement by hour
-            day_data: Views/engagement by day
-            slot_data: Views/engagement by (hour, day) slot
+            hour_stats: Aggregates by hour
+            day_stats: Aggregates by day
+            slot_stats: Aggregates by (hour, day) slot
             sample_size: Total samples
             days: Days of data
 
         Returns:
             TimeSlotAnalysis with calculated scores
         """
-        # Calculate hour scores
-        hour_slots: list[TimeSlot] = []
-        max_views = 1.0
-        max_engagement = 1.0
-
-        for hour, data in hour_data.items():
-            avg_views = sum(v for v, _ in data) / len(data)
-            avg_engagement = sum(e for _, e in data) / len(data)
-            max_views = max(max_views, avg_views)
-            max_engagement = max(max_engagement, avg_engagement)
-            hour_slots.append(
-                TimeSlot(
-                    hour=hour,
-                    avg_views=avg_views,
-                    avg_engagement=avg_engagement,
-                    sample_count=len(data),
-                )
-            )
-
-        # Normalize and score hour slots
+        max_views = max([1.0, *(s.weighted_views for s in hour_stats.values())])
+        max_engagement = max([1.0, *(s.weighted_engagement for s in hour_stats.values())])
         engagement_weight = self.config.engagement_weight
         views_weight = 1 - engagement_weight
 
-        for slot in hour_slots:
-            confidence = min(slot.sample_count / 10, 1.0)
-            view_score = slot.avg_views / max_views if max_views > 0 else 0
-            eng_score = slot.avg_engagement / max_engagement if max_engagement > 0 else 0
-            slot.score = (views_weight * view_score + engagement_weight * eng_score) * confidence
-
-        # Calculate day scores
-        day_slots: list[TimeSlot] = []
-        for day, data in day_data.items():
-            avg_views = sum(v for v, _ in data) / len(data)
-            avg_engagement = sum(e for _, e in data) / len(data)
-            confidence = min(len(data) / 10, 1.0)
-            view_score = avg_views / max_views if max_views > 0 else 0
-            eng_score = avg_engagement / max_engagement if max_engagement > 0 else 0
-            score = (views_weight * view_score + engagement_weight * eng_score) * confidence
-            day_slots.append(
-                TimeSlot(
-                    hour=0,  # Not applicable
-                    day_of_week=day,
-                    avg_views=avg_views,
-                    avg_engagement=avg_engagement,
-                    sample_count=len(data),
-                    score=score,
-                )
+        def to_slot(stats: SlotStats, hour: int, day: int | None, full_confidence: int) -> TimeSlot:
+            confidence = min(stats.sample_count / full_confidence, 1.0)
+            view_score = stats.weighted_views / max_views
+            eng_score = stats.weighted_engagement / max_engagement
+            return TimeSlot(
+                hour=hour,
+                day_of_week=day,
+                avg_views=stats.avg_views,
+                avg_engagement=stats.avg_engagement,
+                sample_count=stats.sample_count,
+                score=(views_weight * view_score + engagement_weight * eng_score) * confidence,
             )
 
-        # Calculate combined slot scores
-        combined_slots: list[TimeSlot] = []
-        for (hour, day), data in slot_data.items():
-            avg_views = sum(v for v, _ in data) / len(data)
-            avg_engagement = sum(e for _, e in data) / len(data)
-            confidence = min(len(data) / 5, 1.0)
-            view_score = avg_views / max_views if max_views > 0 else 0
-            eng_score = avg_engagement / max_engagement if max_engagement > 0 else 0
-            score = (views_weight * view_score + engagement_weight * eng_score) * confidence
-            combined_slots.append(
-                TimeSlot(
-                    hour=hour,
-                    day_of_week=day,
-                    avg_views=avg_views,
-                    avg_engagement=avg_engagement,
-                    sample_count=len(data),
-                    score=score,
-                )
-            )
+        hour_slots = [to_slot(stats, hour, None, 10) for hour, stats in hour_stats.items()]
+        # Hour is not applicable for day totals
+        day_slots = [to_slot(stats, 0, day, 10) for day, stats in day_stats.items()]
+        combined_slots = [to_slot(stats, hour, day, 5) for (hour, day), stats in slot_stats.items()]
 
         # Sort and select best/worst
         hour_slots.sort(key=lambda x: x.score, reverse=True)
@@ -282,9 +335,9 @@ class OptimalTimeAnalyzer:
         best_days = [s.day_of_week for s in day_slots[:3] if s.day_of_week is not None]
 
         # Build confidence scores
-        confidence_scores = {}
-        for slot in hour_slots:
-            confidence_scores[f"hour_{slot.hour}"] = min(slot.sample_count / 10, 1.0)
+        confidence_scores = {
+            f"hour_{slot.hour}": min(slot.sample_count / 10, 1.0) for slot in hour_slots
+        }
 
         return TimeSlotAnalysis(
             best_hours=best_hours,
@@ -375,6 +428,7 @@ class OptimalTimeAnalyzer:
 
 __all__ = [
     "OptimalTimeAnalyzer",
+    "SlotStats",
     "TimeSlotAnalysis",
     "TimeSlot",
 ]
@@ -4,7 +4,9 @@ This package implements the topic collection pipeline:
 1. Source collectors fetch raw topics from external sources
 2. Normalizer translates, cleans, and classifies topics
 3. Filter applies include/exclude rules
-4. Deduplication via DB hash check
+4. Deduplication: near-duplicate clusters (MinHash/LSH) and DB hash check
+5. Scorer ranks the batch before saving
+6. Series detector assigns saved topics to (auto-detected) series
 """
 
 from app.services.collector.base import (
@@ -15,7 +17,10 @@ from app.services.collector.base import (
     ScoredTopic,
 )
 from app.services.collector.filter import FilterReason, FilterResult, TopicFilter
+from app.services.collector.near_duplicates import NearDuplicateDetector, NearDuplicateStore
 from app.services.collector.normalizer import ClassificationResult, TopicNormalizer
+from app.services.collector.scorer import TopicScorer
+from app.services.collector.series_detector import SeriesDetector
 
 __all__ = [
     # Base DTOs
@@ -31,4 +36,9 @@ __all__ = [
     "TopicFilter",
     "FilterResult",
     "FilterReason",
+    # Deduplication and scoring
+    "NearDuplicateDetector",
+    "NearDuplicateStore",
+    "TopicScorer",
+    "SeriesDetector",
 ]
@@ -6,6 +6,7 @@ used throughout the topic collection pipeline.
 
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any, Generic, TypeVar
 
@@ -179,6 +180,22 @@ class BaseSource(ABC, Generic[ConfigT]):
         """
         ...
 
+    async def stream(self, params: dict[str, Any] | None = None) -> AsyncIterator[list[RawTopic]]:
+        """Collect raw topics incrementally, yielding batches as they arrive.
+
+        Lets the pipeline start normalizing early results before slow
+        endpoints respond, and keep what arrived if a deadline expires.
+        The default yields collect() as a single batch; sources that query
+        several endpoints override this to yield per endpoint.
+
+        Args:
+            params: Collection parameters (channel-specific overrides)
+
+        Yields:
+            Batches of raw topics
+        """
+        yield await self.collect(params)
+
     @abstractmethod
     async def health_check(self) -> bool:
         """Check if source is accessible and healthy.
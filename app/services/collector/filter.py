@@ -1,15 +1,22 @@
 """Topic filtering service.
 
 Filtering happens after normalization, before scoring.
+
+Include and exclude terms are compiled into one Aho-Corasick automaton
+(TermMatcher), cached per filtering config, so each topic is scanned once
+regardless of how many terms are configured.
 """
 
+from collections.abc import Sequence
 from enum import StrEnum
+from functools import lru_cache
 
 from pydantic import BaseModel, Field
 
-from app.config.filtering import FilteringConfig
+from app.config.filtering import FilteringConfig, TermMatchMode
 from app.core.logging import get_logger
 from app.services.collector.base import NormalizedTopic
+from app.services.collector.term_matcher import TermMatcher
 
 logger = get_logger(__name__)
 
@@ -27,17 +34,32 @@ class FilterResult(BaseModel):
     Attributes:
         passed: Whether the topic passed filtering
         reason: Reason for rejection (if not passed)
-        matched_terms: Terms that matched include filters
+        matched_terms: Terms that matched include filters, in order of
+            first occurrence
+        excluded_term: Exclude term that rejected the topic
     """
 
     passed: bool
     reason: FilterReason | None = None
     matched_terms: list[str] = Field(default_factory=list)
+    excluded_term: str | None = None
+
+
+@lru_cache(maxsize=64)
+def _compile_matcher(
+    include: tuple[str, ...], exclude: tuple[str, ...], mode: TermMatchMode
+) -> TermMatcher:
+    """Compile the terms of a filtering config (cached per config)."""
+    return TermMatcher((*exclude, *include), mode=mode)
 
 
 class TopicFilter:
     """Filters topics based on include/exclude rules.
 
+    Example:
+        >>> topic_filter = TopicFilter(FilteringConfig(include=["ai"], exclude=["광고"]))
+        >>> passed = [t for t, r in zip(topics, topic_filter.filter_many(topics)) if r.passed]
+
     Attributes:
         config: Filtering configuration
     """
@@ -49,8 +71,11 @@ class TopicFilter:
             config: Filter configuration (uses empty config if not provided)
         """
         self.config = config or FilteringConfig()
-        self._include = {t.lower() for t in self.config.include}
-        self._exclude = {t.lower() for t in self.config.exclude}
+        include = tuple(dict.fromkeys(t.lower() for t in self.config.include))
+        exclude = tuple(dict.fromkeys(t.lower() for t in self.config.exclude))
+        self._include = frozenset(include)
+        self._exclude = frozenset(exclude)
+        self._matcher = _compile_matcher(include, exclude, self.config.match_mode)
 
     def filter(self, topic: NormalizedTopic) -> FilterResult:
         """Filter a topic based on configured rules.
@@ -61,42 +86,65 @@ class TopicFilter:
         Returns:
             FilterResult with pass/fail status and details
         """
-        searchable_text = self._build_searchable_text(topic)
-
-        # Step 1: Check exclude terms (hard reject)
-        for term in self._exclude:
-            if term in searchable_text:
-                logger.debug(
-                    "Topic excluded by term",
-                    title=topic.title_normalized[:50],
-                    excluded_term=term,
-                )
-                return FilterResult(
-                    passed=False,
-                    reason=FilterReason.EXCLUDED_TERM,
-                )
-
-        # Step 2: Check include terms (at least one must match)
-        matched_terms = []
-        if self._include:
-            for term in self._include:
-                if term in searchable_text:
-                    matched_terms.append(term)
-
-            if not matched_terms:
-                logger.debug(
-                    "Topic rejected: no include term match",
-                    title=topic.title_normalized[:50],
-                )
-                return FilterResult(
-                    passed=False,
-                    reason=FilterReason.NO_INCLUDE_MATCH,
-                )
+        result = self._evaluate(topic)
 
+        if result.reason == FilterReason.EXCLUDED_TERM:
+            logger.debug(
+                "Topic excluded by term",
+                title=topic.title_normalized[:50],
+                excluded_term=result.excluded_term,
+            )
+        elif result.reason == FilterReason.NO_INCLUDE_MATCH:
+            logger.debug(
+                "Topic rejected: no include term match",
+                title=topic.title_normalized[:50],
+            )
+        elif result.matched_terms:
             logger.debug(
                 "Topic matched terms",
                 title=topic.title_normalized[:50],
-                matched_terms=matched_terms[:5],
+                matched_terms=result.matched_terms[:5],
+            )
+
+        return result
+
+    def filter_many(self, topics: Sequence[NormalizedTopic]) -> list[FilterResult]:
+        """Filter a batch of topics.
+
+        Args:
+            topics: Normalized topics to filter
+
+        Returns:
+            FilterResults aligned with ``topics``
+        """
+        results = [self._evaluate(topic) for topic in topics]
+        logger.debug(
+            "Filtered topics",
+            total=len(results),
+            passed=sum(result.passed for result in results),
+            excluded=sum(result.reason == FilterReason.EXCLUDED_TERM for result in results),
+        )
+        return results
+
+    def _evaluate(self, topic: NormalizedTopic) -> FilterResult:
+        """Match all terms against a topic in one pass and apply the rules."""
+        found = self._matcher.find_all(self._build_searchable_text(topic))
+
+        # Step 1: Check exclude terms (hard reject)
+        excluded = next((term for term in found if term in self._exclude), None)
+        if excluded is not None:
+            return FilterResult(
+                passed=False,
+                reason=FilterReason.EXCLUDED_TERM,
+                excluded_term=excluded,
+            )
+
+        # Step 2: Check include terms (at least one must match)
+        matched_terms = [term for term in found if term in self._include]
+        if self._include and not matched_terms:
+            return FilterResult(
+                passed=False,
+                reason=FilterReason.NO_INCLUDE_MATCH,
             )
 
         return FilterResult(
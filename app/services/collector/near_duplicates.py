@@ -0,0 +1,528 @@
+"""Near-duplicate topic detection with MinHash and LSH.
+
+The content hash only catches an identical title from the same URL, so one
+story reported by Reddit, an RSS feed and Google Trends would become three
+topics (and three videos). This module groups such reports into clusters:
+
+- MinHasher: MinHash signatures of a topic's token set
+- LSHIndex: banded signature buckets; a lookup touches ``bands`` buckets
+  instead of every indexed topic
+- NearDuplicateIndex: a channel's indexed topics and their clusters
+- NearDuplicateStore: SQLite persistence of saved topics between runs
+- NearDuplicateDetector: clusters a collection batch against the channel's
+  rolling window
+
+Usage:
+    detector = NearDuplicateDetector(store=NearDuplicateStore(path))
+    clusters = await detector.cluster(channel.id, topics)
+    fresh = [c.representative for c in clusters if not c.seen_before]
+    ...
+    await detector.remember(channel.id, saved_clusters)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from app.core.config_loader import load_defaults
+from app.core.logging import get_logger
+from app.infrastructure.tokenizer import tokenize_without_stopwords
+from app.services.collector.base import NormalizedTopic, RawTopic
+from app.services.collector.scorer import SOURCE_KEY
+
+logger = get_logger(__name__)
+
+SignatureArray = npt.NDArray[np.uint32]
+
+# Universal hashing (a * x + b) mod p of 32-bit token hashes, truncated to
+# 32 bits. a < 2**31 keeps a * x + b below 2**64, so uint64 never wraps.
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_MAX_MULTIPLIER = 1 << 31
+
+
+def _get_near_duplicate_defaults() -> dict[str, Any]:
+    """Get near-duplicate settings from config/defaults.yaml."""
+    collector = load_defaults().get("collector", {})
+    settings = collector.get("near_duplicates", {}) if isinstance(collector, dict) else {}
+    return settings if isinstance(settings, dict) else {}
+
+
+def topic_tokens(norm: NormalizedTopic) -> set[str]:
+    """Token set used to compare topics.
+
+    Uses the title in the target language (so translated reports of the same
+    story overlap) plus the extracted terms.
+
+    Args:
+        norm: Normalized topic
+
+    Returns:
+        Lowercased tokens without stopwords
+    """
+    title = norm.title_translated or norm.title_normalized
+    tokens = set(tokenize_without_stopwords(title))
+    tokens.update(term.lower() for term in norm.terms if term.strip())
+    return tokens
+
+
+class MinHasher:
+    """MinHash signatures with ``num_perm`` seeded hash permutations.
+
+    Token hashes use BLAKE2b (not Python's salted ``hash``), so signatures
+    are stable across processes and can be persisted.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1) -> None:
+        """Initialize MinHasher.
+
+        Args:
+            num_perm: Signature length
+            seed: Seed for the permutation parameters
+        """
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, _MAX_MULTIPLIER, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MAX_HASH, size=num_perm, dtype=np.uint64)
+
+    def signature(self, tokens: Iterable[str]) -> SignatureArray:
+        """Compute the MinHash signature of a token set.
+
+        Args:
+            tokens: Tokens (duplicates are ignored)
+
+        Returns:
+            Signature of length ``num_perm``
+        """
+        unique = set(tokens)
+        if not unique:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+
+        hashes = np.fromiter(
+            (
+                int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), "little")
+                for token in unique
+            ),
+            dtype=np.uint64,
+            count=len(unique),
+        )
+        # (tokens x permutations)
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        signature: SignatureArray = permuted.min(axis=0).astype(np.uint32)
+        return signature
+
+
+def estimate_similarity(
+    signature: SignatureArray, others: SignatureArray
+) -> npt.NDArray[np.float64]:
+    """Estimate Jaccard similarity from MinHash signatures.
+
+    Args:
+        signature: Signature of shape (num_perm,)
+        others: Signatures of shape (n, num_perm)
+
+    Returns:
+        Similarity of ``signature`` to each row of ``others``
+    """
+    similarity: npt.NDArray[np.float64] = np.mean(others == signature, axis=1)
+    return similarity
+
+
+class LSHIndex:
+    """Locality-sensitive hashing over MinHash signature bands.
+
+    Signatures are split into ``bands`` bands of ``rows`` values; topics
+    sharing any whole band become candidates. Pairs with Jaccard similarity
+    around ``(1 / bands) ** (1 / rows)`` or higher are likely to collide.
+    """
+
+    def __init__(self, bands: int, rows: int) -> None:
+        """Initialize LSHIndex.
+
+        Args:
+            bands: Number of bands
+            rows: Signature values per band
+        """
+        self.bands = bands
+        self.rows = rows
+        self._buckets: list[defaultdict[bytes, list[int]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+
+    def _band_keys(self, signature: SignatureArray) -> list[bytes]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def insert(self, key: int, signature: SignatureArray) -> None:
+        """Index a signature under ``key``."""
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature), strict=True):
+            buckets[band_key].append(key)
+
+    def candidates(self, signature: SignatureArray) -> set[int]:
+        """Keys sharing at least one band with ``signature``."""
+        found: set[int] = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature), strict=True):
+            found.update(buckets.get(band_key, ()))
+        return found
+
+
+@dataclass
+class IndexedTopic:
+    """A topic signature kept in a channel's index.
+
+    Attributes:
+        cluster_id: Cluster (story) the topic belongs to
+        source: Source the topic was collected from
+        signature: MinHash signature
+        seen_at: Unix time the topic was indexed
+    """
+
+    cluster_id: str
+    source: str
+    signature: SignatureArray
+    seen_at: float
+
+
+class NearDuplicateIndex:
+    """In-memory index of a channel's topics, grouped into clusters."""
+
+    def __init__(self, bands: int, rows: int, threshold: float) -> None:
+        """Initialize NearDuplicateIndex.
+
+        Args:
+            bands: LSH bands
+            rows: LSH rows per band
+            threshold: Minimum estimated similarity to join a cluster
+        """
+        self.threshold = threshold
+        self.entries: list[IndexedTopic] = []
+        self._lsh = LSHIndex(bands, rows)
+
+    def __len__(self) -> int:
+        """Number of indexed topics."""
+        return len(self.entries)
+
+    def add(self, entry: IndexedTopic) -> None:
+        """Index a topic."""
+        self._lsh.insert(len(self.entries), entry.signature)
+        self.entries.append(entry)
+
+    def find_cluster(self, signature: SignatureArray) -> str | None:
+        """Cluster of the most similar indexed topic above the threshold.
+
+        Only LSH candidates are compared, so lookups do not scan the index.
+
+        Args:
+            signature: Signature to look up
+
+        Returns:
+            Matching cluster ID, or None
+        """
+        candidates = sorted(self._lsh.candidates(signature))
+        if not candidates:
+            return None
+
+        similarity = estimate_similarity(
+            signature, np.stack([self.entries[i].signature for i in candidates])
+        )
+        best = int(np.argmax(similarity))
+        if similarity[best] < self.threshold:
+            return None
+        return self.entries[candidates[best]].cluster_id
+
+
+class NearDuplicateStore:
+    """SQLite store for indexed topics, per channel.
+
+    Queries run in a worker thread so the event loop is never blocked on
+    disk I/O. Rows older than the window are purged on write.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize NearDuplicateStore.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS near_duplicates ("
+                "channel_id TEXT NOT NULL, cluster_id TEXT NOT NULL, source TEXT NOT NULL, "
+                "signature BLOB NOT NULL, seen_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_near_duplicates_channel "
+                "ON near_duplicates(channel_id, seen_at)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _load_sync(self, channel_id: str, since: float) -> list[IndexedTopic]:
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT cluster_id, source, signature, seen_at FROM near_duplicates "
+                    "WHERE channel_id = ? AND seen_at >= ? ORDER BY seen_at",
+                    (channel_id, since),
+                )
+                .fetchall()
+            )
+        return [
+            IndexedTopic(
+                cluster_id=cluster_id,
+                source=source,
+                signature=np.frombuffer(signature, dtype="<u4").astype(np.uint32),
+                seen_at=seen_at,
+            )
+            for cluster_id, source, signature, seen_at in rows
+        ]
+
+    def _add_sync(self, channel_id: str, entries: list[IndexedTopic], expire_before: float) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT INTO near_duplicates VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        channel_id,
+                        entry.cluster_id,
+                        entry.source,
+                        entry.signature.astype("<u4").tobytes(),
+                        entry.seen_at,
+                    )
+                    for entry in entries
+                ],
+            )
+            conn.execute(
+                "DELETE FROM near_duplicates WHERE channel_id = ? AND seen_at < ?",
+                (channel_id, expire_before),
+            )
+            conn.commit()
+
+    async def load(self, channel_id: str, since: float) -> list[IndexedTopic]:
+        """Load a channel's topics indexed at or after ``since``.
+
+        Args:
+            channel_id: Channel identifier
+            since: Unix time of the window start
+
+        Returns:
+            Indexed topics, oldest first (empty if the store is unreadable)
+        """
+        try:
+            return await asyncio.to_thread(self._load_sync, channel_id, since)
+        except sqlite3.Error as e:
+            logger.warning("near_duplicate_load_failed", channel_id=channel_id, error=str(e))
+            return []
+
+    async def add(self, channel_id: str, entries: list[IndexedTopic], expire_before: float) -> None:
+        """Store topics and purge the channel's expired rows.
+
+        Args:
+            channel_id: Channel identifier
+            entries: Topics to store
+            expire_before: Unix time before which rows are deleted
+        """
+        try:
+            await asyncio.to_thread(self._add_sync, channel_id, entries, expire_before)
+        except sqlite3.Error as e:
+            logger.warning("near_duplicate_write_failed", channel_id=channel_id, error=str(e))
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+@dataclass
+class DuplicateCluster:
+    """Reports of one story within a collection batch.
+
+    Attributes:
+        cluster_id: Cluster identifier (stable across runs)
+        members: (raw, normalized) topics, in batch order
+        signatures: MinHash signature of each member (None without tokens)
+        seen_before: Whether the story was saved in an earlier run
+    """
+
+    cluster_id: str
+    members: list[tuple[RawTopic, NormalizedTopic]] = field(default_factory=list)
+    signatures: list[SignatureArray | None] = field(default_factory=list)
+    seen_before: bool = False
+
+    @property
+    def representative(self) -> tuple[RawTopic, NormalizedTopic]:
+        """The first report, which stands for the cluster."""
+        return self.members[0]
+
+    @property
+    def sources(self) -> set[str]:
+        """Distinct sources reporting the story."""
+        return {_source_name(raw, norm) for raw, norm in self.members}
+
+
+def _source_name(raw: RawTopic, norm: NormalizedTopic) -> str:
+    return str(raw.metadata.get(SOURCE_KEY, norm.source_id))
+
+
+class NearDuplicateDetector:
+    """Cluster collected topics against a channel's recent stories.
+
+    Example:
+        >>> detector = NearDuplicateDetector(store=NearDuplicateStore(path))
+        >>> clusters = await detector.cluster(channel_id, topics)
+        >>> [len(c.sources) for c in clusters]
+    """
+
+    def __init__(
+        self,
+        store: NearDuplicateStore | None = None,
+        num_perm: int | None = None,
+        bands: int | None = None,
+        threshold: float | None = None,
+        window_hours: float | None = None,
+    ) -> None:
+        """Initialize NearDuplicateDetector.
+
+        Unset options come from ``collector.near_duplicates`` in defaults.yaml.
+
+        Args:
+            store: Persistent store (None clusters within a batch only)
+            num_perm: MinHash signature length
+            bands: LSH bands (must divide ``num_perm``)
+            threshold: Minimum estimated Jaccard similarity for duplicates
+            window_hours: How long saved stories are remembered
+        """
+        defaults = _get_near_duplicate_defaults()
+        num_perm = num_perm or int(defaults.get("num_perm", 128))
+        self.bands = bands or int(defaults.get("bands", 32))
+        if num_perm % self.bands:
+            raise ValueError(f"bands ({self.bands}) must divide num_perm ({num_perm})")
+        self.rows = num_perm // self.bands
+        self.threshold = (
+            threshold if threshold is not None else float(defaults.get("threshold", 0.5))
+        )
+        self.window_hours = window_hours or float(defaults.get("window_hours", 72))
+        self.hasher = MinHasher(num_perm=num_perm)
+        self.store = store
+
+    async def cluster(
+        self,
+        channel_id: uuid.UUID | str,
+        topics: Sequence[tuple[RawTopic, NormalizedTopic]],
+        now: float | None = None,
+    ) -> list[DuplicateCluster]:
+        """Group a batch into clusters of near-duplicate reports.
+
+        Topics are matched against each other and against the stories the
+        channel saved within the window.
+
+        Args:
+            channel_id: Channel the batch was collected for
+            topics: (raw, normalized) topic pairs
+            now: Current Unix time (defaults to now)
+
+        Returns:
+            Clusters in order of their first member
+        """
+        now = time.time() if now is None else now
+        index = NearDuplicateIndex(self.bands, self.rows, self.threshold)
+        if self.store is not None:
+            since = now - self.window_hours * 3600
+            for entry in await self.store.load(str(channel_id), since):
+                if len(entry.signature) == self.hasher.num_perm:
+                    index.add(entry)
+        known = {entry.cluster_id for entry in index.entries}
+
+        clusters: dict[str, DuplicateCluster] = {}
+        for raw, norm in topics:
+            tokens = topic_tokens(norm)
+            signature = self.hasher.signature(tokens)
+            # Topics without tokens cannot be compared; keep them as singletons
+            cluster_id = index.find_cluster(signature) if tokens else None
+            if cluster_id is None:
+                cluster_id = uuid.uuid4().hex
+            if tokens:
+                index.add(IndexedTopic(cluster_id, _source_name(raw, norm), signature, now))
+
+            cluster = clusters.get(cluster_id)
+            if cluster is None:
+                cluster = DuplicateCluster(cluster_id=cluster_id, seen_before=cluster_id in known)
+                clusters[cluster_id] = cluster
+            cluster.members.append((raw, norm))
+            cluster.signatures.append(signature if tokens else None)
+
+        logger.info(
+            "near_duplicates_clustered",
+            channel_id=str(channel_id),
+            topics=len(topics),
+            clusters=len(clusters),
+            seen_before=sum(cluster.seen_before for cluster in clusters.values()),
+            indexed=len(known),
+        )
+        return list(clusters.values())
+
+    async def remember(
+        self,
+        channel_id: uuid.UUID | str,
+        clusters: Iterable[DuplicateCluster],
+        now: float | None = None,
+    ) -> None:
+        """Persist the members of saved clusters for later runs.
+
+        Args:
+            channel_id: Channel the clusters belong to
+            clusters: Clusters whose story was saved
+            now: Current Unix time (defaults to now)
+        """
+        if self.store is None:
+            return
+        now = time.time() if now is None else now
+        entries = [
+            IndexedTopic(cluster.cluster_id, _source_name(raw, norm), signature, now)
+            for cluster in clusters
+            for (raw, norm), signature in zip(cluster.members, cluster.signatures, strict=True)
+            if signature is not None
+        ]
+        await self.store.add(str(channel_id), entries, expire_before=now - self.window_hours * 3600)
+
+
+__all__ = [
+    "DuplicateCluster",
+    "IndexedTopic",
+    "LSHIndex",
+    "MinHasher",
+    "NearDuplicateDetector",
+    "NearDuplicateIndex",
+    "NearDuplicateStore",
+    "estimate_similarity",
+    "topic_tokens",
+]
@@ -9,14 +9,16 @@ This module handles:
 6. Hash generation for deduplication
 """
 
+import asyncio
 import hashlib
 import json
 import re
 import uuid
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
+from app.core.config_loader import load_defaults
 from app.core.logging import get_logger
 from app.infrastructure.llm import LLMClient, LLMConfig
 from app.prompts.manager import PromptManager, PromptType
@@ -24,6 +26,15 @@ from app.services.collector.base import NormalizedTopic, RawTopic
 
 logger = get_logger(__name__)
 
+_LANGUAGE_NAMES = {"en": "English", "ko": "Korean"}
+
+
+def _get_normalization_defaults() -> dict[str, Any]:
+    """Get batch normalization defaults from config/defaults.yaml."""
+    collector = load_defaults().get("collector", {})
+    section = collector.get("normalization", {}) if isinstance(collector, dict) else {}
+    return section if isinstance(section, dict) else {}
+
 
 class ClassificationResult(BaseModel):
     """LLM classification result."""
@@ -44,16 +55,25 @@ class TopicNormalizer:
         self,
         llm_client: LLMClient,
         prompt_manager: PromptManager,
+        batch_size: int | None = None,
+        max_concurrent_batches: int | None = None,
     ):
         """Initialize normalizer with API clients.
 
         Args:
             llm_client: LLMClient instance
             prompt_manager: PromptManager for loading templates
+            batch_size: Topics per batched LLM call (defaults from config)
+            max_concurrent_batches: Batched LLM calls in flight (defaults from config)
         """
+        defaults = _get_normalization_defaults()
         self.llm_client = llm_client
         self.prompt_manager = prompt_manager
         self.supported_languages = {"en", "ko"}
+        self.batch_size = max(1, batch_size or defaults.get("batch_size", 10))
+        self.max_concurrent_batches = max(
+            1, max_concurrent_batches or defaults.get("max_concurrent_batches", 4)
+        )
 
     async def normalize(
         self, raw: RawTopic, source_id: uuid.UUID, target_language: str = "ko"
@@ -94,34 +114,16 @@ class TopicNormalizer:
                     title=raw.title[:50],
                 )
 
-            # Clean and normalize title
-            title_normalized = self._clean_title(raw.title)
-
             # Classify and summarize
             classification = await self._classify(raw.title, raw.content)
 
-            # Generate content hash for deduplication
-            content_hash = self._generate_hash(title_normalized, classification.terms)
-
-            normalized = NormalizedTopic(
-                source_id=source_id,
-                source_url=raw.source_url,
-                title_original=raw.title,
-                title_translated=title_translated,
-                title_normalized=title_normalized,
-                summary=classification.summary,
-                terms=classification.terms,
-                entities=classification.entities,
-                language=language,
-                published_at=raw.published_at,
-                content_hash=content_hash,
-                metrics=raw.metrics,
-                metadata=raw.metadata,
+            normalized = self._build_normalized(
+                raw, source_id, language, title_translated, classification
             )
 
             logger.info(
                 "Topic normalized",
-                title=title_normalized[:50],
+                title=normalized.title_normalized[:50],
                 language=language,
                 terms=classification.terms,
             )
@@ -136,6 +138,197 @@ class TopicNormalizer:
             )
             raise
 
+    async def normalize_batch(
+        self,
+        items: list[tuple[RawTopic, uuid.UUID]],
+        target_language: str = "ko",
+    ) -> list[NormalizedTopic | Exception]:
+        """Normalize many topics with batched LLM calls.
+
+        Topics are packed ``batch_size`` at a time into one combined
+        translation + classification prompt, and up to
+        ``max_concurrent_batches`` prompts run at once. Topics missing from
+        or malformed in a batch response fall back to normalize().
+
+        Args:
+            items: (raw topic, source UUID) pairs
+            target_language: Channel's target language (default: "ko")
+
+        Returns:
+            One entry per item in input order: the normalized topic, or the
+            exception raised while normalizing it
+        """
+        if not items:
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        async def _run(
+            chunk: list[tuple[RawTopic, uuid.UUID]],
+        ) -> list[NormalizedTopic | Exception]:
+            async with semaphore:
+                return await self._normalize_chunk(chunk, target_language)
+
+        chunks = [items[i : i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+        chunk_results = await asyncio.gather(*(_run(chunk) for chunk in chunks))
+
+        logger.info(
+            "Batch normalization complete",
+            topics=len(items),
+            batches=len(chunks),
+        )
+        return [result for chunk_result in chunk_results for result in chunk_result]
+
+    async def _normalize_chunk(
+        self,
+        chunk: list[tuple[RawTopic, uuid.UUID]],
+        target_language: str,
+    ) -> list[NormalizedTopic | Exception]:
+        """Normalize one batch with a single LLM call, falling back per item.
+
+        Args:
+            chunk: (raw topic, source UUID) pairs in this batch
+            target_language: Channel's target language
+
+        Returns:
+            Normalized topics (or exceptions) in chunk order
+        """
+        languages = [await self._detect_language(raw.title) for raw, _ in chunk]
+        raws = [raw for raw, _ in chunk]
+
+        try:
+            parsed = await self._translate_and_classify_batch(raws, languages, target_language)
+        except Exception as e:
+            logger.warning("batch_normalization_failed", size=len(chunk), error=str(e))
+            parsed = {}
+
+        results: list[NormalizedTopic | Exception] = []
+        for index, ((raw, source_id), language) in enumerate(zip(chunk, languages, strict=True)):
+            needs_translation = language != target_language
+            item = parsed.get(index)
+            try:
+                if item is None:
+                    raise ValueError("missing from batch response")
+                classification = ClassificationResult(
+                    terms=[str(t).lower() for t in item.get("terms") or []] or ["general"],
+                    entities=item.get("entities") or {},
+                    summary=item.get("summary") or raw.title[:200],
+                )
+                translation = item.get("translation")
+                if needs_translation and not (isinstance(translation, str) and translation.strip()):
+                    raise ValueError("missing translation")
+            except (ValueError, TypeError, AttributeError, ValidationError) as e:
+                logger.debug("batch_item_fallback", title=raw.title[:50], reason=str(e))
+                try:
+                    results.append(await self.normalize(raw, source_id, target_language))
+                except Exception as fallback_error:
+                    results.append(fallback_error)
+                continue
+
+            title_translated = (
+                translation.strip() if needs_translation and isinstance(translation, str) else None
+            )
+            results.append(
+                self._build_normalized(raw, source_id, language, title_translated, classification)
+            )
+
+        return results
+
+    async def _translate_and_classify_batch(
+        self,
+        raws: list[RawTopic],
+        languages: list[str],
+        target_language: str,
+    ) -> dict[int, dict[str, Any]]:
+        """Translate and classify a batch of topics in one LLM call.
+
+        Args:
+            raws: Raw topics in the batch
+            languages: Detected language per topic
+            target_language: Channel's target language
+
+        Returns:
+            Parsed result objects keyed by their position in the batch
+        """
+        topics = [
+            {
+                "id": index,
+                "title": raw.title,
+                "content": raw.content if raw.content and len(raw.content) < 1000 else None,
+                "translate": language != target_language,
+            }
+            for index, (raw, language) in enumerate(zip(raws, languages, strict=True))
+        ]
+
+        prompt = self.prompt_manager.render(
+            PromptType.BATCH_NORMALIZATION,
+            target_name=_LANGUAGE_NAMES.get(target_language, target_language),
+            topics_json=json.dumps(topics, ensure_ascii=False),
+        )
+
+        llm_settings = self.prompt_manager.get_llm_settings(PromptType.BATCH_NORMALIZATION)
+        config = LLMConfig.from_prompt_settings(llm_settings)
+
+        response = await self.llm_client.complete(
+            config=config,
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        entries = self._extract_first_json_array(self._strip_code_fence(response.content.strip()))
+
+        parsed: dict[int, dict[str, Any]] = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            index = entry.get("id")
+            if isinstance(index, int) and 0 <= index < len(raws):
+                parsed.setdefault(index, entry)
+
+        logger.debug("Batch classification complete", requested=len(raws), parsed=len(parsed))
+        return parsed
+
+    def _build_normalized(
+        self,
+        raw: RawTopic,
+        source_id: uuid.UUID,
+        language: str,
+        title_translated: str | None,
+        classification: ClassificationResult,
+    ) -> NormalizedTopic:
+        """Assemble a NormalizedTopic from normalization results.
+
+        Args:
+            raw: Raw topic from source
+            source_id: Source UUID
+            language: Detected source language
+            title_translated: Translated title (None if not translated)
+            classification: Terms, entities and summary
+
+        Returns:
+            Normalized topic
+        """
+        # Clean and normalize title
+        title_normalized = self._clean_title(raw.title)
+
+        # Generate content hash for deduplication
+        content_hash = self._generate_hash(title_normalized, classification.terms)
+
+        return NormalizedTopic(
+            source_id=source_id,
+            source_url=raw.source_url,
+            title_original=raw.title,
+            title_translated=title_translated,
+            title_normalized=title_normalized,
+            summary=classification.summary,
+            terms=classification.terms,
+            entities=classification.entities,
+            language=language,
+            published_at=raw.published_at,
+            content_hash=content_hash,
+            metrics=raw.metrics,
+            metadata=raw.metadata,
+        )
+
     async def _detect_language(self, text: str) -> str:
         """Detect text language using simple heuristics.
 
@@ -168,9 +361,8 @@ class TopicNormalizer:
             Translated text
         """
         try:
-            lang_names = {"en": "English", "ko": "Korean"}
-            source_name = lang_names.get(source_lang, source_lang)
-            target_name = lang_names.get(target_lang, target_lang)
+            source_name = _LANGUAGE_NAMES.get(source_lang, source_lang)
+            target_name = _LANGUAGE_NAMES.get(target_lang, target_lang)
 
             # Render translation prompt from template
             prompt = self.prompt_manager.render(
@@ -280,20 +472,7 @@ class TopicNormalizer:
                 )
 
             # Extract JSON from response (handle markdown code blocks)
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                if json_end != -1:
-                    response_text = response_text[json_start:json_end].strip()
-                else:
-                    response_text = response_text[json_start:].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                if json_end != -1:
-                    response_text = response_text[json_start:json_end].strip()
-                else:
-                    response_text = response_text[json_start:].strip()
+            response_text = self._strip_code_fence(response_text)
 
             # Extract first JSON object (handle extra text after JSON)
             result_dict = self._extract_first_json_object(response_text)
@@ -327,6 +506,27 @@ class TopicNormalizer:
                 summary=title[:200],
             )
 
+    def _strip_code_fence(self, text: str) -> str:
+        """Return the contents of the first markdown code block, if any.
+
+        Args:
+            text: LLM response text
+
+        Returns:
+            Text inside the code block, or the original text
+        """
+        if "```json" in text:
+            json_start = text.find("```json") + 7
+        elif "```" in text:
+            json_start = text.find("```") + 3
+        else:
+            return text
+
+        json_end = text.find("```", json_start)
+        if json_end != -1:
+            return text[json_start:json_end].strip()
+        return text[json_start:].strip()
+
     def _extract_first_json_object(self, text: str) -> dict[str, Any]:
         """Extract the first valid JSON object from text.
 
@@ -338,22 +538,57 @@ class TopicNormalizer:
         Returns:
             Parsed JSON object
 
+        Raises:
+            json.JSONDecodeError: If no valid JSON found
+        """
+        result: dict[str, Any] = self._extract_first_json_value(text, "{", "}")
+        return result
+
+    def _extract_first_json_array(self, text: str) -> list[Any]:
+        """Extract the first valid JSON array from text.
+
+        Handles cases where LLM outputs extra text around the array.
+
+        Args:
+            text: Text potentially containing a JSON array
+
+        Returns:
+            Parsed JSON array
+
+        Raises:
+            json.JSONDecodeError: If no valid JSON array found
+        """
+        result: list[Any] = self._extract_first_json_value(text, "[", "]")
+        return result
+
+    def _extract_first_json_value(self, text: str, open_char: str, close_char: str) -> Any:
+        """Extract the first complete JSON value delimited by open/close characters.
+
+        Args:
+            text: Text potentially containing JSON
+            open_char: Opening delimiter ("{" or "[")
+            close_char: Closing delimiter ("}" or "]")
+
+        Returns:
+            Parsed JSON value
+
         Raises:
             json.JSONDecodeError: If no valid JSON found
         """
         # Try parsing the whole text first
         try:
-            result: dict[str, Any] = json.loads(text)
-            return result
+            parsed = json.loads(text)
+            if text.lstrip().startswith(open_char):
+                return parsed
         except json.JSONDecodeError:
             pass
 
-        # Find the first { and try to find matching }
-        start = text.find("{")
+        # Find the first opening delimiter and try to find the matching close
+        start = text.find(open_char)
         if start == -1:
             raise json.JSONDecodeError("No JSON object found", text, 0)
 
-        # Track brace nesting to find the complete object
+        # Track nesting to find the complete value
         depth = 0
         in_string = False
         escape_next = False
@@ -374,17 +609,15 @@ class TopicNormalizer:
             if in_string:
                 continue
 
-            if char == "{":
+            if char == open_char:
                 depth += 1
-            elif char == "}":
+            elif char == close_char:
                 depth -= 1
                 if depth == 0:
-                    # Found complete JSON object
-                    json_str = text[start : i + 1]
-                    parsed: dict[str, Any] = json.loads(json_str)
-                    return parsed
+                    # Found complete JSON value
+                    return json.loads(text[start : i + 1])
 
-        # If we get here, no complete object was found
+        # If we get here, no complete value was found
         raise json.JSONDecodeError("Incomplete JSON object", text, len(text))
 
     def _generate_hash(self, title: str, terms: list[str]) -> str:
@@ -3,9 +3,13 @@
 Simplified pipeline for collecting and processing topics:
 1. Collect raw topics from sources (Google Trends, Reddit, RSS)
 2. Normalize (translate, classify, extract terms)
+   Sources are collected concurrently, each under its own deadline, and
+   topics are normalized in batches as they stream in.
 3. Filter (include/exclude terms)
-4. Deduplicate (DB hash-based)
-5. Save to database
+4. Deduplicate: merge near-duplicate reports of one story (MinHash/LSH,
+   also against stories saved in recent runs), then drop exact DB hashes
+5. Score the whole batch and keep the top ``max_topics``
+6. Save to database, assigning topics to (auto-detected) series
 
 Usage:
     pipeline = TopicCollectionPipeline(session, http_client, normalizer)
@@ -14,8 +18,12 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import time
 import uuid
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -25,7 +33,7 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import FilteringConfig
+from app.config import FilteringConfig, TermMatchMode
 from app.core.config_loader import load_defaults
 from app.core.logging import get_logger
 from app.infrastructure.http_client import HTTPClient
@@ -33,7 +41,10 @@ from app.models.channel import Channel
 from app.models.topic import Topic, TopicStatus
 from app.services.collector.base import NormalizedTopic, RawTopic
 from app.services.collector.filter import TopicFilter
+from app.services.collector.near_duplicates import DuplicateCluster, NearDuplicateDetector
 from app.services.collector.normalizer import TopicNormalizer
+from app.services.collector.scorer import SOURCE_KEY, TopicScorer
+from app.services.collector.series_detector import SeriesDetector, SeriesIndex
 from app.services.collector.sources.factory import create_source
 
 logger = get_logger(__name__)
@@ -46,17 +57,30 @@ class CollectionStats(BaseModel):
         total_collected: Total raw topics collected
         normalized_count: Topics after normalization
         filtered_count: Topics after filtering
+        near_duplicate_count: Topics merged into another report of their
+            story, or dropped as a story saved in a recent run
         deduplicated_count: Topics after deduplication
+        top_score: Highest total score in the batch
         saved_count: Topics saved to database
+        series_assigned_count: Saved topics assigned to a series
         errors: List of error messages
+        source_latencies: Seconds spent collecting, per source
+        source_counts: Raw topics kept, per source
+        timed_out_sources: Sources that hit their deadline
     """
 
     total_collected: int = 0
     normalized_count: int = 0
     filtered_count: int = 0
+    near_duplicate_count: int = 0
     deduplicated_count: int = 0
+    top_score: int = 0
     saved_count: int = 0
+    series_assigned_count: int = 0
     errors: list[str] = []
+    source_latencies: dict[str, float] = {}
+    source_counts: dict[str, int] = {}
+    timed_out_sources: list[str] = []
 
 
 def _get_collector_defaults() -> dict[str, Any]:
@@ -76,8 +100,14 @@ class CollectionConfig:
         source_overrides: Per-source configuration overrides
         include: Terms to include
         exclude: Terms to exclude
+        match_mode: How include/exclude terms are matched (substring, word,
+            hangul)
         max_topics: Maximum topics to process
         save_to_db: Whether to save topics to database
+        source_timeout: Deadline in seconds for each source (overridable per
+            source with ``timeout_seconds`` in its overrides)
+        keep_partial_results: Keep topics a source yielded before its
+            deadline expired (otherwise a timed-out source contributes none)
     """
 
     sources: list[str]
@@ -85,9 +115,16 @@ class CollectionConfig:
     source_overrides: dict[str, Any] = field(default_factory=dict)
     include: list[str] = field(default_factory=list)
     exclude: list[str] = field(default_factory=list)
+    match_mode: TermMatchMode = "substring"
     max_topics: int = field(default_factory=lambda: _get_collector_defaults().get("max_topics", 20))
     save_to_db: bool = True
     default_topic_status: TopicStatus = TopicStatus.APPROVED
+    source_timeout: float = field(
+        default_factory=lambda: _get_collector_defaults().get("source_timeout_seconds", 30.0)
+    )
+    keep_partial_results: bool = field(
+        default_factory=lambda: _get_collector_defaults().get("keep_partial_results", True)
+    )
 
     @classmethod
     def from_channel_config(cls, channel_config: dict[str, Any]) -> CollectionConfig:
@@ -112,15 +149,18 @@ class CollectionConfig:
             source_overrides=topic_collection.get("source_overrides", {}),
             include=filtering.get("include", []),
             exclude=filtering.get("exclude", []),
+            match_mode=filtering.get("match_mode", "substring"),
             max_topics=defaults.get("max_topics", 20),
             save_to_db=True,
+            source_timeout=defaults.get("source_timeout_seconds", 30.0),
+            keep_partial_results=defaults.get("keep_partial_results", True),
         )
 
 
 class TopicCollectionPipeline:
     """Simplified topic collection pipeline.
 
-    Pipeline: Collect → Normalize → Filter → Dedup (DB) → Save
+    Pipeline: Collect → Normalize → Filter → Dedup (near-duplicate, DB) → Score → Save
     """
 
     def __init__(
@@ -128,6 +168,8 @@ class TopicCollectionPipeline:
         session: AsyncSession,
         http_client: HTTPClient,
         normalizer: TopicNormalizer,
+        near_duplicates: NearDuplicateDetector | None = None,
+        series_detector: SeriesDetector | None = None,
     ) -> None:
         """Initialize pipeline.
 
@@ -135,10 +177,15 @@ class TopicCollectionPipeline:
             session: Database session
             http_client: HTTP client for source requests
             normalizer: Topic normalizer
+            near_duplicates: Near-duplicate detector (None for exact hash
+                deduplication only)
+            series_detector: Series detector (None to leave topics unassigned)
         """
         self.session = session
         self.http_client = http_client
         self.normalizer = normalizer
+        self.near_duplicates = near_duplicates
+        self.series_detector = series_detector
 
     async def collect_for_channel(
         self,
@@ -157,17 +204,13 @@ class TopicCollectionPipeline:
         stats = CollectionStats()
         logger.info("starting_collection", channel=channel.name)
 
-        # Step 1: Collect raw topics from all sources
-        raw_topics = await self._collect_raw_topics(config, stats)
+        # Steps 1-2: Collect raw topics from all sources, normalizing as they arrive
+        normalized = await self._collect_and_normalize(config, stats)
 
-        if not raw_topics:
+        if not stats.total_collected:
             logger.warning("no_raw_topics", channel=channel.name)
             return [], stats
 
-        stats.total_collected = len(raw_topics)
-
-        # Step 2: Normalize
-        normalized = await self._normalize_topics(raw_topics, config.target_language, stats)
         if not normalized:
             return [], stats
         stats.normalized_count = len(normalized)
@@ -178,44 +221,203 @@ class TopicCollectionPipeline:
             return [], stats
         stats.filtered_count = len(filtered)
 
-        # Step 4: Deduplicate (DB-based)
-        deduplicated = await self._deduplicate_topics(filtered, channel.id)
+        # Step 4: Deduplicate (near-duplicate clusters, then DB hash)
+        merged, clusters = await self._merge_near_duplicates(filtered, channel.id, stats)
+        deduplicated = await self._deduplicate_topics(merged, channel.id)
         stats.deduplicated_count = len(deduplicated)
 
-        # Step 5: Save to DB
+        # Step 5: Score and keep the best topics
+        series_index = (
+            await self.series_detector.load_index(self.session, channel.id)
+            if self.series_detector is not None and deduplicated
+            else None
+        )
+        ranked, scores = self._rank_topics(deduplicated, config, stats, clusters, series_index)
+
+        # Step 6: Save to DB
         topic_status = config.default_topic_status
         if config.save_to_db:
-            saved = await self._save_topics(channel, deduplicated, config.max_topics, topic_status)
+            saved = await self._save_topics(
+                channel,
+                ranked,
+                config.max_topics,
+                topic_status,
+                scores=scores,
+                series_index=series_index,
+            )
             stats.saved_count = len(saved)
+            stats.series_assigned_count = sum(topic.series_id is not None for topic in saved)
+            if saved and self.near_duplicates is not None:
+                await self.near_duplicates.remember(
+                    channel.id, [clusters[id(raw)] for raw, _ in ranked[: config.max_topics]]
+                )
             return saved, stats
 
         topics = [
-            self._create_topic_model(channel, raw, norm, status=topic_status)
-            for raw, norm in deduplicated[: config.max_topics]
+            self._create_topic_model(channel, raw, norm, status=topic_status, scores=score)
+            for (raw, norm), score in zip(ranked, scores, strict=True)
         ]
         return topics, stats
 
-    async def _collect_raw_topics(
+    def _rank_topics(
         self,
+        topics: list[tuple[RawTopic, NormalizedTopic]],
         config: CollectionConfig,
         stats: CollectionStats,
-    ) -> list[RawTopic]:
-        """Collect raw topics from all configured sources."""
-        all_topics: list[RawTopic] = []
-
-        for source_name in config.sources:
-            overrides = config.source_overrides.get(source_name, {})
-            try:
-                source = create_source(source_name, self.http_client, overrides)
-                topics = await source.collect()
-                all_topics.extend(topics)
-                logger.info("source_collected", source=source_name, count=len(topics))
-            except Exception as e:
-                error_msg = f"{source_name} collection failed: {e}"
-                logger.error(error_msg, exc_info=True)
-                stats.errors.append(error_msg)
+        clusters: dict[int, DuplicateCluster] | None = None,
+        series_index: SeriesIndex | None = None,
+    ) -> tuple[list[tuple[RawTopic, NormalizedTopic]], list[dict[str, float]]]:
+        """Score all candidates and select the top ``max_topics``, best first.
+
+        Returns:
+            Tuple of (selected topics, their score fields)
+        """
+        if not topics:
+            return [], []
+
+        source_counts = [len(clusters[id(raw)].sources) for raw, _ in topics] if clusters else None
+        series_performance = (
+            [series_index.performance(norm.terms) for _, norm in topics] if series_index else None
+        )
+        scorer = TopicScorer(include=config.include, source_overrides=config.source_overrides)
+        batch = scorer.score(
+            topics, series_performance=series_performance, source_counts=source_counts
+        )
+        selected = batch.top_k(config.max_topics)
+        stats.top_score = int(batch.total[selected[0]]) if selected else 0
+
+        logger.info(
+            "topics_scored",
+            candidates=len(batch),
+            selected=len(selected),
+            top_score=stats.top_score,
+            cutoff_score=int(batch.total[selected[-1]]) if selected else None,
+        )
+        return [topics[i] for i in selected], [batch.components(i) for i in selected]
+
+    async def _collect_and_normalize(
+        self,
+        config: CollectionConfig,
+        stats: CollectionStats,
+    ) -> list[tuple[RawTopic, NormalizedTopic]]:
+        """Collect from all sources and normalize topics as they stream in.
+
+        Arriving topics are buffered into chunks of the normalizer's batch
+        size, and each full chunk is normalized while collection continues,
+        with at most ``max_concurrent_batches`` chunks in flight. Results are
+        returned in source order regardless of arrival order.
+        """
+        chunk_size = self.normalizer.batch_size
+        semaphore = asyncio.Semaphore(self.normalizer.max_concurrent_batches)
+        tasks: list[asyncio.Task[list[tuple[RawTopic, NormalizedTopic]]]] = []
+        positions: dict[int, tuple[int, int]] = {}  # id(raw) -> (source index, arrival)
+        buffer: list[RawTopic] = []
+
+        async def _normalize(chunk: list[RawTopic]) -> list[tuple[RawTopic, NormalizedTopic]]:
+            async with semaphore:
+                return await self._normalize_topics(chunk, config.target_language, stats)
+
+        def _dispatch() -> None:
+            tasks.append(asyncio.create_task(_normalize(buffer.copy())))
+            buffer.clear()
+
+        try:
+            async with aclosing(self._stream_raw_topics(config, stats)) as batches:
+                async for index, batch in batches:
+                    for topic in batch:
+                        positions[id(topic)] = (index, len(positions))
+                        buffer.append(topic)
+                        if len(buffer) >= chunk_size:
+                            _dispatch()
+            if buffer:
+                _dispatch()
+
+            chunk_results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        stats.total_collected = len(positions)
+        normalized = [pair for chunk in chunk_results for pair in chunk]
+        normalized.sort(key=lambda pair: positions[id(pair[0])])
+        return normalized
+
+    async def _stream_raw_topics(
+        self,
+        config: CollectionConfig,
+        stats: CollectionStats,
+    ) -> AsyncGenerator[tuple[int, list[RawTopic]], None]:
+        """Run all sources concurrently and yield batches as they arrive.
+
+        Yields:
+            (source index in config.sources, batch of raw topics)
+        """
+        queue: asyncio.Queue[tuple[int, list[RawTopic]] | None] = asyncio.Queue()
+        workers = [
+            asyncio.create_task(self._collect_source(index, source_name, config, stats, queue))
+            for index, source_name in enumerate(config.sources)
+        ]
 
-        return all_topics
+        try:
+            remaining = len(workers)
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _collect_source(
+        self,
+        index: int,
+        source_name: str,
+        config: CollectionConfig,
+        stats: CollectionStats,
+        queue: asyncio.Queue[tuple[int, list[RawTopic]] | None],
+    ) -> None:
+        """Collect one source under its deadline, forwarding batches to ``queue``.
+
+        Always enqueues a final ``None`` marker. Errors and timeouts are
+        recorded in stats rather than raised.
+        """
+        overrides = config.source_overrides.get(source_name, {})
+        deadline = float(overrides.get("timeout_seconds", config.source_timeout))
+        pending: list[RawTopic] = []
+        count = 0
+        started = time.perf_counter()
+
+        try:
+            source = create_source(source_name, self.http_client, overrides)
+            async with asyncio.timeout(deadline):
+                async for batch in source.stream():
+                    for topic in batch:
+                        # Lets scoring look up per-source settings (credibility)
+                        topic.metadata.setdefault(SOURCE_KEY, source_name)
+                    if config.keep_partial_results:
+                        count += len(batch)
+                        queue.put_nowait((index, batch))
+                    else:
+                        pending.extend(batch)
+            if pending:
+                count += len(pending)
+                queue.put_nowait((index, pending))
+            logger.info("source_collected", source=source_name, count=count)
+        except TimeoutError:
+            error_msg = f"{source_name} collection timed out after {deadline:g}s"
+            logger.warning(error_msg, kept=count)
+            stats.errors.append(error_msg)
+            stats.timed_out_sources.append(source_name)
+        except Exception as e:
+            error_msg = f"{source_name} collection failed: {e}"
+            logger.error(error_msg, exc_info=True)
+            stats.errors.append(error_msg)
+        finally:
+            stats.source_latencies[source_name] = round(time.perf_counter() - started, 3)
+            stats.source_counts[source_name] = count
+            queue.put_nowait(None)
 
     async def _normalize_topics(
         self,
@@ -223,29 +425,30 @@ class TopicCollectionPipeline:
         target_language: str,
         stats: CollectionStats,
     ) -> list[tuple[RawTopic, NormalizedTopic]]:
-        """Normalize raw topics."""
-        normalized: list[tuple[RawTopic, NormalizedTopic]] = []
-
+        """Normalize raw topics using batched LLM calls."""
+        items: list[tuple[RawTopic, uuid.UUID]] = []
         for raw in raw_topics:
-            try:
-                source_id = getattr(raw, "source_id", None)
-                if source_id is None:
+            source_id = getattr(raw, "source_id", None)
+            if source_id is None:
+                source_id = uuid.uuid4()
+            elif isinstance(source_id, str):
+                try:
+                    source_id = uuid.UUID(source_id)
+                except ValueError:
+                    logger.warning("invalid_uuid_generating_new", source_id=source_id)
                     source_id = uuid.uuid4()
-                elif isinstance(source_id, str):
-                    try:
-                        source_id = uuid.UUID(source_id)
-                    except ValueError:
-                        logger.warning("invalid_uuid_generating_new", source_id=source_id)
-                        source_id = uuid.uuid4()
-
-                norm = await self.normalizer.normalize(
-                    raw, source_id=source_id, target_language=target_language
-                )
-                normalized.append((raw, norm))
-            except Exception as e:
-                error_msg = f"Normalization failed for '{raw.title[:30]}...': {e}"
+            items.append((raw, source_id))
+
+        results = await self.normalizer.normalize_batch(items, target_language=target_language)
+
+        normalized: list[tuple[RawTopic, NormalizedTopic]] = []
+        for raw, result in zip(raw_topics, results, strict=True):
+            if isinstance(result, Exception):
+                error_msg = f"Normalization failed for '{raw.title[:30]}...': {result}"
                 logger.warning(error_msg)
                 stats.errors.append(error_msg)
+                continue
+            normalized.append((raw, result))
 
         return normalized
 
@@ -261,10 +464,34 @@ class TopicCollectionPipeline:
         filter_config = FilteringConfig(
             include=config.include,
             exclude=config.exclude,
+            match_mode=config.match_mode,
         )
-        topic_filter = TopicFilter(filter_config)
+        results = TopicFilter(filter_config).filter_many([norm for _, norm in normalized])
 
-        return [(raw, norm) for raw, norm in normalized if topic_filter.filter(norm).passed]
+        return [pair for pair, result in zip(normalized, results, strict=True) if result.passed]
+
+    async def _merge_near_duplicates(
+        self,
+        topics: list[tuple[RawTopic, NormalizedTopic]],
+        channel_id: uuid.UUID,
+        stats: CollectionStats,
+    ) -> tuple[list[tuple[RawTopic, NormalizedTopic]], dict[int, DuplicateCluster]]:
+        """Keep one report per story not saved in a recent run.
+
+        Returns:
+            Tuple of (cluster representatives, cluster by ``id(raw)`` of
+            each representative)
+        """
+        if self.near_duplicates is None or not topics:
+            return topics, {}
+
+        clusters = await self.near_duplicates.cluster(channel_id, topics)
+        fresh = [cluster for cluster in clusters if not cluster.seen_before]
+        stats.near_duplicate_count = len(topics) - len(fresh)
+        return (
+            [cluster.representative for cluster in fresh],
+            {id(cluster.representative[0]): cluster for cluster in fresh},
+        )
 
     @staticmethod
     def _compute_content_hash(norm: NormalizedTopic) -> str:
@@ -309,16 +536,32 @@ class TopicCollectionPipeline:
         topics: list[tuple[RawTopic, NormalizedTopic]],
         max_topics: int,
         status: TopicStatus = TopicStatus.APPROVED,
+        scores: list[dict[str, float]] | None = None,
+        series_index: SeriesIndex | None = None,
     ) -> list[Topic]:
-        """Save topics to database."""
+        """Save topics to database.
+
+        Args:
+            channel: Channel the topics belong to
+            topics: Topics to save, in priority order
+            max_topics: Maximum topics to save
+            status: Initial topic status
+            scores: Score fields per topic (aligned with ``topics``)
+            series_index: Channel series index to assign topics to series
+        """
         saved: list[Topic] = []
 
-        for raw, norm in topics[:max_topics]:
-            topic = self._create_topic_model(channel, raw, norm, status=status)
+        for index, (raw, norm) in enumerate(topics[:max_topics]):
+            score = scores[index] if scores is not None else None
+            topic = self._create_topic_model(channel, raw, norm, status=status, scores=score)
             self.session.add(topic)
             saved.append(topic)
 
         try:
+            if series_index is not None:
+                for topic in saved:
+                    series_index.assign(topic)
+                await series_index.persist(self.session)
             await self.session.flush()
             await self.session.commit()
         except IntegrityError:
@@ -341,8 +584,27 @@ class TopicCollectionPipeline:
         norm: NormalizedTopic,
         content_hash: str | None = None,
         status: TopicStatus = TopicStatus.APPROVED,
+        scores: dict[str, float] | None = None,
     ) -> Topic:
-        """Create Topic model from processed data."""
+        """Create Topic model from processed data.
+
+        Args:
+            channel: Channel the topic belongs to
+            raw: Raw topic
+            norm: Normalized topic
+            content_hash: Precomputed content hash
+            status: Initial topic status
+            scores: ``score_*`` fields from TopicScorer (zeros if not scored)
+        """
+        score_fields: dict[str, Any] = {
+            "score_source": 0.0,
+            "score_freshness": 0.0,
+            "score_trend": 0.0,
+            "score_relevance": 0.0,
+            "score_total": 0,
+        }
+        if scores:
+            score_fields.update(scores)
         if content_hash is None:
             content_hash = self._compute_content_hash(norm)
         published_at = norm.published_at
@@ -360,15 +622,11 @@ class TopicCollectionPipeline:
             terms=norm.terms or [],
             entities={},
             language=norm.language or "en",
-            score_source=0.0,
-            score_freshness=0.0,
-            score_trend=0.0,
-            score_relevance=0.0,
-            score_total=0.0,
             status=status,
             published_at=published_at,
             expires_at=expires_at,
             content_hash=content_hash,
+            **score_fields,
         )
 
 
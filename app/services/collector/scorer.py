@@ -0,0 +1,351 @@
+"""Topic scoring service.
+
+Scores a whole batch of candidate topics at once with NumPy arrays, then
+selects the best ``k`` with a partial sort, so only the top topics are
+saved (and later spend LLM/TTS budget).
+
+Components (each 0-1), configured under ``scoring`` in defaults.yaml:
+
+- source: source credibility (1-10 in source overrides, scaled to 0-1)
+- freshness: exponential decay with age (halves every half-life)
+- trend: engagement velocity relative to the batch, plus a bonus for
+  stories reported by several sources (near-duplicate clusters when
+  available, otherwise identical titles within the batch)
+- relevance: channel include-term matches, plus a bonus for topics of a
+  well-performing series
+
+``score_total`` is their weighted sum scaled to 0-100.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from app.core.config_loader import load_defaults
+from app.core.logging import get_logger
+from app.services.collector.base import NormalizedTopic, RawTopic
+
+logger = get_logger(__name__)
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+# Metadata key the pipeline stamps on raw topics with the configured source name
+SOURCE_KEY = "collector_source"
+# Numeric metrics counted as engagement (Reddit score/comments, view counts, ...)
+_ENGAGEMENT_METRICS = ("score", "comments", "views", "points", "traffic")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_DEFAULT_WEIGHTS = {"source": 0.2, "freshness": 0.3, "trend": 0.3, "relevance": 0.2}
+
+
+def _get_scoring_defaults() -> dict[str, Any]:
+    """Get scoring defaults from config/defaults.yaml."""
+    scoring = load_defaults().get("scoring", {})
+    return scoring if isinstance(scoring, dict) else {}
+
+
+@dataclass
+class ScoreBatch:
+    """Score components of a topic batch, aligned with the input order.
+
+    Attributes:
+        source: Source credibility scores (0-1)
+        freshness: Freshness scores (0-1)
+        trend: Trend momentum scores (0-1)
+        relevance: Channel relevance scores (0-1)
+        total: Weighted total scores (0-100)
+    """
+
+    source: FloatArray
+    freshness: FloatArray
+    trend: FloatArray
+    relevance: FloatArray
+    total: IntArray
+
+    def __len__(self) -> int:
+        """Number of scored topics."""
+        return len(self.total)
+
+    def top_k(self, k: int) -> list[int]:
+        """Indices of the ``k`` best topics, best first.
+
+        Uses a partial sort (O(n)) to find the ``k``-th best score, then
+        sorts only the topics above it plus the earliest ties at it, so ties
+        keep input order.
+
+        Args:
+            k: Number of topics to select
+
+        Returns:
+            Indices into the scored batch
+        """
+        n = len(self)
+        k = min(max(k, 0), n)
+        if k == 0:
+            return []
+        if k == n:
+            candidates = np.arange(n)
+        else:
+            cutoff = -np.partition(-self.total, k - 1)[k - 1]
+            above = np.flatnonzero(self.total > cutoff)
+            ties = np.flatnonzero(self.total == cutoff)[: k - len(above)]
+            candidates = np.concatenate((above, ties))
+        order = np.lexsort((candidates, -self.total[candidates]))
+        return [int(i) for i in candidates[order]]
+
+    def components(self, index: int) -> dict[str, float]:
+        """Score fields of one topic, named as on the Topic model.
+
+        Args:
+            index: Topic index in the batch
+
+        Returns:
+            Mapping of ``score_*`` field to value
+        """
+        return {
+            "score_source": float(self.source[index]),
+            "score_freshness": float(self.freshness[index]),
+            "score_trend": float(self.trend[index]),
+            "score_relevance": float(self.relevance[index]),
+            "score_total": int(self.total[index]),
+        }
+
+
+class TopicScorer:
+    """Compute topic scores over a whole candidate batch.
+
+    Example:
+        >>> scorer = TopicScorer(include=["ai"], source_overrides=overrides)
+        >>> scores = scorer.score(pairs)
+        >>> best = [pairs[i] for i in scores.top_k(20)]
+    """
+
+    def __init__(
+        self,
+        include: Sequence[str] = (),
+        source_overrides: dict[str, Any] | None = None,
+        scoring: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize TopicScorer.
+
+        Args:
+            include: Channel include terms (relevance)
+            source_overrides: Per-source overrides; ``credibility`` (1-10)
+                sets a source's credibility
+            scoring: Scoring settings (defaults to ``scoring`` in defaults.yaml)
+        """
+        scoring = scoring if scoring is not None else _get_scoring_defaults()
+        self.include = [term.lower() for term in include]
+        self.credibility_scale = float(scoring.get("source_credibility_scale", 10.0))
+        self.default_source_score = float(scoring.get("default_source_score", 0.5))
+        self.decay_base = float(scoring.get("freshness_decay_base", 2.0))
+        self.half_life_hours = float(scoring.get("freshness_half_life_hours", 24.0))
+        self.relevance_saturation = max(1, int(scoring.get("relevance_saturation", 3)))
+        self.multi_source_bonuses = self._bonus_table(scoring.get("multi_source_bonuses", {}))
+        self.series_performance = dict(scoring.get("series_performance", {}))
+
+        weights = {**_DEFAULT_WEIGHTS, **scoring.get("weights", {})}
+        total_weight = sum(weights.values()) or 1.0
+        self.weights = {name: value / total_weight for name, value in weights.items()}
+
+        self.credibility: dict[str, float] = {}
+        for name, override in (source_overrides or {}).items():
+            if isinstance(override, dict) and override.get("credibility") is not None:
+                self.credibility[name] = float(override["credibility"])
+
+    def score(
+        self,
+        topics: Sequence[tuple[RawTopic, NormalizedTopic]],
+        series_performance: Sequence[float | None] | None = None,
+        source_counts: Sequence[int] | None = None,
+        now: datetime | None = None,
+    ) -> ScoreBatch:
+        """Score a batch of topics.
+
+        Args:
+            topics: (raw, normalized) topic pairs
+            series_performance: Performance (0-1) of each topic's series, or
+                None for topics outside a series
+            source_counts: Distinct sources reporting each topic's story (from
+                near-duplicate clustering); defaults to counting identical
+                titles within the batch
+            now: Reference time for freshness (defaults to now)
+
+        Returns:
+            ScoreBatch aligned with ``topics``
+        """
+        now = now or datetime.now(UTC)
+        sources = [str(raw.metadata.get(SOURCE_KEY, norm.source_id)) for raw, norm in topics]
+
+        age_hours = self._age_hours(topics, now)
+        source = self._source_scores(sources)
+        freshness = self._freshness_scores(age_hours)
+        trend = np.clip(
+            self._velocity_scores(topics, age_hours)
+            + self._multi_source_bonus(topics, sources, source_counts),
+            0.0,
+            1.0,
+        )
+        relevance = np.clip(
+            self._relevance_scores(topics) + self._series_bonus(series_performance, len(topics)),
+            0.0,
+            1.0,
+        )
+
+        weighted = (
+            self.weights["source"] * source
+            + self.weights["freshness"] * freshness
+            + self.weights["trend"] * trend
+            + self.weights["relevance"] * relevance
+        )
+        total = np.clip(np.rint(weighted * 100), 0, 100).astype(np.int64)
+
+        return ScoreBatch(
+            source=source,
+            freshness=freshness,
+            trend=trend,
+            relevance=relevance,
+            total=total,
+        )
+
+    @staticmethod
+    def _age_hours(topics: Sequence[tuple[RawTopic, NormalizedTopic]], now: datetime) -> FloatArray:
+        """Topic ages in hours (NaN when the publish time is unknown)."""
+        ages = np.full(len(topics), np.nan)
+        for i, (raw, norm) in enumerate(topics):
+            published = norm.published_at or raw.published_at
+            if published is not None:
+                if published.tzinfo is None:
+                    published = published.replace(tzinfo=UTC)
+                ages[i] = (now - published).total_seconds() / 3600
+        clamped: FloatArray = np.maximum(ages, 0.0)
+        return clamped
+
+    def _source_scores(self, sources: list[str]) -> FloatArray:
+        """Credibility of each topic's source, scaled to 0-1."""
+        credibility = np.array(
+            [self.credibility.get(name, np.nan) for name in sources], dtype=np.float64
+        )
+        scores = credibility / self.credibility_scale
+        return np.clip(np.where(np.isnan(scores), self.default_source_score, scores), 0.0, 1.0)
+
+    def _freshness_scores(self, age_hours: FloatArray) -> FloatArray:
+        """Exponential decay that halves (for base 2) every half-life.
+
+        Topics without a publish time score as one half-life old.
+        """
+        ages = np.where(np.isnan(age_hours), self.half_life_hours, age_hours)
+        return np.power(self.decay_base, -ages / self.half_life_hours)
+
+    @staticmethod
+    def _velocity_scores(
+        topics: Sequence[tuple[RawTopic, NormalizedTopic]], age_hours: FloatArray
+    ) -> FloatArray:
+        """Engagement per hour on a log scale, relative to the batch maximum."""
+        engagement = np.zeros(len(topics))
+        for i, (raw, _) in enumerate(topics):
+            engagement[i] = sum(
+                float(value)
+                for key in _ENGAGEMENT_METRICS
+                if isinstance(value := raw.metrics.get(key), int | float)
+                and not isinstance(value, bool)
+            )
+
+        hours = np.maximum(np.nan_to_num(age_hours, nan=1.0), 1.0)
+        velocity = np.log1p(np.maximum(engagement, 0.0) / hours)
+        peak = velocity.max(initial=0.0)
+        return velocity / peak if peak > 0 else np.zeros(len(topics))
+
+    def _multi_source_bonus(
+        self,
+        topics: Sequence[tuple[RawTopic, NormalizedTopic]],
+        sources: list[str],
+        source_counts: Sequence[int] | None = None,
+    ) -> FloatArray:
+        """Bonus for stories reported by several sources.
+
+        Without explicit counts, stories are matched by normalized title.
+        """
+        if not topics or len(self.multi_source_bonuses) <= 1:
+            return np.zeros(len(topics))
+
+        table = self.multi_source_bonuses
+        if source_counts is not None:
+            counts = np.asarray(source_counts, dtype=np.int64)
+            return table[np.clip(counts, 0, len(table) - 1)]
+
+        titles = [
+            _WHITESPACE_RE.sub(" ", norm.title_normalized).strip().casefold() for _, norm in topics
+        ]
+        _, title_ids = np.unique(np.array(titles, dtype=object), return_inverse=True)
+        _, source_ids = np.unique(np.array(sources, dtype=object), return_inverse=True)
+
+        # Distinct (title, source) pairs, counted per title
+        pairs = np.unique(title_ids * (int(source_ids.max()) + 1) + source_ids)
+        sources_per_title = np.bincount(
+            pairs // (int(source_ids.max()) + 1), minlength=int(title_ids.max()) + 1
+        )
+        counts = sources_per_title[title_ids]
+        return table[np.minimum(counts, len(table) - 1)]
+
+    def _relevance_scores(self, topics: Sequence[tuple[RawTopic, NormalizedTopic]]) -> FloatArray:
+        """Share of channel include terms matched, saturating at a few hits.
+
+        Without include terms every topic is equally (neutrally) relevant.
+        """
+        if not self.include:
+            return np.full(len(topics), self.default_source_score)
+
+        hits = np.zeros(len(topics))
+        for i, (_, norm) in enumerate(topics):
+            text = " ".join([norm.title_normalized.lower(), *(t.lower() for t in norm.terms)])
+            hits[i] = sum(term in text for term in self.include)
+        return np.minimum(hits, self.relevance_saturation) / self.relevance_saturation
+
+    def _series_bonus(self, performance: Sequence[float | None] | None, n: int) -> FloatArray:
+        """Bonus for topics continuing a series, tiered by series performance."""
+        if performance is None:
+            return np.zeros(n)
+
+        values = np.array([np.nan if p is None else p for p in performance], dtype=np.float64)
+        cfg = self.series_performance
+        return np.select(
+            [
+                values >= float(cfg.get("high_threshold", 0.8)),
+                values >= float(cfg.get("medium_threshold", 0.5)),
+                ~np.isnan(values),
+            ],
+            [
+                float(cfg.get("high_bonus", 0.3)),
+                float(cfg.get("medium_bonus", 0.15)),
+                float(cfg.get("low_bonus", 0.05)),
+            ],
+            default=0.0,
+        )
+
+    @staticmethod
+    def _bonus_table(bonuses: dict[Any, Any]) -> FloatArray:
+        """Lookup table from source count to bonus; the last entry covers "N or more"."""
+        if not bonuses:
+            return np.zeros(1)
+        levels = {int(count): float(bonus) for count, bonus in bonuses.items()}
+        table = np.zeros(max(levels) + 1)
+        for count, bonus in levels.items():
+            table[count] = bonus
+        # Counts between configured levels keep the lower level's bonus
+        return np.maximum.accumulate(table)
+
+
+__all__ = [
+    "ScoreBatch",
+    "SOURCE_KEY",
+    "TopicScorer",
+]
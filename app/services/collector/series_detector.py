@@ -0,0 +1,464 @@
+"""Automatic series detection.
+
+Groups a channel's topics into series incrementally as they are saved.
+Each cluster (a series, or a recent topic not yet in one) is a sparse term
+vector: how many of its topics contain each term. An inverted index from
+term to cluster means a new topic is compared only with clusters sharing
+at least one of its terms, never with the whole topic history.
+
+Matching uses cosine similarity between the topic's (binary) term vector
+and the cluster's term counts:
+
+- a match with a series assigns the topic to it
+- a match with an unassigned recent topic starts a new series of both
+- otherwise the topic waits as a candidate for later topics
+
+Series performance aggregates are updated incrementally from analytics
+syncs by ``record_episode_performance``.
+
+Usage:
+    detector = SeriesDetector()
+    index = await detector.load_index(session, channel.id)
+    for topic in new_topics:
+        index.assign(topic)
+    await index.persist(session)
+"""
+
+from __future__ import annotations
+
+import math
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config_loader import load_defaults
+from app.core.logging import get_logger
+from app.models.series import Series, SeriesStatus
+from app.models.topic import Topic
+
+logger = get_logger(__name__)
+
+
+def _get_series_defaults() -> dict[str, Any]:
+    """Get series detection defaults from config/defaults.yaml."""
+    series = load_defaults().get("series_detection", {})
+    return series if isinstance(series, dict) else {}
+
+
+def topic_terms(terms: Iterable[str] | None) -> set[str]:
+    """Normalize topic terms for matching.
+
+    Args:
+        terms: Raw topic terms
+
+    Returns:
+        Lowercased, stripped, non-empty terms
+    """
+    return {term.strip().lower() for term in terms or () if term and term.strip()}
+
+
+@dataclass
+class _Cluster:
+    """Sparse term vector of a series or a lone candidate topic."""
+
+    key: uuid.UUID
+    counts: Counter[str] = field(default_factory=Counter)
+    sum_squares: int = 0
+    series: Series | None = None
+    topic: Topic | None = None  # Candidate topic saved in this run
+
+    def add_terms(self, terms: set[str]) -> None:
+        for term in terms:
+            # (k + 1)^2 - k^2 keeps the squared norm current
+            self.sum_squares += 2 * self.counts[term] + 1
+            self.counts[term] += 1
+
+    def similarity(self, terms: set[str]) -> float:
+        """Cosine similarity between ``terms`` (binary) and the term counts."""
+        if not terms or not self.sum_squares:
+            return 0.0
+        dot = sum(self.counts.get(term, 0) for term in terms)
+        return dot / math.sqrt(len(terms) * self.sum_squares)
+
+
+class SeriesIndex:
+    """A channel's series and candidate topics, indexed by term.
+
+    Created by ``SeriesDetector.load_index``; assignments are applied to
+    the database by ``persist``.
+    """
+
+    def __init__(
+        self,
+        channel_id: uuid.UUID,
+        min_similarity: float,
+        max_keywords: int,
+    ) -> None:
+        """Initialize SeriesIndex.
+
+        Args:
+            channel_id: Channel the index belongs to
+            min_similarity: Similarity needed to pair two candidate topics
+                (series use their own ``min_similarity``)
+            max_keywords: Terms kept in ``Series.criteria_keywords``
+        """
+        self.channel_id = channel_id
+        self.min_similarity = min_similarity
+        self.max_keywords = max_keywords
+        self._clusters: dict[uuid.UUID, _Cluster] = {}
+        self._postings: defaultdict[str, set[uuid.UUID]] = defaultdict(set)
+        self._new_series: list[Series] = []
+        self._candidate_updates: dict[uuid.UUID, uuid.UUID] = {}  # stored topic -> series
+        self._max_avg_views = 0.0
+
+    @property
+    def series_count(self) -> int:
+        """Number of indexed series."""
+        return sum(cluster.series is not None for cluster in self._clusters.values())
+
+    @property
+    def candidate_count(self) -> int:
+        """Number of indexed topics not yet in a series."""
+        return sum(cluster.series is None for cluster in self._clusters.values())
+
+    def add_series(self, series: Series) -> None:
+        """Index an existing series.
+
+        Series without term counts (e.g. created by hand) are seeded from
+        their criteria keywords.
+        """
+        cluster = _Cluster(key=series.id, series=series)
+        if series.term_counts:
+            for term, count in series.term_counts.items():
+                cluster.counts[term] = int(count)
+                cluster.sum_squares += int(count) ** 2
+        else:
+            cluster.add_terms(topic_terms(series.criteria_keywords))
+        self._insert(cluster)
+        if series.measured_episodes:
+            self._max_avg_views = max(self._max_avg_views, series.avg_views)
+
+    def add_candidate(
+        self, topic_id: uuid.UUID, terms: Iterable[str], topic: Topic | None = None
+    ) -> None:
+        """Index a topic that is not in a series yet."""
+        cluster = _Cluster(key=topic_id, topic=topic)
+        cluster.add_terms(topic_terms(terms))
+        self._insert(cluster)
+
+    def match(self, terms: Iterable[str]) -> tuple[Series | None, float]:
+        """Find the best-matching cluster for a term set without assigning.
+
+        Args:
+            terms: Topic terms
+
+        Returns:
+            Tuple of (matched series or None, similarity); a match with a
+            candidate topic returns (None, similarity)
+        """
+        cluster, similarity = self._best_cluster(topic_terms(terms))
+        if cluster is None:
+            return None, 0.0
+        return cluster.series, similarity
+
+    def performance(self, terms: Iterable[str]) -> float | None:
+        """Relative performance (0-1) of the series a topic would join.
+
+        Args:
+            terms: Topic terms
+
+        Returns:
+            The series' average views relative to the channel's best
+            measured series, or None if there is no measured match
+        """
+        series, _ = self.match(terms)
+        if series is None or not series.measured_episodes or self._max_avg_views <= 0:
+            return None
+        return min(series.avg_views / self._max_avg_views, 1.0)
+
+    def assign(self, topic: Topic) -> Series | None:
+        """Assign a new topic to a series, creating one if needed.
+
+        Sets ``topic.series_id`` and updates the series' term counts and
+        episode count. Unmatched topics become candidates.
+
+        Args:
+            topic: Topic being saved
+
+        Returns:
+            The topic's series, or None if it starts no series yet
+        """
+        terms = topic_terms(topic.terms)
+        if not terms:
+            return None
+
+        cluster, _ = self._best_cluster(terms)
+        if cluster is None:
+            self.add_candidate(topic.id, terms, topic=topic)
+            return None
+
+        series = cluster.series
+        if series is None:
+            series, cluster = self._promote(cluster)
+
+        self._extend(cluster, terms)
+        series.episode_count = (series.episode_count or 0) + 1
+        self._sync_criteria(series, cluster)
+        topic.series_id = series.id
+        return series
+
+    async def persist(self, session: AsyncSession) -> None:
+        """Add new series and assign stored candidate topics to them.
+
+        Args:
+            session: Session the new topics were added to
+        """
+        session.add_all(self._new_series)
+        if self._candidate_updates:
+            await session.flush()
+            for topic_id, series_id in self._candidate_updates.items():
+                await session.execute(
+                    update(Topic).where(Topic.id == topic_id).values(series_id=series_id)
+                )
+
+        if self._new_series:
+            logger.info(
+                "series_detected",
+                channel_id=str(self.channel_id),
+                series=[series.name for series in self._new_series],
+            )
+        self._new_series = []
+        self._candidate_updates = {}
+
+    def _insert(self, cluster: _Cluster) -> None:
+        self._clusters[cluster.key] = cluster
+        for term in cluster.counts:
+            self._postings[term].add(cluster.key)
+
+    def _extend(self, cluster: _Cluster, terms: set[str]) -> None:
+        cluster.add_terms(terms)
+        for term in terms:
+            self._postings[term].add(cluster.key)
+
+    def _best_cluster(self, terms: set[str]) -> tuple[_Cluster | None, float]:
+        """Most similar cluster above its threshold, among those sharing a term."""
+        candidates: set[uuid.UUID] = set()
+        for term in terms:
+            candidates.update(self._postings.get(term, ()))
+
+        best: _Cluster | None = None
+        best_similarity = 0.0
+        # Sorted for deterministic tie-breaking
+        for key in sorted(candidates, key=str):
+            cluster = self._clusters[key]
+            threshold = (
+                cluster.series.min_similarity if cluster.series is not None else self.min_similarity
+            )
+            similarity = cluster.similarity(terms)
+            if similarity >= threshold and similarity > best_similarity:
+                best, best_similarity = cluster, similarity
+        return best, best_similarity
+
+    def _promote(self, candidate: _Cluster) -> tuple[Series, _Cluster]:
+        """Turn a candidate topic into a new series containing it."""
+        series = Series(
+            id=uuid.uuid4(),
+            channel_id=self.channel_id,
+            min_similarity=self.min_similarity,
+            episode_count=1,
+            measured_episodes=0,
+            avg_views=0.0,
+            avg_engagement=0.0,
+            recent_engagement=0.0,
+            trend="stable",
+            status=SeriesStatus.ACTIVE,
+            auto_detected=True,
+            confirmed_by_user=False,
+        )
+        self._new_series.append(series)
+        if candidate.topic is not None:
+            candidate.topic.series_id = series.id
+        else:
+            self._candidate_updates[candidate.key] = series.id
+
+        for term in candidate.counts:
+            self._postings[term].discard(candidate.key)
+        del self._clusters[candidate.key]
+
+        cluster = _Cluster(
+            key=series.id,
+            counts=candidate.counts,
+            sum_squares=candidate.sum_squares,
+            series=series,
+        )
+        self._insert(cluster)
+        return series, cluster
+
+    def _sync_criteria(self, series: Series, cluster: _Cluster) -> None:
+        """Write term counts and top keywords back to the series row."""
+        ranked = sorted(cluster.counts.items(), key=lambda item: (-item[1], item[0]))
+        keywords = [term for term, _ in ranked[: self.max_keywords]]
+        # New objects so SQLAlchemy sees the JSON/ARRAY changes
+        series.term_counts = dict(cluster.counts)
+        series.criteria_keywords = keywords
+        if series.auto_detected and not series.confirmed_by_user:
+            series.name = " · ".join(keywords[:3])[:200]
+
+
+class SeriesDetector:
+    """Load per-channel series indexes for incremental detection.
+
+    Example:
+        >>> detector = SeriesDetector()
+        >>> index = await detector.load_index(session, channel.id)
+        >>> index.assign(topic)
+        >>> await index.persist(session)
+    """
+
+    def __init__(
+        self,
+        min_similarity: float | None = None,
+        lookback_days: int | None = None,
+        max_candidates: int | None = None,
+        max_keywords: int | None = None,
+    ) -> None:
+        """Initialize SeriesDetector.
+
+        Unset options come from ``series_detection`` in defaults.yaml.
+
+        Args:
+            min_similarity: Cosine similarity needed to join a cluster
+            lookback_days: How far back unassigned topics stay candidates
+            max_candidates: Most recent unassigned topics loaded as candidates
+            max_keywords: Terms kept as series criteria keywords
+        """
+        defaults = _get_series_defaults()
+        self.min_similarity = (
+            min_similarity
+            if min_similarity is not None
+            else float(defaults.get("min_similarity", 0.5))
+        )
+        self.lookback_days = lookback_days or int(defaults.get("lookback_days", 30))
+        self.max_candidates = max_candidates or int(defaults.get("max_candidates", 2000))
+        self.max_keywords = max_keywords or int(defaults.get("max_keywords", 10))
+
+    async def load_index(self, session: AsyncSession, channel_id: uuid.UUID) -> SeriesIndex:
+        """Load a channel's active series and recent unassigned topics.
+
+        Args:
+            session: Database session
+            channel_id: Channel to load
+
+        Returns:
+            SeriesIndex ready for matching and assignment
+        """
+        index = SeriesIndex(channel_id, self.min_similarity, self.max_keywords)
+
+        series_result = await session.execute(
+            select(Series).where(
+                Series.channel_id == channel_id,
+                Series.status == SeriesStatus.ACTIVE,
+            )
+        )
+        for series in series_result.scalars().all():
+            index.add_series(series)
+
+        cutoff = datetime.now(UTC) - timedelta(days=self.lookback_days)
+        topic_result = await session.execute(
+            select(Topic.id, Topic.terms)
+            .where(
+                Topic.channel_id == channel_id,
+                Topic.series_id.is_(None),
+                Topic.created_at >= cutoff,
+            )
+            .order_by(Topic.created_at.desc())
+            .limit(self.max_candidates)
+        )
+        for topic_id, terms in topic_result.all():
+            index.add_candidate(topic_id, terms or [])
+
+        logger.debug(
+            "series_index_loaded",
+            channel_id=str(channel_id),
+            series=index.series_count,
+            candidates=index.candidate_count,
+        )
+        return index
+
+
+def record_episode_performance(
+    series: Series,
+    upload_id: uuid.UUID,
+    views: int,
+    engagement_rate: float,
+    previous: tuple[int, float] | None = None,
+    smoothing: float | None = None,
+    tolerance: float | None = None,
+) -> None:
+    """Update a series' performance aggregates with one episode's metrics.
+
+    Averages are maintained incrementally: a first measurement adds the
+    episode, a re-sync replaces its previous values. The trend compares
+    an exponentially weighted recent engagement rate with the average.
+
+    Args:
+        series: Series of the episode
+        upload_id: Upload of the episode; recorded in ``series.measured_uploads``
+            so the episode is counted once
+        views: Episode's current views
+        engagement_rate: Episode's current engagement rate
+        previous: Episode's previously recorded (views, engagement_rate), or
+            None for its first measurement
+        smoothing: Weight of the newest measurement in recent engagement
+        tolerance: Relative difference from the average that counts as a trend
+    """
+    defaults = _get_series_defaults()
+    smoothing = smoothing if smoothing is not None else float(defaults.get("trend_smoothing", 0.3))
+    tolerance = tolerance if tolerance is not None else float(defaults.get("trend_tolerance", 0.1))
+
+    measured = series.measured_episodes or 0
+    total_views = (series.avg_views or 0.0) * measured
+    total_engagement = (series.avg_engagement or 0.0) * measured
+    measured_uploads = list(series.measured_uploads or [])
+    if str(upload_id) not in measured_uploads:
+        measured += 1
+        measured_uploads.append(str(upload_id))
+        # New list so SQLAlchemy sees the JSON change
+        series.measured_uploads = measured_uploads
+    elif previous is not None:
+        total_views -= previous[0]
+        total_engagement -= previous[1]
+    total_views += views
+    total_engagement += engagement_rate
+
+    series.measured_episodes = measured
+    series.avg_views = max(total_views / measured, 0.0)
+    series.avg_engagement = max(total_engagement / measured, 0.0)
+    series.recent_engagement = (
+        engagement_rate
+        if measured == 1
+        else smoothing * engagement_rate + (1 - smoothing) * (series.recent_engagement or 0.0)
+    )
+
+    trend = "stable"
+    if measured > 1 and series.avg_engagement > 0:
+        ratio = series.recent_engagement / series.avg_engagement
+        if ratio >= 1 + tolerance:
+            trend = "up"
+        elif ratio <= 1 - tolerance:
+            trend = "down"
+    series.trend = trend
+
+
+__all__ = [
+    "SeriesDetector",
+    "SeriesIndex",
+    "record_episode_performance",
+    "topic_terms",
+]
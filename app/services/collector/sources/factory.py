@@ -4,6 +4,7 @@ This module provides a factory pattern for creating topic sources
 based on configuration, enabling config-driven source selection.
 """
 
+import asyncio
 import uuid
 from typing import Any, Final
 
@@ -132,7 +133,7 @@ async def collect_from_sources(
     http_client: HTTPClient,
     source_overrides: dict[str, Any] | None = None,
 ) -> list[RawTopic]:
-    """Collect topics from multiple sources.
+    """Collect topics from multiple sources concurrently.
 
     Args:
         enabled_sources: List of source names to collect from
@@ -140,22 +141,23 @@ async def collect_from_sources(
         source_overrides: Per-source configuration overrides
 
     Returns:
-        List of RawTopic objects from all sources
+        List of RawTopic objects from all sources, in source order
     """
     source_overrides = source_overrides or {}
-    all_topics: list[RawTopic] = []
 
-    for source_name in enabled_sources:
+    async def _collect(source_name: str) -> list[RawTopic]:
         overrides = source_overrides.get(source_name, {})
         try:
             source = create_source(source_name, http_client, overrides)
             topics = await source.collect()
-            all_topics.extend(topics)
             logger.info(f"Collected {len(topics)} topics from {source_name}")
+            return topics
         except Exception as e:
             logger.error(f"Failed to collect from {source_name}: {e}")
+            return []
 
-    return all_topics
+    results = await asyncio.gather(*(_collect(name) for name in enabled_sources))
+    return [topic for topics in results for topic in topics]
 
 
 __all__ = [
@@ -2,10 +2,18 @@
 
 Collects trending search topics from Google Trends using pytrends.
 Supports multiple regions and real-time/daily trends.
+
+pytrends is blocking (requests-based), so every call runs in a worker
+thread under a timeout, with regions fetched concurrently. TrendReq
+sessions (which fetch Google cookies on creation) are reused per region,
+and region lookups against CLDR/pytz/pycountry data are memoized.
 """
 
-from collections.abc import Mapping
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Coroutine, Mapping
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any, cast
 from zoneinfo import ZoneInfo
 
@@ -22,6 +30,7 @@ from app.services.collector.base import BaseSource, RawTopic
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
 def get_host_language_for_region(region: str) -> str:
     """Get primary language code for a region using babel CLDR data.
 
@@ -61,7 +70,9 @@ def get_host_language_for_region(region: str) -> str:
 def get_timezone_offset_for_region(region: str) -> int:
     """Get timezone offset in minutes for a region using pytz.
 
-    Uses the first (primary) timezone for the country.
+    Uses the first (primary) timezone for the country. The zone lookup is
+    memoized; the offset itself is computed for the current time so DST
+    changes are picked up.
 
     Args:
         region: ISO 3166-1 alpha-2 country code (e.g., 'KR', 'US')
@@ -69,21 +80,81 @@ def get_timezone_offset_for_region(region: str) -> int:
     Returns:
         Timezone offset in minutes from UTC
     """
-    timezones = pytz.country_timezones.get(region.upper(), [])
-    if not timezones:
+    tz = _get_primary_timezone(region.upper())
+    if tz is None:
         return 0
 
-    # Use first timezone (usually capital/most populous city)
-    tz_name = timezones[0]
+    offset = datetime.now(tz).utcoffset()
+    if offset is not None:
+        return int(offset.total_seconds() / 60)
+    return 0
+
+
+@lru_cache(maxsize=256)
+def _get_primary_timezone(region: str) -> ZoneInfo | None:
+    """Get the primary timezone of a region (first pytz zone, usually the capital)."""
+    timezones = pytz.country_timezones.get(region, [])
+    if not timezones:
+        return None
     try:
-        tz = ZoneInfo(tz_name)
-        now = datetime.now(tz)
-        offset = now.utcoffset()
-        if offset is not None:
-            return int(offset.total_seconds() / 60)
+        return ZoneInfo(timezones[0])
     except Exception:
-        pass
-    return 0
+        return None
+
+
+@lru_cache(maxsize=256)
+def get_pn_code_for_region(region: str) -> str:
+    """Convert ISO alpha-2 country code to pytrends pn format.
+
+    Uses pycountry to dynamically convert ISO codes to pytrends format.
+
+    Args:
+        region: ISO 3166-1 alpha-2 country code (e.g., 'KR', 'US')
+
+    Returns:
+        pytrends pn format (e.g., 'south_korea', 'united_states')
+    """
+    country = pycountry.countries.get(alpha_2=region.upper())
+    if not country:
+        logger.warning(f"Unknown country code: {region}, using as-is")
+        return region.lower()
+
+    # Prefer common_name if available (e.g., 'South Korea' instead of 'Korea, Republic of')
+    name: str = getattr(country, "common_name", None) or country.name
+
+    # Convert to pytrends format: lowercase with underscores
+    return name.lower().replace(" ", "_").replace("-", "_")
+
+
+# Reused TrendReq sessions keyed by (host language, tz offset, request timeout).
+# Each session has a lock so one region's session is never used by two
+# worker threads at once.
+_sessions: dict[tuple[str, int, float], tuple[TrendReq, threading.Lock]] = {}
+_sessions_lock = threading.Lock()
+
+
+def _get_session(region: str, request_timeout: float) -> tuple[TrendReq, threading.Lock]:
+    """Get (or create) the shared TrendReq session for a region.
+
+    Must run in a worker thread: creating a TrendReq performs HTTP requests.
+    The session is built outside the registry lock so regions start up in
+    parallel; if two threads race for the same key, the first one stored wins.
+    """
+    host_language = get_host_language_for_region(region.upper())
+    timezone_offset = get_timezone_offset_for_region(region)
+    key = (host_language, timezone_offset, request_timeout)
+
+    with _sessions_lock:
+        entry = _sessions.get(key)
+    if entry is not None:
+        return entry
+
+    created = (
+        TrendReq(hl=host_language, tz=timezone_offset, timeout=request_timeout),
+        threading.Lock(),
+    )
+    with _sessions_lock:
+        return _sessions.setdefault(key, created)
 
 
 class GoogleTrendsSource(BaseSource[GoogleTrendsConfig]):
@@ -130,12 +201,43 @@ class GoogleTrendsSource(BaseSource[GoogleTrendsConfig]):
     async def collect(self, params: dict[str, Any] | None = None) -> list[RawTopic]:
         """Collect trending topics from Google Trends.
 
+        Regions are fetched concurrently; results keep region order.
+
         Args:
             params: Optional parameters to override defaults
 
         Returns:
             List of RawTopic from Google Trends
         """
+        topics: list[RawTopic] = []
+        for batch in await asyncio.gather(*self._region_jobs(params)):
+            topics.extend(batch)
+
+        logger.info("Google Trends collection complete", collected=len(topics))
+        return topics
+
+    async def stream(self, params: dict[str, Any] | None = None) -> AsyncIterator[list[RawTopic]]:
+        """Yield each region's trends as soon as it is fetched.
+
+        Args:
+            params: Optional parameters to override defaults
+
+        Yields:
+            Trending topics from one region
+        """
+        tasks = [asyncio.ensure_future(job) for job in self._region_jobs(params)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Deadline expired or consumer stopped early
+            for task in tasks:
+                task.cancel()
+
+    def _region_jobs(
+        self, params: dict[str, Any] | None
+    ) -> list[Coroutine[Any, Any, list[RawTopic]]]:
+        """Build one collection coroutine per configured region."""
         params = params or {}
         regions = params.get("regions", self._config.regions)
         limit = params.get("limit", self._config.limit)
@@ -146,53 +248,78 @@ class GoogleTrendsSource(BaseSource[GoogleTrendsConfig]):
             limit=limit,
         )
 
-        topics: list[RawTopic] = []
+        semaphore = asyncio.Semaphore(self._config.max_concurrent_regions)
 
-        for region in regions:
-            try:
-                region_topics = await self._fetch_trending_searches(region, limit)
-                topics.extend(region_topics)
-            except Exception as e:
-                logger.error(
-                    "Failed to fetch Google Trends",
-                    region=region,
-                    error=str(e),
-                )
-                continue
+        async def _collect_one(region: str) -> list[RawTopic]:
+            async with semaphore:
+                try:
+                    return await self._fetch_trending_searches(region, limit)
+                except Exception as e:
+                    logger.error(
+                        "Failed to fetch Google Trends",
+                        region=region,
+                        error=str(e) or type(e).__name__,
+                    )
+                    return []
 
-        logger.info("Google Trends collection complete", collected=len(topics))
-        return topics
+        return [_collect_one(region) for region in regions]
 
     async def _fetch_trending_searches(self, region: str, limit: int) -> list[RawTopic]:
         """Fetch trending searches for a specific region.
 
+        The blocking pytrends calls run in a worker thread, bounded by
+        ``fetch_timeout``. A timed-out thread finishes in the background
+        (its requests are bounded by ``request_timeout``) without holding
+        up the event loop.
+
         Args:
             region: Region code (e.g., 'KR', 'US')
             limit: Maximum trends to fetch
 
         Returns:
             List of RawTopic
+
+        Raises:
+            TimeoutError: If pytrends does not answer within fetch_timeout
         """
-        # Get region-specific language and timezone
-        host_language = get_host_language_for_region(region)
-        timezone_offset = get_timezone_offset_for_region(region)
+        queries = await asyncio.wait_for(
+            asyncio.to_thread(self._fetch_queries_sync, region, limit),
+            timeout=self._config.fetch_timeout,
+        )
 
-        # pytrends is synchronous, but we wrap it for consistency
-        pytrends = TrendReq(hl=host_language, tz=timezone_offset)
+        topics: list[RawTopic] = []
+        for query in queries:
+            topic = self._create_topic(query, region)
+            if topic:
+                topics.append(topic)
+        return topics
 
-        # Get daily trending searches
-        try:
-            trending_df = pytrends.trending_searches(pn=self._get_pn_code(region))
-        except Exception as e:
-            logger.warning(
-                "Failed to get trending searches, trying realtime",
-                region=region,
-                error=str(e),
-            )
-            # Fallback to realtime trends
-            trending_df = pytrends.realtime_trending_searches(pn=self._get_region_name(region))
+    def _fetch_queries_sync(self, region: str, limit: int) -> list[str]:
+        """Fetch trending queries with pytrends (worker thread only).
 
-        topics: list[RawTopic] = []
+        Args:
+            region: Region code (e.g., 'KR', 'US')
+            limit: Maximum trends to fetch
+
+        Returns:
+            Trending search queries
+        """
+        pytrends, session_lock = _get_session(region, self._config.request_timeout)
+
+        with session_lock:
+            # Get daily trending searches
+            try:
+                trending_df = pytrends.trending_searches(pn=self._get_pn_code(region))
+            except Exception as e:
+                logger.warning(
+                    "Failed to get trending searches, trying realtime",
+                    region=region,
+                    error=str(e),
+                )
+                # Fallback to realtime trends
+                trending_df = pytrends.realtime_trending_searches(pn=self._get_region_name(region))
+
+        queries: list[str] = []
 
         # Process trending searches
         if trending_df is not None and not trending_df.empty:
@@ -201,12 +328,9 @@ class GoogleTrendsSource(BaseSource[GoogleTrendsConfig]):
                 query = row if isinstance(row, str) else row.iloc[0] if len(row) > 0 else str(row)
                 if not query or not isinstance(query, str):
                     continue
+                queries.append(query)
 
-                topic = self._create_topic(query, region)
-                if topic:
-                    topics.append(topic)
-
-        return topics
+        return queries
 
     def _create_topic(self, query: str, region: str) -> RawTopic | None:
         """Create RawTopic from trending search query.
@@ -253,24 +377,13 @@ class GoogleTrendsSource(BaseSource[GoogleTrendsConfig]):
     def _get_pn_code(self, region: str) -> str:
         """Convert ISO alpha-2 country code to pytrends pn format.
 
-        Uses pycountry to dynamically convert ISO codes to pytrends format.
-
         Args:
             region: ISO 3166-1 alpha-2 country code (e.g., 'KR', 'US')
 
         Returns:
             pytrends pn format (e.g., 'south_korea', 'united_states')
         """
-        country = pycountry.countries.get(alpha_2=region.upper())
-        if not country:
-            logger.warning(f"Unknown country code: {region}, using as-is")
-            return region.lower()
-
-        # Prefer common_name if available (e.g., 'South Korea' instead of 'Korea, Republic of')
-        name: str = getattr(country, "common_name", None) or country.name
-
-        # Convert to pytrends format: lowercase with underscores
-        return name.lower().replace(" ", "_").replace("-", "_")
+        return get_pn_code_for_region(region.upper())
 
     def _get_region_name(self, region: str) -> str:
         """Get region name for realtime trends (uses ISO code directly).
@@ -292,13 +405,25 @@ class GoogleTrendsSource(BaseSource[GoogleTrendsConfig]):
         """
         try:
             # Use US as default for health check
-            pytrends = TrendReq(hl="en-US", tz=-300)
-            # Try a simple trending search
-            df = pytrends.trending_searches(pn="united_states")
-            return df is not None and not df.empty
+            return await asyncio.wait_for(
+                asyncio.to_thread(self._health_check_sync),
+                timeout=self._config.fetch_timeout,
+            )
         except Exception as e:
             logger.warning("Google Trends health check failed", error=str(e))
             return False
 
+    def _health_check_sync(self) -> bool:
+        """Run a trending search for the US (worker thread only)."""
+        pytrends, session_lock = _get_session("US", self._config.request_timeout)
+        with session_lock:
+            df = pytrends.trending_searches(pn="united_states")
+        return df is not None and not df.empty
+
 
-__all__ = ["GoogleTrendsSource"]
+__all__ = [
+    "GoogleTrendsSource",
+    "get_host_language_for_region",
+    "get_pn_code_for_region",
+    "get_timezone_offset_for_region",
+]
@@ -4,6 +4,8 @@ Collects posts from Reddit using the public JSON API.
 No authentication required for public subreddits.
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Coroutine
 from datetime import UTC, datetime
 from typing import Any
 
@@ -77,12 +79,44 @@ class RedditSource(BaseSource[RedditConfig]):
     async def collect(self, params: dict[str, Any] | None = None) -> list[RawTopic]:
         """Collect posts from Reddit subreddits.
 
+        Subreddits are fetched concurrently; results keep subreddit order.
+
         Args:
             params: Optional parameters to override defaults
 
         Returns:
             List of RawTopic from Reddit
         """
+        topics: list[RawTopic] = []
+        for batch in await asyncio.gather(*self._subreddit_jobs(params)):
+            topics.extend(batch)
+
+        logger.info("Reddit collection complete", collected=len(topics))
+        return topics
+
+    async def stream(self, params: dict[str, Any] | None = None) -> AsyncIterator[list[RawTopic]]:
+        """Yield each subreddit's posts as soon as it responds.
+
+        Args:
+            params: Optional parameters to override defaults
+
+        Yields:
+            Posts from one subreddit
+        """
+        jobs = self._subreddit_jobs(params)
+        tasks = [asyncio.ensure_future(job) for job in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Deadline expired or consumer stopped early
+            for task in tasks:
+                task.cancel()
+
+    def _subreddit_jobs(
+        self, params: dict[str, Any] | None
+    ) -> list[Coroutine[Any, Any, list[RawTopic]]]:
+        """Build one collection coroutine per configured subreddit."""
         params = params or {}
         subreddits = params.get("subreddits", self._config.subreddits)
         limit = params.get("limit", self._config.limit)
@@ -102,25 +136,49 @@ class RedditSource(BaseSource[RedditConfig]):
             sort=sort,
         )
 
+        semaphore = asyncio.Semaphore(self._config.max_concurrent_requests)
+
+        async def _collect_one(subreddit: str) -> list[RawTopic]:
+            async with semaphore:
+                return await self._collect_subreddit(subreddit, limit, min_score, sort, time_filter)
+
+        return [_collect_one(subreddit) for subreddit in subreddits]
+
+    async def _collect_subreddit(
+        self,
+        subreddit: str,
+        limit: int,
+        min_score: int,
+        sort: str,
+        time_filter: str,
+    ) -> list[RawTopic]:
+        """Fetch and convert posts from one subreddit, logging failures.
+
+        Args:
+            subreddit: Subreddit name
+            limit: Max posts to fetch
+            min_score: Minimum upvotes
+            sort: Sort method
+            time_filter: Time filter for top sort
+
+        Returns:
+            List of RawTopic (empty if the fetch failed)
+        """
         topics: list[RawTopic] = []
-        for subreddit in subreddits:
-            try:
-                posts = await self._fetch_subreddit(subreddit, limit, sort, time_filter)
-                for post in posts:
-                    if post.get("data", {}).get("score", 0) >= min_score:
-                        topic = self._to_raw_topic(post["data"], subreddit)
-                        if topic:
-                            topics.append(topic)
-
-            except Exception as e:
-                logger.error(
-                    "Failed to fetch subreddit",
-                    subreddit=subreddit,
-                    error=str(e),
-                )
-                continue
+        try:
+            posts = await self._fetch_subreddit(subreddit, limit, sort, time_filter)
+            for post in posts:
+                if post.get("data", {}).get("score", 0) >= min_score:
+                    topic = self._to_raw_topic(post["data"], subreddit)
+                    if topic:
+                        topics.append(topic)
 
-        logger.info("Reddit collection complete", collected=len(topics))
+        except Exception as e:
+            logger.error(
+                "Failed to fetch subreddit",
+                subreddit=subreddit,
+                error=str(e),
+            )
         return topics
 
     async def _fetch_subreddit(
@@ -0,0 +1,144 @@
+"""Multi-term matching with an Aho-Corasick automaton.
+
+All terms are compiled into one automaton, so finding every term in a text
+takes a single pass over the text, however many terms there are. Used by
+the topic filter, where exclude lists can hold thousands of banned terms.
+
+Match modes:
+
+- substring: a term matches anywhere (``"ai"`` in ``"openai"``)
+- word: a term must not be part of a longer word (letters, digits, ``_``)
+- hangul: like word, but a term may be directly followed by Hangul, so
+  Korean particles and endings attach (``"삼성"`` in ``"삼성이"``,
+  ``"ai"`` in ``"ai가"``)
+
+Boundaries are only checked at term edges that are word characters, so
+terms such as ``"c++"`` still match in word mode.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+from app.config.filtering import TermMatchMode
+
+_HANGUL_FIRST = "가"
+_HANGUL_LAST = "힣"
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character is part of a word."""
+    return char.isalnum() or char == "_"
+
+
+def _is_hangul(char: str) -> bool:
+    """Whether a character is a Hangul syllable."""
+    return _HANGUL_FIRST <= char <= _HANGUL_LAST
+
+
+class TermMatcher:
+    """Find many terms in a text in one pass.
+
+    Example:
+        >>> matcher = TermMatcher(["ai", "삼성"], mode="hangul")
+        >>> matcher.find_all("삼성이 ai가 바꾸는 openai")
+        ['삼성', 'ai']
+    """
+
+    def __init__(self, terms: Iterable[str], mode: TermMatchMode = "substring") -> None:
+        """Compile terms into an automaton.
+
+        Args:
+            terms: Terms to match (duplicates and empty strings are ignored)
+            mode: How term boundaries are matched
+        """
+        self.terms = tuple(dict.fromkeys(term for term in terms if term))
+        self.mode = mode
+
+        # Trie of all terms; state 0 is the root
+        self._goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for index, term in enumerate(self.terms):
+            state = 0
+            for char in term:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # Failure links (longest proper suffix that is also a trie path), built
+        # breadth-first so each state inherits the terms ending at its suffix
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+        self._outputs = [tuple(output) for output in outputs]
+
+    def __len__(self) -> int:
+        """Number of compiled terms."""
+        return len(self.terms)
+
+    def iter_matches(self, text: str) -> Iterator[tuple[str, int]]:
+        """Yield every term occurrence in the text.
+
+        Occurrences are yielded in order of where they end; at the same end,
+        longer terms come first.
+
+        Args:
+            text: Text to search (matched case-sensitively)
+
+        Yields:
+            (term, start index) of each occurrence
+        """
+        if not self.terms:
+            return
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in outputs[state]:
+                term = self.terms[index]
+                start = end + 1 - len(term)
+                if self._at_boundaries(text, term, start, end + 1):
+                    yield term, start
+
+    def find_all(self, text: str) -> list[str]:
+        """Distinct terms found in the text, in order of first occurrence.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Matched terms
+        """
+        return list(dict.fromkeys(term for term, _ in self.iter_matches(text)))
+
+    def _at_boundaries(self, text: str, term: str, start: int, end: int) -> bool:
+        """Whether an occurrence at text[start:end] satisfies the match mode."""
+        if self.mode == "substring":
+            return True
+        if start > 0 and _is_word_char(term[0]) and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(term[-1]):
+            following = text[end]
+            if _is_word_char(following):
+                return self.mode == "hangul" and _is_hangul(following)
+        return True
+
+
+__all__ = ["TermMatcher"]
@@ -4,7 +4,7 @@ This module provides services for generating YouTube Shorts videos:
 - TTS: Text-to-Speech engines (Edge TTS, ElevenLabs)
 - Subtitle: Subtitle generation and formatting
 - Visual: Visual asset sourcing and management
-- Compositor: FFmpeg-based video composition
+- Compositor: Remotion and single-pass FFmpeg video composition
 - Thumbnail: Thumbnail generation
 - Pipeline: Complete video generation orchestration
 """
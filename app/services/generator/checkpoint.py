@@ -0,0 +1,408 @@
+"""Stage checkpoints for resumable video generation.
+
+Each pipeline stage (TTS, concat, subtitles, visuals, compose, thumbnail)
+records its output artifacts with their SHA-256 checksums plus whatever
+metadata is needed to rebuild its in-memory result. When a job is retried
+after a crash, stages whose artifacts are still intact on disk are
+restored instead of recomputed, so paid TTS and stock/AI visuals are not
+requested twice.
+
+Once a stage has to be recomputed, every later stage is recomputed too,
+since their outputs were derived from the previous result.
+
+Checkpoint format (stored in ``GenerationJob.checkpoints``)::
+
+    {
+        "<stage>": {
+            "artifacts": {"<name>": {"path": str, "sha256": str, "size": int}},
+            "data": {...},
+            "completed_at": "<ISO timestamp>",
+        },
+    }
+"""
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+from app.core.logging import get_logger
+from app.models.generation_job import GenerationStage
+from app.services.generator.remotion_compositor import CompositionResult
+from app.services.generator.tts.base import SceneTTSResult, TTSResult, WordTimestamp
+from app.services.generator.visual.base import VisualAsset, VisualSourceType
+from app.services.generator.visual.manager import SceneVisualResult
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# (artifacts by name, JSON-serializable data)
+StageOutput = tuple[dict[str, Path], dict[str, Any]]
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """Compute the SHA-256 digest of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _describe_artifacts(artifacts: dict[str, Path]) -> dict[str, dict[str, Any]]:
+    """Record path, size and checksum for each artifact."""
+    return {
+        name: {"path": str(path), "sha256": file_sha256(path), "size": path.stat().st_size}
+        for name, path in artifacts.items()
+    }
+
+
+def _verify_artifacts(artifacts: dict[str, dict[str, Any]]) -> bool:
+    """Check that every artifact still exists with its recorded checksum."""
+    for entry in artifacts.values():
+        path = Path(entry["path"])
+        try:
+            if path.stat().st_size != entry["size"] or file_sha256(path) != entry["sha256"]:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+class StageCheckpointer:
+    """Run pipeline stages, restoring completed ones from checkpoints.
+
+    Example:
+        >>> checkpointer = StageCheckpointer(job.checkpoints, persist=save_checkpoints)
+        >>> results = await checkpointer.run(
+        ...     GenerationStage.TTS, synthesize, dump=dump_scene_tts, load=load_scene_tts
+        ... )
+    """
+
+    def __init__(
+        self,
+        checkpoints: dict[str, Any] | None = None,
+        persist: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+    ) -> None:
+        """Initialize StageCheckpointer.
+
+        Args:
+            checkpoints: Previously recorded checkpoints
+            persist: Called with all checkpoints after each completed stage
+        """
+        self.checkpoints: dict[str, Any] = dict(checkpoints or {})
+        self.persist = persist
+        self.restored: list[GenerationStage] = []
+        self._invalidated = False
+
+    async def restore(self, stage: GenerationStage) -> dict[str, Any] | None:
+        """Get a stage's checkpoint if its artifacts are intact.
+
+        Args:
+            stage: Pipeline stage
+
+        Returns:
+            Checkpoint dict (``artifacts``, ``data``), or None if the stage
+            must be recomputed
+        """
+        if self._invalidated:
+            return None
+        checkpoint = self.checkpoints.get(stage.value)
+        if checkpoint is None:
+            return None
+
+        if not await asyncio.to_thread(_verify_artifacts, checkpoint.get("artifacts", {})):
+            logger.warning("checkpoint_artifacts_invalid", stage=stage.value)
+            return None
+        return dict(checkpoint)
+
+    async def record(
+        self,
+        stage: GenerationStage,
+        artifacts: dict[str, Path],
+        data: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a completed stage and persist all checkpoints.
+
+        Checkpoints of later stages are discarded, since they were derived
+        from this stage's previous output.
+
+        Args:
+            stage: Pipeline stage
+            artifacts: Output files by name
+            data: JSON-serializable metadata needed to rebuild the result
+        """
+        described = await asyncio.to_thread(_describe_artifacts, artifacts)
+        stages = list(GenerationStage)
+        for later in stages[stages.index(stage) + 1 :]:
+            self.checkpoints.pop(later.value, None)
+
+        self.checkpoints[stage.value] = {
+            "artifacts": described,
+            "data": json.loads(json.dumps(data or {}, ensure_ascii=False, default=str)),
+            "completed_at": datetime.now(tz=UTC).isoformat(),
+        }
+        if self.persist is not None:
+            await self.persist(self.checkpoints)
+
+    async def run(
+        self,
+        stage: GenerationStage,
+        compute: Callable[[], Awaitable[T]],
+        dump: Callable[[T], StageOutput],
+        load: Callable[[dict[str, Any]], T],
+    ) -> T:
+        """Restore a stage from its checkpoint, or compute and record it.
+
+        Args:
+            stage: Pipeline stage
+            compute: Produces the stage result
+            dump: Splits a result into artifacts and data
+            load: Rebuilds a result from a checkpoint
+
+        Returns:
+            Stage result
+        """
+        checkpoint = await self.restore(stage)
+        if checkpoint is not None:
+            try:
+                result = load(checkpoint)
+            except (KeyError, TypeError, ValueError):
+                logger.warning("checkpoint_load_failed", stage=stage.value, exc_info=True)
+            else:
+                self.restored.append(stage)
+                logger.info("stage_restored", stage=stage.value)
+                return result
+
+        # Everything after a recomputed stage is recomputed as well
+        self._invalidated = True
+        result = await compute()
+        artifacts, data = dump(result)
+        await self.record(stage, artifacts, data)
+        return result
+
+
+def _artifact_path(checkpoint: dict[str, Any], name: str) -> Path:
+    """Get an artifact path from a checkpoint."""
+    return Path(checkpoint["artifacts"][name]["path"])
+
+
+def _dump_timestamps(timestamps: list[WordTimestamp] | None) -> list[list[Any]] | None:
+    if timestamps is None:
+        return None
+    return [[wt.word, wt.start, wt.end] for wt in timestamps]
+
+
+def _load_timestamps(raw: list[list[Any]] | None) -> list[WordTimestamp] | None:
+    if raw is None:
+        return None
+    return [WordTimestamp(word=w, start=s, end=e) for w, s, e in raw]
+
+
+# ---- TTS ----
+
+
+def dump_scene_tts(results: list[SceneTTSResult]) -> StageOutput:
+    """Serialize per-scene TTS results."""
+    artifacts = {f"scene_{i}": r.audio_path for i, r in enumerate(results)}
+    data = {
+        "scenes": [
+            {
+                "scene_index": r.scene_index,
+                "scene_type": r.scene_type,
+                "duration_seconds": r.duration_seconds,
+                "start_offset": r.start_offset,
+                "word_timestamps": _dump_timestamps(r.word_timestamps),
+            }
+            for r in results
+        ]
+    }
+    return artifacts, data
+
+
+def load_scene_tts(checkpoint: dict[str, Any]) -> list[SceneTTSResult]:
+    """Rebuild per-scene TTS results from a checkpoint."""
+    return [
+        SceneTTSResult(
+            scene_index=scene["scene_index"],
+            scene_type=scene["scene_type"],
+            audio_path=_artifact_path(checkpoint, f"scene_{i}"),
+            duration_seconds=scene["duration_seconds"],
+            word_timestamps=_load_timestamps(scene["word_timestamps"]),
+            start_offset=scene["start_offset"],
+        )
+        for i, scene in enumerate(checkpoint["data"]["scenes"])
+    ]
+
+
+# ---- Concat ----
+
+
+def dump_tts_result(result: TTSResult) -> StageOutput:
+    """Serialize the combined audio result."""
+    data = {
+        "duration_seconds": result.duration_seconds,
+        "word_timestamps": _dump_timestamps(result.word_timestamps),
+        "sample_rate": result.sample_rate,
+        "format": result.format,
+    }
+    return {"audio": result.audio_path}, data
+
+
+def load_tts_result(checkpoint: dict[str, Any]) -> TTSResult:
+    """Rebuild the combined audio result from a checkpoint."""
+    data = checkpoint["data"]
+    return TTSResult(
+        audio_path=_artifact_path(checkpoint, "audio"),
+        duration_seconds=data["duration_seconds"],
+        word_timestamps=_load_timestamps(data["word_timestamps"]),
+        sample_rate=data["sample_rate"],
+        format=data["format"],
+    )
+
+
+# ---- Subtitles / thumbnail ----
+
+
+def dump_optional_path(path: Path | None) -> StageOutput:
+    """Serialize a stage whose result is a single optional file."""
+    return ({"file": path} if path is not None else {}), {}
+
+
+def load_optional_path(checkpoint: dict[str, Any]) -> Path | None:
+    """Rebuild a single optional file result from a checkpoint."""
+    if "file" not in checkpoint["artifacts"]:
+        return None
+    return _artifact_path(checkpoint, "file")
+
+
+def dump_path(path: Path) -> StageOutput:
+    """Serialize a stage whose result is a single file."""
+    return {"file": path}, {}
+
+
+def load_path(checkpoint: dict[str, Any]) -> Path:
+    """Rebuild a single file result from a checkpoint."""
+    return _artifact_path(checkpoint, "file")
+
+
+# ---- Visuals ----
+
+
+def dump_scene_visuals(results: list[SceneVisualResult]) -> StageOutput:
+    """Serialize per-scene visual results.
+
+    Generated assets (solid colors, gradients) have no file and are
+    restored from their metadata alone.
+    """
+    artifacts: dict[str, Path] = {}
+    scenes: list[dict[str, Any]] = []
+    for i, r in enumerate(results):
+        asset = r.asset
+        if asset.path is not None:
+            artifacts[f"scene_{i}"] = asset.path
+        scenes.append(
+            {
+                "scene_index": r.scene_index,
+                "scene_type": r.scene_type,
+                "duration": r.duration,
+                "start_offset": r.start_offset,
+                "asset": {
+                    "type": asset.type.value,
+                    "url": asset.url,
+                    "duration": asset.duration,
+                    "width": asset.width,
+                    "height": asset.height,
+                    "color": asset.color,
+                    "gradient_colors": asset.gradient_colors,
+                    "source": asset.source,
+                    "source_id": asset.source_id,
+                    "license": asset.license,
+                    "keywords": asset.keywords,
+                    "metadata": asset.metadata,
+                    "metadata_score": asset.metadata_score,
+                },
+            }
+        )
+    return artifacts, {"scenes": scenes}
+
+
+def load_scene_visuals(checkpoint: dict[str, Any]) -> list[SceneVisualResult]:
+    """Rebuild per-scene visual results from a checkpoint."""
+    results: list[SceneVisualResult] = []
+    for i, scene in enumerate(checkpoint["data"]["scenes"]):
+        fields = dict(scene["asset"])
+        fields["type"] = VisualSourceType(fields["type"])
+        path = (
+            _artifact_path(checkpoint, f"scene_{i}")
+            if f"scene_{i}" in checkpoint["artifacts"]
+            else None
+        )
+        results.append(
+            SceneVisualResult(
+                scene_index=scene["scene_index"],
+                scene_type=scene["scene_type"],
+                asset=VisualAsset(path=path, **fields),
+                duration=scene["duration"],
+                start_offset=scene["start_offset"],
+            )
+        )
+    return results
+
+
+# ---- Compose ----
+
+
+def dump_composition(result: CompositionResult) -> StageOutput:
+    """Serialize the composition result."""
+    data = {
+        "duration_seconds": result.duration_seconds,
+        "file_size_bytes": result.file_size_bytes,
+        "resolution": result.resolution,
+        "fps": result.fps,
+    }
+    return {"video": result.video_path}, data
+
+
+def load_composition(checkpoint: dict[str, Any]) -> CompositionResult:
+    """Rebuild the composition result from a checkpoint."""
+    data = checkpoint["data"]
+    return CompositionResult(
+        video_path=_artifact_path(checkpoint, "video"),
+        duration_seconds=data["duration_seconds"],
+        file_size_bytes=data["file_size_bytes"],
+        resolution=data["resolution"],
+        fps=data["fps"],
+    )
+
+
+__all__ = [
+    "StageCheckpointer",
+    "StageOutput",
+    "dump_composition",
+    "dump_optional_path",
+    "dump_path",
+    "dump_scene_tts",
+    "dump_scene_visuals",
+    "dump_tts_result",
+    "file_sha256",
+    "load_composition",
+    "load_optional_path",
+    "load_path",
+    "load_scene_tts",
+    "load_scene_visuals",
+    "load_tts_result",
+]
@@ -2,9 +2,16 @@
 
 This module provides a typed interface for FFmpeg operations,
 using the ffmpeg-python library for better type safety and maintainability.
-All operations use the SDK approach - no subprocess calls.
+Streams are built with the SDK and compiled to argument lists, which are
+then executed as asyncio subprocesses so FFmpeg never blocks the event loop.
 """
 
+import asyncio
+import contextlib
+import json
+import re
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -26,6 +33,18 @@ def _get_generator_defaults() -> dict[str, Any]:
     return generator if isinstance(generator, dict) else {}
 
 
+def _get_execution_defaults() -> dict[str, Any]:
+    """Get FFmpeg execution defaults (worker pool size, timeouts)."""
+    execution = _get_generator_defaults().get("ffmpeg", {})
+    return execution if isinstance(execution, dict) else {}
+
+
+# Matches "key=value" lines emitted by "-progress pipe:2"
+_PROGRESS_LINE_RE = re.compile(r"^([a-z_]+)=(.*)$")
+# Number of stderr lines kept for error reporting
+_STDERR_TAIL_LINES = 50
+
+
 class FFmpegError(Exception):
     """FFmpeg operation failed."""
 
@@ -65,27 +84,116 @@ class ProbeResult:
     bit_rate: int | None
 
 
+@dataclass
+class FFmpegProgress:
+    """Progress snapshot parsed from FFmpeg ``-progress`` output.
+
+    Attributes:
+        frame: Number of frames encoded so far
+        fps: Current encoding speed in frames per second
+        out_time_seconds: Output timestamp reached so far
+        speed: Encoding speed relative to realtime (e.g. 2.5 = 2.5x)
+        is_final: Whether this is the last report ("progress=end")
+    """
+
+    frame: int = 0
+    fps: float = 0.0
+    out_time_seconds: float = 0.0
+    speed: float | None = None
+    is_final: bool = False
+
+
+ProgressCallback = Callable[[FFmpegProgress], None]
+
+
+def _parse_progress_block(fields: dict[str, str]) -> FFmpegProgress:
+    """Build an FFmpegProgress from one block of ``-progress`` key/value pairs.
+
+    Args:
+        fields: Key/value pairs collected up to a "progress=" line
+
+    Returns:
+        Parsed progress snapshot
+    """
+
+    def _to_float(value: str | None) -> float | None:
+        if not value or value == "N/A":
+            return None
+        try:
+            return float(value.rstrip("x"))
+        except ValueError:
+            return None
+
+    frame = _to_float(fields.get("frame"))
+    fps = _to_float(fields.get("fps"))
+    # out_time_us is microseconds ("out_time_ms" is also microseconds, kept for old builds)
+    out_time_us = _to_float(fields.get("out_time_us") or fields.get("out_time_ms"))
+
+    return FFmpegProgress(
+        frame=int(frame) if frame is not None else 0,
+        fps=fps or 0.0,
+        out_time_seconds=max(out_time_us / 1_000_000, 0.0) if out_time_us is not None else 0.0,
+        speed=_to_float(fields.get("speed")),
+        is_final=fields.get("progress") == "end",
+    )
+
+
 class FFmpegWrapper:
     """Type-safe wrapper for FFmpeg operations.
 
     Provides a clean interface for common FFmpeg tasks with proper
     error handling and type annotations.
 
+    Jobs run as asyncio subprocesses. At most ``max_concurrent_jobs``
+    FFmpeg processes run at once per wrapper; further jobs wait for a
+    free slot. Share one wrapper to bound FFmpeg load process-wide.
+
     Example:
         >>> wrapper = FFmpegWrapper()
         >>> info = await wrapper.probe("/path/to/video.mp4")
         >>> print(f"Duration: {info.duration}s")
     """
 
-    def __init__(self, overwrite: bool = True, quiet: bool = True) -> None:
+    def __init__(
+        self,
+        overwrite: bool = True,
+        quiet: bool = True,
+        max_concurrent_jobs: int | None = None,
+        timeout_seconds: float | None = None,
+        probe_timeout_seconds: float | None = None,
+    ) -> None:
         """Initialize FFmpeg wrapper.
 
         Args:
             overwrite: Whether to overwrite output files
             quiet: Whether to suppress FFmpeg output
+            max_concurrent_jobs: Size of the FFmpeg worker pool (default from config)
+            timeout_seconds: Default per-job timeout, None to use config
+            probe_timeout_seconds: Timeout for ffprobe calls, None to use config
         """
+        execution = _get_execution_defaults()
         self.overwrite = overwrite
         self.quiet = quiet
+        self.max_concurrent_jobs = max(
+            1, max_concurrent_jobs or int(execution.get("max_concurrent_jobs", 4))
+        )
+        self.timeout_seconds = (
+            timeout_seconds
+            if timeout_seconds is not None
+            else float(execution.get("timeout_seconds", 600))
+        )
+        self.probe_timeout_seconds = (
+            probe_timeout_seconds
+            if probe_timeout_seconds is not None
+            else float(execution.get("probe_timeout_seconds", 30))
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+        self._active_jobs = 0
+
+    @property
+    def active_jobs(self) -> int:
+        """Number of FFmpeg processes currently running."""
+        return self._active_jobs
 
     async def probe(self, input_path: Path | str) -> ProbeResult:
         """Probe a media file for information.
@@ -99,13 +207,21 @@ class FFmpegWrapper:
         Raises:
             FFmpegError: If probing fails
         """
+        cmd = ["ffprobe", "-show_format", "-show_streams", "-of", "json", str(input_path)]
         try:
-            probe_data = ffmpeg.probe(str(input_path))
-        except ffmpeg.Error as e:
-            raise FFmpegError(
-                f"Failed to probe {input_path}",
-                stderr=e.stderr.decode() if e.stderr else None,
-            ) from e
+            returncode, stdout, stderr = await self._execute(
+                cmd, timeout=self.probe_timeout_seconds, capture_stdout=True
+            )
+        except FFmpegError as e:
+            raise FFmpegError(f"Failed to probe {input_path}", stderr=e.stderr) from e
+
+        if returncode != 0:
+            raise FFmpegError(f"Failed to probe {input_path}", stderr=stderr or None)
+
+        try:
+            probe_data = json.loads(stdout)
+        except json.JSONDecodeError as e:
+            raise FFmpegError(f"Failed to probe {input_path}", stderr=stderr or None) from e
 
         # Parse format info
         format_info = probe_data.get("format", {})
@@ -375,24 +491,140 @@ class FFmpegWrapper:
 
         return stream
 
-    async def run(self, stream: ffmpeg.nodes.OutputStream) -> None:
-        """Execute an FFmpeg stream.
+    async def run(
+        self,
+        stream: ffmpeg.nodes.OutputStream,
+        timeout: float | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> None:
+        """Execute an FFmpeg stream without blocking the event loop.
+
+        The job waits for a free slot in the worker pool, then runs as an
+        asyncio subprocess. Cancelling the awaiting task kills the process.
 
         Args:
             stream: FFmpeg output stream to execute
+            timeout: Per-job timeout in seconds (defaults to ``timeout_seconds``)
+            on_progress: Optional callback invoked with each progress report
 
         Raises:
-            FFmpegError: If execution fails
+            FFmpegError: If execution fails or times out
         """
-        try:
-            if self.quiet:
-                stream.run(quiet=True, capture_stderr=True)
-            else:
-                stream.run()
-        except ffmpeg.Error as e:
-            stderr = e.stderr.decode() if e.stderr else "Unknown error"
-            logger.error("FFmpeg command failed", stderr=stderr, exc_info=True)
-            raise FFmpegError(f"FFmpeg execution failed: {stderr}", stderr=stderr) from e
+        args = self.get_command(stream)
+        # Progress reports go to stderr alongside log lines; -nostats drops the
+        # carriage-return status line that would otherwise interleave with them.
+        cmd = [args[0], "-nostats", "-progress", "pipe:2", *args[1:]]
+
+        returncode, _, stderr = await self._execute(
+            cmd,
+            timeout=timeout if timeout is not None else self.timeout_seconds,
+            on_progress=on_progress,
+        )
+
+        if returncode != 0:
+            stderr = stderr or "Unknown error"
+            logger.error("FFmpeg command failed", returncode=returncode, stderr=stderr[-500:])
+            raise FFmpegError(f"FFmpeg execution failed: {stderr}", stderr=stderr)
+
+    async def _execute(
+        self,
+        cmd: list[str],
+        timeout: float | None,
+        on_progress: ProgressCallback | None = None,
+        capture_stdout: bool = False,
+    ) -> tuple[int, str, str]:
+        """Run an FFmpeg/ffprobe command in the worker pool.
+
+        Args:
+            cmd: Full command line (executable first)
+            timeout: Timeout in seconds, or None/0 for no limit
+            on_progress: Callback for parsed ``-progress`` blocks on stderr
+            capture_stdout: Whether to collect stdout (ffprobe JSON output)
+
+        Returns:
+            Tuple of (returncode, stdout, stderr tail)
+
+        Raises:
+            FFmpegError: If the executable is missing or the job times out
+        """
+        async with self._semaphore:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=(
+                        asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL
+                    ),
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except FileNotFoundError as e:
+                raise FFmpegError(f"{cmd[0]} executable not found") from e
+
+            self._active_jobs += 1
+            stderr_tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+            stdout_task: asyncio.Future[bytes] | None = None
+            if capture_stdout and proc.stdout is not None:
+                stdout_task = asyncio.ensure_future(proc.stdout.read())
+            try:
+                async with asyncio.timeout(timeout or None):
+                    await self._consume_stderr(proc, stderr_tail, on_progress)
+                    stdout = await stdout_task if stdout_task else b""
+                    returncode = await proc.wait()
+            except TimeoutError:
+                logger.error("FFmpeg job timed out", command=cmd[0], timeout_s=timeout)
+                raise FFmpegError(
+                    f"{cmd[0]} timed out after {timeout}s", stderr="\n".join(stderr_tail)
+                ) from None
+            finally:
+                self._active_jobs -= 1
+                if stdout_task is not None and not stdout_task.done():
+                    stdout_task.cancel()
+                if proc.returncode is None:
+                    # Timed out or cancelled: don't leave an orphaned encoder behind
+                    with contextlib.suppress(ProcessLookupError):
+                        proc.kill()
+                    await asyncio.shield(proc.wait())
+
+        return returncode, stdout.decode("utf-8", errors="replace"), "\n".join(stderr_tail)
+
+    async def _consume_stderr(
+        self,
+        proc: asyncio.subprocess.Process,
+        stderr_tail: deque[str],
+        on_progress: ProgressCallback | None,
+    ) -> None:
+        """Stream stderr line by line, splitting progress reports from log output.
+
+        Args:
+            proc: Running FFmpeg process
+            stderr_tail: Bounded buffer receiving non-progress log lines
+            on_progress: Callback for each completed progress block
+        """
+        if proc.stderr is None:
+            return
+
+        fields: dict[str, str] = {}
+        async for raw_line in proc.stderr:
+            line = raw_line.decode("utf-8", errors="replace").rstrip()
+            if not line:
+                continue
+
+            match = _PROGRESS_LINE_RE.match(line)
+            if not match:
+                stderr_tail.append(line)
+                if not self.quiet:
+                    logger.debug("ffmpeg_output", line=line)
+                continue
+
+            key, value = match.groups()
+            fields[key] = value.strip()
+            if key == "progress":
+                if on_progress is not None:
+                    try:
+                        on_progress(_parse_progress_block(fields))
+                    except Exception:
+                        logger.warning("FFmpeg progress callback failed", exc_info=True)
+                fields = {}
 
     def get_command(self, stream: ffmpeg.nodes.OutputStream) -> list[str]:
         """Get the FFmpeg command line arguments.
@@ -828,6 +1060,8 @@ class FFmpegWrapper:
 
 __all__ = [
     "FFmpegError",
+    "FFmpegProgress",
     "FFmpegWrapper",
     "ProbeResult",
+    "ProgressCallback",
 ]
@@ -0,0 +1,544 @@
+"""FFmpeg-based video compositor.
+
+Renders the same output contract as RemotionCompositor with a single
+FFmpeg invocation, for templates that select ``compositor: ffmpeg``.
+Everything is built as one filter graph:
+
+- per-scene scale/crop with an optional Ken Burns zoom
+- ``xfade`` transitions between scenes
+- color grading
+- ASS (or SRT) subtitles burned in from the subtitle file
+- the two-line headline via ``drawtext``
+- background music ducked under the voice (``sidechaincompress``)
+
+No browser and no intermediate video files are involved (only the
+headline text files ``drawtext`` reads, written to a temporary directory
+for the duration of the render), so simple templates render in seconds
+instead of minutes.
+"""
+
+import math
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import ffmpeg
+
+from app.config.video import CompositionConfig
+from app.config.video_template import SafeZoneConfig, ThemeConfig, VisualEffectsConfig
+from app.core.config_loader import load_defaults
+from app.core.logging import get_logger
+from app.services.generator.ffmpeg import FFmpegError, FFmpegProgress, FFmpegWrapper
+from app.services.generator.remotion_compositor import CompositionResult
+
+if TYPE_CHECKING:
+    from app.config.persona import PersonaStyleConfig
+    from app.config.video_template import VideoTemplateConfig
+    from app.models.scene import Scene
+    from app.services.generator.subtitle import SubtitleFile
+    from app.services.generator.tts.base import SceneTTSResult
+    from app.services.generator.visual.manager import SceneVisualResult
+
+logger = get_logger(__name__)
+
+
+# Template/scene transition names mapped to xfade transitions
+_XFADE_TRANSITIONS: dict[str, str] = {
+    "fade": "fade",
+    "crossfade": "fade",
+    "flash": "fadewhite",
+    "zoom": "zoomin",
+    "slide": "slideleft",
+    "slide_left": "slideleft",
+    "slide_right": "slideright",
+    "wipe": "wipeleft",
+}
+# Seconds the headline stays on screen (matches the Remotion layout)
+_HEADLINE_EXIT_AFTER_SECONDS = 3.0
+
+
+@lru_cache(maxsize=1)
+def _get_ffmpeg_compositor_defaults() -> dict[str, Any]:
+    """Get FFmpeg compositor defaults from config/defaults.yaml."""
+    generator = load_defaults().get("generator", {})
+    section = generator.get("ffmpeg_compositor", {}) if isinstance(generator, dict) else {}
+    return section if isinstance(section, dict) else {}
+
+
+@dataclass
+class _Segment:
+    """One visual segment of the timeline.
+
+    Attributes:
+        scene_index: Index of the scene the segment belongs to
+        path: Image or video file (None renders a solid color)
+        is_video: Whether ``path`` is a video
+        color: Fill color when there is no file
+        duration: Seconds the segment owns on the timeline
+        transition: xfade transition into the next segment (None for a cut)
+    """
+
+    scene_index: int
+    path: Path | None
+    is_video: bool
+    color: str
+    duration: float
+    transition: str | None = None
+
+
+class FFmpegCompositor:
+    """Compose video with a single FFmpeg filter graph.
+
+    A drop-in alternative to RemotionCompositor for simple templates:
+    karaoke and React animations are not available, but rendering needs
+    neither Chromium nor staged assets.
+
+    Example:
+        >>> compositor = FFmpegCompositor(CompositionConfig(), ffmpeg_wrapper)
+        >>> result = await compositor.compose_scenes(scenes, tts, visuals, ...)
+    """
+
+    def __init__(
+        self,
+        config: CompositionConfig,
+        ffmpeg_wrapper: FFmpegWrapper,
+        preset: str | None = None,
+        fonts_dir: Path | None = None,
+    ) -> None:
+        """Initialize FFmpegCompositor.
+
+        Args:
+            config: Video composition configuration
+            ffmpeg_wrapper: FFmpeg wrapper used to run the render
+            preset: x264 preset (default from config, then ``config.preset``)
+            fonts_dir: Directory with subtitle/headline fonts (default from config)
+        """
+        defaults = _get_ffmpeg_compositor_defaults()
+        self.config = config
+        self.ffmpeg = ffmpeg_wrapper
+        self.preset = preset or str(defaults.get("preset") or config.preset)
+        configured_fonts = fonts_dir or defaults.get("fonts_dir")
+        self.fonts_dir = Path(configured_fonts) if configured_fonts else None
+        ducking = defaults.get("ducking", {})
+        self.ducking: dict[str, Any] = ducking if isinstance(ducking, dict) else {}
+
+    async def compose_scenes(
+        self,
+        scenes: list["Scene"],
+        scene_tts_results: list["SceneTTSResult"],
+        scene_visuals: list["SceneVisualResult"],
+        combined_audio_path: Path,
+        subtitle_file: Path | None,
+        output_path: Path,
+        persona_style: "PersonaStyleConfig | None" = None,
+        background_music_path: Path | None = None,
+        headline: str | None = None,
+        subtitle_data: "SubtitleFile | None" = None,
+        video_template: "VideoTemplateConfig | None" = None,
+        sfx_dir: Path | None = None,
+    ) -> CompositionResult:
+        """Compose video from scene-based components in one FFmpeg pass.
+
+        Args:
+            scenes: List of Scene objects
+            scene_tts_results: Per-scene TTS results (timing)
+            scene_visuals: Per-scene visual assets (local file paths)
+            combined_audio_path: Path to merged TTS audio
+            subtitle_file: Path to saved ASS/SRT file to burn in
+            output_path: Output video path (without extension)
+            persona_style: Channel persona style config
+            background_music_path: Optional BGM path
+            headline: Headline string (split into 2 lines at newline)
+            subtitle_data: Unused; subtitles come from ``subtitle_file``
+            video_template: Video template config (effects, safe zone, theme)
+            sfx_dir: Unused; sound effects are Remotion-only
+
+        Returns:
+            CompositionResult with path and metadata
+
+        Raises:
+            FFmpegError: If rendering fails
+        """
+        output_mp4 = output_path.with_suffix(".mp4").resolve()
+        output_mp4.parent.mkdir(parents=True, exist_ok=True)
+        total_duration = sum(r.duration_seconds for r in scene_tts_results)
+
+        last_progress: list[FFmpegProgress] = []
+        # Headline text files must outlive the render but not be left next to the output
+        with tempfile.TemporaryDirectory(prefix="ffmpeg_render_") as work_dir:
+            stream = self.build_stream(
+                scenes=scenes,
+                scene_visuals=scene_visuals,
+                combined_audio_path=combined_audio_path,
+                subtitle_file=subtitle_file,
+                output_mp4=output_mp4,
+                total_duration=total_duration,
+                work_dir=Path(work_dir),
+                persona_style=persona_style,
+                background_music_path=background_music_path,
+                headline=headline,
+                video_template=video_template,
+            )
+
+            logger.info(
+                "ffmpeg_render_start",
+                scenes=len(scene_visuals),
+                duration_s=round(total_duration, 1),
+                preset=self.preset,
+            )
+
+            await self.ffmpeg.run(stream, on_progress=last_progress.append)
+
+        if not output_mp4.exists():
+            raise FFmpegError(f"FFmpeg produced no output at {output_mp4}")
+
+        logger.info(
+            "ffmpeg_render_complete",
+            path=str(output_mp4),
+            frames=last_progress[-1].frame if last_progress else None,
+            speed=last_progress[-1].speed if last_progress else None,
+        )
+
+        return CompositionResult(
+            video_path=output_mp4,
+            duration_seconds=total_duration,
+            file_size_bytes=output_mp4.stat().st_size,
+            resolution=f"{self.config.width}x{self.config.height}",
+            fps=self.config.fps,
+        )
+
+    def build_stream(
+        self,
+        scenes: list["Scene"],
+        scene_visuals: list["SceneVisualResult"],
+        combined_audio_path: Path,
+        subtitle_file: Path | None,
+        output_mp4: Path,
+        total_duration: float,
+        work_dir: Path,
+        persona_style: "PersonaStyleConfig | None" = None,
+        background_music_path: Path | None = None,
+        headline: str | None = None,
+        video_template: "VideoTemplateConfig | None" = None,
+    ) -> ffmpeg.nodes.OutputStream:
+        """Build the single-pass render as an FFmpeg output stream.
+
+        Args:
+            scenes: List of Scene objects
+            scene_visuals: Per-scene visual assets
+            combined_audio_path: Path to merged TTS audio
+            subtitle_file: Path to ASS/SRT file to burn in
+            output_mp4: Output video path
+            total_duration: Video duration in seconds
+            work_dir: Directory for files the graph reads (headline text);
+                must exist until the render finishes
+            persona_style: Channel persona style config
+            background_music_path: Optional BGM path
+            headline: Headline string
+            video_template: Video template config
+
+        Returns:
+            FFmpeg output stream (one input per segment, one filter graph)
+        """
+        vfx = (
+            video_template.visual_effects
+            if video_template and video_template.visual_effects
+            else VisualEffectsConfig()
+        )
+
+        segments = self._build_segments(scenes, scene_visuals, vfx, total_duration)
+        video = self._build_video(segments, vfx)
+
+        if vfx.color_grading_enabled:
+            video = video.filter(
+                "eq",
+                brightness=vfx.brightness,
+                contrast=vfx.contrast,
+                saturation=vfx.saturation,
+            )
+
+        if subtitle_file is not None and subtitle_file.exists():
+            video = self._burn_subtitles(video, subtitle_file)
+
+        headline_text = (headline or "").strip()
+        if headline_text:
+            video = self._draw_headline(
+                video, headline_text, work_dir, video_template, persona_style
+            )
+
+        audio = self._build_audio(combined_audio_path, background_music_path)
+
+        stream = ffmpeg.output(
+            video,
+            audio,
+            str(output_mp4),
+            vcodec=self.config.video_codec,
+            acodec=self.config.audio_codec,
+            crf=self.config.crf,
+            preset=self.preset,
+            pix_fmt=self.config.pixel_format,
+            r=self.config.fps,
+            t=total_duration,
+            movflags="+faststart",
+            **{"b:a": self.config.audio_bitrate},
+        )
+        if self.ffmpeg.overwrite:
+            stream = stream.overwrite_output()
+        return stream
+
+    def _build_segments(
+        self,
+        scenes: list["Scene"],
+        scene_visuals: list["SceneVisualResult"],
+        vfx: VisualEffectsConfig,
+        total_duration: float,
+    ) -> list[_Segment]:
+        """Lay visuals out on the timeline with the transition after each.
+
+        A transition is taken from the next scene's ``transition_in`` when
+        the scene changes, and from the template otherwise.
+
+        Args:
+            scenes: List of Scene objects
+            scene_visuals: Per-scene visual assets
+            vfx: Visual effects config
+            total_duration: Video duration (used when there are no visuals)
+
+        Returns:
+            Timeline segments, in order
+        """
+        segments: list[_Segment] = []
+        for sv in scene_visuals:
+            if sv.duration <= 0:
+                continue
+            asset = sv.asset
+            has_file = asset.path is not None and asset.path.exists()
+            segments.append(
+                _Segment(
+                    scene_index=sv.scene_index,
+                    path=asset.path if has_file else None,
+                    is_video=has_file and asset.is_video,
+                    color=asset.color or (asset.gradient_colors or ["#000000"])[0],
+                    duration=sv.duration,
+                )
+            )
+
+        if not segments:
+            return [
+                _Segment(
+                    scene_index=0,
+                    path=None,
+                    is_video=False,
+                    color="#000000",
+                    duration=total_duration,
+                )
+            ]
+
+        for current, following in zip(segments, segments[1:], strict=False):
+            name: str = vfx.transition_type
+            if following.scene_index != current.scene_index and following.scene_index < len(scenes):
+                name = scenes[following.scene_index].transition_in.value
+            current.transition = _XFADE_TRANSITIONS.get(name)
+
+        return segments
+
+    def _build_video(self, segments: list[_Segment], vfx: VisualEffectsConfig) -> Any:
+        """Scale every segment and chain them with ``xfade``.
+
+        Each segment except the last is extended by its outgoing transition,
+        so transitions start exactly at scene boundaries and the timeline
+        length stays the sum of the segment durations.
+
+        Args:
+            segments: Timeline segments
+            vfx: Visual effects config
+
+        Returns:
+            Video stream of the full timeline
+        """
+        fps = self.config.fps
+        cut = 1 / fps
+        overlaps = [
+            (vfx.transition_duration if seg.transition else cut) if i < len(segments) - 1 else 0.0
+            for i, seg in enumerate(segments)
+        ]
+        # A transition cannot be longer than the segments it joins
+        for i in range(len(segments) - 1):
+            limit = min(segments[i].duration, segments[i + 1].duration) / 2
+            overlaps[i] = max(cut, min(overlaps[i], limit))
+
+        streams = [
+            self._segment_stream(seg, seg.duration + overlaps[i], vfx)
+            for i, seg in enumerate(segments)
+        ]
+
+        video = streams[0]
+        offset = 0.0
+        for i in range(1, len(streams)):
+            offset += segments[i - 1].duration
+            video = ffmpeg.filter(
+                [video, streams[i]],
+                "xfade",
+                transition=segments[i - 1].transition or "fade",
+                duration=round(overlaps[i - 1], 3),
+                offset=round(offset, 3),
+            )
+        return video
+
+    def _segment_stream(self, segment: _Segment, length: float, vfx: VisualEffectsConfig) -> Any:
+        """Build the scaled (and optionally zoomed) stream of one segment.
+
+        Args:
+            segment: Timeline segment
+            length: Seconds to render, including the outgoing transition
+            vfx: Visual effects config
+
+        Returns:
+            Video stream at output size, frame rate and pixel format
+        """
+        width, height, fps = self.config.width, self.config.height, self.config.fps
+        size = f"{width}x{height}"
+
+        if segment.path is None:
+            color = segment.color.lstrip("#")
+            return ffmpeg.input(
+                f"color=c=0x{color}:s={size}:r={fps}", f="lavfi", t=length
+            ).video.filter("format", "yuv420p")
+
+        if segment.is_video:
+            stream = ffmpeg.input(str(segment.path), stream_loop=-1, t=length).video
+        elif vfx.ken_burns_enabled:
+            # zoompan emits ``d`` frames from the single decoded image
+            stream = ffmpeg.input(str(segment.path)).video
+        else:
+            stream = ffmpeg.input(str(segment.path), loop=1, t=length, framerate=fps).video
+
+        stream = stream.filter(
+            "scale", width, height, force_original_aspect_ratio="increase"
+        ).filter("crop", width, height)
+
+        if vfx.ken_burns_enabled and not segment.is_video:
+            stream = stream.filter(
+                "zoompan",
+                z=f"min(zoom+{vfx.ken_burns_zoom_speed},{vfx.ken_burns_start_scale})",
+                x="iw/2-(iw/zoom/2)",
+                y="ih/2-(ih/zoom/2)",
+                d=max(1, math.ceil(length * fps)),
+                s=size,
+                fps=fps,
+            )
+
+        return (
+            stream.filter("fps", fps=fps)
+            .filter("trim", duration=round(length, 3))
+            .filter("setpts", "PTS-STARTPTS")
+            .filter("setsar", 1)
+            .filter("format", "yuv420p")
+        )
+
+    def _burn_subtitles(self, video: Any, subtitle_file: Path) -> Any:
+        """Burn an ASS (styled, from SubtitleGenerator) or SRT file into the video."""
+        options: dict[str, Any] = {}
+        if self.fonts_dir is not None and self.fonts_dir.is_dir():
+            options["fontsdir"] = str(self.fonts_dir)
+        name = "ass" if subtitle_file.suffix.lower() == ".ass" else "subtitles"
+        return video.filter(name, str(subtitle_file), **options)
+
+    def _draw_headline(
+        self,
+        video: Any,
+        headline: str,
+        work_dir: Path,
+        video_template: "VideoTemplateConfig | None",
+        persona_style: "PersonaStyleConfig | None",
+    ) -> Any:
+        """Draw the two-line headline inside the top safe zone.
+
+        Lines are passed through ``textfile`` so no drawtext escaping of
+        user text is needed.
+
+        Args:
+            video: Video stream
+            headline: Headline string (split into 2 lines at newline)
+            work_dir: Directory for the headline text files
+            video_template: Template config (safe zone, theme)
+            persona_style: Persona style (accent color override)
+
+        Returns:
+            Video stream with the headline drawn
+        """
+        theme = video_template.theme if video_template and video_template.theme else ThemeConfig()
+        safe_zone = (
+            video_template.layout.safe_zone
+            if video_template and video_template.layout.safe_zone
+            else SafeZoneConfig()
+        )
+        accent = persona_style.accent_color if persona_style else theme.accent_color
+
+        lines = [line.strip() for line in headline.split("\n", 1)]
+        styles = [
+            (theme.headline_font_size_line1, accent),
+            (theme.headline_font_size_line2, theme.secondary_color),
+        ]
+        box_color = f"{theme.headline_bg_color}@{theme.headline_bg_opacity}"
+        enable = f"lt(t,{_HEADLINE_EXIT_AFTER_SECONDS})"
+
+        # Lines stack upwards from the top of the safe zone
+        y = max(0, safe_zone.top_px - sum(size for size, _ in styles[: len(lines)]) * 1.3)
+        for index, (line, (font_size, color)) in enumerate(zip(lines, styles, strict=False)):
+            if not line:
+                continue
+            text_path = work_dir / f"headline_line{index + 1}.txt"
+            text_path.write_text(line, encoding="utf-8")
+            video = video.filter(
+                "drawtext",
+                textfile=str(text_path),
+                font=theme.font_family,
+                fontsize=font_size,
+                fontcolor=color,
+                borderw=4,
+                bordercolor=theme.outline_color,
+                box=1,
+                boxcolor=box_color,
+                boxborderw=20,
+                x="(w-text_w)/2",
+                y=round(y),
+                enable=enable,
+            )
+            y += font_size * 1.3
+        return video
+
+    def _build_audio(self, voice_path: Path, background_music_path: Path | None) -> Any:
+        """Mix the voice with BGM that ducks whenever the voice is present.
+
+        Args:
+            voice_path: Combined TTS audio
+            background_music_path: Optional BGM (looped to cover the video)
+
+        Returns:
+            Audio stream
+        """
+        voice = ffmpeg.input(str(voice_path)).audio
+        if background_music_path is None or not background_music_path.exists():
+            return voice
+
+        voice_split = voice.filter_multi_output("asplit", 2)
+        bgm = ffmpeg.input(str(background_music_path), stream_loop=-1).audio.filter(
+            "volume", self.config.background_music_volume
+        )
+        ducked = ffmpeg.filter(
+            [bgm, voice_split[0]],
+            "sidechaincompress",
+            threshold=self.ducking.get("threshold", 0.05),
+            ratio=self.ducking.get("ratio", 8),
+            attack=self.ducking.get("attack_ms", 20),
+            release=self.ducking.get("release_ms", 400),
+        )
+        return ffmpeg.filter(
+            [voice_split[1], ducked], "amix", inputs=2, duration="first", normalize=0
+        )
+
+
+__all__ = ["FFmpegCompositor"]
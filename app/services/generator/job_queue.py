@@ -0,0 +1,392 @@
+"""Durable, database-backed queue for video generation jobs.
+
+Stands in for a Celery broker: jobs live in the ``generation_jobs`` table,
+so they survive worker restarts and work on PostgreSQL as well as SQLite.
+
+Workers claim jobs with a time-limited lease. Each completed stage is
+checkpointed, and a heartbeat renews the lease while a stage runs, so a
+stage that waits for a pool slot or renders for a long time keeps its
+job. If a worker dies, its lease expires and the next worker to claim
+the job resumes it from the last completed stage.
+
+Claiming uses ``FOR UPDATE SKIP LOCKED`` where supported (PostgreSQL) and
+is always guarded by a conditional UPDATE, so two workers can never hold
+the same job.
+"""
+
+import asyncio
+import contextlib
+import os
+import socket
+import uuid
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.exceptions import JobLeaseLostError
+from app.core.logging import get_logger
+from app.core.types import SessionFactory
+from app.models.generation_job import GenerationJob, JobStatus
+from app.models.script import Script
+from app.services.generator.checkpoint import StageCheckpointer
+
+logger = get_logger(__name__)
+
+
+def _default_worker_id() -> str:
+    """Identify this worker process."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class GenerationJobQueue:
+    """Enqueue, lease and checkpoint video generation jobs.
+
+    Example:
+        >>> queue = GenerationJobQueue(async_session_maker)
+        >>> job = await queue.enqueue(script, {"voice_id": voice_id})
+        >>> job = await queue.claim(job_id=job.id)
+        >>> async with queue.heartbeat(job.id):
+        ...     result = await pipeline.generate(..., checkpointer=queue.checkpointer(job))
+        >>> await queue.complete(job.id)
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        lease_seconds: int = 1800,
+        max_attempts: int = 3,
+        worker_id: str | None = None,
+    ) -> None:
+        """Initialize GenerationJobQueue.
+
+        Args:
+            session_factory: Database session factory
+            lease_seconds: How long a claim is valid without a checkpoint or
+                heartbeat; heartbeats renew it every third of this
+            max_attempts: Attempts before a job is marked failed
+            worker_id: Identifier of this worker (generated if not provided)
+        """
+        self.session_factory = session_factory
+        self.lease = timedelta(seconds=lease_seconds)
+        self.heartbeat_seconds = lease_seconds / 3
+        self.max_attempts = max_attempts
+        self.worker_id = worker_id or _default_worker_id()
+
+    async def enqueue(self, script: Script, payload: dict[str, Any] | None = None) -> GenerationJob:
+        """Create the job for a script (idempotent per script).
+
+        Args:
+            script: Script to render
+            payload: Generation parameters (voice_id, tts_provider, template_name)
+
+        Returns:
+            New job, or the script's existing job
+        """
+        async with self.session_factory() as session:
+            job = GenerationJob(
+                id=uuid.uuid4(),
+                script_id=script.id,
+                channel_id=script.channel_id,
+                status=JobStatus.QUEUED,
+                payload=payload or {},
+                checkpoints={},
+                attempts=0,
+                max_attempts=self.max_attempts,
+            )
+            session.add(job)
+            try:
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                existing = await session.execute(
+                    select(GenerationJob).where(GenerationJob.script_id == script.id)
+                )
+                return existing.scalar_one()
+
+        logger.info("generation_job_enqueued", job_id=str(job.id), script_id=str(script.id))
+        return job
+
+    async def pending_job_ids(self, channel_id: uuid.UUID | None = None) -> list[uuid.UUID]:
+        """List jobs that can be claimed now, oldest first.
+
+        Args:
+            channel_id: Only jobs of this channel
+
+        Returns:
+            Job IDs
+        """
+        query = select(GenerationJob.id).where(self._claimable()).order_by(GenerationJob.created_at)
+        if channel_id is not None:
+            query = query.where(GenerationJob.channel_id == channel_id)
+
+        async with self.session_factory() as session:
+            await self._fail_exhausted(session)
+            result = await session.execute(query)
+            return list(result.scalars().all())
+
+    async def claim(
+        self,
+        job_id: uuid.UUID | None = None,
+        channel_id: uuid.UUID | None = None,
+    ) -> GenerationJob | None:
+        """Lease a queued job, or a running job whose lease expired.
+
+        Args:
+            job_id: Claim this specific job
+            channel_id: Claim the oldest claimable job of this channel
+
+        Returns:
+            Claimed job (detached, with its script loaded), or None if
+            nothing is claimable
+        """
+        now = datetime.now(tz=UTC)
+        query = (
+            select(GenerationJob)
+            .where(self._claimable(now))
+            .order_by(GenerationJob.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if job_id is not None:
+            query = query.where(GenerationJob.id == job_id)
+        if channel_id is not None:
+            query = query.where(GenerationJob.channel_id == channel_id)
+
+        async with self.session_factory() as session:
+            await self._fail_exhausted(session, now)
+            job = (await session.execute(query)).scalar_one_or_none()
+            if job is None:
+                return None
+
+            claimed = await session.execute(
+                update(GenerationJob)
+                .where(GenerationJob.id == job.id, self._claimable(now))
+                .values(
+                    status=JobStatus.RUNNING,
+                    locked_by=self.worker_id,
+                    locked_until=now + self.lease,
+                    attempts=GenerationJob.attempts + 1,
+                )
+                .returning(GenerationJob.id)
+                .execution_options(synchronize_session=False)
+            )
+            if claimed.scalar_one_or_none() is None:
+                await session.rollback()
+                return None
+            await session.commit()
+
+            reloaded = await session.execute(
+                select(GenerationJob)
+                .options(selectinload(GenerationJob.script))
+                .where(GenerationJob.id == job.id)
+                .execution_options(populate_existing=True)
+            )
+            job = reloaded.scalar_one()
+            session.expunge_all()
+
+        logger.info(
+            "generation_job_claimed",
+            job_id=str(job.id),
+            attempt=job.attempts,
+            completed_stages=[stage.value for stage in job.completed_stages],
+        )
+        return job
+
+    def checkpointer(self, job: GenerationJob) -> StageCheckpointer:
+        """Create a checkpointer that persists stages to this job.
+
+        Args:
+            job: Claimed job
+
+        Returns:
+            StageCheckpointer seeded with the job's checkpoints
+        """
+
+        async def persist(checkpoints: dict[str, Any]) -> None:
+            await self.save_checkpoints(job.id, checkpoints)
+
+        return StageCheckpointer(job.checkpoints, persist=persist)
+
+    async def save_checkpoints(self, job_id: uuid.UUID, checkpoints: dict[str, Any]) -> None:
+        """Store checkpoints and renew the lease.
+
+        Args:
+            job_id: Job held by this worker
+            checkpoints: All recorded checkpoints
+
+        Raises:
+            JobLeaseLostError: If another worker has taken over the job
+        """
+        await self._update_held(
+            job_id,
+            checkpoints=checkpoints,
+            locked_until=datetime.now(tz=UTC) + self.lease,
+        )
+
+    async def renew(self, job_id: uuid.UUID) -> None:
+        """Extend the lease of a held job.
+
+        Args:
+            job_id: Job held by this worker
+
+        Raises:
+            JobLeaseLostError: If another worker has taken over the job
+        """
+        await self._update_held(job_id, locked_until=datetime.now(tz=UTC) + self.lease)
+
+    @contextlib.asynccontextmanager
+    async def heartbeat(self, job_id: uuid.UUID) -> AsyncIterator[None]:
+        """Keep renewing a held job's lease while the block runs.
+
+        Args:
+            job_id: Job held by this worker
+        """
+        task = asyncio.create_task(self._renew_periodically(job_id))
+        try:
+            yield
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _renew_periodically(self, job_id: uuid.UUID) -> None:
+        """Renew the lease every ``heartbeat_seconds`` until cancelled or lost."""
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                await self.renew(job_id)
+            except JobLeaseLostError:
+                # The next checkpoint raises for the worker running the job
+                logger.warning("generation_job_lease_lost", job_id=str(job_id))
+                return
+            except Exception as e:
+                # Transient database errors; the lease still has time left
+                logger.warning("generation_job_heartbeat_failed", job_id=str(job_id), error=str(e))
+
+    async def complete(self, job_id: uuid.UUID) -> None:
+        """Mark a held job as completed.
+
+        Args:
+            job_id: Job held by this worker
+        """
+        await self._update_held(
+            job_id, status=JobStatus.COMPLETED, locked_by=None, locked_until=None, last_error=None
+        )
+        logger.info("generation_job_completed", job_id=str(job_id))
+
+    async def fail(self, job_id: uuid.UUID, error: str) -> None:
+        """Record a failed attempt; requeue unless attempts are exhausted.
+
+        Args:
+            job_id: Job held by this worker
+            error: Error message
+        """
+        async with self.session_factory() as session:
+            job = await session.get(GenerationJob, job_id)
+            if job is None or job.locked_by != self.worker_id:
+                raise JobLeaseLostError(job_id=str(job_id))
+            exhausted = job.attempts >= job.max_attempts
+            job.status = JobStatus.FAILED if exhausted else JobStatus.QUEUED
+            job.locked_by = None
+            job.locked_until = None
+            job.last_error = error[:2000]
+            await session.commit()
+
+        logger.warning(
+            "generation_job_failed",
+            job_id=str(job_id),
+            will_retry=not exhausted,
+            error=error[:200],
+        )
+
+    async def release(self, job_id: uuid.UUID) -> None:
+        """Return a held job to the queue without counting the attempt.
+
+        Used when a worker is cancelled (shutdown, channel timeout).
+
+        Args:
+            job_id: Job held by this worker
+        """
+        async with self.session_factory() as session:
+            await session.execute(
+                update(GenerationJob)
+                .where(GenerationJob.id == job_id, GenerationJob.locked_by == self.worker_id)
+                .values(
+                    status=JobStatus.QUEUED,
+                    locked_by=None,
+                    locked_until=None,
+                    attempts=GenerationJob.attempts - 1,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+        logger.info("generation_job_released", job_id=str(job_id))
+
+    async def _update_held(self, job_id: uuid.UUID, **values: Any) -> None:
+        """Update a job only while this worker holds its lease."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(GenerationJob)
+                .where(
+                    GenerationJob.id == job_id,
+                    GenerationJob.status == JobStatus.RUNNING,
+                    GenerationJob.locked_by == self.worker_id,
+                )
+                .values(**values)
+                .returning(GenerationJob.id)
+                .execution_options(synchronize_session=False)
+            )
+            if result.scalar_one_or_none() is None:
+                await session.rollback()
+                raise JobLeaseLostError(job_id=str(job_id))
+            await session.commit()
+
+    async def _fail_exhausted(self, session: AsyncSession, now: datetime | None = None) -> None:
+        """Fail running jobs whose lease expired on their last attempt.
+
+        A worker that dies mid-job never calls ``fail``, so without this a
+        job that keeps killing its worker would be reclaimed forever.
+        """
+        now = now or datetime.now(tz=UTC)
+        result = await session.execute(
+            update(GenerationJob)
+            .where(
+                GenerationJob.status == JobStatus.RUNNING,
+                GenerationJob.locked_until < now,
+                GenerationJob.attempts >= GenerationJob.max_attempts,
+            )
+            .values(
+                status=JobStatus.FAILED,
+                locked_by=None,
+                locked_until=None,
+                last_error="Lease expired on the final attempt",
+            )
+            .returning(GenerationJob.id)
+            .execution_options(synchronize_session=False)
+        )
+        failed = list(result.scalars().all())
+        await session.commit()
+        for job_id in failed:
+            logger.warning("generation_job_exhausted", job_id=str(job_id))
+
+    @staticmethod
+    def _claimable(now: datetime | None = None) -> ColumnElement[bool]:
+        """Condition for jobs a worker may claim."""
+        now = now or datetime.now(tz=UTC)
+        return or_(
+            GenerationJob.status == JobStatus.QUEUED,
+            and_(
+                GenerationJob.status == JobStatus.RUNNING,
+                GenerationJob.locked_until < now,
+                GenerationJob.attempts < GenerationJob.max_attempts,
+            ),
+        )
+
+
+__all__ = ["GenerationJobQueue"]
@@ -7,25 +7,45 @@ Supports scene-based generation for BSForge's scene architecture.
 
 import shutil
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from app.config.video import VideoGenerationConfig
 from app.config.video_template import VideoTemplateConfig
 from app.core.logging import get_logger
 from app.core.template_loader import VideoTemplateLoader
 from app.core.types import SessionFactory
+from app.infrastructure.resource_pools import ResourceClass, ResourcePools, resource_slot
+from app.models.generation_job import GenerationStage
 from app.models.script import Script
 from app.services.generator.bgm import BGMManager
+from app.services.generator.checkpoint import (
+    StageCheckpointer,
+    StageOutput,
+    dump_composition,
+    dump_optional_path,
+    dump_path,
+    dump_scene_tts,
+    dump_scene_visuals,
+    dump_tts_result,
+    load_composition,
+    load_optional_path,
+    load_path,
+    load_scene_tts,
+    load_scene_visuals,
+    load_tts_result,
+)
 from app.services.generator.ffmpeg import FFmpegWrapper
-from app.services.generator.remotion_compositor import RemotionCompositor
+from app.services.generator.ffmpeg_compositor import FFmpegCompositor
+from app.services.generator.remotion_compositor import CompositionResult, RemotionCompositor
 from app.services.generator.subtitle import SubtitleGenerator
-from app.services.generator.tts.base import TTSSynthesisConfig
+from app.services.generator.tts.base import SceneTTSResult, TTSResult, TTSSynthesisConfig
 from app.services.generator.tts.factory import TTSEngineFactory
 from app.services.generator.tts.utils import concatenate_scene_audio
-from app.services.generator.visual.manager import VisualSourcingManager
+from app.services.generator.visual.manager import SceneVisualResult, VisualSourcingManager
 
 if TYPE_CHECKING:
     from app.config.persona import PersonaStyleConfig
@@ -33,6 +53,21 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+async def _run_stage(
+    checkpointer: StageCheckpointer | None,
+    stage: GenerationStage,
+    compute: Callable[[], Awaitable[T]],
+    dump: Callable[[T], StageOutput],
+    load: Callable[[dict[str, Any]], T],
+) -> T:
+    """Run a pipeline stage, through the checkpointer when there is one."""
+    if checkpointer is None:
+        return await compute()
+    return await checkpointer.run(stage, compute, dump, load)
+
 
 @dataclass
 class VideoGenerationResult:
@@ -99,6 +134,8 @@ class VideoGenerationPipeline:
         config: VideoGenerationConfig,
         template_loader: VideoTemplateLoader,
         bgm_manager: BGMManager,
+        resource_pools: ResourcePools | None = None,
+        ffmpeg_compositor: FFmpegCompositor | None = None,
     ) -> None:
         """Initialize VideoGenerationPipeline.
 
@@ -112,6 +149,10 @@ class VideoGenerationPipeline:
             config: Video generation configuration
             template_loader: Video template loader
             bgm_manager: BGM manager for background music
+            resource_pools: Shared pools bounding network (TTS, visuals) and
+                CPU (FFmpeg, Remotion) stages across channels
+            ffmpeg_compositor: Single-pass compositor for templates that
+                select ``compositor: ffmpeg``
         """
         self.tts_factory = tts_factory
         self.visual_manager = visual_manager
@@ -122,6 +163,8 @@ class VideoGenerationPipeline:
         self.config = config
         self.template_loader = template_loader
         self.bgm_manager = bgm_manager
+        self.resource_pools = resource_pools
+        self.ffmpeg_compositor = ffmpeg_compositor
 
     async def generate(
         self,
@@ -131,6 +174,7 @@ class VideoGenerationPipeline:
         tts_provider: str | None = None,
         template_name: str | None = None,
         persona_style: "PersonaStyleConfig | None" = None,
+        checkpointer: StageCheckpointer | None = None,
     ) -> VideoGenerationResult:
         """Generate video from scene-based script.
 
@@ -142,6 +186,11 @@ class VideoGenerationPipeline:
         5. Scene-based composition with transitions
         6. Thumbnail generation
 
+        With a ``checkpointer``, each stage is recorded as it completes and
+        stages already recorded by a previous attempt are restored instead
+        of recomputed. Partial output is then kept on failure so the next
+        attempt can resume from it.
+
         Args:
             script: Script model instance
             scene_script: SceneScript with list of Scene objects
@@ -149,6 +198,7 @@ class VideoGenerationPipeline:
             tts_provider: Optional TTS provider override
             template_name: Video template name
             persona_style: PersonaStyleConfig for visual styling
+            checkpointer: Stage checkpointer of a durable generation job
 
         Returns:
             VideoGenerationResult with file paths and metadata
@@ -175,11 +225,17 @@ class VideoGenerationPipeline:
         temp_dir = Path(self.config.temp_dir) / str(script.id)
         temp_dir.mkdir(parents=True, exist_ok=True)
 
+        succeeded = False
         try:
             logger.info(
                 "video_generation_start",
                 script_id=str(script.id),
                 scene_count=len(scene_script.scenes),
+                resumed_stages=(
+                    [stage for stage in GenerationStage if stage.value in checkpointer.checkpoints]
+                    if checkpointer
+                    else []
+                ),
             )
 
             # Step 1: Get TTS engine
@@ -195,33 +251,44 @@ class VideoGenerationPipeline:
             )
 
             # Step 2: Per-scene TTS generation
-            logger.info("generating_audio", scene_count=len(scene_script.scenes))
+            async def synthesize() -> list[SceneTTSResult]:
+                logger.info("generating_audio", scene_count=len(scene_script.scenes))
+                async with resource_slot(self.resource_pools, ResourceClass.NETWORK):
+                    return await engine.synthesize_scenes(
+                        scenes=scene_script.scenes,
+                        config=tts_config,
+                        output_dir=temp_dir / "audio_scenes",
+                        concurrent=self.config.tts.concurrent_scenes,
+                    )
 
-            scene_tts_results = await engine.synthesize_scenes(
-                scenes=scene_script.scenes,
-                config=tts_config,
-                output_dir=temp_dir / "audio_scenes",
+            scene_tts_results = await _run_stage(
+                checkpointer, GenerationStage.TTS, synthesize, dump_scene_tts, load_scene_tts
             )
 
             total_duration = sum(r.duration_seconds for r in scene_tts_results)
             logger.info("scene_audio_generated", total_duration_s=round(total_duration, 1))
 
             # Step 3: Concatenate audio
-            logger.info("Concatenating scene audio")
+            async def concatenate() -> TTSResult:
+                logger.info("Concatenating scene audio")
+                async with resource_slot(self.resource_pools, ResourceClass.CPU):
+                    return await concatenate_scene_audio(
+                        scene_results=scene_tts_results,
+                        output_path=output_dir / "audio",
+                        ffmpeg_wrapper=self.ffmpeg,
+                    )
 
-            combined_tts = await concatenate_scene_audio(
-                scene_results=scene_tts_results,
-                output_path=output_dir / "audio",
-                ffmpeg_wrapper=self.ffmpeg,
+            combined_tts = await _run_stage(
+                checkpointer, GenerationStage.CONCAT, concatenate, dump_tts_result, load_tts_result
             )
 
             logger.info("audio_combined", duration_s=round(combined_tts.duration_seconds, 1))
 
             # Step 4: Generate scene-aware subtitles
+            subtitle_file = None
             subtitle_path = None
             if self.config.subtitle.enabled:
-                logger.info("Generating scene-aware subtitles")
-
+                # Cheap and deterministic, so rebuilt even when the file is restored
                 subtitle_file = self.subtitle_generator.generate_from_scene_results(
                     scene_results=scene_tts_results,
                     scenes=scene_script.scenes,
@@ -229,71 +296,99 @@ class VideoGenerationPipeline:
                     template=template,
                 )
 
-                if self.config.subtitle.format == "ass":
-                    subtitle_path = self.subtitle_generator.to_ass_with_scene_styles(
-                        subtitle=subtitle_file,
-                        output_path=output_dir / "subtitle",
-                        scenes=scene_script.scenes,
-                        scene_results=scene_tts_results,
-                        persona_style=persona_style,
-                        template=template,
-                    )
-                else:
-                    subtitle_path = self.subtitle_generator.to_srt(
-                        subtitle_file,
-                        output_dir / "subtitle",
-                    )
+                async def write_subtitles() -> Path | None:
+                    logger.info("Generating scene-aware subtitles")
+                    if self.config.subtitle.format == "ass":
+                        return self.subtitle_generator.to_ass_with_scene_styles(
+                            subtitle=subtitle_file,
+                            output_path=output_dir / "subtitle",
+                            scenes=scene_script.scenes,
+                            scene_results=scene_tts_results,
+                            persona_style=persona_style,
+                            template=template,
+                        )
+                    return self.subtitle_generator.to_srt(subtitle_file, output_dir / "subtitle")
+
+                subtitle_path = await _run_stage(
+                    checkpointer,
+                    GenerationStage.SUBTITLES,
+                    write_subtitles,
+                    dump_optional_path,
+                    load_optional_path,
+                )
 
                 logger.info("subtitles_generated", segment_count=len(subtitle_file.segments))
 
             # Step 5: Per-scene visual sourcing
-            logger.info("Sourcing visuals for each scene")
+            async def source_visuals() -> list[SceneVisualResult]:
+                logger.info("Sourcing visuals for each scene")
+                async with resource_slot(self.resource_pools, ResourceClass.NETWORK):
+                    return await self.visual_manager.source_visuals_for_scenes(
+                        scenes=scene_script.scenes,
+                        scene_results=scene_tts_results,
+                        output_dir=temp_dir / "visuals",
+                        concurrent=self.config.visual.concurrent_scenes,
+                    )
 
-            scene_visuals = await self.visual_manager.source_visuals_for_scenes(
-                scenes=scene_script.scenes,
-                scene_results=scene_tts_results,
-                output_dir=temp_dir / "visuals",
+            scene_visuals = await _run_stage(
+                checkpointer,
+                GenerationStage.VISUALS,
+                source_visuals,
+                dump_scene_visuals,
+                load_scene_visuals,
             )
 
             visual_sources = list({v.asset.source or "unknown" for v in scene_visuals})
             logger.info("visuals_sourced", count=len(scene_visuals), sources=visual_sources)
 
             # Step 6: Scene-based composition
-            logger.info("Composing scene-based video")
-
-            # Get headline
-            headline = scene_script.headline
-            logger.info("headline_set", headline=headline)
-
-            # Get BGM path if available
-            background_music_path = None
-            if self.bgm_manager and self.bgm_manager.is_enabled:
-                background_music_path = await self.bgm_manager.get_bgm_for_video()
-                if background_music_path:
-                    logger.info("bgm_selected", name=background_music_path.name)
-
-            composition_result = await self.compositor.compose_scenes(
-                scenes=scene_script.scenes,
-                scene_tts_results=scene_tts_results,
-                scene_visuals=scene_visuals,
-                combined_audio_path=combined_tts.audio_path,
-                subtitle_file=subtitle_path,
-                output_path=output_dir / "video",
-                background_music_path=background_music_path,
-                persona_style=persona_style,
-                headline=headline,
-                subtitle_data=subtitle_file if self.config.subtitle.enabled else None,
-                video_template=template,
+            async def compose() -> CompositionResult:
+                logger.info("Composing scene-based video")
+
+                # Get headline
+                headline = scene_script.headline
+                logger.info("headline_set", headline=headline)
+
+                # Get BGM path if available
+                background_music_path = None
+                if self.bgm_manager and self.bgm_manager.is_enabled:
+                    background_music_path = await self.bgm_manager.get_bgm_for_video()
+                    if background_music_path:
+                        logger.info("bgm_selected", name=background_music_path.name)
+
+                compositor = self._select_compositor(template)
+                async with resource_slot(self.resource_pools, ResourceClass.CPU):
+                    return await compositor.compose_scenes(
+                        scenes=scene_script.scenes,
+                        scene_tts_results=scene_tts_results,
+                        scene_visuals=scene_visuals,
+                        combined_audio_path=combined_tts.audio_path,
+                        subtitle_file=subtitle_path,
+                        output_path=output_dir / "video",
+                        background_music_path=background_music_path,
+                        persona_style=persona_style,
+                        headline=headline,
+                        subtitle_data=subtitle_file,
+                        video_template=template,
+                    )
+
+            composition_result = await _run_stage(
+                checkpointer, GenerationStage.COMPOSE, compose, dump_composition, load_composition
             )
 
             logger.info("video_composed", duration_s=round(composition_result.duration_seconds, 1))
 
             # Step 7: Extract thumbnail from first frame
-            logger.info("Extracting thumbnail from video")
+            async def extract_thumbnail() -> Path:
+                logger.info("Extracting thumbnail from video")
+                async with resource_slot(self.resource_pools, ResourceClass.CPU):
+                    return await self._extract_thumbnail(
+                        video_path=composition_result.video_path,
+                        output_path=output_dir / "thumbnail",
+                    )
 
-            thumbnail_path = await self._extract_thumbnail(
-                video_path=composition_result.video_path,
-                output_path=output_dir / "thumbnail",
+            thumbnail_path = await _run_stage(
+                checkpointer, GenerationStage.THUMBNAIL, extract_thumbnail, dump_path, load_path
             )
 
             logger.info("thumbnail_extracted", path=str(thumbnail_path))
@@ -322,24 +417,45 @@ class VideoGenerationPipeline:
                 generation_time_s=generation_time,
             )
 
+            succeeded = True
             return result
 
         except Exception:
-            # Clean up partial output on failure
-            if output_dir.exists():
+            # Checkpointed artifacts are kept so a retry can resume from them
+            if checkpointer is None and output_dir.exists():
                 shutil.rmtree(output_dir, ignore_errors=True)
             raise
 
         finally:
-            # Cleanup temp directory
-            if self.config.cleanup_temp and temp_dir.exists():
+            # Cleanup temp directory (kept on failure when resuming is possible)
+            keep_for_resume = checkpointer is not None and not succeeded
+            if self.config.cleanup_temp and temp_dir.exists() and not keep_for_resume:
                 try:
                     shutil.rmtree(temp_dir)
                 except Exception:
                     logger.warning("temp_cleanup_failed", path=str(temp_dir), exc_info=True)
-            elif not self.config.cleanup_temp and temp_dir.exists():
+            elif temp_dir.exists():
                 logger.warning("temp_dir_retained", path=str(temp_dir))
 
+    def _select_compositor(
+        self, template: VideoTemplateConfig | None
+    ) -> RemotionCompositor | FFmpegCompositor:
+        """Pick the rendering backend requested by the template.
+
+        Args:
+            template: Loaded video template (None uses Remotion)
+
+        Returns:
+            FFmpeg compositor for ``compositor: ffmpeg`` templates when one
+            is configured, otherwise the Remotion compositor
+        """
+        if template and template.compositor == "ffmpeg":
+            if self.ffmpeg_compositor is not None:
+                logger.info("compositor_selected", backend="ffmpeg", template=template.name)
+                return self.ffmpeg_compositor
+            logger.warning("ffmpeg_compositor_unavailable", template=template.name)
+        return self.compositor
+
     def _get_voice_for_script(self, script: Script) -> str:
         """Determine voice ID for script.
 
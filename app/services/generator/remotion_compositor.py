@@ -1,11 +1,18 @@
 """Remotion-based video compositor.
 
-Replaces FFmpegCompositor for video rendering.
+Default renderer; templates can select FFmpegCompositor for fast single-pass renders.
 Calls Remotion CLI via subprocess to compose Korean Shorts videos.
 Supports karaoke subtitles, Ken Burns, and rich text animations.
+
+In render service mode (``warm_bundle``) the Remotion project is bundled
+once per process, and again only when its sources change. Every render
+then reuses that bundle instead of re-running webpack. Renders run in a
+bounded pool, each using several Chromium tabs (``--concurrency``) sized
+from the CPU count and available memory.
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import platform
@@ -14,11 +21,13 @@ import shutil
 import time
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from app.config.video import CompositionConfig
 from app.config.video_template import SafeZoneConfig, ThemeConfig, VisualEffectsConfig
+from app.core.config_loader import load_defaults
 from app.core.logging import get_logger
 
 if TYPE_CHECKING:
@@ -32,6 +41,28 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@dataclass
+class StagingStats:
+    """Bytes staged into Remotion's public directory for one render.
+
+    Attributes:
+        files: Assets staged
+        linked_bytes: Bytes hard-linked or symlinked (no data copied)
+        copied_bytes: Bytes copied (linking not possible)
+        shared_bytes: Bytes served from the shared staging area without restaging
+    """
+
+    files: int = 0
+    linked_bytes: int = 0
+    copied_bytes: int = 0
+    shared_bytes: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes that did not have to be copied."""
+        return self.linked_bytes + self.shared_bytes
+
+
 @dataclass
 class CompositionResult:
     """Result of video composition.
@@ -55,36 +86,184 @@ class CompositionResult:
 _COMPOSITION_ID = "KoreanShorts"
 # Maximum time to wait for a Remotion render before killing the process
 _RENDER_TIMEOUT_SECONDS = 600  # 10 minutes
+# Maximum time to wait for a Remotion bundle (webpack) build
+_BUNDLE_TIMEOUT_SECONDS = 300
+# Project files outside src/ and public/ that affect the bundle
+_BUNDLE_INPUTS = ("package.json", "package-lock.json", "remotion.config.ts", "tsconfig.json")
+# Prefix of per-render asset directories staged under public/
+_RENDER_DIR_PREFIX = "_render_"
+# Directory under public/ holding immutable assets (BGM, SFX) shared across renders
+_SHARED_DIR = f"{_RENDER_DIR_PREFIX}shared"
+
+
+@lru_cache(maxsize=1)
+def _get_remotion_defaults() -> dict[str, Any]:
+    """Get Remotion render defaults from config/defaults.yaml."""
+    generator = load_defaults().get("generator", {})
+    remotion = generator.get("remotion", {}) if isinstance(generator, dict) else {}
+    return remotion if isinstance(remotion, dict) else {}
+
+
+def _available_memory_mb() -> int | None:
+    """Get available system memory in MB, or None if unknown."""
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def resolve_render_concurrency(parallel_renders: int, memory_per_tab_mb: int) -> int:
+    """Size Remotion's ``--concurrency`` from CPU count and available memory.
+
+    Each of the ``parallel_renders`` concurrent renders gets an equal share
+    of the cores, capped so that all tabs fit in available memory.
+
+    Args:
+        parallel_renders: Renders running at once
+        memory_per_tab_mb: Memory budget per Chromium tab
+
+    Returns:
+        Tabs per render (at least 1)
+    """
+    parallel = max(1, parallel_renders)
+    concurrency = (os.cpu_count() or 1) // parallel
+    available_mb = _available_memory_mb()
+    if available_mb is not None and memory_per_tab_mb > 0:
+        concurrency = min(concurrency, available_mb // parallel // memory_per_tab_mb)
+    return max(1, concurrency)
+
+
+def _link_or_copy(src: Path, dest: Path) -> bool:
+    """Hard-link ``src`` to ``dest``, falling back to a symlink, then a copy.
+
+    Returns:
+        True if the data had to be copied
+    """
+    try:
+        os.link(src, dest)
+        return False
+    except OSError:
+        pass
+    try:
+        # Different filesystem or hard links unsupported
+        dest.symlink_to(src.resolve())
+        return False
+    except OSError:
+        shutil.copy2(src, dest)
+        return True
+
+
+def _count_staged(stats: StagingStats, src: Path, copied: bool) -> None:
+    """Add a newly staged file to the staging counters."""
+    size = src.stat().st_size
+    stats.files += 1
+    if copied:
+        stats.copied_bytes += size
+    else:
+        stats.linked_bytes += size
+
+
+def _bundle_in_use(bundle: Path) -> bool:
+    """Whether a render is staging assets in a bundle's public/ directory."""
+    try:
+        return any(
+            child.name.startswith(_RENDER_DIR_PREFIX) and child.name != _SHARED_DIR
+            for child in (bundle / "public").iterdir()
+        )
+    except OSError:
+        return False
+
+
+def _subprocess_env() -> dict[str, str]:
+    """Environment for Remotion subprocesses.
+
+    Chromium headless requires certain shared libraries; extend LD_LIBRARY_PATH.
+    """
+    env = os.environ.copy()
+    arch = platform.machine()
+    arch_dir = {"aarch64": "aarch64-linux-gnu", "x86_64": "x86_64-linux-gnu"}.get(
+        arch, f"{arch}-linux-gnu"
+    )
+    chromium_base = os.environ.get(
+        "CHROMIUM_LIB_PATH",
+        str(Path.home() / ".local/lib/chromium-deps/usr/lib"),
+    )
+    chromium_libs = Path(chromium_base) / arch_dir
+    if chromium_libs.exists():
+        env["LD_LIBRARY_PATH"] = f"{chromium_libs}:{env.get('LD_LIBRARY_PATH', '')}"
+    return env
 
 
 class RemotionCompositor:
     """Compose video using Remotion (React-based video generation).
 
-    Replaces FFmpegCompositor with browser-quality rendering:
+    Browser-quality rendering (FFmpegCompositor is the fast alternative):
     - Crisp text and animations via CSS/React
     - TikTok-style karaoke subtitles
     - Rich transitions and effects
 
     Calls Remotion CLI via asyncio subprocess, keeping the pipeline fully async.
 
-    Assets are staged into a unique subdirectory under the Remotion
-    project's ``public/`` folder so that ``staticFile()`` can resolve
-    them.  The subdirectory is cleaned up after rendering.
+    Assets are staged into a unique subdirectory under the ``public/``
+    folder being served (the project's, or the warm bundle's) so that
+    ``staticFile()`` can resolve them.  Files are hard-linked (or
+    symlinked) rather than copied; BGM and SFX are staged once into a
+    shared subdirectory reused by every render.  The per-render
+    subdirectory is cleaned up after rendering.
+
+    Share one compositor per process so the bundle and the render pool
+    are shared too.
     """
 
     def __init__(
         self,
         config: CompositionConfig,
         remotion_dir: Path | None = None,
+        warm_bundle: bool | None = None,
+        bundle_dir: Path | None = None,
+        concurrency: int | None = None,
+        max_parallel_renders: int | None = None,
     ) -> None:
         """Initialize RemotionCompositor.
 
         Args:
             config: Video composition configuration
             remotion_dir: Path to the Remotion project directory
+            warm_bundle: Reuse one bundle across renders (default from config)
+            bundle_dir: Where bundles are built (default from config)
+            concurrency: Chromium tabs per render, 0 to size automatically
+                (default from config)
+            max_parallel_renders: Renders running at once (default from config)
         """
+        defaults = _get_remotion_defaults()
         self.config = config
         self.remotion_dir = remotion_dir or Path("/workspace/remotion")
+        self.warm_bundle = (
+            warm_bundle if warm_bundle is not None else bool(defaults.get("warm_bundle", False))
+        )
+        self.bundle_dir = bundle_dir or Path(defaults.get("bundle_dir", "data/cache/remotion"))
+        self.max_parallel_renders = max(
+            1, max_parallel_renders or int(defaults.get("max_parallel_renders", 1))
+        )
+        configured = concurrency if concurrency is not None else int(defaults.get("concurrency", 0))
+        self.concurrency = (
+            configured
+            if configured > 0
+            else resolve_render_concurrency(
+                self.max_parallel_renders, int(defaults.get("memory_per_tab_mb", 1024))
+            )
+        )
+        self._render_slots = asyncio.Semaphore(self.max_parallel_renders)
+        self._bundle_lock = asyncio.Lock()
+        # (source fingerprint, bundle directory) of the current warm bundle
+        self._bundle: tuple[str, Path] | None = None
 
     async def compose_scenes(
         self,
@@ -154,15 +333,20 @@ class RemotionCompositor:
         # BGM volume from config
         bgm_volume = self.config.background_music_volume
 
-        # Stage assets into Remotion's public/ directory for staticFile() resolution.
+        # Stage assets into the served public/ directory for staticFile() resolution.
         # Use a unique subdirectory per render to avoid collisions.
-        render_id = f"_render_{uuid.uuid4().hex[:12]}"
-        public_dir = self.remotion_dir / "public" / render_id
+        serve_dir = await self._ensure_bundle() if self.warm_bundle else None
+        public_root = (serve_dir or self.remotion_dir) / "public"
+        render_id = f"{_RENDER_DIR_PREFIX}{uuid.uuid4().hex[:12]}"
+        public_dir = public_root / render_id
         public_dir.mkdir(parents=True, exist_ok=True)
 
-        audio_rel = self._stage_asset(combined_audio_path, public_dir, "audio", render_id)
+        staging = StagingStats()
+        audio_rel = self._stage_asset(
+            combined_audio_path, public_dir, "audio", render_id, stats=staging
+        )
         bgm_rel = (
-            self._stage_asset(background_music_path, public_dir, "bgm", render_id)
+            self._stage_shared_asset(background_music_path, public_root, stats=staging)
             if background_music_path
             else None
         )
@@ -179,16 +363,28 @@ class RemotionCompositor:
             for sfx_name in ("whoosh", "pop", "ding"):
                 sfx_file = _sfx_source / f"{sfx_name}.mp3"
                 if sfx_file.exists():
-                    rel = self._stage_asset(sfx_file, public_dir, f"sfx_{sfx_name}", render_id)
+                    rel = self._stage_shared_asset(sfx_file, public_root, stats=staging)
                     sfx_paths_rel[sfx_name] = rel
 
         # Stage visual assets and rewrite paths to relative.
         # OffthreadVideo uses server-side FFmpeg, so no re-encoding needed.
         for v in visuals:
             src = Path(v["path"])
-            staged = self._stage_asset(src, public_dir, f"visual_{v['start_time']:.1f}", render_id)
+            staged = self._stage_asset(
+                src, public_dir, f"visual_{v['start_time']:.1f}", render_id, stats=staging
+            )
             v["path"] = staged
 
+        logger.info(
+            "remotion_assets_staged",
+            render_id=render_id,
+            files=staging.files,
+            linked_mb=round(staging.linked_bytes / 1048576, 1),
+            shared_mb=round(staging.shared_bytes / 1048576, 1),
+            copied_mb=round(staging.copied_bytes / 1048576, 1),
+            saved_mb=round(staging.bytes_saved / 1048576, 1),
+        )
+
         # Build safe zone and theme from template config
         safe_zone_dict = self._build_safe_zone(video_template)
         theme_dict = self._build_theme(video_template, persona_style)
@@ -246,7 +442,7 @@ class RemotionCompositor:
         props_path.write_text(json.dumps(props, ensure_ascii=False), encoding="utf-8")
 
         try:
-            result = await self._render(props_path, output_mp4, total_duration)
+            result = await self._render(props_path, output_mp4, total_duration, serve_dir)
         finally:
             props_path.unlink(missing_ok=True)
             shutil.rmtree(public_dir, ignore_errors=True)
@@ -254,14 +450,24 @@ class RemotionCompositor:
         return result
 
     @staticmethod
-    def _stage_asset(src: Path, public_dir: Path, prefix: str, render_id: str) -> str:
-        """Symlink or copy an asset into the public directory.
+    def _stage_asset(
+        src: Path,
+        public_dir: Path,
+        prefix: str,
+        render_id: str,
+        stats: StagingStats | None = None,
+    ) -> str:
+        """Stage an asset into the public directory by hard link, symlink or copy.
+
+        Tries a hard link first, then a symlink (e.g. across filesystems), and
+        copies only if neither can be created.
 
         Args:
             src: Source file path
             public_dir: Remotion public/<render_id>/ directory
             prefix: Filename prefix for the staged file
             render_id: Unique render subdirectory name
+            stats: Staging counters to update
 
         Returns:
             Relative path usable by staticFile() (e.g. "_render_123/audio.wav")
@@ -274,23 +480,205 @@ class RemotionCompositor:
         dest = public_dir / dest_name
 
         if not dest.exists():
-            shutil.copy2(src, dest)
+            copied = _link_or_copy(src, dest)
+            if stats is not None:
+                _count_staged(stats, src, copied)
 
         # staticFile() resolves from remotion/public/, so include subdirectory
         return f"{render_id}/{dest_name}"
 
+    @staticmethod
+    def _stage_shared_asset(src: Path, public_root: Path, stats: StagingStats | None = None) -> str:
+        """Stage an immutable asset (BGM, SFX) once for all renders.
+
+        Shared assets are keyed by path, size and mtime, so a changed file
+        is staged under a new name. They are not removed after a render.
+
+        Args:
+            src: Source file path
+            public_root: Served public/ directory
+            stats: Staging counters to update
+
+        Returns:
+            Relative path usable by staticFile(), or "" if ``src`` is missing
+        """
+        try:
+            stat = src.stat()
+        except OSError:
+            logger.warning("staging_file_missing", path=str(src))
+            return ""
+
+        identity = f"{src.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        dest_name = f"{hashlib.sha256(identity.encode()).hexdigest()[:16]}{src.suffix}"
+        dest = public_root / _SHARED_DIR / dest_name
+
+        if dest.exists():
+            if stats is not None:
+                stats.files += 1
+                stats.shared_bytes += stat.st_size
+        else:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f".{dest_name}.{os.getpid()}.{uuid.uuid4().hex[:6]}.tmp")
+            copied = _link_or_copy(src, tmp)
+            os.replace(tmp, dest)
+            if stats is not None:
+                _count_staged(stats, src, copied)
+
+        return f"{_SHARED_DIR}/{dest_name}"
+
+    async def _ensure_bundle(self) -> Path:
+        """Get the warm bundle for the current sources, building it if needed.
+
+        Bundles are keyed by a fingerprint of the project sources, so a
+        source or template change triggers exactly one rebuild, and a
+        bundle built by an earlier process is reused. After a rebuild,
+        bundles of other fingerprints are pruned.
+
+        Returns:
+            Bundle directory (serve URL) to render from
+
+        Raises:
+            RuntimeError: If bundling fails
+        """
+        fingerprint = await asyncio.to_thread(self._source_fingerprint)
+        async with self._bundle_lock:
+            if self._bundle is not None and self._bundle[0] == fingerprint:
+                return self._bundle[1]
+
+            serve_dir = (self.bundle_dir / fingerprint[:16]).resolve()
+            if (serve_dir / "index.html").exists():
+                logger.info("remotion_bundle_reused", path=str(serve_dir))
+            else:
+                await self._build_bundle(serve_dir)
+                await asyncio.to_thread(self._prune_bundles, serve_dir)
+
+            self._bundle = (fingerprint, serve_dir)
+            return serve_dir
+
+    def _prune_bundles(self, keep: Path) -> None:
+        """Remove bundles other than ``keep`` that no render is using.
+
+        A bundle is in use while its public/ holds a per-render staging
+        directory; such bundles are left for a later rebuild to prune.
+        In-progress builds (hidden temporary directories) are skipped.
+        """
+        try:
+            entries = list(self.bundle_dir.iterdir())
+        except OSError:
+            return
+        for path in entries:
+            if (
+                path.name == keep.name
+                or path.name.startswith(".")
+                or not (path / "index.html").is_file()
+                or _bundle_in_use(path)
+            ):
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            logger.info("remotion_bundle_pruned", path=str(path))
+
+    def _source_fingerprint(self) -> str:
+        """Hash paths, sizes and mtimes of everything that goes into a bundle."""
+        digest = hashlib.sha256()
+        files = [self.remotion_dir / name for name in _BUNDLE_INPUTS]
+        for subdir in ("src", "public"):
+            root = self.remotion_dir / subdir
+            if root.is_dir():
+                files.extend(
+                    path
+                    for path in root.rglob("*")
+                    if not any(part.startswith(_RENDER_DIR_PREFIX) for part in path.parts)
+                )
+        for path in sorted(files):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if path.is_file():
+                rel = path.relative_to(self.remotion_dir)
+                digest.update(f"{rel}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+
+    async def _build_bundle(self, serve_dir: Path) -> None:
+        """Run ``remotion bundle`` into ``serve_dir``.
+
+        Raises:
+            RuntimeError: If bundling fails or times out
+        """
+        tmp_dir = serve_dir.with_name(f".{serve_dir.name}.{os.getpid()}.tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        cmd = [
+            "npx",
+            "remotion",
+            "bundle",
+            str(self.remotion_dir / "src" / "index.ts"),
+            "--out-dir",
+            str(tmp_dir),
+            "--log",
+            "error",
+        ]
+        logger.info("remotion_bundle_start", path=str(serve_dir))
+        start_time = time.time()
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(self.remotion_dir),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_subprocess_env(),
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=_BUNDLE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise RuntimeError(
+                f"Remotion bundle timed out after {_BUNDLE_TIMEOUT_SECONDS}s"
+            ) from None
+
+        if proc.returncode != 0:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            stderr_text = stderr.decode("utf-8", errors="replace")
+            logger.error(
+                "remotion_bundle_failed", returncode=proc.returncode, stderr=stderr_text[:500]
+            )
+            raise RuntimeError(
+                f"Remotion bundle failed with exit code {proc.returncode}: {stderr_text[:500]}"
+            )
+
+        try:
+            os.replace(tmp_dir, serve_dir)
+        except OSError:
+            # Another process published the same bundle first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        logger.info(
+            "remotion_bundle_built",
+            path=str(serve_dir),
+            bundle_time=round(time.time() - start_time, 1),
+        )
+
     async def _render(
         self,
         props_path: Path,
         output_path: Path,
         total_duration: float,
+        serve_dir: Path | None = None,
     ) -> CompositionResult:
         """Invoke Remotion CLI to render the composition.
 
+        At most ``max_parallel_renders`` renders run at once; the rest wait
+        for a free slot.
+
         Args:
             props_path: Path to JSON props file
             output_path: Output MP4 path
             total_duration: Expected duration (for logging)
+            serve_dir: Warm bundle to render from (bundles the entry point
+                on the fly if not provided)
 
         Returns:
             CompositionResult
@@ -298,12 +686,12 @@ class RemotionCompositor:
         Raises:
             RuntimeError: If Remotion render fails
         """
-        entry_point = self.remotion_dir / "src" / "index.ts"
+        source = serve_dir or self.remotion_dir / "src" / "index.ts"
         cmd = [
             "npx",
             "remotion",
             "render",
-            str(entry_point),
+            str(source),
             _COMPOSITION_ID,
             str(output_path),
             "--props",
@@ -311,52 +699,41 @@ class RemotionCompositor:
             "--log",
             "error",  # suppress verbose output
             "--concurrency",
-            "1",  # limit parallelism to prevent OOM
+            str(self.concurrency),  # sized from CPU count and available memory
             "--video-bitrate",
             "8M",
         ]
 
-        logger.info(
-            "remotion_render_start",
-            composition=_COMPOSITION_ID,
-            duration=round(total_duration, 1),
-            output=output_path.name,
-        )
-        start_time = time.time()
-
-        # Chromium headless requires certain shared libraries; extend LD_LIBRARY_PATH
-        env = os.environ.copy()
-        arch = platform.machine()
-        arch_dir = {"aarch64": "aarch64-linux-gnu", "x86_64": "x86_64-linux-gnu"}.get(
-            arch, f"{arch}-linux-gnu"
-        )
-        chromium_base = os.environ.get(
-            "CHROMIUM_LIB_PATH",
-            str(Path.home() / ".local/lib/chromium-deps/usr/lib"),
-        )
-        chromium_libs = Path(chromium_base) / arch_dir
-        if chromium_libs.exists():
-            env["LD_LIBRARY_PATH"] = f"{chromium_libs}:{env.get('LD_LIBRARY_PATH', '')}"
-
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=str(self.remotion_dir),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
-        )
-        try:
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=_RENDER_TIMEOUT_SECONDS
+        async with self._render_slots:
+            logger.info(
+                "remotion_render_start",
+                composition=_COMPOSITION_ID,
+                duration=round(total_duration, 1),
+                output=output_path.name,
+                concurrency=self.concurrency,
+                warm_bundle=serve_dir is not None,
             )
-        except TimeoutError:
-            proc.kill()
-            await proc.wait()
-            raise RuntimeError(
-                f"Remotion render timed out after {_RENDER_TIMEOUT_SECONDS}s"
-            ) from None
-
-        elapsed = time.time() - start_time
+            start_time = time.time()
+
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=str(self.remotion_dir),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=_subprocess_env(),
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=_RENDER_TIMEOUT_SECONDS
+                )
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise RuntimeError(
+                    f"Remotion render timed out after {_RENDER_TIMEOUT_SECONDS}s"
+                ) from None
+
+            elapsed = time.time() - start_time
 
         if proc.returncode != 0:
             stderr_text = stderr.decode("utf-8", errors="replace")
@@ -375,12 +752,15 @@ class RemotionCompositor:
             )
 
         file_size = output_path.stat().st_size
+        frames = round(total_duration * self.config.fps)
         logger.info(
             "remotion_render_complete",
             output=output_path.name,
             duration=round(total_duration, 1),
             size_mb=round(file_size / 1024 / 1024, 1),
             render_time=round(elapsed, 1),
+            frames=frames,
+            frames_per_second=round(frames / elapsed, 1) if elapsed > 0 else None,
         )
 
         return CompositionResult(
@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, Any, Literal
 from app.config.video import CompositionConfig, SubtitleConfig, SubtitleStyleConfig
 from app.core.config_loader import load_language_config
 from app.core.logging import get_logger
+from app.services.generator.subtitle_segmenter import emphasis_pattern, get_segmenter
 from app.services.generator.templates import (
     ASSDialogueParams,
     ASSStyleParams,
@@ -61,14 +62,6 @@ if TYPE_CHECKING:
     from app.models.scene import Scene, VisualStyle
 
 
-@lru_cache(maxsize=1)
-def _get_korean_subtitle_config() -> dict[str, Any]:
-    """Get Korean subtitle configuration from config/language/korean.yaml."""
-    config = load_language_config("korean")
-    subtitle = config.get("subtitle", {})
-    return subtitle if isinstance(subtitle, dict) else {}
-
-
 @lru_cache(maxsize=1)
 def _get_korean_timing_config() -> dict[str, Any]:
     """Get Korean timing configuration from config/language/korean.yaml."""
@@ -141,6 +134,7 @@ class SubtitleGenerator:
         self.config = config
         self.composition_config = composition_config
         self.template_loader = template_loader
+        self._segmenter = get_segmenter("korean")
 
     def generate_from_timestamps(
         self,
@@ -757,58 +751,16 @@ class SubtitleGenerator:
         # Use scene duration for timing calculation
         scene_duration = scene_result.duration_seconds
 
-        # Group scene words into segments
-        current_segment_words: list[str] = []
-
-        for word_idx, word in enumerate(scene_words):
-            word_count = len(current_segment_words) + 1
-
-            # Check if we should break
-            potential_text = " ".join(current_segment_words + [word])
-            should_break = self._should_break_korean(
-                current_text=" ".join(current_segment_words),
-                next_word=word,
-                potential_text=potential_text,
-                word_count=word_count,
-                max_chars=max_chars,
-                max_words=max_words,
-            )
-
-            if should_break and current_segment_words:
-                # Create segment with timing proportional to words processed
-                progress_start = (word_idx - len(current_segment_words)) / len(scene_words)
-                progress_end = word_idx / len(scene_words)
-
-                seg_start = scene_result.start_offset + progress_start * scene_duration
-                seg_end = scene_result.start_offset + progress_end * scene_duration
-
-                segment_text = " ".join(current_segment_words)
-                styled_text = self._apply_scene_styling(
-                    segment_text, visual_style, emphasis_words, persona_style
-                )
-                segments.append(
-                    SubtitleSegment(
-                        index=segment_index,
-                        start=seg_start,
-                        end=seg_end,
-                        text=styled_text,
-                        words=None,  # No word-level timing for original text
-                    )
-                )
-                segment_index += 1
-                current_segment_words = []
+        # Group scene words into segments, timed by their share of the words
+        for start, end in self._segmenter.segment(scene_words, max_chars, max_words):
+            progress_start = start / len(scene_words)
+            progress_end = end / len(scene_words)
 
-            current_segment_words.append(word)
-
-        # Don't forget the last segment
-        if current_segment_words:
-            progress_start = (len(scene_words) - len(current_segment_words)) / len(scene_words)
             seg_start = scene_result.start_offset + progress_start * scene_duration
-            seg_end = scene_result.start_offset + scene_duration
+            seg_end = scene_result.start_offset + progress_end * scene_duration
 
-            segment_text = " ".join(current_segment_words)
             styled_text = self._apply_scene_styling(
-                segment_text, visual_style, emphasis_words, persona_style
+                " ".join(scene_words[start:end]), visual_style, emphasis_words, persona_style
             )
             segments.append(
                 SubtitleSegment(
@@ -816,9 +768,10 @@ class SubtitleGenerator:
                     start=seg_start,
                     end=seg_end,
                     text=styled_text,
-                    words=None,
+                    words=None,  # No word-level timing for original text
                 )
             )
+            segment_index += 1
 
         return segments
 
@@ -853,52 +806,14 @@ class SubtitleGenerator:
         """
         segments: list[SubtitleSegment] = []
         segment_index = start_index
-        current_words: list[WordTimestamp] = []
-        current_text = ""
-
-        for word_ts in word_timestamps:
-            word = word_ts.word.strip()
-            if not word:
-                continue
-
-            potential_text = f"{current_text} {word}".strip() if current_text else word
-            word_count = len(current_words) + 1
-
-            should_break = self._should_break_korean(
-                current_text=current_text,
-                next_word=word,
-                potential_text=potential_text,
-                word_count=word_count,
-                max_chars=max_chars,
-                max_words=max_words,
-            )
-
-            if should_break and current_words:
-                styled_text = self._apply_scene_styling(
-                    current_text,
-                    visual_style,
-                    emphasis_words,
-                    persona_style,
-                )
-                segments.append(
-                    SubtitleSegment(
-                        index=segment_index,
-                        start=current_words[0].start + scene_result.start_offset,
-                        end=current_words[-1].end + scene_result.start_offset,
-                        text=styled_text,
-                        words=current_words.copy(),
-                    )
-                )
-                segment_index += 1
-                current_words = []
-                current_text = ""
 
-            current_words.append(word_ts)
-            current_text = f"{current_text} {word}".strip() if current_text else word
+        timed_words = [word_ts for word_ts in word_timestamps if word_ts.word.strip()]
+        words = [word_ts.word.strip() for word_ts in timed_words]
 
-        if current_words:
+        for start, end in self._segmenter.segment(words, max_chars, max_words):
+            current_words = timed_words[start:end]
             styled_text = self._apply_scene_styling(
-                current_text,
+                " ".join(words[start:end]),
                 visual_style,
                 emphasis_words,
                 persona_style,
@@ -909,9 +824,10 @@ class SubtitleGenerator:
                     start=current_words[0].start + scene_result.start_offset,
                     end=current_words[-1].end + scene_result.start_offset,
                     text=styled_text,
-                    words=current_words.copy(),
+                    words=current_words,
                 )
             )
+            segment_index += 1
 
         return segments
 
@@ -1065,87 +981,6 @@ class SubtitleGenerator:
             format=self.config.format,
         )
 
-    def _should_break_korean(
-        self,
-        current_text: str,
-        next_word: str,
-        potential_text: str,
-        word_count: int,
-        max_chars: int,
-        max_words: int,
-    ) -> bool:
-        """Determine if subtitle should break at this point (Korean-aware).
-
-        Korean subtitle breaking rules:
-        1. Break AFTER sentence-ending markers: ~요, ~다, ~죠, ~네, ~거든요, ~세요
-        2. Break AFTER comma or period
-        3. Break BEFORE connectors: 근데, 그래서, 하지만, 그리고, 사실
-        4. Respect max_chars limit
-        5. Use max_words as soft limit (can be exceeded to complete a phrase)
-
-        Args:
-            current_text: Current segment text so far
-            next_word: Next word to potentially add
-            potential_text: What text would be if we add next_word
-            word_count: How many words would be in segment if we add next_word
-            max_chars: Maximum characters per line
-            max_words: Soft maximum words per segment
-
-        Returns:
-            True if we should break before adding next_word
-        """
-        if not current_text:
-            return False
-
-        # Load Korean rules from config
-        korean_config = _get_korean_subtitle_config()
-        timing_config = _get_korean_timing_config()
-
-        # Korean sentence endings that signal natural break points
-        sentence_endings = tuple(korean_config.get("sentence_endings", []))
-
-        # Connectors that should start a new segment
-        connectors = tuple(korean_config.get("connectors", []))
-
-        # Punctuation characters
-        punctuation = korean_config.get("punctuation_with_comma", ".!?。！？,，")
-
-        # Word limit overhead for soft breaks
-        word_limit_overhead = timing_config.get("word_limit_overhead", 2)
-
-        # 1. Hard break: exceeds max_chars
-        if len(potential_text) > max_chars:
-            return True
-
-        # 2. Break after punctuation
-        if current_text and current_text[-1] in punctuation:
-            return True
-
-        # 3. Break after Korean sentence endings
-        for ending in sentence_endings:
-            if current_text.endswith(ending):
-                return True
-
-        # 4. Break before connectors (next_word starts a new thought)
-        for connector in connectors:
-            if next_word.startswith(connector):
-                return True
-
-        # 5. Soft break: exceeded word limit, but only if we have a natural point
-        # For karaoke style (max_words=4~5), be a bit more flexible
-        if word_count > max_words:
-            # Check if current_text ends with particles that complete a phrase
-            # (subject markers, topic markers, object markers)
-            complete_particles = tuple(korean_config.get("complete_particles", []))
-            for particle in complete_particles:
-                if current_text.endswith(particle):
-                    return True
-            # Also break if we're significantly over the limit
-            if word_count > max_words + word_limit_overhead:
-                return True
-
-        return False
-
     def _create_segments_from_manual(
         self,
         subtitle_segments: list[str],
@@ -1283,22 +1118,27 @@ class SubtitleGenerator:
         Returns:
             Styled text (may include ASS tags for special styling)
         """
-        result = text
-
         # Highlight emphasis words (wrap with secondary color tag)
         # Note: This creates inline ASS override tags
-        if emphasis_words and persona_style:
-            ass_color = _hex_to_inline_bgr(persona_style.secondary_color)
-            for word in emphasis_words:
-                # Match whole word only, replace first occurrence to avoid
-                # corrupting already-inserted ASS tags
-                pattern = re.compile(re.escape(word))
-                if pattern.search(result):
-                    highlighted = f"{{\\c{ass_color}}}{word}{{\\c}}"
-                    repl = highlighted  # bind for lambda closure
-                    result = pattern.sub(lambda _, r=repl: r, result, count=1)
-
-        return result
+        if not emphasis_words or not persona_style:
+            return text
+        pattern = emphasis_pattern(tuple(emphasis_words))
+        if pattern is None:
+            return text
+
+        ass_color = _hex_to_inline_bgr(persona_style.secondary_color)
+        highlighted: set[str] = set()
+
+        def highlight(match: re.Match[str]) -> str:
+            # One pass over the original text, so inserted ASS tags are never
+            # matched; only the first occurrence of each word is highlighted
+            word = match.group()
+            if word in highlighted:
+                return word
+            highlighted.add(word)
+            return f"{{\\c{ass_color}}}{word}{{\\c}}"
+
+        return pattern.sub(highlight, text)
 
     def to_ass_with_scene_styles(
         self,
@@ -0,0 +1,231 @@
+"""Korean-aware subtitle segmentation.
+
+Breaks a scene's words into subtitle segments using the rules in
+config/language/<language>.yaml (``subtitle`` and ``timing``):
+
+1. Break when the segment would exceed ``max_chars``
+2. Break AFTER punctuation (including commas)
+3. Break AFTER sentence endings (~요., ~다., ~거든요, ...)
+4. Break BEFORE connectors (근데, 그래서, 하지만, ...)
+5. Past ``max_words``, break after phrase-completing particles, and always
+   ``word_limit_overhead`` words later
+
+Rules are compiled once per language into affix tables keyed by length, and
+segments are built with running length counters, so segmenting a script is
+linear in its number of words.
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from app.core.config_loader import load_language_config
+
+_DEFAULT_PUNCTUATION = ".!?。！？,，"
+
+
+@dataclass(frozen=True)
+class AffixTable:
+    """Set of word prefixes or suffixes matched with one lookup per distinct length.
+
+    Attributes:
+        affixes: Affixes to match
+        lengths: Distinct affix lengths, shortest first
+    """
+
+    affixes: frozenset[str]
+    lengths: tuple[int, ...]
+
+    @classmethod
+    def build(cls, affixes: Iterable[str]) -> "AffixTable":
+        """Build a table from affixes (empty strings are ignored)."""
+        items = frozenset(affix for affix in affixes if affix)
+        return cls(items, tuple(sorted({len(affix) for affix in items})))
+
+    def matches_suffix(self, word: str) -> bool:
+        """Whether the word ends with one of the affixes."""
+        size = len(word)
+        return any(word[size - n :] in self.affixes for n in self.lengths if n <= size)
+
+    def matches_prefix(self, word: str) -> bool:
+        """Whether the word starts with one of the affixes."""
+        size = len(word)
+        return any(word[:n] in self.affixes for n in self.lengths if n <= size)
+
+
+class SubtitleSegmenter:
+    """Split words into subtitle segments with Korean line-breaking rules.
+
+    Endings, connectors and particles are matched against single words
+    (the last word of the segment, or the next word for connectors).
+
+    Example:
+        >>> segmenter = SubtitleSegmenter(sentence_endings=["요."], connectors=["근데"])
+        >>> segmenter.segment(["좋아요.", "근데", "비싸요"], max_chars=20, max_words=10)
+        [(0, 1), (1, 3)]
+    """
+
+    def __init__(
+        self,
+        sentence_endings: Iterable[str] = (),
+        connectors: Iterable[str] = (),
+        complete_particles: Iterable[str] = (),
+        punctuation: str = _DEFAULT_PUNCTUATION,
+        word_limit_overhead: int = 2,
+    ) -> None:
+        """Initialize SubtitleSegmenter.
+
+        Args:
+            sentence_endings: Endings to break after
+            connectors: Word prefixes to break before
+            complete_particles: Endings that allow a break past ``max_words``
+            punctuation: Characters to break after
+            word_limit_overhead: Words allowed past ``max_words`` before a
+                forced break
+        """
+        self.sentence_endings = AffixTable.build(sentence_endings)
+        self.connectors = AffixTable.build(connectors)
+        self.complete_particles = AffixTable.build(complete_particles)
+        self.punctuation = frozenset(punctuation)
+        self.word_limit_overhead = word_limit_overhead
+
+    @classmethod
+    def from_language_config(cls, language: str) -> "SubtitleSegmenter":
+        """Create a segmenter from config/language/<language>.yaml.
+
+        Args:
+            language: Language config name (e.g. "korean")
+
+        Returns:
+            Segmenter with the language's subtitle rules
+        """
+        config = load_language_config(language)
+        subtitle = _section(config, "subtitle")
+        timing = _section(config, "timing")
+        return cls(
+            sentence_endings=subtitle.get("sentence_endings", []),
+            connectors=subtitle.get("connectors", []),
+            complete_particles=subtitle.get("complete_particles", []),
+            punctuation=subtitle.get("punctuation_with_comma", _DEFAULT_PUNCTUATION),
+            word_limit_overhead=int(timing.get("word_limit_overhead", 2)),
+        )
+
+    def should_break(
+        self,
+        last_word: str,
+        next_word: str,
+        length: int,
+        word_count: int,
+        max_chars: int,
+        max_words: int,
+    ) -> bool:
+        """Whether to start a new segment before ``next_word``.
+
+        Args:
+            last_word: Last word of the current (non-empty) segment
+            next_word: Next word to potentially add
+            length: Characters in the segment if ``next_word`` is added
+            word_count: Words in the segment if ``next_word`` is added
+            max_chars: Maximum characters per line
+            max_words: Soft maximum words per segment
+
+        Returns:
+            True if the segment should end before ``next_word``
+        """
+        if length > max_chars:
+            return True
+        if last_word[-1] in self.punctuation:
+            return True
+        if self.sentence_endings.matches_suffix(last_word):
+            return True
+        if self.connectors.matches_prefix(next_word):
+            return True
+        if word_count > max_words:
+            return (
+                self.complete_particles.matches_suffix(last_word)
+                or word_count > max_words + self.word_limit_overhead
+            )
+        return False
+
+    def segment(
+        self, words: Sequence[str], max_chars: int, max_words: int
+    ) -> list[tuple[int, int]]:
+        """Group words into segments.
+
+        Args:
+            words: Non-empty words in order
+            max_chars: Maximum characters per line
+            max_words: Soft maximum words per segment
+
+        Returns:
+            (start, end) word index ranges of the segments, in order
+        """
+        spans: list[tuple[int, int]] = []
+        start = 0
+        length = 0
+
+        for i, word in enumerate(words):
+            if i > start:
+                potential = length + 1 + len(word)
+                if self.should_break(
+                    words[i - 1], word, potential, i - start + 1, max_chars, max_words
+                ):
+                    spans.append((start, i))
+                    start = i
+                    length = len(word)
+                else:
+                    length = potential
+            else:
+                length = len(word)
+
+        if start < len(words):
+            spans.append((start, len(words)))
+        return spans
+
+
+def _section(config: dict[str, Any], name: str) -> dict[str, Any]:
+    """Get a mapping section of a language config."""
+    section = config.get(name, {})
+    return section if isinstance(section, dict) else {}
+
+
+@lru_cache(maxsize=8)
+def get_segmenter(language: str = "korean") -> SubtitleSegmenter:
+    """Get the segmenter for a language, built once per process.
+
+    Args:
+        language: Language config name
+
+    Returns:
+        Shared SubtitleSegmenter
+    """
+    return SubtitleSegmenter.from_language_config(language)
+
+
+@lru_cache(maxsize=256)
+def emphasis_pattern(words: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile one alternation matching any of the emphasis words.
+
+    Longer words come first, so a word containing another (e.g. "OpenAI"
+    and "AI") is matched whole.
+
+    Args:
+        words: Emphasis words
+
+    Returns:
+        Compiled pattern, or None without (non-empty) words
+    """
+    unique = sorted({word for word in words if word}, key=len, reverse=True)
+    if not unique:
+        return None
+    return re.compile("|".join(re.escape(word) for word in unique))
+
+
+__all__ = [
+    "AffixTable",
+    "SubtitleSegmenter",
+    "emphasis_pattern",
+    "get_segmenter",
+]
@@ -0,0 +1,192 @@
+"""Shared Whisper word-timestamp aligner.
+
+ElevenLabs does not return word timings, so they are recovered by running
+Whisper over the synthesized audio. Loading a Whisper model takes seconds
+and inference is CPU-bound, so this module keeps one lazily loaded model
+per process and runs inference on a dedicated worker thread, off the event
+loop. Pending work is bounded so a burst of scenes cannot queue unbounded
+audio in memory.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from app.config.video import WhisperAlignerConfig
+from app.core.logging import get_logger
+from app.services.generator.tts.base import WordTimestamp
+
+logger = get_logger(__name__)
+
+
+class WhisperAligner:
+    """Word-level aligner backed by a single shared Whisper model.
+
+    The model is loaded on first use inside the worker thread. All
+    inference runs on that thread, so the (non thread-safe) model is never
+    used concurrently while the event loop stays free.
+
+    Example:
+        >>> aligner = get_whisper_aligner(WhisperAlignerConfig(model_size="base"))
+        >>> timestamps = await aligner.align(Path("scene_000.mp3"), language="ko")
+        >>> batch = await aligner.align_batch([(path1, "ko"), (path2, "ko")])
+    """
+
+    def __init__(self, config: WhisperAlignerConfig) -> None:
+        """Initialize WhisperAligner.
+
+        Args:
+            config: Model size, device and queue limits
+        """
+        self.config = config
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+        self._pending = asyncio.Semaphore(config.max_queue_size)
+        self._model: Any = None
+        self._unavailable = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the Whisper model has been loaded."""
+        return self._model is not None
+
+    async def align(
+        self, audio_path: Path, language: str | None = None
+    ) -> list[WordTimestamp] | None:
+        """Generate word timestamps for one audio file.
+
+        Args:
+            audio_path: Path to audio file
+            language: Whisper language code (auto-detected if None)
+
+        Returns:
+            List of word timestamps, or None if alignment failed
+        """
+        results = await self.align_batch([(audio_path, language)])
+        return results[0]
+
+    async def align_batch(
+        self,
+        items: list[tuple[Path, str | None]],
+    ) -> list[list[WordTimestamp] | None]:
+        """Generate word timestamps for several audio files in one job.
+
+        The whole batch runs as a single worker job, so the model is
+        loaded (at most) once and thread hand-off is paid once per video.
+
+        Args:
+            items: List of (audio_path, language) pairs
+
+        Returns:
+            Timestamps per item in input order (None where alignment failed)
+        """
+        if not items:
+            return []
+
+        async with self._pending:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._transcribe_many, items)
+
+    def close(self) -> None:
+        """Shut down the worker thread and drop the model."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._model = None
+
+    def _transcribe_many(
+        self,
+        items: list[tuple[Path, str | None]],
+    ) -> list[list[WordTimestamp] | None]:
+        """Transcribe a batch on the worker thread."""
+        model = self._load_model()
+        if model is None:
+            return [None] * len(items)
+
+        results: list[list[WordTimestamp] | None] = []
+        for audio_path, language in items:
+            try:
+                result = model.transcribe(
+                    str(audio_path),
+                    word_timestamps=True,
+                    language=language,
+                    fp16=self.config.device != "cpu",
+                )
+                results.append(self._extract_words(result))
+            except Exception as e:
+                logger.warning("whisper_alignment_failed", path=str(audio_path), error=str(e))
+                results.append(None)
+
+        return results
+
+    def _load_model(self) -> Any:
+        """Load the Whisper model once (worker thread only)."""
+        if self._model is not None or self._unavailable:
+            return self._model
+
+        try:
+            import whisper  # lazy: heavy dependency, only needed here
+        except ImportError:
+            logger.warning("Whisper not installed, skipping timestamp generation")
+            self._unavailable = True
+            return None
+
+        if self.config.num_threads:
+            import torch
+
+            torch.set_num_threads(self.config.num_threads)
+
+        logger.info(
+            "whisper_model_loading",
+            model_size=self.config.model_size,
+            device=self.config.device,
+        )
+        try:
+            self._model = whisper.load_model(self.config.model_size, device=self.config.device)
+        except Exception as e:
+            logger.warning("whisper_model_load_failed", error=str(e))
+            self._unavailable = True
+            return None
+        return self._model
+
+    @staticmethod
+    def _extract_words(result: dict[str, Any]) -> list[WordTimestamp] | None:
+        """Convert a Whisper transcription result into word timestamps."""
+        timestamps: list[WordTimestamp] = []
+        for segment in result.get("segments", []):
+            for word_info in segment.get("words", []):
+                word = word_info.get("word", "").strip()
+                if word:
+                    start = max(float(word_info.get("start", 0.0)), 0.0)
+                    timestamps.append(
+                        WordTimestamp(
+                            word=word,
+                            start=start,
+                            end=max(float(word_info.get("end", 0.0)), start),
+                        )
+                    )
+        return timestamps if timestamps else None
+
+
+# Process-wide aligners keyed by config, so every engine shares one model
+_aligners: dict[tuple[str, str, int | None], WhisperAligner] = {}
+_aligners_lock = threading.Lock()
+
+
+def get_whisper_aligner(config: WhisperAlignerConfig | None = None) -> WhisperAligner:
+    """Get the shared aligner for a model configuration.
+
+    Args:
+        config: Aligner configuration (defaults if None)
+
+    Returns:
+        Process-wide WhisperAligner instance
+    """
+    config = config or WhisperAlignerConfig()
+    key = (config.model_size, config.device, config.num_threads)
+    with _aligners_lock:
+        if key not in _aligners:
+            _aligners[key] = WhisperAligner(config)
+        return _aligners[key]
+
+
+__all__ = ["WhisperAligner", "get_whisper_aligner"]
@@ -4,13 +4,18 @@ This module defines the abstract base class for TTS engines and
 common data structures used across all TTS implementations.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+from app.config.video import TTSConcurrencyConfig
+from app.infrastructure.rate_limiter import AsyncRateLimiter
+
 if TYPE_CHECKING:
     from app.models.scene import Scene
+    from app.services.generator.tts.cache import TTSCache
 
 
 @dataclass
@@ -224,8 +229,79 @@ class BaseTTSEngine(ABC):
 
     All TTS implementations must inherit from this class and implement
     the required methods.
+
+    Scene synthesis can run concurrently; each engine bounds its own
+    in-flight requests and request rate via ``TTSConcurrencyConfig``.
+    Engines given a ``TTSCache`` serve repeated requests from disk.
     """
 
+    def __init__(
+        self,
+        concurrency: TTSConcurrencyConfig | None = None,
+        cache: "TTSCache | None" = None,
+    ) -> None:
+        """Initialize concurrency limits and optional audio cache.
+
+        Args:
+            concurrency: Per-provider concurrency limits (defaults if None)
+            cache: Optional content-addressed audio cache
+        """
+        self.concurrency = concurrency or TTSConcurrencyConfig()
+        self.cache = cache
+        self._semaphore = asyncio.Semaphore(self.concurrency.max_concurrency)
+        self._rate_limiter = AsyncRateLimiter(self.concurrency.requests_per_second)
+
+    @property
+    def cache_namespace(self) -> str:
+        """Identifier separating this engine's cache entries from other providers."""
+        return type(self).__name__
+
+    def _cache_lookup(
+        self,
+        text: str,
+        config: TTSSynthesisConfig,
+        output_path: Path,
+    ) -> tuple[str | None, TTSResult | None]:
+        """Look up a synthesis request in the audio cache.
+
+        Args:
+            text: Text to synthesize
+            config: TTS configuration
+            output_path: Path to save audio file (without extension)
+
+        Returns:
+            Tuple of (cache key or None if caching is off, cached result or None)
+        """
+        if self.cache is None:
+            return None, None
+        key = self.cache.make_key(self.cache_namespace, text, config)
+        return key, self.cache.get(key, output_path, config.output_format)
+
+    def _is_cached(self, text: str, config: TTSSynthesisConfig) -> bool:
+        """Check whether a synthesis request would be served from the cache.
+
+        Args:
+            text: Text to synthesize
+            config: TTS configuration
+
+        Returns:
+            True if a fresh cache entry exists
+        """
+        if self.cache is None:
+            return False
+        key = self.cache.make_key(self.cache_namespace, text, config)
+        return self.cache.contains(key, config.output_format)
+
+    def _cache_store(self, key: str | None, result: TTSResult) -> None:
+        """Store a fresh synthesis result under the key from _cache_lookup().
+
+        Args:
+            key: Cache key (None when caching is off)
+            result: Synthesis result to store
+        """
+        if self.cache is not None and key is not None:
+            self.cache.put(key, result)
+
     @abstractmethod
     async def synthesize(
         self,
@@ -277,54 +353,119 @@ class BaseTTSEngine(ABC):
         scenes: list["Scene"],
         config: TTSSynthesisConfig,
         output_dir: Path,
+        concurrent: bool = False,
     ) -> list[SceneTTSResult]:
         """Synthesize audio for each scene separately.
 
         This method generates individual audio files for each scene,
         enabling scene-level control over timing and visual sync.
 
+        In concurrent mode all scenes are submitted at once (bounded by the
+        engine's concurrency limits) and ``start_offset`` values are
+        recomputed in scene order once every scene has finished.
+
         Args:
             scenes: List of Scene objects with text to synthesize
             config: TTS configuration
             output_dir: Directory for output files
+            concurrent: Synthesize scenes in parallel instead of one by one
 
         Returns:
             List of SceneTTSResult, one per scene
         """
         output_dir.mkdir(parents=True, exist_ok=True)
+
+        if concurrent and len(scenes) > 1:
+            return await self._synthesize_scenes_concurrent(scenes, config, output_dir)
+
         results: list[SceneTTSResult] = []
         current_offset = 0.0
 
         for i, scene in enumerate(scenes):
-            # Generate unique output path for each scene
-            scene_output = output_dir / f"scene_{i:03d}"
-
-            # Use tts_content (tts_text if set, otherwise text)
-            # This allows proper pronunciation while keeping original text for subtitles
-            tts_text = scene.tts_content
-
-            # Synthesize this scene
-            tts_result = await self.synthesize(
-                text=tts_text,
-                config=config,
-                output_path=scene_output,
-            )
-
-            results.append(
-                SceneTTSResult(
-                    scene_index=i,
-                    scene_type=scene.scene_type.value,
-                    audio_path=tts_result.audio_path,
-                    duration_seconds=tts_result.duration_seconds,
-                    word_timestamps=tts_result.word_timestamps,
-                    start_offset=current_offset,
-                )
-            )
-
-            current_offset += tts_result.duration_seconds
+            scene_result = await self._synthesize_scene(i, scene, config, output_dir)
+            scene_result.start_offset = current_offset
+            results.append(scene_result)
+
+            current_offset += scene_result.duration_seconds
+
+        return results
+
+    async def _synthesize_scenes_concurrent(
+        self,
+        scenes: list["Scene"],
+        config: TTSSynthesisConfig,
+        output_dir: Path,
+    ) -> list[SceneTTSResult]:
+        """Synthesize all scenes in parallel and reassemble them in order.
+
+        If any scene fails, the remaining in-flight scenes are cancelled
+        and the first error is raised.
+
+        Args:
+            scenes: List of Scene objects with text to synthesize
+            config: TTS configuration
+            output_dir: Directory for output files
 
+        Returns:
+            List of SceneTTSResult in scene order with offsets computed
+        """
+        from app.services.generator.tts.utils import adjust_scene_offsets
+
+        async def _limited(index: int, scene: "Scene") -> SceneTTSResult:
+            # Cached scenes never reach the provider, so they skip its limits
+            if self._is_cached(scene.tts_content, config):
+                return await self._synthesize_scene(index, scene, config, output_dir)
+            async with self._semaphore:
+                await self._rate_limiter.acquire()
+                return await self._synthesize_scene(index, scene, config, output_dir)
+
+        tasks = [asyncio.create_task(_limited(i, scene)) for i, scene in enumerate(scenes)]
+        try:
+            results = list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        # gather() preserves submission order, so offsets follow scene order
+        adjust_scene_offsets(results)
         return results
 
+    async def _synthesize_scene(
+        self,
+        index: int,
+        scene: "Scene",
+        config: TTSSynthesisConfig,
+        output_dir: Path,
+    ) -> SceneTTSResult:
+        """Synthesize a single scene into ``scene_{index:03d}``.
+
+        Args:
+            index: Scene index in the script
+            scene: Scene to synthesize
+            config: TTS configuration
+            output_dir: Directory for output files
+
+        Returns:
+            SceneTTSResult with start_offset left at 0.0
+        """
+        # Use tts_content (tts_text if set, otherwise text)
+        # This allows proper pronunciation while keeping original text for subtitles
+        tts_result = await self.synthesize(
+            text=scene.tts_content,
+            config=config,
+            output_path=output_dir / f"scene_{index:03d}",
+        )
+
+        return SceneTTSResult(
+            scene_index=index,
+            scene_type=scene.scene_type.value,
+            audio_path=tts_result.audio_path,
+            duration_seconds=tts_result.duration_seconds,
+            word_timestamps=tts_result.word_timestamps,
+        )
+
 
 __all__ = [
     "WordTimestamp",
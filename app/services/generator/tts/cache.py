@@ -0,0 +1,294 @@
+"""Content-addressed disk cache for synthesized TTS audio.
+
+Retries, re-renders and template variants often re-synthesize identical
+scene text with identical voice settings. This cache stores the audio and
+its word timestamps keyed by a hash of everything that affects the output,
+so repeated synthesis becomes a local file copy.
+
+Layout::
+
+    <cache_dir>/<key[:2]>/<key>.<format>   # audio
+    <cache_dir>/<key[:2]>/<key>.json       # duration + word timestamps
+
+Entry recency is tracked through the metadata file's mtime, which is
+refreshed on every hit and used for LRU eviction.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.config.video import TTSCacheConfig
+from app.core.logging import get_logger
+from app.services.generator.tts.base import TTSResult, TTSSynthesisConfig, WordTimestamp
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class TTSCacheStats:
+    """Hit/miss counters for a TTSCache.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that required synthesis
+        stores: Entries written
+        evictions: Entries removed by size/age limits
+        bytes_served: Audio bytes served from the cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_served: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTSCache:
+    """Disk-backed, content-addressed TTS audio cache with LRU eviction.
+
+    Example:
+        >>> cache = TTSCache(TTSCacheConfig(cache_dir="/tmp/tts-cache"))
+        >>> key = cache.make_key("edge-tts", "안녕하세요", config)
+        >>> result = cache.get(key, Path("/tmp/out/scene_000"), "mp3")
+        >>> if result is None:
+        ...     result = await engine.synthesize(...)
+        ...     cache.put(key, result)
+    """
+
+    def __init__(self, config: TTSCacheConfig) -> None:
+        """Initialize TTSCache.
+
+        Args:
+            config: Cache location and size/age limits
+        """
+        self.config = config
+        self.cache_dir = Path(config.cache_dir)
+        self.max_bytes = config.max_size_mb * 1024 * 1024
+        self.max_age_seconds = config.max_age_days * 86400
+        self.stats = TTSCacheStats()
+        self._total_bytes: int | None = None
+
+    @staticmethod
+    def make_key(namespace: str, text: str, config: TTSSynthesisConfig) -> str:
+        """Build the content address for a synthesis request.
+
+        Args:
+            namespace: Provider/model identifier (e.g. "edge-tts")
+            text: Text to synthesize
+            config: Synthesis parameters
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            {
+                "namespace": namespace,
+                "text": text,
+                "voice_id": config.voice_id,
+                "speed": config.speed,
+                "pitch": config.pitch,
+                "volume": config.volume,
+                "output_format": config.output_format,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, output_path: Path, output_format: str) -> TTSResult | None:
+        """Materialize a cached entry at ``output_path``.
+
+        Args:
+            key: Cache key from make_key()
+            output_path: Destination path (without extension)
+            output_format: Audio format/extension
+
+        Returns:
+            TTSResult pointing at the materialized file, or None on miss
+        """
+        audio_path, meta_path = self._entry_paths(key, output_format)
+
+        try:
+            meta_stat = meta_path.stat()
+            if self._expired(meta_stat.st_mtime):
+                entry_bytes = meta_stat.st_size + self._file_size(audio_path)
+                self._remove_entry(meta_path, audio_path)
+                self.stats.evictions += 1
+                if self._total_bytes is not None:
+                    self._total_bytes = max(self._total_bytes - entry_bytes, 0)
+                raise FileNotFoundError(meta_path)
+
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            dest = output_path.with_suffix(f".{output_format}")
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            # Copy rather than link: engines write audio in place with open("wb"),
+            # which would truncate a shared inode and corrupt the cache entry.
+            shutil.copyfile(audio_path, dest)
+        except (OSError, ValueError, KeyError):
+            self.stats.misses += 1
+            return None
+
+        # Refresh recency for LRU eviction
+        os.utime(meta_path)
+
+        word_timestamps = [
+            WordTimestamp(word=w["word"], start=w["start"], end=w["end"])
+            for w in meta.get("word_timestamps") or []
+        ]
+
+        self.stats.hits += 1
+        self.stats.bytes_served += dest.stat().st_size
+        logger.debug("tts_cache_hit", key=key[:12], hit_ratio=round(self.stats.hit_ratio, 3))
+
+        return TTSResult(
+            audio_path=dest,
+            duration_seconds=float(meta["duration_seconds"]),
+            word_timestamps=word_timestamps or None,
+            sample_rate=int(meta.get("sample_rate", 24000)),
+            format=meta.get("format", output_format),
+        )
+
+    def contains(self, key: str, output_format: str) -> bool:
+        """Check for a fresh entry without serving it or counting a hit/miss.
+
+        Args:
+            key: Cache key from make_key()
+            output_format: Audio format/extension
+
+        Returns:
+            True if get() would most likely hit
+        """
+        audio_path, meta_path = self._entry_paths(key, output_format)
+        try:
+            meta_mtime = meta_path.stat().st_mtime
+        except OSError:
+            return False
+        return not self._expired(meta_mtime) and audio_path.exists()
+
+    def put(self, key: str, result: TTSResult) -> None:
+        """Store a synthesis result.
+
+        Failures are logged and ignored; the cache is never required for synthesis.
+
+        Args:
+            key: Cache key from make_key()
+            result: Freshly synthesized result
+        """
+        audio_path, meta_path = self._entry_paths(key, result.format)
+        meta = {
+            "duration_seconds": result.duration_seconds,
+            "sample_rate": result.sample_rate,
+            "format": result.format,
+            "word_timestamps": [
+                {"word": w.word, "start": w.start, "end": w.end}
+                for w in result.word_timestamps or []
+            ],
+            "created_at": time.time(),
+        }
+
+        try:
+            audio_path.parent.mkdir(parents=True, exist_ok=True)
+            # An overwritten entry's bytes leave the running total
+            replaced_bytes = self._file_size(audio_path) + self._file_size(meta_path)
+            # Write to temp names and rename so readers never see partial entries
+            tmp_audio = audio_path.with_name(f".{audio_path.name}.{os.getpid()}.tmp")
+            shutil.copyfile(result.audio_path, tmp_audio)
+            os.replace(tmp_audio, audio_path)
+
+            tmp_meta = meta_path.with_name(f".{meta_path.name}.{os.getpid()}.tmp")
+            tmp_meta.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_meta, meta_path)
+        except OSError as e:
+            logger.warning("tts_cache_store_failed", key=key[:12], error=str(e))
+            return
+
+        self.stats.stores += 1
+        if self._total_bytes is not None:
+            self._total_bytes += (
+                audio_path.stat().st_size + meta_path.stat().st_size - replaced_bytes
+            )
+
+        if self.max_bytes and self._get_total_bytes() > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove expired entries, then least recently used ones above the size limit.
+
+        Returns:
+            Number of entries removed
+        """
+        entries: list[tuple[float, int, Path, list[Path]]] = []
+        for meta_path in self.cache_dir.glob("*/*.json"):
+            audio_paths = [
+                p for p in meta_path.parent.glob(f"{meta_path.stem}.*") if p.suffix != ".json"
+            ]
+            try:
+                meta_stat = meta_path.stat()
+                size = meta_stat.st_size + sum(p.stat().st_size for p in audio_paths)
+            except OSError:
+                continue
+            entries.append((meta_stat.st_mtime, size, meta_path, audio_paths))
+
+        now = time.time()
+        total = sum(size for _, size, _, _ in entries)
+        removed = 0
+
+        # Least recently used first
+        for last_used, size, meta_path, audio_paths in sorted(entries, key=lambda e: e[0]):
+            expired = bool(self.max_age_seconds) and now - last_used > self.max_age_seconds
+            if not expired and (not self.max_bytes or total <= self.max_bytes):
+                break
+            self._remove_entry(meta_path, *audio_paths)
+            total -= size
+            removed += 1
+
+        self._total_bytes = total
+        self.stats.evictions += removed
+        if removed:
+            logger.info("tts_cache_evicted", entries=removed, total_mb=round(total / 1048576, 1))
+        return removed
+
+    def _expired(self, last_used: float) -> bool:
+        """Check whether an entry last used at ``last_used`` is past max age."""
+        return bool(self.max_age_seconds) and time.time() - last_used > self.max_age_seconds
+
+    def _get_total_bytes(self) -> int:
+        """Get total cache size, scanning the directory on first use."""
+        if self._total_bytes is None:
+            self._total_bytes = sum(
+                p.stat().st_size for p in self.cache_dir.glob("*/*") if p.is_file()
+            )
+        return self._total_bytes
+
+    def _entry_paths(self, key: str, output_format: str) -> tuple[Path, Path]:
+        """Get (audio, metadata) paths for a cache key."""
+        shard = self.cache_dir / key[:2]
+        return shard / f"{key}.{output_format}", shard / f"{key}.json"
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """Get a file's size, or 0 if it does not exist."""
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _remove_entry(*paths: Path) -> None:
+        """Delete an entry's files (metadata first), ignoring ones already gone."""
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+
+__all__ = ["TTSCache", "TTSCacheStats"]
@@ -8,7 +8,9 @@ Microsoft Edge TTS provides free, high-quality neural TTS with:
 
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from app.config.video import TTSConcurrencyConfig
 from app.services.generator.ffmpeg import FFmpegWrapper
 from app.services.generator.tts.base import (
     EDGE_TTS_VOICES_EN,
@@ -20,6 +22,9 @@ from app.services.generator.tts.base import (
     WordTimestamp,
 )
 
+if TYPE_CHECKING:
+    from app.services.generator.tts.cache import TTSCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,12 +45,20 @@ class EdgeTTSEngine(BaseTTSEngine):
         1.5
     """
 
-    def __init__(self, ffmpeg_wrapper: FFmpegWrapper) -> None:
+    def __init__(
+        self,
+        ffmpeg_wrapper: FFmpegWrapper,
+        concurrency: TTSConcurrencyConfig | None = None,
+        cache: "TTSCache | None" = None,
+    ) -> None:
         """Initialize EdgeTTSEngine.
 
         Args:
             ffmpeg_wrapper: FFmpeg wrapper for audio duration probing
+            concurrency: Limits for concurrent scene synthesis
+            cache: Optional audio cache for repeated requests
         """
+        super().__init__(concurrency, cache)
         self._ffmpeg = ffmpeg_wrapper
         self._voices: dict[str, VoiceInfo] = {
             **EDGE_TTS_VOICES_KO,
@@ -74,6 +87,11 @@ class EdgeTTSEngine(BaseTTSEngine):
         """
         import edge_tts
 
+        cache_key, cached = self._cache_lookup(text, config, output_path)
+        if cached is not None:
+            logger.info(f"TTS cache hit: {cached.audio_path}")
+            return cached
+
         if config.voice_id not in self._voices:
             logger.warning(f"Voice {config.voice_id} not in predefined list, using anyway")
 
@@ -151,12 +169,19 @@ class EdgeTTSEngine(BaseTTSEngine):
             f"words={len(word_timestamps)}"
         )
 
-        return TTSResult(
+        result = TTSResult(
             audio_path=audio_path,
             duration_seconds=duration,
             word_timestamps=word_timestamps if word_timestamps else None,
             format=config.output_format,
         )
+        self._cache_store(cache_key, result)
+        return result
+
+    @property
+    def cache_namespace(self) -> str:
+        """Cache namespace for Edge TTS entries."""
+        return "edge-tts"
 
     def get_available_voices(
         self,
@@ -10,16 +10,23 @@ ElevenLabs provides premium, high-quality AI voices with:
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from app.config.video import TTSConcurrencyConfig
+from app.services.generator.tts.aligner import WhisperAligner, get_whisper_aligner
 from app.services.generator.tts.base import (
     BaseTTSEngine,
+    SceneTTSResult,
     TTSResult,
     TTSSynthesisConfig,
     VoiceInfo,
     WordTimestamp,
 )
 
+if TYPE_CHECKING:
+    from app.models.scene import Scene
+    from app.services.generator.tts.cache import TTSCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,21 +53,30 @@ class ElevenLabsEngine(BaseTTSEngine):
         self,
         api_key: str | None = None,
         model_id: str = "eleven_multilingual_v2",
+        concurrency: TTSConcurrencyConfig | None = None,
+        cache: "TTSCache | None" = None,
+        aligner: WhisperAligner | None = None,
     ) -> None:
         """Initialize ElevenLabsEngine.
 
         Args:
             api_key: ElevenLabs API key (or from ELEVENLABS_API_KEY env)
             model_id: ElevenLabs model ID
+            concurrency: Limits for concurrent scene synthesis
+            cache: Optional audio cache for repeated requests
+            aligner: Whisper aligner for word timestamps (process-wide default if None)
         """
         import os
 
+        super().__init__(concurrency, cache)
+
         self._api_key = api_key or os.environ.get("ELEVENLABS_API_KEY")
         if not self._api_key:
             logger.warning("ELEVENLABS_API_KEY not set, ElevenLabs TTS will not work")
 
         self._model_id = model_id
         self._voices_cache: list[VoiceInfo] | None = None
+        self._aligner = aligner
 
     async def synthesize(
         self,
@@ -78,6 +94,128 @@ class ElevenLabsEngine(BaseTTSEngine):
         Returns:
             TTSResult with audio path and word timestamps
 
+        Raises:
+            RuntimeError: If API key not set or synthesis fails
+        """
+        cache_key, cached = self._cache_lookup(text, config, output_path)
+        if cached is not None:
+            logger.info(f"TTS cache hit: {cached.audio_path}")
+            return cached
+
+        result = await self._synthesize_audio(text, config, output_path)
+
+        # Generate word timestamps using Whisper
+        result.word_timestamps = await self._generate_timestamps_with_whisper(
+            result.audio_path, text
+        )
+
+        logger.info(
+            f"Synthesis complete: {result.audio_path}, duration={result.duration_seconds:.2f}s, "
+            f"words={len(result.word_timestamps) if result.word_timestamps else 0}"
+        )
+
+        self._cache_store(cache_key, result)
+        return result
+
+    async def synthesize_scenes(
+        self,
+        scenes: list["Scene"],
+        config: TTSSynthesisConfig,
+        output_dir: Path,
+        concurrent: bool = False,
+    ) -> list[SceneTTSResult]:
+        """Synthesize audio for each scene, then align all scenes in one batch.
+
+        Scene audio is generated first (concurrently if requested) without
+        per-scene Whisper calls; scenes lacking word timestamps are then
+        aligned together in a single aligner job and written to the cache.
+
+        Args:
+            scenes: List of Scene objects with text to synthesize
+            config: TTS configuration
+            output_dir: Directory for output files
+            concurrent: Synthesize scenes in parallel instead of one by one
+
+        Returns:
+            List of SceneTTSResult, one per scene
+        """
+        results = await super().synthesize_scenes(scenes, config, output_dir, concurrent)
+
+        pending = [r for r in results if r.word_timestamps is None]
+        if not pending:
+            return results
+
+        texts = [scenes[r.scene_index].tts_content for r in pending]
+        aligned = await self._get_aligner().align_batch(
+            [
+                (r.audio_path, self._detect_language(text))
+                for r, text in zip(pending, texts, strict=True)
+            ]
+        )
+
+        for scene_result, text, word_timestamps in zip(pending, texts, aligned, strict=True):
+            scene_result.word_timestamps = word_timestamps
+            if self.cache is not None:
+                self._cache_store(
+                    self.cache.make_key(self.cache_namespace, text, config),
+                    TTSResult(
+                        audio_path=scene_result.audio_path,
+                        duration_seconds=scene_result.duration_seconds,
+                        word_timestamps=word_timestamps,
+                        format=config.output_format,
+                    ),
+                )
+
+        logger.info(f"Aligned {len(pending)} scenes with Whisper")
+        return results
+
+    async def _synthesize_scene(
+        self,
+        index: int,
+        scene: "Scene",
+        config: TTSSynthesisConfig,
+        output_dir: Path,
+    ) -> SceneTTSResult:
+        """Synthesize scene audio only; alignment is batched by synthesize_scenes().
+
+        Args:
+            index: Scene index in the script
+            scene: Scene to synthesize
+            config: TTS configuration
+            output_dir: Directory for output files
+
+        Returns:
+            SceneTTSResult (word_timestamps is None unless served from cache)
+        """
+        output_path = output_dir / f"scene_{index:03d}"
+        _, tts_result = self._cache_lookup(scene.tts_content, config, output_path)
+        if tts_result is None:
+            tts_result = await self._synthesize_audio(scene.tts_content, config, output_path)
+
+        return SceneTTSResult(
+            scene_index=index,
+            scene_type=scene.scene_type.value,
+            audio_path=tts_result.audio_path,
+            duration_seconds=tts_result.duration_seconds,
+            word_timestamps=tts_result.word_timestamps,
+        )
+
+    async def _synthesize_audio(
+        self,
+        text: str,
+        config: TTSSynthesisConfig,
+        output_path: Path,
+    ) -> TTSResult:
+        """Generate audio with the ElevenLabs API (no word timestamps).
+
+        Args:
+            text: Text to synthesize
+            config: TTS configuration
+            output_path: Path to save audio file (without extension)
+
+        Returns:
+            TTSResult with word_timestamps set to None
+
         Raises:
             RuntimeError: If API key not set or synthesis fails
         """
@@ -116,21 +254,17 @@ class ElevenLabsEngine(BaseTTSEngine):
         # Get duration
         duration = await self.get_audio_duration(audio_path)
 
-        # Generate word timestamps using Whisper
-        word_timestamps = await self._generate_timestamps_with_whisper(audio_path, text)
-
-        logger.info(
-            f"Synthesis complete: {audio_path}, duration={duration:.2f}s, "
-            f"words={len(word_timestamps) if word_timestamps else 0}"
-        )
-
         return TTSResult(
             audio_path=audio_path,
             duration_seconds=duration,
-            word_timestamps=word_timestamps,
             format=config.output_format,
         )
 
+    @property
+    def cache_namespace(self) -> str:
+        """Cache namespace for ElevenLabs entries (model changes the audio)."""
+        return f"elevenlabs:{self._model_id}"
+
     def get_available_voices(
         self,
         language: str | None = None,
@@ -227,7 +361,7 @@ class ElevenLabsEngine(BaseTTSEngine):
         audio_path: Path,
         original_text: str,
     ) -> list[WordTimestamp] | None:
-        """Generate word timestamps using Whisper.
+        """Generate word timestamps using the shared Whisper aligner.
 
         Args:
             audio_path: Path to audio file
@@ -237,42 +371,17 @@ class ElevenLabsEngine(BaseTTSEngine):
             List of word timestamps or None if failed
         """
         try:
-            # Load model (cached after first load)
-            import whisper  # lazy: heavy dependency, only needed here
-
-            model = whisper.load_model("base")
-
-            # Transcribe with word timestamps
-            result = model.transcribe(
-                str(audio_path),
-                word_timestamps=True,
-                language=self._detect_language(original_text),
-            )
-
-            timestamps: list[WordTimestamp] = []
-
-            # Extract word-level timestamps
-            for segment in result.get("segments", []):
-                for word_info in segment.get("words", []):
-                    word = word_info.get("word", "").strip()
-                    if word:
-                        timestamps.append(
-                            WordTimestamp(
-                                word=word,
-                                start=word_info.get("start", 0.0),
-                                end=word_info.get("end", 0.0),
-                            )
-                        )
-
-            return timestamps if timestamps else None
-
-        except ImportError:
-            logger.warning("Whisper not installed, skipping timestamp generation")
-            return None
+            return await self._get_aligner().align(audio_path, self._detect_language(original_text))
         except Exception as e:
             logger.warning(f"Whisper timestamp generation failed: {e}")
             return None
 
+    def _get_aligner(self) -> WhisperAligner:
+        """Get the Whisper aligner, falling back to the process-wide default."""
+        if self._aligner is None:
+            self._aligner = get_whisper_aligner()
+        return self._aligner
+
     def _get_voice_settings(self, config: TTSSynthesisConfig) -> dict[str, Any]:
         """Get ElevenLabs voice settings from config.
 
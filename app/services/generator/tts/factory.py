@@ -8,7 +8,9 @@ from typing import Literal
 
 from app.config.video import TTSProviderConfig
 from app.services.generator.ffmpeg import FFmpegWrapper
+from app.services.generator.tts.aligner import get_whisper_aligner
 from app.services.generator.tts.base import BaseTTSEngine
+from app.services.generator.tts.cache import TTSCache
 from app.services.generator.tts.edge import EdgeTTSEngine
 from app.services.generator.tts.elevenlabs import ElevenLabsEngine
 
@@ -45,6 +47,8 @@ class TTSEngineFactory:
         self._config = config
         self._elevenlabs_api_key = elevenlabs_api_key
         self._engines: dict[str, BaseTTSEngine] = {}
+        # One cache shared by all engines; keys are namespaced per provider
+        self._cache = TTSCache(config.cache) if config.cache.enabled else None
 
     def get_engine(self, provider: str | None = None) -> BaseTTSEngine:
         """Get or create a TTS engine instance.
@@ -69,9 +73,18 @@ class TTSEngineFactory:
 
         engine: BaseTTSEngine
         if provider == "edge-tts":
-            engine = EdgeTTSEngine(ffmpeg_wrapper=self._ffmpeg_wrapper)
+            engine = EdgeTTSEngine(
+                ffmpeg_wrapper=self._ffmpeg_wrapper,
+                concurrency=self._config.edge_tts_concurrency,
+                cache=self._cache,
+            )
         elif provider == "elevenlabs":
-            engine = ElevenLabsEngine(api_key=self._elevenlabs_api_key)
+            engine = ElevenLabsEngine(
+                api_key=self._elevenlabs_api_key,
+                concurrency=self._config.elevenlabs_concurrency,
+                cache=self._cache,
+                aligner=get_whisper_aligner(self._config.whisper),
+            )
         else:
             raise ValueError(f"Unsupported TTS provider: {provider}")
 
@@ -99,6 +112,11 @@ class TTSEngineFactory:
         else:
             return self._config.default_voice_en
 
+    @property
+    def cache(self) -> TTSCache | None:
+        """Shared TTS audio cache (None when disabled)."""
+        return self._cache
+
     @property
     def available_providers(self) -> list[str]:
         """Get list of available TTS providers.
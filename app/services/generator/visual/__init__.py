@@ -4,6 +4,7 @@ This module provides visual asset sourcing for video generation:
 - PexelsClient: Stock video/image search and download
 - WanVideoSource: Wan 2.2 T2V video generation via HTTP API
 - VisualSourcingManager: Orchestrates visual sourcing with priority
+- VisualAssetCache: Persistent stock search/download cache
 """
 
 from app.services.generator.visual.base import (
@@ -11,6 +12,7 @@ from app.services.generator.visual.base import (
     VisualAsset,
     VisualSourceType,
 )
+from app.services.generator.visual.cache import VisualAssetCache
 from app.services.generator.visual.manager import VisualSourcingManager
 from app.services.generator.visual.pexels import PexelsClient
 from app.services.generator.visual.wan_video_source import WanVideoSource
@@ -22,4 +24,5 @@ __all__ = [
     "PexelsClient",
     "WanVideoSource",
     "VisualSourcingManager",
+    "VisualAssetCache",
 ]
@@ -0,0 +1,304 @@
+"""Persistent cache for stock media searches and downloads.
+
+Channels with recurring keywords search for and download the same stock
+clips over and over. This cache keeps:
+
+- Search responses, keyed by (media type, query, orientation), for a TTL.
+  The raw API payload is stored so filtering and scoring still run on
+  every lookup.
+- Downloaded media in a content-addressed store keyed by source id and
+  file variant (the rendition URL). Files are hard-linked into each
+  render directory instead of being copied or re-downloaded.
+
+Layout::
+
+    <cache_dir>/search/<key>.json
+    <cache_dir>/media/<key[:2]>/<key><ext>
+
+Media recency is tracked through the stored file's mtime, refreshed on
+every hit and used for LRU eviction by total bytes. Evicting a file that
+is still linked into a render directory is safe; the link keeps the data.
+Eviction also deletes search responses past their TTL.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class VisualCacheStats:
+    """Hit/miss counters for a VisualAssetCache.
+
+    Attributes:
+        search_hits: Searches served from the cache
+        search_misses: Searches that required an API call
+        media_hits: Downloads served by linking a stored file
+        media_misses: Downloads that required fetching
+        evictions: Media files removed by the size limit and expired
+            search responses removed
+    """
+
+    search_hits: int = 0
+    search_misses: int = 0
+    media_hits: int = 0
+    media_misses: int = 0
+    evictions: int = 0
+
+
+class VisualAssetCache:
+    """Disk cache for stock search responses and downloaded media.
+
+    Example:
+        >>> cache = VisualAssetCache(Path("data/cache/visual"), ttl_hours=24)
+        >>> data = cache.get_search("videos", "city night", "portrait", per_page=10)
+        >>> if cache.link_media("pexels", "123", url, dest):
+        ...     ...  # dest now hard-links the stored clip
+    """
+
+    def __init__(self, cache_dir: Path, ttl_hours: int = 24, max_size_mb: int = 4096) -> None:
+        """Initialize VisualAssetCache.
+
+        Args:
+            cache_dir: Root directory for cached searches and media
+            ttl_hours: Lifetime of cached search responses
+            max_size_mb: Total media size limit (0 disables eviction)
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.stats = VisualCacheStats()
+        self._media_bytes: int | None = None
+        self._searches_swept = False
+
+    # ---- Search responses ----
+
+    def get_search(
+        self,
+        media_type: str,
+        query: str,
+        orientation: str,
+        per_page: int,
+    ) -> dict[str, Any] | None:
+        """Get a cached search response.
+
+        Args:
+            media_type: "videos" or "photos"
+            query: Search query
+            orientation: Requested orientation
+            per_page: Number of results the caller needs
+
+        Returns:
+            Raw API payload, or None on miss/expiry/too few stored results
+        """
+        path = self._search_path(media_type, query, orientation)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if not self._search_fresh(entry):
+                path.unlink(missing_ok=True)
+            elif int(entry["per_page"]) >= per_page:
+                self.stats.search_hits += 1
+                logger.debug("visual_search_cache_hit", media_type=media_type, query=query)
+                data: dict[str, Any] = entry["data"]
+                return data
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        self.stats.search_misses += 1
+        return None
+
+    def put_search(
+        self,
+        media_type: str,
+        query: str,
+        orientation: str,
+        per_page: int,
+        data: dict[str, Any],
+    ) -> None:
+        """Store a search response.
+
+        Args:
+            media_type: "videos" or "photos"
+            query: Search query
+            orientation: Requested orientation
+            per_page: Number of results requested from the API
+            data: Raw API payload
+        """
+        path = self._search_path(media_type, query, orientation)
+        entry = {"fetched_at": time.time(), "per_page": per_page, "data": data}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("visual_search_cache_store_failed", query=query, error=str(e))
+            return
+
+        # Entries whose query never comes back are only removed by a sweep
+        if not self._searches_swept:
+            self._searches_swept = True
+            self.stats.evictions += self._evict_expired_searches()
+
+    # ---- Media ----
+
+    def link_media(self, source: str, source_id: str, url: str, dest: Path) -> bool:
+        """Materialize a stored media file at ``dest``.
+
+        Args:
+            source: Source identifier (e.g. "pexels")
+            source_id: Asset id on the source platform
+            url: Rendition URL (identifies the file variant)
+            dest: Destination path in the render directory
+
+        Returns:
+            True if served from the cache, False on miss
+        """
+        stored = self._media_path(source, source_id, url, dest.suffix)
+        try:
+            _link_or_copy(stored, dest)
+            os.utime(stored)  # refresh recency for LRU eviction
+        except OSError:
+            self.stats.media_misses += 1
+            return False
+
+        self.stats.media_hits += 1
+        logger.debug("visual_media_cache_hit", source=source, source_id=source_id)
+        return True
+
+    def put_media(self, source: str, source_id: str, url: str, path: Path) -> None:
+        """Add a freshly downloaded file to the store.
+
+        The file is hard-linked into the store, so no data is copied when
+        the render directory shares the cache's filesystem.
+
+        Args:
+            source: Source identifier (e.g. "pexels")
+            source_id: Asset id on the source platform
+            url: Rendition URL (identifies the file variant)
+            path: Downloaded file
+        """
+        stored = self._media_path(source, source_id, url, path.suffix)
+        try:
+            stored.parent.mkdir(parents=True, exist_ok=True)
+            # A replaced file's bytes leave the running total
+            replaced_bytes = stored.stat().st_size if stored.is_file() else 0
+            tmp = stored.with_name(f".{stored.name}.{os.getpid()}.tmp")
+            _link_or_copy(path, tmp)
+            os.replace(tmp, stored)
+        except OSError as e:
+            logger.warning("visual_media_cache_store_failed", source_id=source_id, error=str(e))
+            return
+
+        if self._media_bytes is not None:
+            self._media_bytes += stored.stat().st_size - replaced_bytes
+
+        if self.max_bytes and self._get_media_bytes() > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove expired search responses and least recently used media above the size limit.
+
+        Returns:
+            Number of files removed
+        """
+        removed = self._evict_expired_searches()
+
+        entries: list[tuple[float, int, Path]] = []
+        for path in (self.cache_dir / "media").glob("*/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if not self.max_bytes or total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        self._media_bytes = total
+        self.stats.evictions += removed
+        if removed:
+            logger.info("visual_cache_evicted", files=removed, total_mb=round(total / 1048576, 1))
+        return removed
+
+    def _evict_expired_searches(self) -> int:
+        """Delete search responses past their TTL (or unreadable)."""
+        removed = 0
+        for path in (self.cache_dir / "search").glob("*.json"):
+            try:
+                fresh = self._search_fresh(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                fresh = False
+            if not fresh:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def _search_fresh(self, entry: Any) -> bool:
+        """Check whether a stored search entry is within its TTL."""
+        try:
+            return time.time() - float(entry["fetched_at"]) <= self.ttl_seconds
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def _get_media_bytes(self) -> int:
+        """Get total media size, scanning the store on first use.
+
+        In-flight temp files (dot-prefixed) are skipped, as in evict().
+        """
+        if self._media_bytes is None:
+            self._media_bytes = sum(
+                p.stat().st_size
+                for p in (self.cache_dir / "media").glob("*/*")
+                if p.is_file() and not p.name.startswith(".")
+            )
+        return self._media_bytes
+
+    def _search_path(self, media_type: str, query: str, orientation: str) -> Path:
+        """Get the entry path for a search key."""
+        payload = json.dumps(
+            [media_type, " ".join(query.lower().split()), orientation], ensure_ascii=False
+        )
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return self.cache_dir / "search" / f"{key}.json"
+
+    def _media_path(self, source: str, source_id: str, url: str, ext: str) -> Path:
+        """Get the store path for a media file variant."""
+        key = hashlib.sha256(f"{source}\n{source_id}\n{url}".encode()).hexdigest()
+        return self.cache_dir / "media" / key[:2] / f"{key}{ext}"
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """Hard-link ``src`` to ``dest``, copying when linking is not possible.
+
+    Raises:
+        OSError: If ``src`` does not exist or neither operation succeeds
+    """
+    if not src.is_file():
+        raise FileNotFoundError(src)
+
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        # Different filesystem or links unsupported
+        shutil.copyfile(src, dest)
+
+
+__all__ = ["VisualAssetCache", "VisualCacheStats"]
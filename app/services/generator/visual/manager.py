@@ -6,6 +6,10 @@ Source priority:
 1. Pexels videos/images (stock)
 2. Wan 2.2 AI video generation
 3. Solid color fallback (generated locally)
+
+When the Wan service is up, the best stock candidates of a scene are
+re-ranked by CLIP similarity of their preview images to the scene keyword,
+scored in one batched request per scene.
 """
 
 import asyncio
@@ -29,6 +33,24 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Per-scene budget for stock search/download (and Wan fallback)
+_SCENE_TIMEOUT_SECONDS = 30
+# Timeout for fetching a candidate preview image for CLIP re-ranking
+_PREVIEW_TIMEOUT_SECONDS = 5.0
+# Budget for the whole CLIP re-rank, well inside the scene budget so a slow
+# Wan service costs the ranking, not the candidates already found
+_CLIP_RERANK_TIMEOUT_SECONDS = 8.0
+
+# Errors that degrade a scene to the solid color fallback instead of failing the video
+_SCENE_ERRORS = (httpx.HTTPError, RuntimeError, ValueError, OSError, TimeoutError)
+
+AssetKey = tuple[str | None, str | None]
+
+
+def _asset_key(asset: VisualAsset) -> AssetKey:
+    """Get the (source, source_id or url) key used for deduplication."""
+    return (asset.source, asset.source_id or asset.url)
+
 
 @dataclass
 class SceneVisualResult:
@@ -84,26 +106,26 @@ class VisualSourcingManager:
         scene_results: list["SceneTTSResult"],
         output_dir: Path,
         orientation: Literal["portrait", "landscape", "square"] = "portrait",
+        concurrent: bool = False,
     ) -> list[SceneVisualResult]:
         """Source visual assets for each scene individually.
 
+        In concurrent mode stock searches for all scenes run at once; see
+        _source_scenes_concurrent() for how duplicates are avoided.
+
         Args:
             scenes: List of Scene objects with keywords and strategies
             scene_results: List of SceneTTSResult with timing info
             output_dir: Directory to download assets
             orientation: Visual orientation
+            concurrent: Source scenes in parallel instead of one by one
 
         Returns:
             List of SceneVisualResult, one per scene
         """
         output_dir.mkdir(parents=True, exist_ok=True)
-        results: list[SceneVisualResult] = []
-
-        logger.info("sourcing_visuals", scene_count=len(scenes))
 
-        last_asset: VisualAsset | None = None
-        used_source_ids: set[tuple[str | None, str | None]] = set()
-        reuse_types = self.config.reuse_previous_visual_types
+        logger.info("sourcing_visuals", scene_count=len(scenes), concurrent=concurrent)
 
         if len(scenes) != len(scene_results):
             logger.warning(
@@ -114,8 +136,69 @@ class VisualSourcingManager:
 
         paired_count = min(len(scenes), len(scene_results))
 
-        paired_scenes = zip(scenes[:paired_count], scene_results[:paired_count], strict=True)
-        for i, (scene, tts_result) in enumerate(paired_scenes):
+        if concurrent and paired_count > 1:
+            results = await self._source_scenes_concurrent(
+                scenes[:paired_count], scene_results[:paired_count], output_dir, orientation
+            )
+        else:
+            results = await self._source_scenes_sequential(
+                scenes[:paired_count], scene_results[:paired_count], output_dir, orientation
+            )
+
+        # Generate fallback visuals for remaining scenes without TTS results
+        if len(scenes) > paired_count:
+            last_end = (
+                (scene_results[-1].start_offset + scene_results[-1].duration_seconds)
+                if scene_results
+                else 0.0
+            )
+            default_duration = 3.0
+            for i in range(paired_count, len(scenes)):
+                scene = scenes[i]
+                logger.warning("scene_missing_tts_result", scene=i)
+                fallback_asset = await self._create_fallback(
+                    output_dir=output_dir / f"scene_{i:03d}",
+                    duration=default_duration,
+                    orientation=orientation,
+                )
+                results.append(
+                    SceneVisualResult(
+                        scene_index=i,
+                        scene_type=scene.scene_type.value,
+                        asset=fallback_asset,
+                        duration=default_duration,
+                        start_offset=last_end,
+                    )
+                )
+                last_end += default_duration
+
+        logger.info("sourced_visuals", count=len(results))
+        return results
+
+    async def _source_scenes_sequential(
+        self,
+        scenes: list["Scene"],
+        scene_results: list["SceneTTSResult"],
+        output_dir: Path,
+        orientation: Literal["portrait", "landscape", "square"],
+    ) -> list[SceneVisualResult]:
+        """Source scenes one by one, each excluding assets used by earlier scenes.
+
+        Args:
+            scenes: Scenes paired with scene_results
+            scene_results: TTS results with timing info
+            output_dir: Directory to download assets
+            orientation: Visual orientation
+
+        Returns:
+            List of SceneVisualResult in scene order
+        """
+        results: list[SceneVisualResult] = []
+        last_asset: VisualAsset | None = None
+        used_source_ids: set[AssetKey] = set()
+        reuse_types = self.config.reuse_previous_visual_types
+
+        for i, (scene, tts_result) in enumerate(zip(scenes, scene_results, strict=True)):
             keyword = scene.visual_keyword or scene.text[:50]
             duration = tts_result.duration_seconds
             start_offset = tts_result.start_offset
@@ -136,7 +219,7 @@ class VisualSourcingManager:
 
             scene_dir = output_dir / f"scene_{i:03d}"
             try:
-                async with asyncio.timeout(30):
+                async with asyncio.timeout(_SCENE_TIMEOUT_SECONDS):
                     asset = await self._source_for_scene(
                         keyword=keyword,
                         duration=duration,
@@ -148,8 +231,7 @@ class VisualSourcingManager:
                 last_asset = asset
 
                 # Track by (source, source_id) or (source, url) for deduplication
-                asset_key = (asset.source, asset.source_id or asset.url)
-                used_source_ids.add(asset_key)
+                used_source_ids.add(_asset_key(asset))
 
                 results.append(
                     SceneVisualResult(
@@ -186,43 +268,339 @@ class VisualSourcingManager:
                     )
                 )
 
-        # Generate fallback visuals for remaining scenes without TTS results
-        if len(scenes) > paired_count:
-            last_end = (
-                (scene_results[-1].start_offset + scene_results[-1].duration_seconds)
-                if scene_results
-                else 0.0
-            )
-            default_duration = 3.0
-            for i in range(paired_count, len(scenes)):
-                scene = scenes[i]
-                logger.warning("scene_missing_tts_result", scene=i)
-                fallback_asset = await self._create_fallback(
-                    output_dir=output_dir / f"scene_{i:03d}",
-                    duration=default_duration,
-                    orientation=orientation,
+        return results
+
+    async def _source_scenes_concurrent(
+        self,
+        scenes: list["Scene"],
+        scene_results: list["SceneTTSResult"],
+        output_dir: Path,
+        orientation: Literal["portrait", "landscape", "square"],
+    ) -> list[SceneVisualResult]:
+        """Source all scenes in parallel with a global deduplication pass.
+
+        Stock searches for every scene are started at once (bounded by
+        ``max_concurrent_searches``). Candidates are then assigned in scene
+        order, each scene taking its best candidate not already assigned to
+        an earlier scene, which matches sequential deduplication. A scene's
+        download starts as soon as it is assigned, while later searches are
+        still in flight. If a download fails, the scene's next candidate not
+        assigned to another scene is tried. Scenes without a usable
+        candidate fall back to Wan generation and then a solid color. As in
+        sequential sourcing, a scene's search and download together get one
+        ``_SCENE_TIMEOUT_SECONDS`` budget; a scene that exhausts it gets the
+        solid-color fallback.
+
+        Args:
+            scenes: Scenes paired with scene_results
+            scene_results: TTS results with timing info
+            output_dir: Directory to download assets
+            orientation: Visual orientation
+
+        Returns:
+            List of SceneVisualResult in scene order
+        """
+        reuse_types = self.config.reuse_previous_visual_types
+        search_slots = asyncio.Semaphore(self.config.max_concurrent_searches)
+        download_slots = asyncio.Semaphore(self.config.max_concurrent_searches)
+
+        # Search and download share one per-scene deadline; time spent waiting
+        # for a slot or for earlier scenes' assignments is not charged to it.
+        remaining: dict[int, float] = {}
+
+        async def _search(index: int, keyword: str) -> list[VisualAsset]:
+            async with search_slots:
+                loop = asyncio.get_running_loop()
+                started = loop.time()
+                try:
+                    async with asyncio.timeout(_SCENE_TIMEOUT_SECONDS):
+                        return await self._search_candidates(keyword, orientation)
+                finally:
+                    remaining[index] = max(_SCENE_TIMEOUT_SECONDS - (loop.time() - started), 0.0)
+
+        async def _materialize(
+            index: int,
+            candidate: VisualAsset | None,
+            alternates: list[VisualAsset],
+            keyword: str,
+            duration: float,
+        ) -> VisualAsset:
+            budget = remaining.get(index, _SCENE_TIMEOUT_SECONDS)
+            async with download_slots, asyncio.timeout(budget):
+                return await self._download_or_generate(
+                    candidate,
+                    keyword,
+                    duration,
+                    output_dir / f"scene_{index:03d}",
+                    orientation,
+                    alternates=alternates,
+                    used_keys=used_source_ids,
                 )
-                results.append(
-                    SceneVisualResult(
-                        scene_index=i,
-                        scene_type=scene.scene_type.value,
-                        asset=fallback_asset,
-                        duration=default_duration,
-                        start_offset=last_end,
+
+        # Reuse-type scenes copy the previous scene's visual (except a leading one)
+        keywords = {
+            i: scene.visual_keyword or scene.text[:50]
+            for i, scene in enumerate(scenes)
+            if i == 0 or scene.scene_type.value not in reuse_types
+        }
+
+        search_tasks = {i: asyncio.create_task(_search(i, kw)) for i, kw in keywords.items()}
+        download_tasks: dict[int, asyncio.Task[VisualAsset]] = {}
+        used_source_ids: set[AssetKey] = set()
+
+        try:
+            for i, keyword in keywords.items():
+                try:
+                    candidates = await search_tasks[i]
+                except _SCENE_ERRORS as e:
+                    logger.warning(
+                        "scene_visual_search_failed",
+                        scene=i,
+                        error_type=type(e).__name__,
+                        error=str(e),
+                    )
+                    candidates = []
+
+                position = next(
+                    (n for n, c in enumerate(candidates) if _asset_key(c) not in used_source_ids),
+                    None,
+                )
+                candidate = None if position is None else candidates[position]
+                alternates = [] if position is None else candidates[position + 1 :]
+                if candidate is not None:
+                    used_source_ids.add(_asset_key(candidate))
+
+                download_tasks[i] = asyncio.create_task(
+                    _materialize(
+                        i, candidate, alternates, keyword, scene_results[i].duration_seconds
                     )
                 )
-                last_end += default_duration
 
-        logger.info("sourced_visuals", count=len(results))
+            outcomes = dict(
+                zip(
+                    download_tasks,
+                    await asyncio.gather(*download_tasks.values(), return_exceptions=True),
+                    strict=True,
+                )
+            )
+        except BaseException:
+            pending = [*search_tasks.values(), *download_tasks.values()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+
+        results: list[SceneVisualResult] = []
+        last_asset: VisualAsset | None = None
+
+        for i, (scene, tts_result) in enumerate(zip(scenes, scene_results, strict=True)):
+            duration = tts_result.duration_seconds
+            outcome = outcomes.get(i)
+
+            if i not in outcomes and last_asset is not None:
+                asset = replace(last_asset, duration=duration)
+            elif isinstance(outcome, VisualAsset):
+                asset = outcome
+                asset.duration = duration
+            elif isinstance(outcome, _SCENE_ERRORS):
+                logger.warning(
+                    "scene_visual_failed",
+                    scene=i,
+                    error_type=type(outcome).__name__,
+                    error=str(outcome),
+                )
+                scene_dir = output_dir / f"scene_{i:03d}"
+                # Clean up partial downloads from failed attempt
+                shutil.rmtree(scene_dir, ignore_errors=True)
+                asset = await self._create_fallback(scene_dir, duration, orientation)
+            else:
+                raise outcome  # type: ignore[misc]
+
+            last_asset = asset
+            results.append(
+                SceneVisualResult(
+                    scene_index=i,
+                    scene_type=scene.scene_type.value,
+                    asset=asset,
+                    duration=duration,
+                    start_offset=tts_result.start_offset,
+                )
+            )
+
         return results
 
+    async def _search_candidates(
+        self,
+        keyword: str,
+        orientation: Literal["portrait", "landscape", "square"],
+    ) -> list[VisualAsset]:
+        """Search Pexels images and videos for a scene concurrently.
+
+        Returns:
+            Acceptable candidates in preference order (images, then videos,
+            each by metadata score)
+        """
+        searches = {
+            "pexels_image": self._pexels.search_images(
+                query=keyword,
+                max_results=5,
+                orientation=orientation,
+            ),
+            "pexels_video": self._pexels.search_videos(
+                query=keyword,
+                max_results=5,
+                orientation=orientation,
+                min_duration=3.0,
+            ),
+        }
+        responses = await asyncio.gather(*searches.values(), return_exceptions=True)
+
+        candidates: list[VisualAsset] = []
+        for source_type, response in zip(searches, responses, strict=True):
+            if isinstance(response, BaseException):
+                if not isinstance(response, Exception):
+                    raise response
+                logger.warning(
+                    "pexels_search_failed",
+                    source_type=source_type,
+                    keyword=keyword,
+                    error=str(response),
+                )
+                continue
+
+            for asset in sorted(response, key=lambda a: a.metadata_score or 0.0, reverse=True):
+                if (
+                    asset.metadata_score is not None
+                    and asset.metadata_score < self.config.metadata_score_threshold
+                ):
+                    continue
+                candidates.append(asset)
+
+        return await self._rank_by_clip(keyword, candidates)
+
+    async def _rank_by_clip(self, keyword: str, candidates: list[VisualAsset]) -> list[VisualAsset]:
+        """Re-order the leading candidates by CLIP similarity to the keyword.
+
+        Preview images of the first ``clip_rerank_top_n`` candidates are
+        fetched concurrently and scored in one Wan request. Their CLIP score
+        is stored as ``metadata["clip_score"]``. Candidates without a preview
+        keep their place behind the scored ones; the rest of the list is
+        left as is. Without the Wan service, or if re-ranking takes longer
+        than ``_CLIP_RERANK_TIMEOUT_SECONDS``, the order is unchanged.
+
+        Args:
+            keyword: Scene keyword
+            candidates: Candidates in preference order
+
+        Returns:
+            Candidates in the new preference order
+        """
+        top_n = self.config.clip_rerank_top_n
+        if top_n == 0 or len(candidates) < 2:
+            return candidates
+
+        head, tail = candidates[:top_n], candidates[top_n:]
+        try:
+            async with asyncio.timeout(_CLIP_RERANK_TIMEOUT_SECONDS):
+                if not await self._wan_video.is_available():
+                    return candidates
+                previews = await asyncio.gather(*(self._fetch_preview(asset) for asset in head))
+                scored = [
+                    (asset, image) for asset, image in zip(head, previews, strict=True) if image
+                ]
+                if len(scored) < 2:
+                    return candidates
+                scores = await self._wan_video.evaluate_images(
+                    [image for _, image in scored], [keyword]
+                )
+        except TimeoutError:
+            logger.warning("clip_rerank_timeout", keyword=keyword, candidates=len(head))
+            return candidates
+        if scores is None:
+            return candidates
+
+        for (asset, _), row in zip(scored, scores, strict=True):
+            asset.metadata["clip_score"] = row[0]
+
+        # Stable sort: ties (and candidates without a preview) keep their order
+        head = sorted(head, key=lambda a: a.metadata.get("clip_score", -1.0), reverse=True)
+        logger.debug(
+            "clip_rerank",
+            keyword=keyword,
+            scored=len(scored),
+            best=head[0].metadata.get("clip_score"),
+        )
+        return head + tail
+
+    async def _fetch_preview(self, asset: VisualAsset) -> bytes | None:
+        """Download a candidate's preview image, or None if it has none."""
+        url = asset.metadata.get("preview_url")
+        if not url:
+            return None
+        try:
+            response = await self._http_client.get(url, timeout=_PREVIEW_TIMEOUT_SECONDS)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.debug("preview_fetch_failed", url=url, error=str(e))
+            return None
+        return response.content
+
+    async def _download_or_generate(
+        self,
+        candidate: VisualAsset | None,
+        keyword: str,
+        duration: float,
+        output_dir: Path,
+        orientation: Literal["portrait", "landscape", "square"],
+        alternates: list[VisualAsset] | None = None,
+        used_keys: set[AssetKey] | None = None,
+    ) -> VisualAsset:
+        """Download an assigned stock candidate, or generate a visual without one.
+
+        If the download fails, the next of ``alternates`` not yet in
+        ``used_keys`` is claimed (added to ``used_keys``, so no other scene
+        takes it) and tried, before falling back to generation.
+
+        Args:
+            candidate: Stock candidate assigned to the scene
+            keyword: Scene keyword
+            duration: Scene duration in seconds
+            output_dir: Scene output directory
+            orientation: Visual orientation
+            alternates: The scene's lower-ranked candidates, in order
+            used_keys: Keys of candidates assigned to any scene
+
+        Returns:
+            Downloaded or generated asset
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        used = used_keys if used_keys is not None else set()
+
+        while candidate is not None:
+            if candidate.is_downloaded:
+                return candidate
+            try:
+                return await self._pexels.download(candidate, output_dir)
+            except Exception as e:
+                logger.warning(
+                    "pexels_download_failed",
+                    keyword=keyword,
+                    source_id=candidate.source_id,
+                    error=str(e),
+                )
+            candidate = next((c for c in alternates or [] if _asset_key(c) not in used), None)
+            if candidate is not None:
+                used.add(_asset_key(candidate))
+
+        return await self._generate_or_fallback(keyword, duration, output_dir, orientation)
+
     async def _source_for_scene(
         self,
         keyword: str,
         duration: float,
         output_dir: Path,
         orientation: Literal["portrait", "landscape", "square"],
-        exclude_source_ids: set[tuple[str | None, str | None]] | None = None,
+        exclude_source_ids: set[AssetKey] | None = None,
     ) -> VisualAsset:
         """Source a single visual asset for a scene.
 
@@ -250,17 +628,15 @@ class VisualSourcingManager:
                     )
 
                 assets = sorted(assets, key=lambda a: a.metadata_score or 0.0, reverse=True)
+                assets = [
+                    asset
+                    for asset in assets
+                    if _asset_key(asset) not in exclude_ids
+                    and (asset.metadata_score is None or asset.metadata_score >= metadata_threshold)
+                ]
+                assets = await self._rank_by_clip(keyword, assets)
 
                 for asset in assets:
-                    asset_key = (asset.source, asset.source_id or asset.url)
-                    if asset_key in exclude_ids:
-                        continue
-                    if (
-                        asset.metadata_score is not None
-                        and asset.metadata_score < metadata_threshold
-                    ):
-                        continue
-
                     if not asset.is_downloaded:
                         asset = await self._pexels.download(asset, output_dir)
                     return asset
@@ -273,6 +649,16 @@ class VisualSourcingManager:
                     error=str(e),
                 )
 
+        return await self._generate_or_fallback(keyword, duration, output_dir, orientation)
+
+    async def _generate_or_fallback(
+        self,
+        keyword: str,
+        duration: float,
+        output_dir: Path,
+        orientation: Literal["portrait", "landscape", "square"],
+    ) -> VisualAsset:
+        """Generate a Wan AI video for a scene, or a solid color fallback."""
         # Try Wan AI video
         try:
             if await self._wan_video.is_available():
@@ -7,7 +7,7 @@ API documentation: https://www.pexels.com/api/documentation/
 import logging
 import os
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import httpx
 
@@ -17,6 +17,9 @@ from app.services.generator.visual.base import (
     VisualSourceType,
 )
 
+if TYPE_CHECKING:
+    from app.services.generator.visual.cache import VisualAssetCache
+
 logger = logging.getLogger(__name__)
 
 PEXELS_API_BASE = "https://api.pexels.com"
@@ -90,17 +93,23 @@ class PexelsClient(BaseVisualSource):
         >>> downloaded = await client.download(videos[0], Path("/tmp"))
     """
 
-    def __init__(self, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache: "VisualAssetCache | None" = None,
+    ) -> None:
         """Initialize PexelsClient.
 
         Args:
             api_key: Pexels API key (or from PEXELS_API_KEY env)
+            cache: Optional search/download cache shared across videos
         """
         self._api_key = api_key or os.environ.get("PEXELS_API_KEY")
         if not self._api_key:
             logger.warning("PEXELS_API_KEY not set, Pexels search will not work")
 
         self._client: httpx.AsyncClient | None = None
+        self._cache = cache
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -179,8 +188,6 @@ class PexelsClient(BaseVisualSource):
             logger.warning("Pexels API key not set")
             return []
 
-        client = await self._get_client()
-
         params: dict[str, str | int] = {
             "query": query,
             "per_page": min(max_results * 2, 80),  # Request more for filtering
@@ -188,12 +195,7 @@ class PexelsClient(BaseVisualSource):
         }
 
         try:
-            response = await client.get(
-                f"{PEXELS_API_BASE}/videos/search",
-                params=params,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = await self._fetch_search("videos", f"{PEXELS_API_BASE}/videos/search", params)
         except httpx.HTTPError as e:
             logger.error(f"Pexels video search failed: {e}", exc_info=True)
             return []
@@ -230,6 +232,7 @@ class PexelsClient(BaseVisualSource):
                     metadata={
                         "photographer": video.get("user", {}).get("name"),
                         "pexels_url": video.get("url"),
+                        "preview_url": video.get("image"),
                     },
                     metadata_score=_calculate_metadata_score(query, video),
                 )
@@ -263,8 +266,6 @@ class PexelsClient(BaseVisualSource):
             logger.warning("Pexels API key not set")
             return []
 
-        client = await self._get_client()
-
         # Request more results to have room for filtering out excluded IDs
         request_count = max_results + (len(exclude_ids) if exclude_ids else 0) + 5
 
@@ -275,12 +276,7 @@ class PexelsClient(BaseVisualSource):
         }
 
         try:
-            response = await client.get(
-                f"{PEXELS_API_BASE}/v1/search",
-                params=params,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = await self._fetch_search("photos", f"{PEXELS_API_BASE}/v1/search", params)
         except httpx.HTTPError as e:
             logger.error(f"Pexels image search failed: {e}", exc_info=True)
             return []
@@ -316,6 +312,7 @@ class PexelsClient(BaseVisualSource):
                         "photographer": photo.get("photographer"),
                         "pexels_url": photo.get("url"),
                         "avg_color": photo.get("avg_color"),
+                        "preview_url": src.get("medium"),
                     },
                     metadata_score=_calculate_metadata_score(query, photo),
                 )
@@ -363,6 +360,14 @@ class PexelsClient(BaseVisualSource):
             asset.path = output_path
             return asset
 
+        source_id = asset.source_id or ""
+        if self._cache is not None and self._cache.link_media(
+            "pexels", source_id, asset.url, output_path
+        ):
+            logger.debug(f"Asset served from cache: {output_path}")
+            asset.path = output_path
+            return asset
+
         client = await self._get_client()
 
         try:
@@ -373,13 +378,52 @@ class PexelsClient(BaseVisualSource):
                     async for chunk in response.aiter_bytes(chunk_size=8192):
                         f.write(chunk)
 
-            logger.info(f"Downloaded: {output_path}")
-            asset.path = output_path
-            return asset
-
         except httpx.HTTPError as e:
             raise RuntimeError(f"Download failed: {e}") from e
 
+        logger.info(f"Downloaded: {output_path}")
+        if self._cache is not None:
+            self._cache.put_media("pexels", source_id, asset.url, output_path)
+        asset.path = output_path
+        return asset
+
+    async def _fetch_search(
+        self,
+        media_type: str,
+        url: str,
+        params: dict[str, str | int],
+    ) -> dict[str, Any]:
+        """Run a search request, serving repeated queries from the cache.
+
+        Args:
+            media_type: "videos" or "photos" (cache namespace)
+            url: Search endpoint
+            params: Query parameters (query, per_page, orientation)
+
+        Returns:
+            Raw API response payload
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        query = str(params["query"])
+        orientation = str(params["orientation"])
+        per_page = int(params["per_page"])
+
+        if self._cache is not None:
+            cached = self._cache.get_search(media_type, query, orientation, per_page)
+            if cached is not None:
+                return cached
+
+        client = await self._get_client()
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        data: dict[str, Any] = response.json()
+
+        if self._cache is not None:
+            self._cache.put_search(media_type, query, orientation, per_page, data)
+        return data
+
     def _select_best_video_file(
         self,
         video_files: list[dict[str, Any]],
@@ -1,6 +1,8 @@
 """Wan 2.2 HTTP client for text-to-video generation.
 
-Communicates with the Wan Docker service via HTTP API.
+Communicates with the Wan Docker service via its job API: clips are queued
+with ``POST /jobs``, awaited by long-polling ``GET /jobs/{id}``, and
+streamed straight to disk from ``GET /jobs/{id}/video``.
 Provides graceful fallback when the Wan service is unavailable.
 """
 
@@ -8,7 +10,7 @@ import base64
 import random
 import time
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import httpx
 
@@ -21,8 +23,10 @@ from app.services.generator.visual.base import (
     VisualSourceType,
 )
 
-# Maximum base64 payload size (100 MB decoded)
+# Maximum downloaded clip size (100 MB)
 _MAX_VIDEO_BYTES = 100 * 1024 * 1024
+# Timeout for job submission and deletion requests in seconds
+_REQUEST_TIMEOUT_SECONDS = 30.0
 # Service availability cache TTL in seconds (5 minutes)
 _AVAILABILITY_TTL_SECONDS = 300
 
@@ -169,7 +173,7 @@ class WanVideoSource(BaseVisualSource):
             seed: Random seed for reproducibility
 
         Returns:
-            List of generated video assets (with base64 data in metadata)
+            List of generated video assets (with the server job ID in metadata)
         """
         if not await self.is_available():
             logger.warning("Wan service not available, skipping generation")
@@ -179,14 +183,13 @@ class WanVideoSource(BaseVisualSource):
         width, height = self._get_dimensions(orientation)
         duration = duration_seconds or self._config.default_duration_seconds
 
-        assets: list[VisualAsset] = []
-
+        # Queue every clip first so the server's worker can run them back to back
+        job_ids: list[str] = []
         for i in range(count):
+            current_seed = seed + i if seed is not None else random.randint(0, 2**32 - 1)
             try:
-                current_seed = seed + i if seed is not None else random.randint(0, 2**32 - 1)
-
                 response = await self._client.post(
-                    f"{self._config.service_url}/generate",
+                    f"{self._config.service_url}/jobs",
                     json={
                         "prompt": prompt,
                         "width": width,
@@ -196,45 +199,95 @@ class WanVideoSource(BaseVisualSource):
                         "guidance_scale": 5.0,
                         "seed": current_seed,
                     },
-                    timeout=self._config.timeout,
+                    timeout=_REQUEST_TIMEOUT_SECONDS,
                 )
                 response.raise_for_status()
-                data = response.json()
+                job_ids.append(response.json()["job_id"])
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429:
+                    logger.warning("Wan job queue full, skipping remaining clips")
+                    break
+                logger.error(f"Wan job submission failed: {e}")
+                self._service_available = False
+                break
+            except (httpx.HTTPError, ValueError, KeyError, OSError) as e:
+                logger.error(f"Wan job submission failed: {e}", exc_info=True)
+                self._service_available = False
+                break
 
-                assets.append(
-                    VisualAsset(
-                        type=VisualSourceType.AI_VIDEO,
-                        url=None,
-                        width=data.get("width", width),
-                        height=data.get("height", height),
-                        duration=data.get("duration_seconds", duration),
-                        source="wan_video",
-                        source_id=f"wan_{data.get('seed', i)}",
-                        license="Local Generation",
-                        keywords=prompt.split()[:5],
-                        metadata={
-                            "prompt": prompt,
-                            "seed": data.get("seed"),
-                            "fps": data.get("fps", self._config.default_fps),
-                            "num_frames": data.get("num_frames"),
-                            "video_base64": data.get("video"),
-                        },
-                    )
-                )
+        assets: list[VisualAsset] = []
+        for i, job_id in enumerate(job_ids):
+            try:
+                data = await self._wait_for_job(job_id)
+            except (httpx.HTTPError, ValueError, OSError) as e:
+                logger.error(f"Wan job {job_id} status check failed: {e}", exc_info=True)
+                continue
+
+            if data.get("status") != "succeeded":
+                logger.error(f"Wan generation failed: {data.get('error')}")
+                continue
 
-                logger.info(
-                    f"Generated Wan video {i + 1}/{count} "
-                    f"({data.get('duration_seconds', duration):.1f}s, seed={data.get('seed')})"
+            assets.append(
+                VisualAsset(
+                    type=VisualSourceType.AI_VIDEO,
+                    url=None,
+                    width=data.get("width") or width,
+                    height=data.get("height") or height,
+                    duration=data.get("duration_seconds") or duration,
+                    source="wan_video",
+                    source_id=f"wan_{data.get('seed', i)}",
+                    license="Local Generation",
+                    keywords=prompt.split()[:5],
+                    metadata={
+                        "prompt": prompt,
+                        "seed": data.get("seed"),
+                        "fps": data.get("fps") or self._config.default_fps,
+                        "num_frames": data.get("num_frames"),
+                        "job_id": job_id,
+                    },
                 )
+            )
 
-            except (httpx.HTTPError, ValueError, KeyError, OSError) as e:
-                logger.error(f"Wan generation failed: {e}", exc_info=True)
-                self._service_available = False
-                continue
+            logger.info(
+                f"Generated Wan video {i + 1}/{count} "
+                f"({data.get('duration_seconds') or duration:.1f}s, seed={data.get('seed')})"
+            )
 
         logger.info(f"Generated {len(assets)} Wan videos for prompt: {prompt[:50]}...")
         return assets
 
+    async def _wait_for_job(self, job_id: str) -> dict[str, Any]:
+        """Long-poll a generation job until it finishes.
+
+        Args:
+            job_id: Server job ID
+
+        Returns:
+            Final job status (``succeeded`` or ``failed``)
+
+        Raises:
+            TimeoutError: If the job does not finish within the configured timeout
+            httpx.HTTPError: If a status request fails
+        """
+        deadline = time.monotonic() + self._config.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Wan job {job_id} did not finish within {self._config.timeout:.0f}s"
+                )
+
+            wait = min(self._config.poll_wait_seconds, remaining)
+            response = await self._client.get(
+                f"{self._config.service_url}/jobs/{job_id}",
+                params={"wait": wait},
+                timeout=wait + _REQUEST_TIMEOUT_SECONDS,
+            )
+            response.raise_for_status()
+            data: dict[str, Any] = response.json()
+            if data.get("status") in ("succeeded", "failed"):
+                return data
+
     async def download(
         self,
         asset: VisualAsset,
@@ -242,11 +295,11 @@ class WanVideoSource(BaseVisualSource):
     ) -> VisualAsset:
         """Save generated video to local storage.
 
-        For Wan videos, base64 data is stored in metadata.
-        This method decodes and saves it to disk.
+        Streams the finished clip from the Wan service to disk, then
+        discards the job on the server.
 
         Args:
-            asset: Asset with base64 video data in metadata
+            asset: Asset with the server job ID in metadata
             output_dir: Directory to save the file
 
         Returns:
@@ -256,9 +309,9 @@ class WanVideoSource(BaseVisualSource):
             ValueError: If asset has no video data
             RuntimeError: If save fails
         """
-        video_base64 = asset.metadata.get("video_base64") if asset.metadata else None
+        job_id = asset.metadata.get("job_id") if asset.metadata else None
 
-        if not video_base64:
+        if not job_id:
             raise ValueError("Asset has no video data to save")
 
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -271,31 +324,43 @@ class WanVideoSource(BaseVisualSource):
             asset.path = output_path
             return asset
 
+        # Write to a partial file so an interrupted download never looks complete
+        partial_path = output_path.with_name(f"{filename}.part")
         try:
-            # Validate size before decoding (base64 is ~4/3 of decoded size)
-            estimated_size = len(video_base64) * 3 // 4
-            if estimated_size > _MAX_VIDEO_BYTES:
-                raise ValueError(
-                    f"Video data too large ({estimated_size / 1024 / 1024:.1f}MB), "
-                    f"max={_MAX_VIDEO_BYTES / 1024 / 1024:.0f}MB"
-                )
-
-            video_data = base64.b64decode(video_base64)
-
-            with open(output_path, "wb") as f:
-                f.write(video_data)
+            async with self._client.stream(
+                "GET",
+                f"{self._config.service_url}/jobs/{job_id}/video",
+                timeout=self._config.timeout,
+            ) as response:
+                response.raise_for_status()
+                size = 0
+                with open(partial_path, "wb") as f:
+                    async for chunk in response.aiter_bytes():
+                        size += len(chunk)
+                        if size > _MAX_VIDEO_BYTES:
+                            raise ValueError(
+                                f"Video too large (>{_MAX_VIDEO_BYTES / 1024 / 1024:.0f}MB)"
+                            )
+                        f.write(chunk)
+            partial_path.replace(output_path)
 
-            logger.info(f"Saved Wan video: {output_path}")
-            asset.path = output_path
+        except Exception as e:
+            partial_path.unlink(missing_ok=True)
+            raise RuntimeError(f"Failed to save video: {e}") from e
 
-            # Clear base64 from metadata to free memory
-            if asset.metadata:
-                asset.metadata.pop("video_base64", None)
+        logger.info(f"Saved Wan video: {output_path}")
+        asset.path = output_path
 
-            return asset
+        # The server keeps clips until deleted (or its TTL expires)
+        try:
+            await self._client.delete(
+                f"{self._config.service_url}/jobs/{job_id}",
+                timeout=_REQUEST_TIMEOUT_SECONDS,
+            )
+        except httpx.HTTPError as e:
+            logger.debug(f"Failed to delete Wan job {job_id}: {e}")
 
-        except Exception as e:
-            raise RuntimeError(f"Failed to save video: {e}") from e
+        return asset
 
     async def evaluate(self, file_path: Path, keyword: str) -> float | None:
         """Evaluate video-text similarity using CLIP via Wan service.
@@ -339,6 +404,46 @@ class WanVideoSource(BaseVisualSource):
             self._service_available = False
             return None
 
+    async def evaluate_images(
+        self, images: list[bytes], keywords: list[str]
+    ) -> list[list[float]] | None:
+        """Score many images against several keywords in one CLIP request.
+
+        Args:
+            images: Encoded images (e.g. stock thumbnails or previews)
+            keywords: Texts/keywords to match against every image
+
+        Returns:
+            Similarity scores (0.0 to 1.0), one row per image and one column
+            per keyword, or None if evaluation fails
+        """
+        if not images or not keywords:
+            return []
+        if not await self.is_available():
+            logger.warning("Wan service not available, skipping CLIP evaluation")
+            return None
+
+        try:
+            response = await self._client.post(
+                f"{self._config.service_url}/evaluate_images",
+                json={
+                    "images": [base64.b64encode(image).decode("utf-8") for image in images],
+                    "texts": keywords,
+                },
+                timeout=60.0,
+            )
+            response.raise_for_status()
+            scores: list[list[float]] = response.json()["scores"]
+
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            logger.error(f"CLIP image evaluation failed: {e}", exc_info=True)
+            return None
+
+        if len(scores) != len(images):
+            logger.error(f"CLIP returned {len(scores)} score rows for {len(images)} images")
+            return None
+        return scores
+
     def _get_dimensions(
         self,
         orientation: Literal["portrait", "landscape", "square"],
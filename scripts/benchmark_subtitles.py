@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""Micro-benchmark for Korean subtitle segmentation on long scripts.
+
+Times SubtitleSegmenter.segment() against the previous word-by-word approach
+(re-joining the segment text and looping over every rule for each word),
+plus emphasis highlighting of the resulting segments. Per-word cost should
+stay flat as scripts grow.
+
+Run with: uv run python scripts/benchmark_subtitles.py [--words 1000 10000 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from collections.abc import Callable
+from functools import partial
+
+from app.config.persona import PersonaStyleConfig
+from app.config.video import CompositionConfig, SubtitleConfig
+from app.core.config_loader import load_language_config
+from app.models.scene import VisualStyle
+from app.services.generator.subtitle import SubtitleGenerator
+from app.services.generator.subtitle_segmenter import get_segmenter
+from app.services.generator.templates import ASSTemplateLoader
+
+VOCABULARY = [
+    "오늘은",
+    "정말",
+    "중요한",
+    "소식이",
+    "있어요.",
+    "근데",
+    "그래서",
+    "사실",
+    "AI가",
+    "세상을",
+    "바꾸고",
+    "있거든요",
+    "여러분은",
+    "어떻게",
+    "생각하세요?",
+    "OpenAI는",
+    "새로운",
+    "모델을",
+    "발표했다.",
+    "하지만,",
+    "문제는",
+    "가격이에요",
+    "1000만원",
+    "30%",
+    "데이터에서",
+    "사람에게",
+    "서울로",
+]
+EMPHASIS_WORDS = ["중요한", "AI", "OpenAI", "30%", "1000만원"]
+MAX_CHARS = 16
+MAX_WORDS = 4
+
+
+def _script(words: int) -> list[str]:
+    """Deterministic pseudo-random script of the given length."""
+    rng = random.Random(words)
+    return [rng.choice(VOCABULARY) for _ in range(words)]
+
+
+def _naive_segment(words: list[str]) -> list[tuple[int, int]]:
+    """Previous approach: join the segment per word and scan every rule."""
+    config = load_language_config("korean")
+    spans: list[tuple[int, int]] = []
+    current: list[str] = []
+    start = 0
+    for i, word in enumerate(words):
+        subtitle = config.get("subtitle", {})
+        endings = tuple(subtitle.get("sentence_endings", []))
+        connectors = tuple(subtitle.get("connectors", []))
+        particles = tuple(subtitle.get("complete_particles", []))
+        punctuation = subtitle.get("punctuation_with_comma", ".!?。！？,，")
+        current_text = " ".join(current)
+        potential_text = " ".join(current + [word])
+        should_break = bool(current_text) and (
+            len(potential_text) > MAX_CHARS
+            or current_text[-1] in punctuation
+            or any(current_text.endswith(e) for e in endings)
+            or any(word.startswith(c) for c in connectors)
+            or (
+                len(current) + 1 > MAX_WORDS
+                and (
+                    any(current_text.endswith(p) for p in particles)
+                    or len(current) + 1 > MAX_WORDS + 2
+                )
+            )
+        )
+        if should_break:
+            spans.append((start, i))
+            start = i
+            current = []
+        current.append(word)
+    if current:
+        spans.append((start, len(words)))
+    return spans
+
+
+def _highlight(
+    generator: SubtitleGenerator, texts: list[str], persona_style: PersonaStyleConfig
+) -> None:
+    """Highlight emphasis words in every segment."""
+    for text in texts:
+        generator._apply_scene_styling(text, VisualStyle.PERSONA, EMPHASIS_WORDS, persona_style)
+
+
+def _constant(value: str, _match: re.Match[str]) -> str:
+    """Replacement callback returning a fixed string."""
+    return value
+
+
+def _naive_highlight(texts: list[str]) -> None:
+    """Previous approach: one regex per emphasis word per segment."""
+    for text in texts:
+        for word in EMPHASIS_WORDS:
+            pattern = re.compile(re.escape(word))
+            if pattern.search(text):
+                highlighted = f"{{\\c&H00D7FF&}}{word}{{\\c}}"
+                text = pattern.sub(partial(_constant, highlighted), text, count=1)
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Fastest of ``repeat`` runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print per-word timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    segmenter = get_segmenter("korean")
+    generator = SubtitleGenerator(SubtitleConfig(), CompositionConfig(), ASSTemplateLoader())
+    persona_style = PersonaStyleConfig(secondary_color="#FFD700")
+
+    print(
+        f"{'words':>8} {'segments':>9} {'segment µs/word':>16} {'naive µs/word':>14} "
+        f"{'emphasis µs/seg':>16} {'naive µs/seg':>13}"
+    )
+    for count in args.words:
+        words = _script(count)
+        spans = segmenter.segment(words, MAX_CHARS, MAX_WORDS)
+        if spans != _naive_segment(words):
+            raise SystemExit(f"Segmentation differs from the naive version at {count} words")
+        texts = [" ".join(words[start:end]) for start, end in spans]
+
+        segment_time = _best_of(
+            args.repeat, partial(segmenter.segment, words, MAX_CHARS, MAX_WORDS)
+        )
+        naive_time = _best_of(args.repeat, partial(_naive_segment, words))
+        emphasis_time = _best_of(args.repeat, partial(_highlight, generator, texts, persona_style))
+        naive_emphasis_time = _best_of(args.repeat, partial(_naive_highlight, texts))
+        print(
+            f"{count:>8} {len(spans):>9} {segment_time / count * 1e6:>16.3f} "
+            f"{naive_time / count * 1e6:>14.3f} {emphasis_time / len(spans) * 1e6:>16.3f} "
+            f"{naive_emphasis_time / len(spans) * 1e6:>13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
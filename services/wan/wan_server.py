@@ -5,25 +5,46 @@ Provides HTTP API for video generation using Wan 2.2 T2V model.
 
 Endpoints:
     - /health: Health check
-    - /generate: Text-to-video generation
+    - POST /jobs: Queue a text-to-video generation job
+    - GET /jobs/{job_id}: Job status (``?wait=`` long-polls until it finishes)
+    - GET /jobs/{job_id}/video: Finished clip, streamed as ``video/mp4``
+    - DELETE /jobs/{job_id}: Discard a job and its clip
     - /evaluate_video: CLIP-based text-video similarity (multi-frame)
+    - /evaluate_images: Batched CLIP image-text similarity matrix
+
+Generation runs in a single background worker that drains a bounded job
+queue, so inference never blocks the event loop and the GPU runs one job
+at a time. Clips are written to WAN_OUTPUT_DIR and kept until deleted or
+WAN_JOB_TTL_SECONDS after they finish.
+
+CLIP runs on WAN_CLIP_DEVICE (CPU by default, leaving the GPU to Wan).
+Text embeddings are kept in an LRU cache and images are embedded in
+batches, so scoring many candidates against a few keywords is cheap.
 
 Usage:
     uvicorn wan_server:app --host 0.0.0.0 --port 7861
 """
 
+import asyncio
 import base64
+import io
 import logging
 import os
 import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import cv2
 import torch
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import FileResponse
 from PIL import Image
 from pydantic import BaseModel, Field
 
@@ -34,11 +55,30 @@ logger = logging.getLogger(__name__)
 CLIP_SCORE_MIN = 0.15
 CLIP_SCORE_MAX = 0.35
 
+# Job queue settings
+MAX_QUEUED_JOBS = int(os.environ.get("WAN_MAX_QUEUED_JOBS", "8"))
+JOB_TTL_SECONDS = float(os.environ.get("WAN_JOB_TTL_SECONDS", "3600"))
+MAX_WAIT_SECONDS = 60.0
+OUTPUT_DIR = Path(os.environ.get("WAN_OUTPUT_DIR", Path(tempfile.gettempdir()) / "wan_jobs"))
+
+# CLIP scoring settings
+CLIP_DEVICE = os.environ.get("WAN_CLIP_DEVICE", "cpu")
+CLIP_BATCH_SIZE = int(os.environ.get("WAN_CLIP_BATCH_SIZE", "16"))
+CLIP_TEXT_CACHE_SIZE = int(os.environ.get("WAN_CLIP_TEXT_CACHE_SIZE", "1024"))
+MAX_EVALUATE_IMAGES = 64
+MAX_EVALUATE_TEXTS = 32
+
 # Global model instances (lazy loaded)
 _wan_pipeline: Any = None
 _clip_model: Any = None
 _clip_processor: Any = None
 _device: str = "cpu"
+# Normalized CLIP text embeddings by text, least recently used first
+_text_embeddings: OrderedDict[str, torch.Tensor] = OrderedDict()
+# Serializes CLIP inference and access to the text embedding cache
+_clip_lock = threading.Lock()
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
 
 
 def _detect_device() -> str:
@@ -91,21 +131,84 @@ def _load_clip_model() -> tuple[Any, Any]:
     model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32")
     processor = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
 
-    global _device
-    if _device == "cpu":
-        _device = _detect_device()
-
-    model = model.to(_device)
+    model = model.to(CLIP_DEVICE)
     model.eval()
 
-    logger.info(f"CLIP model loaded on {_device}")
+    logger.info(f"CLIP model loaded on {CLIP_DEVICE}")
     return model, processor
 
 
+def _ensure_clip_model() -> None:
+    """Load CLIP on first use.
+
+    Raises:
+        HTTPException: 503 if the model cannot be loaded
+    """
+    global _clip_model, _clip_processor
+
+    if _clip_model is None or _clip_processor is None:
+        try:
+            _clip_model, _clip_processor = _load_clip_model()
+        except Exception as e:
+            logger.error(f"Failed to load CLIP model: {e}")
+            raise HTTPException(status_code=503, detail=f"CLIP model loading failed: {e}") from e
+
+
+def _embed_texts(texts: list[str]) -> torch.Tensor:
+    """Normalized CLIP embeddings of texts, reusing cached ones.
+
+    Texts not in the cache are embedded together in one batch.
+    """
+    missing = [text for text in dict.fromkeys(texts) if text not in _text_embeddings]
+    if missing:
+        inputs = _clip_processor(text=missing, return_tensors="pt", padding=True, truncation=True)
+        inputs = {k: v.to(CLIP_DEVICE) for k, v in inputs.items()}
+        with torch.inference_mode():
+            features = _clip_model.get_text_features(**inputs)
+        features = torch.nn.functional.normalize(features, dim=-1).cpu()
+        for text, embedding in zip(missing, features, strict=True):
+            _text_embeddings[text] = embedding
+
+    embeddings = []
+    for text in texts:
+        _text_embeddings.move_to_end(text)
+        embeddings.append(_text_embeddings[text])
+    while len(_text_embeddings) > CLIP_TEXT_CACHE_SIZE:
+        _text_embeddings.popitem(last=False)
+    return torch.stack(embeddings)
+
+
+def _embed_images(images: list[Image.Image]) -> torch.Tensor:
+    """Normalized CLIP embeddings of images, computed CLIP_BATCH_SIZE at a time."""
+    batches = []
+    for start in range(0, len(images), CLIP_BATCH_SIZE):
+        inputs = _clip_processor(
+            images=images[start : start + CLIP_BATCH_SIZE], return_tensors="pt"
+        )
+        with torch.inference_mode():
+            features = _clip_model.get_image_features(
+                pixel_values=inputs["pixel_values"].to(CLIP_DEVICE)
+            )
+        batches.append(torch.nn.functional.normalize(features, dim=-1).cpu())
+    return torch.cat(batches)
+
+
+def _similarity_matrix(images: list[Image.Image], texts: list[str]) -> list[list[float]]:
+    """CLIP similarity of every image (rows) to every text (columns), scaled to 0-1.
+
+    Blocking; run it in a worker thread.
+    """
+    with _clip_lock:
+        similarity = _embed_images(images) @ _embed_texts(texts).T
+    scores = (similarity - CLIP_SCORE_MIN) / (CLIP_SCORE_MAX - CLIP_SCORE_MIN)
+    matrix: list[list[float]] = scores.clamp(0.0, 1.0).tolist()
+    return matrix
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Pre-load Wan pipeline on startup."""
-    global _wan_pipeline
+    """Pre-load Wan pipeline and start the generation worker."""
+    global _wan_pipeline, _job_queue
     logger.info("Starting Wan server, pre-loading pipeline...")
 
     try:
@@ -114,9 +217,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error(f"Failed to pre-load Wan pipeline: {e}")
 
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    _job_queue = asyncio.Queue(maxsize=MAX_QUEUED_JOBS)
+    worker = asyncio.create_task(_generation_worker(_job_queue))
+
     yield
 
     logger.info("Shutting down Wan server")
+    worker.cancel()
+    with suppress(asyncio.CancelledError):
+        await worker
 
 
 app = FastAPI(
@@ -145,16 +255,52 @@ class WanGenerateRequest(BaseModel):
     seed: int | None = Field(default=None, description="Random seed for reproducibility")
 
 
-class WanGenerateResponse(BaseModel):
-    """Video generation response."""
+class JobSubmitResponse(BaseModel):
+    """Queued generation job."""
+
+    job_id: str = Field(..., description="Job ID")
+    status: JobStatus = Field(..., description="Job status")
+    queue_position: int = Field(..., description="Jobs ahead of this one (incl. running)")
+
+
+class JobStatusResponse(BaseModel):
+    """Generation job status; clip details are set once it succeeded."""
+
+    job_id: str = Field(..., description="Job ID")
+    status: JobStatus = Field(..., description="Job status")
+    error: str | None = Field(default=None, description="Failure reason")
+    duration_seconds: float | None = Field(default=None, description="Actual video duration")
+    width: int | None = Field(default=None, description="Video width")
+    height: int | None = Field(default=None, description="Video height")
+    fps: int | None = Field(default=None, description="Frames per second")
+    num_frames: int | None = Field(default=None, description="Number of frames generated")
+    seed: int | None = Field(default=None, description="Seed used for generation")
+    size_bytes: int | None = Field(default=None, description="MP4 file size")
+
 
-    video: str = Field(..., description="Base64 encoded MP4 video")
-    duration_seconds: float = Field(..., description="Actual video duration")
-    width: int = Field(..., description="Video width")
-    height: int = Field(..., description="Video height")
-    fps: int = Field(..., description="Frames per second")
-    num_frames: int = Field(..., description="Number of frames generated")
-    seed: int = Field(..., description="Seed used for generation")
+@dataclass
+class _Job:
+    """Generation job tracked by the server."""
+
+    id: str
+    request: WanGenerateRequest
+    status: JobStatus = "queued"
+    error: str | None = None
+    result: dict[str, Any] = field(default_factory=dict)
+    video_path: Path | None = None
+    finished_at: float | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def to_response(self) -> JobStatusResponse:
+        """Status response for this job."""
+        return JobStatusResponse(
+            job_id=self.id, status=self.status, error=self.error, **self.result
+        )
+
+
+_jobs: dict[str, _Job] = {}
+_job_queue: asyncio.Queue[_Job] | None = None
+_running_job: _Job | None = None
 
 
 class HealthResponse(BaseModel):
@@ -175,6 +321,31 @@ class EvaluateVideoRequest(BaseModel):
     num_frames: int = Field(default=5, ge=1, le=10, description="Number of frames to sample")
 
 
+class EvaluateImagesRequest(BaseModel):
+    """Batched CLIP image-text similarity request."""
+
+    images: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_EVALUATE_IMAGES,
+        description="Base64 encoded images (e.g. stock thumbnails or previews)",
+    )
+    texts: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_EVALUATE_TEXTS,
+        description="Texts/keywords to match against every image",
+    )
+
+
+class EvaluateImagesResponse(BaseModel):
+    """Batched CLIP evaluation response."""
+
+    scores: list[list[float]] = Field(
+        ..., description="Similarity (0.0 to 1.0) with one row per image, one column per text"
+    )
+
+
 class EvaluateVideoResponse(BaseModel):
     """CLIP video evaluation response."""
 
@@ -197,27 +368,22 @@ async def health() -> HealthResponse:
     )
 
 
-@app.post("/generate", response_model=WanGenerateResponse)
-async def generate(request: WanGenerateRequest) -> WanGenerateResponse:
-    """Generate video from text prompt.
+def _generate_clip(request: WanGenerateRequest, output_path: Path) -> dict[str, Any]:
+    """Run the Wan pipeline and write the clip to output_path.
+
+    Blocking; called from the generation worker thread.
 
     Args:
         request: Generation parameters
+        output_path: MP4 file to write
 
     Returns:
-        Generated video as base64 MP4
-
-    Raises:
-        HTTPException: If generation fails
+        Clip details for the job status
     """
     global _wan_pipeline
 
     if _wan_pipeline is None:
-        try:
-            _wan_pipeline = _load_wan_pipeline()
-        except Exception as e:
-            logger.error(f"Failed to load Wan pipeline: {e}")
-            raise HTTPException(status_code=503, detail=f"Model loading failed: {e}") from e
+        _wan_pipeline = _load_wan_pipeline()
 
     # Set seed
     if request.seed is not None:
@@ -233,59 +399,184 @@ async def generate(request: WanGenerateRequest) -> WanGenerateResponse:
     if num_frames % 4 != 1:
         num_frames = (num_frames // 4) * 4 + 1
 
-    try:
-        logger.info(
-            f"Generating video: '{request.prompt[:60]}...' "
-            f"({request.width}x{request.height}, {num_frames} frames, "
-            f"fps={request.fps}, seed={seed})"
-        )
+    logger.info(
+        f"Generating video: '{request.prompt[:60]}...' "
+        f"({request.width}x{request.height}, {num_frames} frames, "
+        f"fps={request.fps}, seed={seed})"
+    )
 
-        output = _wan_pipeline(
-            prompt=request.prompt,
-            negative_prompt=request.negative_prompt,
-            height=request.height,
-            width=request.width,
-            num_frames=num_frames,
-            guidance_scale=request.guidance_scale,
-            generator=generator,
-        )
+    output = _wan_pipeline(
+        prompt=request.prompt,
+        negative_prompt=request.negative_prompt,
+        height=request.height,
+        width=request.width,
+        num_frames=num_frames,
+        guidance_scale=request.guidance_scale,
+        generator=generator,
+    )
 
-        frames = output.frames[0]
-        actual_frames = len(frames)
-        actual_duration = actual_frames / request.fps
+    frames = output.frames[0]
+    actual_frames = len(frames)
+    actual_duration = actual_frames / request.fps
 
-        # Export to MP4 in temp file, read, encode as base64
-        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
-            tmp_path = tmp.name
+    from diffusers.utils import export_to_video
+
+    export_to_video(frames, str(output_path), fps=request.fps)
+
+    logger.info(
+        f"Video generated successfully: {actual_frames} frames, "
+        f"{actual_duration:.1f}s (seed={seed})"
+    )
+
+    return {
+        "duration_seconds": actual_duration,
+        "width": request.width,
+        "height": request.height,
+        "fps": request.fps,
+        "num_frames": actual_frames,
+        "seed": seed,
+        "size_bytes": output_path.stat().st_size,
+    }
 
-        try:
-            from diffusers.utils import export_to_video
 
-            export_to_video(frames, tmp_path, fps=request.fps)
+async def _generation_worker(queue: asyncio.Queue[_Job]) -> None:
+    """Run queued jobs one at a time, off the event loop."""
+    global _running_job
 
-            with open(tmp_path, "rb") as f:
-                video_base64 = base64.b64encode(f.read()).decode("utf-8")
+    while True:
+        job = await queue.get()
+        _running_job = job
+        job.status = "running"
+        output_path = OUTPUT_DIR / f"{job.id}.mp4"
+        try:
+            job.result = await asyncio.to_thread(_generate_clip, job.request, output_path)
+            job.video_path = output_path
+            job.status = "succeeded"
+        except Exception as e:
+            logger.error(f"Video generation failed for job {job.id}: {e}", exc_info=True)
+            output_path.unlink(missing_ok=True)
+            job.error = str(e)
+            job.status = "failed"
         finally:
-            Path(tmp_path).unlink(missing_ok=True)
+            _running_job = None
+            job.finished_at = time.monotonic()
+            job.done.set()
+            queue.task_done()
+            _expire_jobs()
 
-        logger.info(
-            f"Video generated successfully: {actual_frames} frames, "
-            f"{actual_duration:.1f}s (seed={seed})"
-        )
 
-        return WanGenerateResponse(
-            video=video_base64,
-            duration_seconds=actual_duration,
-            width=request.width,
-            height=request.height,
-            fps=request.fps,
-            num_frames=actual_frames,
-            seed=seed,
-        )
+def _expire_jobs() -> None:
+    """Forget finished jobs (and their clips) older than JOB_TTL_SECONDS."""
+    cutoff = time.monotonic() - JOB_TTL_SECONDS
+    expired = [
+        job for job in _jobs.values() if job.finished_at is not None and job.finished_at < cutoff
+    ]
+    for job in expired:
+        _discard_job(job)
+
+
+def _discard_job(job: _Job) -> None:
+    """Remove a job and its clip."""
+    _jobs.pop(job.id, None)
+    if job.video_path is not None:
+        job.video_path.unlink(missing_ok=True)
+
+
+def _get_job(job_id: str) -> _Job:
+    """Look up a job or raise 404."""
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+@app.post("/jobs", response_model=JobSubmitResponse, status_code=202)
+async def submit_job(request: WanGenerateRequest) -> JobSubmitResponse:
+    """Queue a text-to-video generation job.
+
+    Args:
+        request: Generation parameters
+
+    Returns:
+        Job ID and queue position
+
+    Raises:
+        HTTPException: 429 if the queue is full, 503 if the worker is not running
+    """
+    if _job_queue is None:
+        raise HTTPException(status_code=503, detail="Generation worker not running")
+
+    job = _Job(id=uuid.uuid4().hex, request=request)
+    try:
+        _job_queue.put_nowait(job)
+    except asyncio.QueueFull as e:
+        raise HTTPException(
+            status_code=429, detail=f"Job queue full ({MAX_QUEUED_JOBS} queued)"
+        ) from e
+
+    _jobs[job.id] = job
+    queue_position = _job_queue.qsize() - 1 + (1 if _running_job is not None else 0)
+    logger.info(f"Queued job {job.id} (position {queue_position})")
+    return JobSubmitResponse(job_id=job.id, status=job.status, queue_position=queue_position)
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def job_status(
+    job_id: str,
+    wait: float = Query(default=0.0, ge=0.0, description="Seconds to wait for completion"),
+) -> JobStatusResponse:
+    """Get a job's status, optionally long-polling until it finishes.
+
+    Args:
+        job_id: Job ID
+        wait: Seconds to wait for the job to finish (capped at MAX_WAIT_SECONDS)
+
+    Returns:
+        Current job status
+
+    Raises:
+        HTTPException: 404 if the job is unknown
+    """
+    job = _get_job(job_id)
+    if wait > 0 and not job.done.is_set():
+        with suppress(TimeoutError):
+            await asyncio.wait_for(job.done.wait(), timeout=min(wait, MAX_WAIT_SECONDS))
+    return job.to_response()
+
+
+@app.get("/jobs/{job_id}/video", response_class=FileResponse)
+async def job_video(job_id: str) -> FileResponse:
+    """Stream a finished job's clip.
+
+    Args:
+        job_id: Job ID
+
+    Returns:
+        MP4 file response (sent in chunks)
+
+    Raises:
+        HTTPException: 404 if the job is unknown, 409 if it has no clip
+    """
+    job = _get_job(job_id)
+    if job.status != "succeeded" or job.video_path is None:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status}")
+    return FileResponse(job.video_path, media_type="video/mp4", filename=f"{job_id}.mp4")
 
-    except Exception as e:
-        logger.error(f"Video generation failed: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Generation failed: {e}") from e
+
+@app.delete("/jobs/{job_id}", status_code=204)
+async def delete_job(job_id: str) -> None:
+    """Discard a finished job and its clip.
+
+    Args:
+        job_id: Job ID
+
+    Raises:
+        HTTPException: 404 if the job is unknown, 409 if it has not finished
+    """
+    job = _get_job(job_id)
+    if not job.done.is_set():
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status}")
+    _discard_job(job)
 
 
 def _extract_video_frames(video_data: bytes, num_frames: int = 5) -> list[Image.Image]:
@@ -339,14 +630,7 @@ async def evaluate_video(request: EvaluateVideoRequest) -> EvaluateVideoResponse
     Raises:
         HTTPException: If evaluation fails
     """
-    global _clip_model, _clip_processor
-
-    if _clip_model is None or _clip_processor is None:
-        try:
-            _clip_model, _clip_processor = _load_clip_model()
-        except Exception as e:
-            logger.error(f"Failed to load CLIP model: {e}")
-            raise HTTPException(status_code=503, detail=f"CLIP model loading failed: {e}") from e
+    _ensure_clip_model()
 
     try:
         video_data = base64.b64decode(request.video)
@@ -354,7 +638,7 @@ async def evaluate_video(request: EvaluateVideoRequest) -> EvaluateVideoResponse
         raise HTTPException(status_code=400, detail=f"Invalid video encoding: {e}") from e
 
     try:
-        frames = _extract_video_frames(video_data, request.num_frames)
+        frames = await asyncio.to_thread(_extract_video_frames, video_data, request.num_frames)
         if not frames:
             raise HTTPException(status_code=400, detail="Could not extract frames from video")
     except HTTPException:
@@ -364,26 +648,8 @@ async def evaluate_video(request: EvaluateVideoRequest) -> EvaluateVideoResponse
         raise HTTPException(status_code=400, detail=f"Frame extraction failed: {e}") from e
 
     try:
-        scores = []
-        for frame in frames:
-            inputs = _clip_processor(
-                text=[request.text],
-                images=frame,
-                return_tensors="pt",
-                padding=True,
-            )
-            inputs = {k: v.to(_device) for k, v in inputs.items()}
-
-            with torch.no_grad():
-                outputs = _clip_model(**inputs)
-                similarity = torch.nn.functional.cosine_similarity(
-                    outputs.image_embeds, outputs.text_embeds
-                ).item()
-
-            score = max(
-                0.0, min(1.0, (similarity - CLIP_SCORE_MIN) / (CLIP_SCORE_MAX - CLIP_SCORE_MIN))
-            )
-            scores.append(score)
+        matrix = await asyncio.to_thread(_similarity_matrix, frames, [request.text])
+        scores = [row[0] for row in matrix]
 
         avg_score = sum(scores) / len(scores)
         logger.info(f"Video eval '{request.text[:40]}': avg={avg_score:.4f}")
@@ -400,6 +666,40 @@ async def evaluate_video(request: EvaluateVideoRequest) -> EvaluateVideoResponse
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {e}") from e
 
 
+@app.post("/evaluate_images", response_model=EvaluateImagesResponse)
+async def evaluate_images(request: EvaluateImagesRequest) -> EvaluateImagesResponse:
+    """Score many images against several texts in one call.
+
+    Each text is embedded once (and cached), images are embedded in batches.
+
+    Args:
+        request: Images and texts to compare
+
+    Returns:
+        Similarity matrix (images x texts)
+
+    Raises:
+        HTTPException: If an image cannot be decoded or evaluation fails
+    """
+    _ensure_clip_model()
+
+    images: list[Image.Image] = []
+    for index, data in enumerate(request.images):
+        try:
+            images.append(Image.open(io.BytesIO(base64.b64decode(data))).convert("RGB"))
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Invalid image {index}: {e}") from e
+
+    try:
+        scores = await asyncio.to_thread(_similarity_matrix, images, request.texts)
+    except Exception as e:
+        logger.error(f"Image evaluation failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Evaluation failed: {e}") from e
+
+    logger.info(f"Evaluated {len(images)} images against {len(request.texts)} texts")
+    return EvaluateImagesResponse(scores=scores)
+
+
 @app.get("/")
 async def root() -> dict[str, str | dict[str, str]]:
     """Root endpoint with API info."""
@@ -409,7 +709,8 @@ async def root() -> dict[str, str | dict[str, str]]:
         "version": "1.0.0",
         "endpoints": {
             "health": "/health",
-            "generate": "/generate (T2V)",
+            "jobs": "/jobs (T2V job queue)",
             "evaluate_video": "/evaluate_video (CLIP)",
+            "evaluate_images": "/evaluate_images (batched CLIP)",
         },
     }
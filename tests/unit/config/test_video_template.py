@@ -379,3 +379,13 @@ class TestVideoTemplateConfig:
         """Test that missing name fails validation."""
         with pytest.raises(ValidationError):
             VideoTemplateConfig()  # type: ignore
+
+    def test_compositor_defaults_to_remotion(self):
+        """Templates render with Remotion unless they opt into FFmpeg."""
+        assert VideoTemplateConfig(name="t").compositor == "remotion"
+        assert VideoTemplateConfig(name="t", compositor="ffmpeg").compositor == "ffmpeg"
+
+    def test_invalid_compositor_fails(self):
+        """Only known rendering backends are accepted."""
+        with pytest.raises(ValidationError):
+            VideoTemplateConfig(name="t", compositor="blender")  # type: ignore[arg-type]
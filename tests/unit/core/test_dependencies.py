@@ -9,8 +9,10 @@ from app.core.config import Config
 from app.core.dependencies import (
     close_singletons,
     create_analytics_collector,
+    create_ffmpeg_wrapper,
     create_http_client,
     create_llm_client,
+    create_near_duplicate_detector,
     create_normalizer,
     create_optimal_time_analyzer,
     create_prompt_manager,
@@ -26,6 +28,7 @@ from app.prompts.manager import PromptManager
 from app.services.analytics.collector import YouTubeAnalyticsCollector
 from app.services.analytics.optimal_time import OptimalTimeAnalyzer
 from app.services.collector.normalizer import TopicNormalizer
+from app.services.generator.ffmpeg import FFmpegWrapper
 from app.services.scheduler.upload_scheduler import UploadScheduler
 from app.services.script_generator import ScriptGenerator
 
@@ -56,6 +59,18 @@ class TestCreateHttpClient:
         assert client1 is client2
 
 
+class TestCreateFFmpegWrapper:
+    """Tests for create_ffmpeg_wrapper."""
+
+    def test_returns_shared_wrapper(self) -> None:
+        """Test FFmpeg wrapper is shared so its worker pool is process-wide."""
+        reset_singletons()
+        wrapper1 = create_ffmpeg_wrapper()
+        wrapper2 = create_ffmpeg_wrapper()
+        assert isinstance(wrapper1, FFmpegWrapper)
+        assert wrapper1 is wrapper2
+
+
 class TestCreateLLMClient:
     """Tests for create_llm_client."""
 
@@ -82,6 +97,17 @@ class TestCreatePromptManager:
         pm = create_prompt_manager()
         assert isinstance(pm, PromptManager)
 
+    def test_uses_configured_module_dir(self) -> None:
+        """Compiled template modules go to prompts.module_dir from defaults.yaml."""
+        reset_singletons()
+        with patch(
+            "app.core.dependencies.load_defaults",
+            return_value={"prompts": {"module_dir": "/tmp/prompt-modules"}},
+        ):
+            pm = create_prompt_manager()
+        assert pm.module_dir == Path("/tmp/prompt-modules")
+        reset_singletons()
+
 
 class TestCreateScriptGenerator:
     """Tests for create_script_generator."""
@@ -192,6 +218,54 @@ class TestCloseSingletons:
         assert new_client is not client
         reset_singletons()
 
+    @pytest.mark.asyncio
+    async def test_closes_near_duplicate_store(self, tmp_path: Path) -> None:
+        """Test that close_singletons closes and clears the near-duplicate store."""
+        reset_singletons()
+        defaults = {
+            "collector": {
+                "near_duplicates": {"enabled": True, "path": str(tmp_path / "near.sqlite3")}
+            }
+        }
+        with patch("app.core.dependencies.load_defaults", return_value=defaults):
+            detector = create_near_duplicate_detector()
+            assert detector is not None
+            store = detector.store
+
+            with patch.object(store, "close", new_callable=AsyncMock) as mock_close:
+                await close_singletons()
+                mock_close.assert_awaited_once()
+
+            new_detector = create_near_duplicate_detector()
+        assert new_detector is not None
+        assert new_detector.store is not store
+        await close_singletons()
+
+    @pytest.mark.asyncio
+    async def test_failed_close_still_closes_the_rest(self, tmp_path: Path) -> None:
+        """Test that one failing close does not skip the others and is re-raised."""
+        reset_singletons()
+        defaults = {
+            "collector": {
+                "near_duplicates": {"enabled": True, "path": str(tmp_path / "near.sqlite3")}
+            }
+        }
+        with patch("app.core.dependencies.load_defaults", return_value=defaults):
+            client = create_http_client()
+            detector = create_near_duplicate_detector()
+        assert detector is not None
+
+        with (
+            patch.object(client, "close", AsyncMock(side_effect=RuntimeError("boom"))),
+            patch.object(detector.store, "close", new_callable=AsyncMock) as store_close,
+        ):
+            with pytest.raises(RuntimeError, match="boom"):
+                await close_singletons()
+            store_close.assert_awaited_once()
+
+        assert create_http_client() is not client
+        await close_singletons()
+
     @pytest.mark.asyncio
     async def test_no_error_when_no_singletons(self) -> None:
         """Test that close_singletons is safe when nothing is initialized."""
@@ -1,5 +1,6 @@
 """Unit tests for LLMClient."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,6 +11,7 @@ from app.infrastructure.llm import (
     LLMError,
     LLMResponse,
 )
+from app.infrastructure.llm_cache import LLMResponseCache, MemoryLLMCacheBackend
 
 
 class TestLLMConfig:
@@ -347,3 +349,112 @@ class TestLLMError:
         """Should be an Exception subclass."""
         error = LLMError("Test")
         assert isinstance(error, Exception)
+
+
+class TestLLMClientCache:
+    """Test LLMClient response caching and request coalescing."""
+
+    @pytest.fixture
+    def mock_acompletion(self) -> MagicMock:
+        """Create mock for litellm.acompletion."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Translated"
+        mock_response.model = "test-model"
+        mock_response.usage = MagicMock()
+        mock_response.usage.prompt_tokens = 10
+        mock_response.usage.completion_tokens = 20
+        mock_response.usage.total_tokens = 30
+        return mock_response
+
+    @pytest.fixture
+    def cache(self) -> LLMResponseCache:
+        """Create an in-memory response cache."""
+        return LLMResponseCache(MemoryLLMCacheBackend())
+
+    @pytest.fixture
+    def llm_client(self, cache: LLMResponseCache) -> LLMClient:
+        """Create LLMClient with a response cache."""
+        return LLMClient(default_model="test-model", cache=cache)
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(
+        self, llm_client: LLMClient, cache: LLMResponseCache, mock_acompletion: MagicMock
+    ) -> None:
+        """Should call the LLM once for identical cacheable requests."""
+        config = LLMConfig(model="test-model", cache_ttl=3600)
+        messages = [{"role": "user", "content": "Hello"}]
+
+        with patch(
+            "app.infrastructure.llm.acompletion", new=AsyncMock(return_value=mock_acompletion)
+        ) as mock:
+            first = await llm_client.complete(config, messages)
+            second = await llm_client.complete(config, messages)
+
+        assert mock.call_count == 1
+        assert first.content == second.content == "Translated"
+        assert cache.stats.hits == 1
+        assert cache.stats.tokens_saved == 30
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesced(
+        self, llm_client: LLMClient, cache: LLMResponseCache, mock_acompletion: MagicMock
+    ) -> None:
+        """Should share one in-flight LLM call between identical concurrent requests."""
+        config = LLMConfig(model="test-model", cache_ttl=3600)
+        messages = [{"role": "user", "content": "Hello"}]
+
+        async def slow_completion(**kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return mock_acompletion
+
+        with patch(
+            "app.infrastructure.llm.acompletion", new=AsyncMock(side_effect=slow_completion)
+        ) as mock:
+            results = await asyncio.gather(
+                *(llm_client.complete(config, messages) for _ in range(3))
+            )
+
+        assert mock.call_count == 1
+        assert [r.content for r in results] == ["Translated"] * 3
+        assert cache.stats.coalesced == 2
+        assert llm_client._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_coalesced_waiters_share_errors(self, llm_client: LLMClient) -> None:
+        """Should raise the in-flight request's error for every waiter."""
+        config = LLMConfig(model="test-model", cache_ttl=3600)
+        messages = [{"role": "user", "content": "Hello"}]
+
+        async def failing_completion(**kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.01)
+            raise Exception("gateway down")
+
+        with patch(
+            "app.infrastructure.llm.acompletion", new=AsyncMock(side_effect=failing_completion)
+        ):
+            results = await asyncio.gather(
+                llm_client.complete(config, messages),
+                llm_client.complete(config, messages),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, LLMError) for r in results)
+        assert llm_client._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_bypasses_cache(
+        self, llm_client: LLMClient, cache: LLMResponseCache, mock_acompletion: MagicMock
+    ) -> None:
+        """Should always call the LLM when cache_ttl is 0."""
+        config = LLMConfig(model="test-model")
+        messages = [{"role": "user", "content": "Write a script"}]
+
+        with patch(
+            "app.infrastructure.llm.acompletion", new=AsyncMock(return_value=mock_acompletion)
+        ) as mock:
+            await llm_client.complete(config, messages)
+            await llm_client.complete(config, messages)
+
+        assert mock.call_count == 2
+        assert cache.stats.hits == cache.stats.misses == 0
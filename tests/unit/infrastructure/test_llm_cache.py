@@ -0,0 +1,142 @@
+"""Unit tests for the LLM response cache."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from app.infrastructure.llm_cache import (
+    CachedCompletion,
+    LLMResponseCache,
+    MemoryLLMCacheBackend,
+    SQLiteLLMCacheBackend,
+)
+
+MESSAGES = [{"role": "user", "content": "번역해줘"}]
+
+
+def _completion(content: str = "ok", total_tokens: int = 30) -> CachedCompletion:
+    return CachedCompletion(content=content, model="m", usage={"total_tokens": total_tokens})
+
+
+class TestMakeKey:
+    """Tests for LLMResponseCache.make_key."""
+
+    def test_stable_for_identical_requests(self) -> None:
+        """Should produce the same key for the same request."""
+        first = LLMResponseCache.make_key("m", MESSAGES, 0.2, 100, {"top_p": 1})
+        second = LLMResponseCache.make_key("m", list(MESSAGES), 0.2, 100, {"top_p": 1})
+        assert first == second
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ("other", MESSAGES, 0.2, 100, None),
+            ("m", [{"role": "user", "content": "x"}], 0.2, 100, None),
+            ("m", MESSAGES, 0.7, 100, None),
+            ("m", MESSAGES, 0.2, 200, None),
+            ("m", MESSAGES, 0.2, 100, {"top_p": 0.5}),
+        ],
+    )
+    def test_sensitive_to_output_affecting_params(self, args: tuple) -> None:
+        """Should change when any parameter affecting the output changes."""
+        base = LLMResponseCache.make_key("m", MESSAGES, 0.2, 100)
+        assert LLMResponseCache.make_key(*args) != base
+
+
+class TestMemoryBackend:
+    """Tests for MemoryLLMCacheBackend."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self) -> None:
+        """Should return a stored entry."""
+        backend = MemoryLLMCacheBackend()
+        await backend.set("k", _completion("hello"), ttl_seconds=60)
+
+        cached = await backend.get("k")
+
+        assert cached is not None
+        assert cached.content == "hello"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should drop entries past their TTL."""
+        backend = MemoryLLMCacheBackend()
+        await backend.set("k", _completion(), ttl_seconds=10)
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+
+        assert await backend.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        """Should evict the least recently used entry beyond max_entries."""
+        backend = MemoryLLMCacheBackend(max_entries=2)
+        await backend.set("a", _completion("a"), 60)
+        await backend.set("b", _completion("b"), 60)
+        await backend.get("a")
+        await backend.set("c", _completion("c"), 60)
+
+        assert await backend.get("a") is not None
+        assert await backend.get("b") is None
+        assert await backend.get("c") is not None
+
+
+class TestSQLiteBackend:
+    """Tests for SQLiteLLMCacheBackend."""
+
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Should serve entries written by another backend instance."""
+        path = tmp_path / "cache" / "llm.sqlite3"
+        writer = SQLiteLLMCacheBackend(path)
+        await writer.set("k", _completion("저장됨", 42), ttl_seconds=60)
+        await writer.close()
+
+        reader = SQLiteLLMCacheBackend(path)
+        cached = await reader.get("k")
+        await reader.close()
+
+        assert cached == _completion("저장됨", 42)
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss(self, tmp_path: Path) -> None:
+        """Should not return entries past their TTL."""
+        backend = SQLiteLLMCacheBackend(tmp_path / "llm.sqlite3")
+        await backend.set("k", _completion(), ttl_seconds=0)
+
+        assert await backend.get("k") is None
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_trims_to_max_entries(self, tmp_path: Path) -> None:
+        """Should keep at most max_entries rows."""
+        backend = SQLiteLLMCacheBackend(tmp_path / "llm.sqlite3", max_entries=2)
+        for key in ("a", "b", "c"):
+            await backend.set(key, _completion(key), ttl_seconds=60)
+            time.sleep(0.01)
+
+        assert await backend.get("a") is None
+        assert await backend.get("c") is not None
+        await backend.close()
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache statistics."""
+
+    @pytest.mark.asyncio
+    async def test_stats(self) -> None:
+        """Should count hits, misses, coalesced requests and saved tokens."""
+        cache = LLMResponseCache(MemoryLLMCacheBackend())
+        assert await cache.get("k") is None
+
+        await cache.set("k", _completion(total_tokens=30), ttl_seconds=60)
+        assert await cache.get("k") is not None
+        cache.record_coalesced({"total_tokens": 30})
+
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.coalesced == 1
+        assert cache.stats.tokens_saved == 60
+        assert cache.stats.hit_ratio == pytest.approx(2 / 3)
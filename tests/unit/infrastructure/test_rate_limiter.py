@@ -0,0 +1,52 @@
+"""Unit tests for async rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.rate_limiter import AsyncRateLimiter
+
+
+class TestAsyncRateLimiter:
+    """Tests for AsyncRateLimiter."""
+
+    def test_disabled_when_rate_not_positive(self) -> None:
+        """Test limiter is a no-op without a positive rate."""
+        assert AsyncRateLimiter(None).enabled is False
+        assert AsyncRateLimiter(0).enabled is False
+        assert AsyncRateLimiter(5.0).enabled is True
+
+    @pytest.mark.asyncio
+    async def test_disabled_does_not_wait(self) -> None:
+        """Test disabled limiter never sleeps."""
+        limiter = AsyncRateLimiter(None)
+        start = time.monotonic()
+
+        for _ in range(100):
+            await limiter.acquire()
+
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_throttles_to_rate(self) -> None:
+        """Test calls beyond the burst are spaced at the configured rate."""
+        limiter = AsyncRateLimiter(requests_per_second=50.0, burst=1)
+        start = time.monotonic()
+
+        await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+
+        # First call is free, remaining 5 wait ~20ms each
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_burst_allows_back_to_back_calls(self) -> None:
+        """Test burst capacity is available immediately."""
+        limiter = AsyncRateLimiter(requests_per_second=1.0, burst=3)
+        start = time.monotonic()
+
+        for _ in range(3):
+            async with limiter:
+                pass
+
+        assert time.monotonic() - start < 0.05
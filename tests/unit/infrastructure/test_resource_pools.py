@@ -0,0 +1,153 @@
+"""Unit tests for resource-class worker pools."""
+
+import asyncio
+
+import pytest
+
+from app.infrastructure.resource_pools import (
+    FairSemaphore,
+    ResourceClass,
+    ResourcePools,
+    current_tenant,
+    resource_slot,
+)
+
+
+async def _hold(sem: FairSemaphore, tenant: str, order: list[str], release: asyncio.Event) -> None:
+    async with sem.slot(tenant):
+        order.append(tenant)
+        await release.wait()
+
+
+class TestFairSemaphore:
+    """Tests for FairSemaphore."""
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self) -> None:
+        """Should never exceed the slot limit."""
+        sem = FairSemaphore(2)
+        running = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal running, peak
+            async with sem.slot("a"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+        assert sem.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_round_robin_between_tenants(self) -> None:
+        """A tenant with many queued waiters should not starve another tenant."""
+        sem = FairSemaphore(1)
+        order: list[str] = []
+        release = asyncio.Event()
+        release.set()
+
+        blocker = asyncio.Event()
+        holder = asyncio.create_task(_hold(sem, "first", [], blocker))
+        await asyncio.sleep(0)
+
+        tasks = [asyncio.create_task(_hold(sem, "busy", order, release)) for _ in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(_hold(sem, "quiet", order, release)))
+        await asyncio.sleep(0)
+
+        blocker.set()
+        await asyncio.gather(holder, *tasks)
+
+        assert order == ["busy", "quiet", "busy", "busy"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Cancelling a queued waiter should leave the slot count intact."""
+        sem = FairSemaphore(1)
+        blocker = asyncio.Event()
+        holder = asyncio.create_task(_hold(sem, "a", [], blocker))
+        await asyncio.sleep(0)
+
+        waiter = asyncio.create_task(sem.acquire("b"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert sem.waiting == 0
+        blocker.set()
+        await holder
+        assert sem.in_use == 0
+
+
+class TestResourcePools:
+    """Tests for ResourcePools."""
+
+    def test_from_defaults(self) -> None:
+        """Should size pools from config/defaults.yaml."""
+        pools = ResourcePools.from_defaults()
+
+        assert pools.pool(ResourceClass.LLM).limit == 4
+        assert pools.pool(ResourceClass.NETWORK).limit == 8
+        assert pools.pool(ResourceClass.CPU).limit == 2
+        assert pools.stage_timeout == 15 * 60
+
+    @pytest.mark.asyncio
+    async def test_slot_uses_current_tenant(self) -> None:
+        """Should queue waiters under the tenant set in the current context."""
+        pools = ResourcePools(cpu=1)
+        blocker = asyncio.Event()
+
+        async def render(tenant: str) -> None:
+            current_tenant.set(tenant)
+            async with pools.slot(ResourceClass.CPU):
+                await blocker.wait()
+
+        tasks = [asyncio.create_task(render(t)) for t in ("a", "b")]
+        await asyncio.sleep(0)
+
+        assert list(pools.pool(ResourceClass.CPU)._waiters) == ["b"]
+        blocker.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_starts_after_acquire(self) -> None:
+        """Time queued for a slot should not count against the stage deadline."""
+        pools = ResourcePools(cpu=1, stage_timeout=0.02)
+        cpu = pools.pool(ResourceClass.CPU)
+        finished: list[str] = []
+
+        async def queued() -> None:
+            async with pools.slot(ResourceClass.CPU):
+                finished.append("queued")
+
+        # Hold the slot directly (no deadline) for longer than the stage deadline
+        await cpu.acquire("other")
+        waiter = asyncio.create_task(queued())
+        await asyncio.sleep(0.05)
+        assert cpu.waiting == 1
+        cpu.release()
+        await waiter
+
+        assert finished == ["queued"]
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_bounds_work_holding_a_slot(self) -> None:
+        """Work holding a slot past the stage deadline should time out and free the slot."""
+        pools = ResourcePools(cpu=1, stage_timeout=0.01)
+
+        with pytest.raises(TimeoutError):
+            async with pools.slot(ResourceClass.CPU):
+                await asyncio.Event().wait()
+
+        assert pools.pool(ResourceClass.CPU).in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_resource_slot_without_pools(self) -> None:
+        """Should be a no-op when no pools are configured."""
+        async with resource_slot(None, ResourceClass.LLM):
+            pass
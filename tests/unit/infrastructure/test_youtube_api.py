@@ -9,6 +9,7 @@ from googleapiclient.errors import HttpError
 
 from app.core.exceptions import QuotaExceededError, YouTubeAPIError
 from app.infrastructure.youtube_api import (
+    MAX_VIDEOS_PER_REPORT,
     UploadMetadata,
     UploadResult,
     VideoAnalytics,
@@ -485,6 +486,66 @@ class TestYouTubeAPIClient:
         assert analytics.views == 0
         assert analytics.likes == 0
 
+    @pytest.mark.asyncio
+    async def test_get_videos_analytics_single_report(self, client, mock_auth_client):
+        """Test that several videos are fetched with one report."""
+        mock_analytics = MagicMock()
+        query = mock_analytics.reports.return_value.query
+        query.return_value.execute.return_value = {
+            "rows": [
+                ["yt_2", 2000, 80, 2, 30, 10, 900, 40.0, 70.0, 8, 0],
+                ["yt_1", 1000, 50, 5, 20, 10, 500, 30.5, 65.0, 5, 1],
+            ]
+        }
+        mock_auth_client.get_analytics_service.return_value = mock_analytics
+
+        with patch("asyncio.to_thread", side_effect=_sync_to_thread):
+            results = await client.get_videos_analytics(
+                video_ids=["yt_1", "yt_2", "yt_3", "yt_1"],
+                start_date="2026-01-01",
+                end_date="2026-01-31",
+            )
+
+        query.assert_called_once()
+        kwargs = query.call_args.kwargs
+        assert kwargs["dimensions"] == "video"
+        assert kwargs["filters"] == "video==yt_1,yt_2,yt_3"
+        assert kwargs["maxResults"] == 3
+        assert results["yt_1"].views == 1000
+        assert results["yt_2"].comments == 30
+        assert results["yt_3"] == VideoAnalytics(video_id="yt_3")
+
+    @pytest.mark.asyncio
+    async def test_get_videos_analytics_empty(self, client, mock_auth_client):
+        """Test that no report is requested without video IDs."""
+        assert await client.get_videos_analytics([], "2026-01-01", "2026-01-31") == {}
+        mock_auth_client.get_analytics_service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_videos_analytics_too_many_ids(self, client):
+        """Test that reports are limited to MAX_VIDEOS_PER_REPORT videos."""
+        video_ids = [f"yt_{i}" for i in range(MAX_VIDEOS_PER_REPORT + 1)]
+
+        with pytest.raises(ValueError):
+            await client.get_videos_analytics(video_ids, "2026-01-01", "2026-01-31")
+
+    @pytest.mark.asyncio
+    async def test_get_videos_analytics_http_error(self, client, mock_auth_client):
+        """Test that API errors are wrapped."""
+        resp = MagicMock()
+        resp.status = 500
+        mock_analytics = MagicMock()
+        mock_analytics.reports.return_value.query.return_value.execute.side_effect = HttpError(
+            resp, b"Backend Error"
+        )
+        mock_auth_client.get_analytics_service.return_value = mock_analytics
+
+        with (
+            patch("asyncio.to_thread", side_effect=_sync_to_thread),
+            pytest.raises(YouTubeAPIError),
+        ):
+            await client.get_videos_analytics(["yt_1"], "2026-01-01", "2026-01-31")
+
     # =========================================================================
     # set_thumbnail() tests
     # =========================================================================
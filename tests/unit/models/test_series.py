@@ -56,9 +56,13 @@ class TestSeriesModel:
             "criteria_keywords",
             "criteria_categories",
             "min_similarity",
+            "term_counts",
             "episode_count",
+            "measured_episodes",
+            "measured_uploads",
             "avg_views",
             "avg_engagement",
+            "recent_engagement",
             "trend",
             "status",
             "auto_detected",
@@ -119,6 +123,14 @@ class TestSeriesModel:
         avg_engagement_col = columns["avg_engagement"]
         assert avg_engagement_col.default.arg == 0.0
 
+    def test_detection_state_defaults(self):
+        """Test detection state starts empty."""
+        columns = Series.__table__.columns
+        assert columns["term_counts"].nullable is False
+        assert columns["measured_episodes"].default.arg == 0
+        assert columns["measured_uploads"].nullable is False
+        assert columns["recent_engagement"].default.arg == 0.0
+
     def test_default_trend(self):
         """Test default trend is 'stable'."""
         columns = Series.__table__.columns
@@ -1,6 +1,11 @@
 """Unit tests for PromptManager."""
 
+import os
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
+from mako.template import Template
 from pydantic import ValidationError
 
 from app.prompts.manager import (
@@ -167,6 +172,83 @@ class TestPromptManager:
             template.name = "Modified"
 
 
+def _write_prompt(prompts_dir: Path, template: str, mtime_ns: int | None = None) -> None:
+    yaml_file = prompts_dir / "translation.yaml"
+    yaml_file.write_text(
+        f"name: translation\nversion: '1'\ndescription: test\ntemplate: {template!r}\n",
+        encoding="utf-8",
+    )
+    if mtime_ns is not None:
+        os.utime(yaml_file, ns=(mtime_ns, mtime_ns))
+
+
+class TestCompiledTemplateCache:
+    """Test compiled template caching."""
+
+    def test_template_compiled_once(self, tmp_path):
+        """Repeated renders reuse the compiled template."""
+        _write_prompt(tmp_path, "Hello ${name}")
+        manager = PromptManager(prompts_dir=tmp_path)
+
+        with patch("app.prompts.manager.Template", wraps=Template) as template_cls:
+            assert manager.render(PromptType.TRANSLATION, name="a") == "Hello a"
+            assert manager.render(PromptType.TRANSLATION, name="b") == "Hello b"
+
+        assert template_cls.call_count == 1
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        """A new YAML mtime invalidates the cached template."""
+        _write_prompt(tmp_path, "Hello ${name}", mtime_ns=1_000_000_000)
+        manager = PromptManager(prompts_dir=tmp_path)
+        manager.render(PromptType.TRANSLATION, name="a")
+
+        _write_prompt(tmp_path, "Bye ${name}", mtime_ns=2_000_000_000)
+
+        assert manager.render(PromptType.TRANSLATION, name="a") == "Bye a"
+
+    def test_modules_survive_restart(self, tmp_path):
+        """Compiled modules are written once and reused by new managers."""
+        prompts_dir = tmp_path / "prompts"
+        module_dir = tmp_path / "modules"
+        prompts_dir.mkdir()
+        _write_prompt(prompts_dir, "Hello ${name}")
+        PromptManager(prompts_dir=prompts_dir, module_dir=module_dir).load(PromptType.TRANSLATION)
+        modules = list(module_dir.glob("translation_*.py"))
+
+        restarted = PromptManager(prompts_dir=prompts_dir, module_dir=module_dir)
+        with patch("app.prompts.manager.Template", wraps=Template) as template_cls:
+            rendered = restarted.render(PromptType.TRANSLATION, name="a")
+
+        assert rendered == "Hello a"
+        assert len(modules) == 1
+        template_cls.assert_not_called()
+
+    def test_edited_template_replaces_module(self, tmp_path):
+        """An edited template gets a new module and the stale one is removed."""
+        prompts_dir = tmp_path / "prompts"
+        module_dir = tmp_path / "modules"
+        prompts_dir.mkdir()
+        _write_prompt(prompts_dir, "Hello ${name}", mtime_ns=1_000_000_000)
+        manager = PromptManager(prompts_dir=prompts_dir, module_dir=module_dir)
+        manager.load(PromptType.TRANSLATION)
+        first = list(module_dir.glob("translation_*.py"))
+
+        _write_prompt(prompts_dir, "Bye ${name}", mtime_ns=2_000_000_000)
+
+        assert manager.render(PromptType.TRANSLATION, name="a") == "Bye a"
+        second = list(module_dir.glob("translation_*.py"))
+        assert len(second) == 1
+        assert second != first
+
+    def test_invalid_template_raises_value_error(self, tmp_path):
+        """Mako syntax errors surface as ValueError when loading."""
+        _write_prompt(tmp_path, "% for x in items:\nunclosed")
+        manager = PromptManager(prompts_dir=tmp_path)
+
+        with pytest.raises(ValueError, match="Failed to compile"):
+            manager.load(PromptType.TRANSLATION)
+
+
 class TestPromptTemplate:
     """Test PromptTemplate model."""
 
@@ -5,10 +5,12 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.config.youtube_upload import AnalyticsConfig
 from app.infrastructure.youtube_api import VideoAnalytics
 from app.models.performance import Performance
+from app.models.series import Series
 from app.models.upload import Upload
 from app.services.analytics.collector import (
     PerformanceSnapshot,
@@ -86,7 +88,12 @@ class TestYouTubeAnalyticsCollector:
     @pytest.fixture
     def mock_db_session_and_factory(self):
         """Create mock database session and factory."""
-        return make_mock_session_factory()
+        factory, session = make_mock_session_factory()
+        # Uploads are not part of a series unless a test says otherwise
+        no_series = MagicMock()
+        no_series.scalar_one_or_none.return_value = None
+        session.execute.return_value = no_series
+        return factory, session
 
     @pytest.fixture
     def mock_db_session_factory(self, mock_db_session_and_factory):
@@ -260,6 +267,32 @@ class TestYouTubeAnalyticsCollector:
             }
         ]
 
+    @pytest.mark.asyncio
+    async def test_collect_updates_series_aggregates(self, collector, mock_db_session):
+        """Test that an episode's metrics are folded into its series."""
+        series = Series(
+            name="AI",
+            measured_episodes=1,
+            avg_views=3000.0,
+            avg_engagement=0.02,
+            recent_engagement=0.02,
+        )
+        series_result = MagicMock()
+        series_result.scalar_one_or_none.return_value = series
+        mock_db_session.execute = AsyncMock(return_value=series_result)
+
+        upload = MagicMock(spec=Upload)
+        upload.id = uuid.uuid4()
+        upload.youtube_video_id = "yt_123"
+        upload.performance = None
+        mock_db_session.get = AsyncMock(return_value=upload)
+
+        await collector.collect_video_performance(upload.id)
+
+        assert series.measured_episodes == 2
+        assert series.avg_views == pytest.approx(2000)
+        assert series.avg_engagement == pytest.approx(0.04)
+
     @pytest.mark.asyncio
     async def test_collect_upload_not_found_raises(self, collector, mock_db_session):
         """Test error when upload not found."""
@@ -310,84 +343,193 @@ class TestYouTubeAnalyticsCollector:
     # sync_channel_uploads() tests
     # =========================================================================
 
+    @staticmethod
+    def _uploads_result(rows):
+        """Result of the upload query: (id, youtube id, views, engagement, series)."""
+        result = MagicMock()
+        result.all.return_value = rows
+        return result
+
     @pytest.mark.asyncio
-    async def test_sync_channel_uploads_empty(self, collector, mock_db_session):
+    async def test_sync_channel_uploads_empty(self, collector, mock_youtube_api, mock_db_session):
         """Test sync when no uploads found."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        mock_db_session.execute = AsyncMock(return_value=self._uploads_result([]))
 
         synced = await collector.sync_channel_uploads(uuid.uuid4())
 
         assert synced == []
+        mock_youtube_api.get_videos_analytics.assert_not_called()
+        mock_db_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_sync_channel_uploads_collects_each(self, collector, mock_db_session):
-        """Test that sync collects performance for each upload."""
-        upload1 = MagicMock(spec=Upload)
-        upload1.id = uuid.uuid4()
-        upload1.youtube_video_id = "yt_1"
-        upload1.performance = None
-
-        upload2 = MagicMock(spec=Upload)
-        upload2.id = uuid.uuid4()
-        upload2.youtube_video_id = "yt_2"
-        upload2.performance = None
+    async def test_sync_channel_uploads_bulk(self, collector, mock_youtube_api, mock_db_session):
+        """Test that uploads are fetched with one report and upserted together."""
+        upload_ids = [uuid.uuid4(), uuid.uuid4()]
+        mock_db_session.execute = AsyncMock(
+            return_value=self._uploads_result(
+                [
+                    (upload_ids[0], "yt_1", None, None, None),
+                    (upload_ids[1], "yt_2", 100, 0.05, None),
+                ]
+            )
+        )
+        mock_youtube_api.get_videos_analytics = AsyncMock(
+            return_value={
+                "yt_1": VideoAnalytics(video_id="yt_1", views=1000, likes=50, comments=10),
+                "yt_2": VideoAnalytics(video_id="yt_2", watch_time_minutes=3),
+            }
+        )
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [upload1, upload2]
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        synced = await collector.sync_channel_uploads(uuid.uuid4())
 
-        with patch.object(
-            collector, "collect_video_performance", new_callable=AsyncMock
-        ) as mock_collect:
-            mock_collect.return_value = PerformanceSnapshot(views=100)
+        assert synced == upload_ids
+        mock_youtube_api.get_videos_analytics.assert_awaited_once()
+        assert mock_youtube_api.get_videos_analytics.await_args.kwargs["video_ids"] == [
+            "yt_1",
+            "yt_2",
+        ]
+        mock_youtube_api.get_video_analytics.assert_not_called()
+
+        # Query, then a single upsert
+        assert mock_db_session.execute.await_count == 2
+        upsert = mock_db_session.execute.await_args_list[1].args[0]
+        sql = str(upsert.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (upload_id) DO UPDATE" in sql
+        params = upsert.compile(dialect=postgresql.dialect()).params
+        assert params["views_m0"] == 1000
+        assert params["engagement_rate_m0"] == pytest.approx(0.06)
+        assert params["watch_time_seconds_m1"] == 180
+        mock_db_session.commit.assert_awaited_once()
 
-            synced = await collector.sync_channel_uploads(uuid.uuid4())
+    @pytest.mark.asyncio
+    async def test_sync_channel_uploads_pages_reports(
+        self, collector, mock_youtube_api, mock_db_session
+    ):
+        """Test that uploads are split into pages of bulk_page_size."""
+        collector.config = AnalyticsConfig(bulk_page_size=2)
+        rows = [(uuid.uuid4(), f"yt_{i}", None, None, None) for i in range(5)]
+        mock_db_session.execute = AsyncMock(return_value=self._uploads_result(rows))
+
+        async def fetch(video_ids, start_date, end_date):
+            return {video_id: VideoAnalytics(video_id=video_id) for video_id in video_ids}
 
-        assert len(synced) == 2
-        assert mock_collect.call_count == 2
+        mock_youtube_api.get_videos_analytics = AsyncMock(side_effect=fetch)
+
+        synced = await collector.sync_channel_uploads(uuid.uuid4())
+
+        assert len(synced) == 5
+        assert [
+            len(call.kwargs["video_ids"])
+            for call in mock_youtube_api.get_videos_analytics.await_args_list
+        ] == [2, 2, 1]
 
     @pytest.mark.asyncio
-    async def test_sync_channel_uploads_handles_individual_failure(
-        self, collector, mock_db_session
+    async def test_sync_channel_uploads_chunks_upsert(
+        self, collector, mock_youtube_api, mock_db_session
     ):
-        """Test that failure on one upload doesn't stop others."""
-        upload1 = MagicMock(spec=Upload)
-        upload1.id = uuid.uuid4()
-        upload2 = MagicMock(spec=Upload)
-        upload2.id = uuid.uuid4()
+        """Test that large syncs are upserted in bounded statements, committed once."""
+        rows = [(uuid.uuid4(), f"yt_{i}", None, None, None) for i in range(5)]
+        mock_db_session.execute = AsyncMock(return_value=self._uploads_result(rows))
 
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [upload1, upload2]
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        async def fetch(video_ids, start_date, end_date):
+            return {video_id: VideoAnalytics(video_id=video_id) for video_id in video_ids}
+
+        mock_youtube_api.get_videos_analytics = AsyncMock(side_effect=fetch)
+
+        with patch("app.services.analytics.collector._UPSERT_CHUNK_ROWS", 2):
+            synced = await collector.sync_channel_uploads(uuid.uuid4())
 
-        with patch.object(
-            collector, "collect_video_performance", new_callable=AsyncMock
-        ) as mock_collect:
-            mock_collect.side_effect = [
+        assert len(synced) == 5
+        upserts = [call.args[0] for call in mock_db_session.execute.await_args_list[1:]]
+        sizes = [
+            sum(
+                1
+                for key in upsert.compile(dialect=postgresql.dialect()).params
+                if key.startswith("upload_id_m")
+            )
+            for upsert in upserts
+        ]
+        assert sizes == [2, 2, 1]
+        mock_db_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sync_channel_uploads_handles_page_failure(
+        self, collector, mock_youtube_api, mock_db_session
+    ):
+        """Test that a failed page doesn't stop the others."""
+        collector.config = AnalyticsConfig(bulk_page_size=1)
+        upload_ids = [uuid.uuid4(), uuid.uuid4()]
+        mock_db_session.execute = AsyncMock(
+            return_value=self._uploads_result(
+                [
+                    (upload_ids[0], "yt_1", None, None, None),
+                    (upload_ids[1], "yt_2", None, None, None),
+                ]
+            )
+        )
+        mock_youtube_api.get_videos_analytics = AsyncMock(
+            side_effect=[
                 Exception("API error"),
-                PerformanceSnapshot(views=200),
+                {"yt_2": VideoAnalytics(video_id="yt_2", views=200)},
             ]
+        )
 
-            synced = await collector.sync_channel_uploads(uuid.uuid4())
+        synced = await collector.sync_channel_uploads(uuid.uuid4())
 
         # Only second succeeded
-        assert len(synced) == 1
-        assert synced[0] == upload2.id
+        assert synced == [upload_ids[1]]
+        mock_db_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sync_channel_uploads_updates_series(
+        self, collector, mock_youtube_api, mock_db_session
+    ):
+        """Test that synced episodes update their series aggregates."""
+        upload_id = uuid.uuid4()
+        series = Series(
+            channel_id=uuid.uuid4(),
+            name="AI",
+            measured_episodes=1,
+            measured_uploads=[str(upload_id)],
+            avg_views=100.0,
+            avg_engagement=0.05,
+            recent_engagement=0.05,
+        )
+        mock_db_session.execute = AsyncMock(
+            return_value=self._uploads_result([(upload_id, "yt_1", 100, 0.05, series)])
+        )
+        mock_youtube_api.get_videos_analytics = AsyncMock(
+            return_value={"yt_1": VideoAnalytics(video_id="yt_1", views=300, likes=15)}
+        )
+
+        await collector.sync_channel_uploads(uuid.uuid4())
+
+        # Re-synced episode replaces its previous views
+        assert series.measured_episodes == 1
+        assert series.avg_views == pytest.approx(300)
 
     @pytest.mark.asyncio
     async def test_sync_custom_since_days(self, collector, mock_db_session):
         """Test that custom since_days overrides config."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        mock_db_session.execute = AsyncMock(return_value=self._uploads_result([]))
 
         await collector.sync_channel_uploads(uuid.uuid4(), since_days=7)
 
         # Should have been called (no error)
         mock_db_session.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_sync_query_filters_by_channel(self, collector, mock_db_session):
+        """Test that only the requested channel's uploads are selected."""
+        channel_id = uuid.uuid4()
+        mock_db_session.execute = AsyncMock(return_value=self._uploads_result([]))
+
+        await collector.sync_channel_uploads(channel_id)
+
+        query = mock_db_session.execute.await_args.args[0]
+        params = query.compile(dialect=postgresql.dialect()).params
+        assert channel_id in params.values()
+
     # =========================================================================
     # identify_high_performers() tests
     # =========================================================================
@@ -5,13 +5,13 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.config.youtube_upload import AnalyticsConfig
-from app.models.performance import Performance
-from app.models.upload import Upload
 from app.services.analytics.optimal_time import (
     KOREAN_GOLDEN_HOURS,
     OptimalTimeAnalyzer,
+    SlotStats,
     TimeSlot,
     TimeSlotAnalysis,
 )
@@ -134,13 +134,35 @@ class TestOptimalTimeAnalyzer:
     # analyze_channel() tests
     # =========================================================================
 
+    @staticmethod
+    def _results(rows, stamp=(10, datetime(2024, 2, 1, tzinfo=UTC))):
+        """Results of the data stamp query and the GROUPING SETS query."""
+        stamp_result = MagicMock()
+        stamp_result.one.return_value = stamp
+        rows_result = MagicMock()
+        rows_result.all.return_value = rows
+        return [stamp_result, rows_result]
+
+    @staticmethod
+    def _grouped_rows(slots):
+        """GROUPING SETS rows for {(hour, day): (count, views, engagement)}."""
+        rows = [(h, d, n, v, e, v, e) for (h, d), (n, v, e) in slots.items()]
+        for index, position in ((0, "hour"), (1, "day")):
+            totals: dict[int, tuple[int, float, float]] = {}
+            for key, (n, v, e) in slots.items():
+                count, views, engagement = totals.get(key[index], (0, 0.0, 0.0))
+                totals[key[index]] = (count + n, views + v * n, engagement + e * n)
+            for value, (n, v, e) in totals.items():
+                hour, day = (value, None) if position == "hour" else (None, value)
+                rows.append((hour, day, n, v / n, e / n, v / n, e / n))
+        return rows
+
     @pytest.mark.asyncio
     async def test_analyze_insufficient_data_returns_defaults(self, analyzer, mock_db_session):
         """Test default analysis when insufficient data."""
-        # Return fewer rows than min_sample_size (5)
-        mock_result = MagicMock()
-        mock_result.all.return_value = [(MagicMock(), MagicMock())] * 3
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        # Fewer samples than min_sample_size (5)
+        rows = self._grouped_rows({(14, 0): (2, 500.0, 0.05), (18, 1): (1, 800.0, 0.04)})
+        mock_db_session.execute = AsyncMock(side_effect=self._results(rows))
 
         analysis = await analyzer.analyze_channel(uuid.uuid4())
 
@@ -151,80 +173,95 @@ class TestOptimalTimeAnalyzer:
     @pytest.mark.asyncio
     async def test_analyze_with_sufficient_data(self, analyzer, mock_db_session):
         """Test analysis with enough data points."""
-        rows = []
-        for i in range(10):
-            upload = MagicMock(spec=Upload)
-            upload.uploaded_at = datetime(2024, 1, 15 + (i % 5), 10 + i, 0, tzinfo=UTC)
-
-            perf = MagicMock(spec=Performance)
-            perf.views = 100 + i * 50
-            perf.engagement_rate = 0.03 + i * 0.005
-
-            rows.append((upload, perf))
-
-        mock_result = MagicMock()
-        mock_result.all.return_value = rows
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        rows = self._grouped_rows(
+            {
+                (10, 0): (3, 200.0, 0.02),
+                (14, 0): (4, 1000.0, 0.08),
+                (18, 5): (3, 800.0, 0.06),
+            }
+        )
+        mock_db_session.execute = AsyncMock(side_effect=self._results(rows))
 
         analysis = await analyzer.analyze_channel(uuid.uuid4())
 
         assert analysis.sample_size == 10
-        assert len(analysis.best_hours) > 0
-        assert len(analysis.best_slots) > 0
+        assert analysis.best_hours[0] == 14
+        assert analysis.best_slots[0].hour == 14
+        assert analysis.best_slots[0].day_of_week == 0
+        assert analysis.best_days == [0, 5]
         assert analysis.analysis_period_days == 90
 
     @pytest.mark.asyncio
     async def test_analyze_custom_lookback(self, analyzer, mock_db_session):
         """Test analysis with custom lookback days."""
-        mock_result = MagicMock()
-        mock_result.all.return_value = []
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+        mock_db_session.execute = AsyncMock(side_effect=self._results([]))
 
         analysis = await analyzer.analyze_channel(uuid.uuid4(), days_lookback=30)
 
         assert analysis.analysis_period_days == 30
 
     @pytest.mark.asyncio
-    async def test_analyze_skips_null_uploaded_at(self, analyzer, mock_db_session):
-        """Test that rows with null uploaded_at are skipped."""
-        rows = []
-        # 5 valid rows + 1 null
-        for i in range(5):
-            upload = MagicMock(spec=Upload)
-            upload.uploaded_at = datetime(2024, 1, 15, 10 + i, 0, tzinfo=UTC)
-            perf = MagicMock(spec=Performance)
-            perf.views = 100
-            perf.engagement_rate = 0.05
-            rows.append((upload, perf))
-
-        # Add one with null uploaded_at
-        null_upload = MagicMock(spec=Upload)
-        null_upload.uploaded_at = None
-        null_perf = MagicMock(spec=Performance)
-        null_perf.views = 9999
-        null_perf.engagement_rate = 0.99
-        rows.append((null_upload, null_perf))
-
-        mock_result = MagicMock()
-        mock_result.all.return_value = rows
-        mock_db_session.execute = AsyncMock(return_value=mock_result)
+    async def test_analyze_caches_until_data_changes(self, analyzer, mock_db_session):
+        """Test that analyses are reused until new performance data lands."""
+        channel_id = uuid.uuid4()
+        rows = self._grouped_rows({(14, 0): (6, 1000.0, 0.08)})
+        changed = (11, datetime(2024, 2, 2, tzinfo=UTC))
+        mock_db_session.execute = AsyncMock(
+            side_effect=[
+                *self._results(rows),
+                self._results(rows)[0],  # Same stamp: cached
+                *self._results(rows, stamp=changed),
+            ]
+        )
 
-        analysis = await analyzer.analyze_channel(uuid.uuid4())
+        first = await analyzer.analyze_channel(channel_id)
+        second = await analyzer.analyze_channel(channel_id)
+        third = await analyzer.analyze_channel(channel_id)
+
+        assert second is first
+        assert third is not first
+        assert mock_db_session.execute.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_analyze_queries_only_the_channel(self, analyzer, mock_db_session):
+        """Test that both queries are scoped to the channel and aggregated in SQL."""
+        channel_id = uuid.uuid4()
+        mock_db_session.execute = AsyncMock(side_effect=self._results([]))
+
+        await analyzer.analyze_channel(channel_id)
+
+        for call in mock_db_session.execute.await_args_list:
+            compiled = call.args[0].compile(dialect=postgresql.dialect())
+            assert channel_id in compiled.params.values()
+            assert "uploaded_at IS NOT NULL" in str(compiled)
+        slot_query = str(mock_db_session.execute.await_args_list[1].args[0])
+        assert "GROUPING SETS" in slot_query
+
+    def test_slot_query_recency_weights(self, mock_db_session_factory):
+        """Test that a configured half-life decays weights in the query."""
+        plain = OptimalTimeAnalyzer(mock_db_session_factory)
+        weighted = OptimalTimeAnalyzer(
+            mock_db_session_factory, config=AnalyticsConfig(recency_half_life_days=14)
+        )
+        cutoff = datetime(2024, 1, 1, tzinfo=UTC)
 
-        # Should have 5 valid data points (+ 1 null skipped)
-        assert analysis.sample_size == 6  # Total rows counted
+        assert "power" not in str(plain._slot_query(uuid.uuid4(), cutoff))
+        assert "power" in str(weighted._slot_query(uuid.uuid4(), cutoff))
 
     # =========================================================================
     # _calculate_scores() tests
     # =========================================================================
 
+    @staticmethod
+    def _stats(views, engagement, count=1):
+        """Unweighted slot aggregates."""
+        return SlotStats(count, views, engagement, views, engagement)
+
     def test_calculate_scores_single_hour(self, analyzer):
         """Test score calculation with single hour data."""
-        hour_data = {14: [(1000.0, 0.05), (800.0, 0.04)]}
-        day_data = {0: [(1000.0, 0.05), (800.0, 0.04)]}
-        slot_data = {(14, 0): [(1000.0, 0.05), (800.0, 0.04)]}
+        stats = self._stats(900.0, 0.045, count=2)
 
-        analysis = analyzer._calculate_scores(hour_data, day_data, slot_data, 2, 30)
+        analysis = analyzer._calculate_scores({14: stats}, {0: stats}, {(14, 0): stats}, 2, 30)
 
         assert len(analysis.best_hours) == 1
         assert analysis.best_hours[0] == 14
@@ -232,35 +269,40 @@ class TestOptimalTimeAnalyzer:
 
     def test_calculate_scores_multiple_hours(self, analyzer):
         """Test score calculation ranks hours by performance."""
-        hour_data = {
-            10: [(200.0, 0.02)],
-            14: [(1000.0, 0.08)],
-            18: [(800.0, 0.06)],
-        }
-        day_data = {0: [(200.0, 0.02), (1000.0, 0.08), (800.0, 0.06)]}
-        slot_data = {
-            (10, 0): [(200.0, 0.02)],
-            (14, 0): [(1000.0, 0.08)],
-            (18, 0): [(800.0, 0.06)],
+        hour_stats = {
+            10: self._stats(200.0, 0.02),
+            14: self._stats(1000.0, 0.08),
+            18: self._stats(800.0, 0.06),
         }
+        day_stats = {0: self._stats(666.7, 0.053, count=3)}
+        slot_stats = {(hour, 0): stats for hour, stats in hour_stats.items()}
 
-        analysis = analyzer._calculate_scores(hour_data, day_data, slot_data, 3, 30)
+        analysis = analyzer._calculate_scores(hour_stats, day_stats, slot_stats, 3, 30)
 
         # Best hour should be 14 (highest views and engagement)
         assert analysis.best_hours[0] == 14
 
+    def test_calculate_scores_uses_weighted_averages(self, analyzer):
+        """Test that recency-weighted averages drive the ranking."""
+        hour_stats = {
+            # Strong on average, but only thanks to old uploads
+            10: SlotStats(10, 2000.0, 0.08, 300.0, 0.02),
+            14: SlotStats(10, 1000.0, 0.05, 1000.0, 0.05),
+        }
+
+        analysis = analyzer._calculate_scores(hour_stats, {}, {}, 20, 30)
+
+        assert analysis.best_hours == [14, 10]
+
     def test_calculate_scores_confidence_by_sample(self, analyzer):
         """Test that confidence increases with sample count."""
-        # One hour with many samples
-        hour_data_many = {14: [(500.0, 0.05)] * 20}
-        # One hour with few samples
-        hour_data_few = {18: [(500.0, 0.05)] * 2}
-
-        combined_hour = {**hour_data_many, **hour_data_few}
-        day_data = {0: [(500.0, 0.05)] * 22}
-        slot_data = {}
+        hour_stats = {
+            14: self._stats(500.0, 0.05, count=20),
+            18: self._stats(500.0, 0.05, count=2),
+        }
+        day_stats = {0: self._stats(500.0, 0.05, count=22)}
 
-        analysis = analyzer._calculate_scores(combined_hour, day_data, slot_data, 22, 30)
+        analysis = analyzer._calculate_scores(hour_stats, day_stats, {}, 22, 30)
 
         assert analysis.confidence_scores["hour_14"] == 1.0  # 20/10 capped at 1.0
         assert analysis.confidence_scores["hour_18"] == pytest.approx(0.2)  # 2/10
@@ -268,25 +310,22 @@ class TestOptimalTimeAnalyzer:
     def test_calculate_scores_worst_slots(self, analyzer):
         """Test that worst slots are returned."""
         # Create 6+ slots for worst_slots to be populated
-        hour_data = {}
-        day_data = {}
-        slot_data = {}
+        hour_stats = {}
+        slot_stats = {}
         for h in range(6):
-            hour_data[h + 10] = [(100.0 * (h + 1), 0.01 * (h + 1))]
-            day_data[h % 5] = day_data.get(h % 5, []) + [(100.0 * (h + 1), 0.01 * (h + 1))]
-            slot_data[(h + 10, h % 5)] = [(100.0 * (h + 1), 0.01 * (h + 1))]
+            stats = self._stats(100.0 * (h + 1), 0.01 * (h + 1))
+            hour_stats[h + 10] = stats
+            slot_stats[(h + 10, h % 5)] = stats
 
-        analysis = analyzer._calculate_scores(hour_data, day_data, slot_data, 6, 30)
+        analysis = analyzer._calculate_scores(hour_stats, {}, slot_stats, 6, 30)
 
         assert len(analysis.worst_slots) > 0
 
     def test_calculate_scores_few_slots_no_worst(self, analyzer):
         """Test that worst slots are empty when < 5 combined slots."""
-        hour_data = {14: [(500.0, 0.05)]}
-        day_data = {0: [(500.0, 0.05)]}
-        slot_data = {(14, 0): [(500.0, 0.05)]}
+        stats = self._stats(500.0, 0.05)
 
-        analysis = analyzer._calculate_scores(hour_data, day_data, slot_data, 1, 30)
+        analysis = analyzer._calculate_scores({14: stats}, {0: stats}, {(14, 0): stats}, 1, 30)
 
         assert analysis.worst_slots == []
 
@@ -4,6 +4,8 @@ Tests use mocked pytrends responses to avoid external API calls.
 Note: These tests mock the TrendReq class to avoid the pandas dependency issue.
 """
 
+import threading
+import time
 import uuid
 from unittest.mock import MagicMock, patch
 
@@ -219,3 +221,146 @@ class TestGoogleTrendsMetrics:
         assert "google_query" in expected_metadata
         assert "region" in expected_metadata
         assert "trends_url" in expected_metadata
+
+
+class TestGoogleTrendsOffEventLoop:
+    """Tests for threaded, concurrent pytrends fetching."""
+
+    @pytest.fixture(autouse=True)
+    def clear_sessions(self):
+        """Reset the shared TrendReq sessions between tests."""
+        from app.services.collector.sources import google_trends
+
+        google_trends._sessions.clear()
+        yield
+        google_trends._sessions.clear()
+
+    @staticmethod
+    def _trend_req(delay: float, threads: list[str], active: list[int] | None = None) -> MagicMock:
+        lock = threading.Lock()
+        running = [0]
+
+        def trending_searches(pn: str) -> MagicMock:
+            threads.append(threading.current_thread().name)
+            with lock:
+                running[0] += 1
+                if active is not None:
+                    active.append(running[0])
+            time.sleep(delay)
+            with lock:
+                running[0] -= 1
+            df = MagicMock()
+            df.empty = False
+            df.head.return_value.iterrows.return_value = [(0, f"trend in {pn}")]
+            return df
+
+        trend_req = MagicMock()
+        trend_req.return_value.trending_searches.side_effect = trending_searches
+        return trend_req
+
+    @pytest.mark.asyncio
+    async def test_regions_fetched_concurrently_off_loop(self, source_id: uuid.UUID):
+        """Blocking pytrends calls run in worker threads, in parallel across regions."""
+        from app.config.sources import GoogleTrendsConfig
+        from app.services.collector.sources.google_trends import GoogleTrendsSource
+
+        threads: list[str] = []
+        active: list[int] = []
+        source = GoogleTrendsSource(
+            config=GoogleTrendsConfig(regions=["KR", "US", "JP"]),
+            source_id=source_id,
+            http_client=MagicMock(),
+        )
+
+        with patch(
+            "app.services.collector.sources.google_trends.TrendReq",
+            self._trend_req(0.2, threads, active),
+        ):
+            topics = await source.collect()
+
+        assert max(active) > 1
+        assert [t.metadata["region"] for t in topics] == ["KR", "US", "JP"]
+        assert threading.main_thread().name not in threads
+
+    @pytest.mark.asyncio
+    async def test_session_reused_per_region(self, source_id: uuid.UUID):
+        """TrendReq is created once per region and reused across collections."""
+        from app.config.sources import GoogleTrendsConfig
+        from app.services.collector.sources.google_trends import GoogleTrendsSource
+
+        trend_req = self._trend_req(0, [])
+        source = GoogleTrendsSource(
+            config=GoogleTrendsConfig(regions=["KR"]),
+            source_id=source_id,
+            http_client=MagicMock(),
+        )
+
+        with patch("app.services.collector.sources.google_trends.TrendReq", trend_req):
+            await source.collect()
+            await source.collect()
+
+        trend_req.assert_called_once_with(hl="ko", tz=540, timeout=10.0)
+
+    def test_sessions_created_in_parallel(self):
+        """Building one region's session does not block other regions."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from app.services.collector.sources.google_trends import _get_session
+
+        lock = threading.Lock()
+        running = [0]
+        active: list[int] = []
+
+        def create(**kwargs: object) -> MagicMock:
+            with lock:
+                running[0] += 1
+                active.append(running[0])
+            time.sleep(0.1)
+            with lock:
+                running[0] -= 1
+            return MagicMock()
+
+        with (
+            patch("app.services.collector.sources.google_trends.TrendReq", side_effect=create),
+            ThreadPoolExecutor(max_workers=3) as pool,
+        ):
+            sessions = list(pool.map(lambda r: _get_session(r, 10.0), ["KR", "US", "JP"]))
+
+        assert max(active) > 1
+        assert len({id(session) for session, _ in sessions}) == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_timeout_skips_region(self, source_id: uuid.UUID):
+        """A region exceeding fetch_timeout is skipped without blocking others."""
+        from app.config.sources import GoogleTrendsConfig
+        from app.services.collector.sources.google_trends import GoogleTrendsSource
+
+        source = GoogleTrendsSource(
+            config=GoogleTrendsConfig(regions=["KR"], fetch_timeout=0.05),
+            source_id=source_id,
+            http_client=MagicMock(),
+        )
+
+        with patch(
+            "app.services.collector.sources.google_trends.TrendReq", self._trend_req(0.3, [])
+        ):
+            topics = await source.collect()
+
+        assert topics == []
+
+    def test_region_lookups_memoized(self):
+        """Region lookups hit the memo cache after the first call."""
+        from app.services.collector.sources.google_trends import (
+            get_host_language_for_region,
+            get_pn_code_for_region,
+        )
+
+        get_host_language_for_region("KR")
+        get_pn_code_for_region("KR")
+        hits = get_host_language_for_region.cache_info().hits
+        pn_hits = get_pn_code_for_region.cache_info().hits
+
+        assert get_host_language_for_region("KR") == "ko"
+        assert get_pn_code_for_region("KR") == "south_korea"
+        assert get_host_language_for_region.cache_info().hits == hits + 1
+        assert get_pn_code_for_region.cache_info().hits == pn_hits + 1
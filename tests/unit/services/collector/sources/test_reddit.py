@@ -3,6 +3,7 @@
 Tests use mocked HTTP responses to avoid external API calls.
 """
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
 from unittest.mock import MagicMock
@@ -173,6 +174,48 @@ class TestRedditCollect:
         assert len(topics) == 0  # Stickied posts filtered
 
 
+class TestRedditStream:
+    """Tests for Reddit.stream() method."""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_subreddits_as_they_respond(
+        self, reddit_source: RedditSource, mock_http_client: HTTPClient, mock_post: dict
+    ):
+        """Test that a slow subreddit does not hold back a fast one."""
+
+        async def fake_get(url: str, params: dict | None = None) -> MagicMock:
+            if "/r/programming/" in url:
+                await asyncio.sleep(0.05)
+            post = {"data": {**mock_post["data"], "title": url}}
+            return create_mock_response(json_data={"data": {"children": [post]}})
+
+        mock_http_client.get.side_effect = fake_get
+
+        batches = [batch async for batch in reddit_source.stream()]
+
+        assert [batch[0].metadata["subreddit"] for batch in batches] == [
+            "technology",
+            "programming",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_collect_keeps_subreddit_order(
+        self, reddit_source: RedditSource, mock_http_client: HTTPClient, mock_post: dict
+    ):
+        """Test that concurrent collection still returns subreddits in config order."""
+
+        async def fake_get(url: str, params: dict | None = None) -> MagicMock:
+            if "/r/programming/" in url:
+                await asyncio.sleep(0.02)
+            return create_mock_response(json_data={"data": {"children": [mock_post]}})
+
+        mock_http_client.get.side_effect = fake_get
+
+        topics = await reddit_source.collect()
+
+        assert [t.metadata["subreddit"] for t in topics] == ["programming", "technology"]
+
+
 class TestRedditHealthCheck:
     """Tests for Reddit.health_check() method."""
 
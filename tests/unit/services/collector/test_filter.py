@@ -187,6 +187,71 @@ class TestEdgeCases:
         assert result.reason == FilterReason.NO_INCLUDE_MATCH
 
 
+class TestFilterMany:
+    """Tests for batch filtering and match modes."""
+
+    def test_results_aligned_with_topics(self):
+        """filter_many returns one result per topic, in order."""
+        topic_filter = TopicFilter(FilteringConfig(include=["ai", "chip"], exclude=["spam"]))
+        topics = [
+            create_topic(title="New AI chip", terms=[]),
+            create_topic(title="AI spam", terms=[]),
+            create_topic(title="Gaming news", terms=[]),
+        ]
+
+        results = topic_filter.filter_many(topics)
+
+        assert [r.passed for r in results] == [True, False, False]
+        assert results[0].matched_terms == ["ai", "chip"]
+        assert results[1].excluded_term == "spam"
+        assert results[2].reason == FilterReason.NO_INCLUDE_MATCH
+
+    def test_matches_single_topic_filter(self):
+        """Batch results equal filtering topics one by one."""
+        topic_filter = TopicFilter(FilteringConfig(include=["tech"], exclude=["politics"]))
+        topics = [create_topic(terms=terms) for terms in (["tech"], ["politics"], ["x"])]
+
+        assert topic_filter.filter_many(topics) == [topic_filter.filter(t) for t in topics]
+
+    def test_compiled_once_per_config(self):
+        """Filters with the same config share one compiled matcher."""
+        first = TopicFilter(FilteringConfig(include=["ai"], exclude=["spam"]))
+        second = TopicFilter(FilteringConfig(include=["AI"], exclude=["spam"]))
+        other = TopicFilter(FilteringConfig(include=["ai"], match_mode="word"))
+
+        assert first._matcher is second._matcher
+        assert first._matcher is not other._matcher
+
+    def test_large_exclude_list(self):
+        """Thousands of exclude terms are matched like a few."""
+        banned = [f"banned{i:04d}" for i in range(5000)]
+        topic_filter = TopicFilter(FilteringConfig(exclude=banned))
+
+        results = topic_filter.filter_many(
+            [create_topic(title="story about banned4321", terms=[]), create_topic(terms=[])]
+        )
+
+        assert results[0].excluded_term == "banned4321"
+        assert results[1].passed is True
+
+    def test_word_mode(self):
+        """Word mode does not match terms inside longer words."""
+        topic_filter = TopicFilter(FilteringConfig(include=["ai"], match_mode="word"))
+
+        assert topic_filter.filter(create_topic(title="OpenAI news", terms=[])).passed is False
+        assert topic_filter.filter(create_topic(title="AI news", terms=[])).passed is True
+
+    def test_hangul_mode_allows_particles(self):
+        """Hangul mode matches terms followed by Korean particles."""
+        topic_filter = TopicFilter(
+            FilteringConfig(include=["ai", "삼성"], exclude=["광고"], match_mode="hangul")
+        )
+
+        assert topic_filter.filter(create_topic(title="AI가 바꾼 삼성의 미래", terms=[])).passed
+        assert not topic_filter.filter(create_topic(title="OpenAI 소식", terms=[])).passed
+        assert not topic_filter.filter(create_topic(title="AI 광고입니다", terms=[])).passed
+
+
 class TestFilterResult:
     """Tests for FilterResult model."""
 
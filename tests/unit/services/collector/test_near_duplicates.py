@@ -0,0 +1,159 @@
+"""Unit tests for MinHash/LSH near-duplicate detection."""
+
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.services.collector.base import NormalizedTopic, RawTopic
+from app.services.collector.near_duplicates import (
+    LSHIndex,
+    MinHasher,
+    NearDuplicateDetector,
+    NearDuplicateStore,
+    estimate_similarity,
+    topic_tokens,
+)
+from app.services.collector.scorer import SOURCE_KEY
+
+NOW = 1_800_000_000.0
+CHANNEL_ID = uuid.uuid4()
+
+
+def _topic(
+    title: str,
+    source: str = "reddit",
+    terms: list[str] | None = None,
+    translated: str | None = None,
+) -> tuple[RawTopic, NormalizedTopic]:
+    raw = RawTopic(
+        source_id=str(uuid.uuid4()),
+        source_url="https://example.com/a",
+        title=title,
+        metadata={SOURCE_KEY: source},
+    )
+    norm = NormalizedTopic(
+        source_id=uuid.uuid4(),
+        source_url="https://example.com/a",
+        title_original=title,
+        title_translated=translated,
+        title_normalized=title,
+        summary="",
+        terms=terms or [],
+        content_hash="x",
+    )
+    return raw, norm
+
+
+def _detector(store: NearDuplicateStore | None = None, **kwargs: float) -> NearDuplicateDetector:
+    options: dict = {"num_perm": 128, "bands": 32, "threshold": 0.5, "window_hours": 72}
+    options.update(kwargs)
+    return NearDuplicateDetector(store=store, **options)
+
+
+class TestMinHash:
+    """Tests for MinHash signatures and LSH banding."""
+
+    def test_similarity_estimates_jaccard(self) -> None:
+        """Signature agreement approximates the Jaccard similarity."""
+        hasher = MinHasher(num_perm=256)
+        a = {f"t{i}" for i in range(100)}
+        b = {f"t{i}" for i in range(50, 150)}  # Jaccard 50 / 150
+
+        similarity = estimate_similarity(hasher.signature(a), hasher.signature(b)[None, :])
+
+        assert similarity[0] == pytest.approx(1 / 3, abs=0.1)
+
+    def test_signatures_are_deterministic(self) -> None:
+        """Signatures do not depend on token order or the process hash seed."""
+        first = MinHasher().signature(["openai", "gpt", "model"])
+        second = MinHasher().signature(["model", "openai", "gpt", "gpt"])
+
+        assert first.dtype == np.uint32
+        np.testing.assert_array_equal(first, second)
+
+    def test_lsh_candidates_share_a_band(self) -> None:
+        """Only signatures sharing a whole band are candidates."""
+        hasher = MinHasher(num_perm=16)
+        index = LSHIndex(bands=4, rows=4)
+        index.insert(0, hasher.signature({"openai", "gpt", "reasoning", "model"}))
+        index.insert(1, hasher.signature({"samsung", "foldable", "phone"}))
+
+        candidates = index.candidates(hasher.signature({"openai", "gpt", "reasoning", "model"}))
+
+        assert candidates == {0}
+
+    def test_tokens_use_translated_title_and_terms(self) -> None:
+        """Translated titles and extracted terms are compared."""
+        _, norm = _topic("Apple launches iPhone", terms=["Apple"], translated="애플 아이폰 출시")
+
+        assert topic_tokens(norm) == {"애플", "아이폰", "출시", "apple"}
+
+
+class TestNearDuplicateDetector:
+    """Tests for clustering batches against a channel's recent stories."""
+
+    @pytest.mark.asyncio
+    async def test_reports_from_several_sources_cluster(self) -> None:
+        """Near-identical titles from different sources form one cluster."""
+        topics = [
+            _topic("OpenAI releases GPT-5 reasoning model", source="reddit"),
+            _topic("Samsung unveils foldable phone", source="reddit"),
+            _topic("OpenAI releases new GPT-5 reasoning model today", source="hn_rss"),
+            _topic("OpenAI releases GPT-5 reasoning model!", source="google_trends"),
+        ]
+
+        clusters = await _detector().cluster(CHANNEL_ID, topics, now=NOW)
+
+        assert [len(c.members) for c in clusters] == [3, 1]
+        assert clusters[0].representative[0] is topics[0][0]
+        assert clusters[0].sources == {"reddit", "hn_rss", "google_trends"}
+        assert not any(c.seen_before for c in clusters)
+
+    @pytest.mark.asyncio
+    async def test_topics_without_tokens_stay_separate(self) -> None:
+        """Topics with nothing to compare are never merged."""
+        topics = [_topic("!!!"), _topic("???")]
+
+        clusters = await _detector().cluster(CHANNEL_ID, topics, now=NOW)
+
+        assert len(clusters) == 2
+
+    @pytest.mark.asyncio
+    async def test_saved_stories_are_remembered_within_window(self, tmp_path: Path) -> None:
+        """Stories saved in an earlier run are recognized until the window ends."""
+        store = NearDuplicateStore(tmp_path / "near_duplicates.sqlite3")
+        first = await _detector(store).cluster(
+            CHANNEL_ID, [_topic("OpenAI releases GPT-5 reasoning model")], now=NOW
+        )
+        await _detector(store).remember(CHANNEL_ID, first, now=NOW)
+
+        later = [_topic("OpenAI releases GPT-5 reasoning model today", source="hn_rss")]
+        next_day = await _detector(store).cluster(CHANNEL_ID, later, now=NOW + 24 * 3600)
+        other_channel = await _detector(store).cluster(uuid.uuid4(), later, now=NOW + 24 * 3600)
+        next_week = await _detector(store).cluster(CHANNEL_ID, later, now=NOW + 7 * 24 * 3600)
+        await store.close()
+
+        assert next_day[0].seen_before
+        assert next_day[0].cluster_id == first[0].cluster_id
+        assert not other_channel[0].seen_before
+        assert not next_week[0].seen_before
+
+    @pytest.mark.asyncio
+    async def test_signatures_of_other_length_are_ignored(self, tmp_path: Path) -> None:
+        """Stored signatures from a different num_perm are skipped."""
+        store = NearDuplicateStore(tmp_path / "near_duplicates.sqlite3")
+        topics = [_topic("OpenAI releases GPT-5 reasoning model")]
+        old = _detector(store, num_perm=64, bands=16)
+        await old.remember(CHANNEL_ID, await old.cluster(CHANNEL_ID, topics, now=NOW), now=NOW)
+
+        clusters = await _detector(store).cluster(CHANNEL_ID, topics, now=NOW)
+        await store.close()
+
+        assert not clusters[0].seen_before
+
+    def test_bands_must_divide_num_perm(self) -> None:
+        """An LSH layout that does not fit the signature is rejected."""
+        with pytest.raises(ValueError):
+            _detector(num_perm=128, bands=30)
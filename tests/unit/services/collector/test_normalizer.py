@@ -1,12 +1,14 @@
 """Unit tests for topic normalizer."""
 
 import json
+import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.infrastructure.llm import LLMResponse
 from app.prompts.manager import LLMSettings
+from app.services.collector.base import NormalizedTopic, RawTopic
 from app.services.collector.normalizer import ClassificationResult, TopicNormalizer
 
 
@@ -335,3 +337,141 @@ class TestTopicNormalizerClassify:
 
         assert result.terms == ["python"]
         assert result.summary == "Python news"
+
+
+def _raw_topic(title: str, index: int = 0) -> RawTopic:
+    return RawTopic(
+        source_id="src",
+        source_url=f"https://example.com/{index}",
+        title=title,
+    )
+
+
+class TestTopicNormalizerBatch:
+    """Tests for batched normalization."""
+
+    @pytest.fixture
+    def normalizer(self):
+        """Create normalizer with mocked LLM and small batches."""
+        mock_llm = MagicMock()
+        mock_llm.complete = AsyncMock()
+        mock_prompt_manager = MagicMock()
+        mock_prompt_manager.render.return_value = "batch prompt"
+        mock_prompt_manager.get_llm_settings.return_value = LLMSettings(
+            model="test",
+            max_tokens=500,
+            temperature=0.3,
+        )
+        return TopicNormalizer(
+            llm_client=mock_llm,
+            prompt_manager=mock_prompt_manager,
+            batch_size=2,
+            max_concurrent_batches=2,
+        )
+
+    @staticmethod
+    def _response(entries: list[dict]) -> LLMResponse:
+        return LLMResponse(content=json.dumps(entries, ensure_ascii=False), model="t", usage={})
+
+    @pytest.mark.asyncio
+    async def test_one_call_per_batch(self, normalizer):
+        """Each batch of topics is translated and classified in a single call."""
+
+        async def complete(config, messages):
+            return self._response(
+                [
+                    {
+                        "id": i,
+                        "translation": f"번역 {i}",
+                        "terms": ["AI"],
+                        "entities": {},
+                        "summary": f"s{i}",
+                    }
+                    for i in range(2)
+                ]
+            )
+
+        normalizer.llm_client.complete.side_effect = complete
+        items = [(_raw_topic(f"Topic {i}", i), uuid.uuid4()) for i in range(4)]
+
+        results = await normalizer.normalize_batch(items, target_language="ko")
+
+        assert normalizer.llm_client.complete.await_count == 2
+        assert all(isinstance(r, NormalizedTopic) for r in results)
+        assert results[0].title_translated == "번역 0"
+        assert results[0].terms == ["ai"]
+        assert results[3].title_original == "Topic 3"
+
+    @pytest.mark.asyncio
+    async def test_same_language_skips_translation(self, normalizer):
+        """Topics already in the target language keep title_translated as None."""
+        normalizer.llm_client.complete.return_value = self._response(
+            [{"id": 0, "translation": "ignored", "terms": ["x"], "entities": {}, "summary": "s"}]
+        )
+
+        results = await normalizer.normalize_batch(
+            [(_raw_topic("한국어 제목"), uuid.uuid4())], target_language="ko"
+        )
+
+        assert results[0].title_translated is None
+        assert results[0].language == "ko"
+
+    @pytest.mark.asyncio
+    async def test_missing_item_falls_back_to_single_normalize(self, normalizer):
+        """Items absent from the batch response are normalized individually."""
+        normalizer.llm_client.complete.return_value = self._response(
+            [{"id": 0, "translation": "번역", "terms": ["a"], "entities": {}, "summary": "s"}]
+        )
+        fallback = MagicMock(spec=NormalizedTopic)
+        normalizer.normalize = AsyncMock(return_value=fallback)
+        items = [(_raw_topic("First", 0), uuid.uuid4()), (_raw_topic("Second", 1), uuid.uuid4())]
+
+        results = await normalizer.normalize_batch(items, target_language="ko")
+
+        assert results[0].title_translated == "번역"
+        assert results[1] is fallback
+        normalizer.normalize.assert_awaited_once_with(items[1][0], items[1][1], "ko")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("translation", [None, 42, "  "])
+    async def test_bad_translation_falls_back_to_single_normalize(self, normalizer, translation):
+        """A needed translation that is null, not a string or blank is normalized individually."""
+        normalizer.llm_client.complete.return_value = self._response(
+            [{"id": 0, "translation": translation, "terms": ["a"], "entities": {}, "summary": "s"}]
+        )
+        fallback = MagicMock(spec=NormalizedTopic)
+        normalizer.normalize = AsyncMock(return_value=fallback)
+        items = [(_raw_topic("Topic", 0), uuid.uuid4())]
+
+        results = await normalizer.normalize_batch(items, target_language="ko")
+
+        assert results == [fallback]
+        normalizer.normalize.assert_awaited_once_with(items[0][0], items[0][1], "ko")
+
+    @pytest.mark.asyncio
+    async def test_unparseable_batch_falls_back_and_reports_errors(self, normalizer):
+        """A bad batch response falls back per item; failures are returned, not raised."""
+        normalizer.llm_client.complete.return_value = LLMResponse(
+            content="not json", model="t", usage={}
+        )
+        normalizer.normalize = AsyncMock(side_effect=RuntimeError("boom"))
+
+        results = await normalizer.normalize_batch(
+            [(_raw_topic("Topic"), uuid.uuid4())], target_language="ko"
+        )
+
+        assert isinstance(results[0], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, normalizer):
+        """No topics means no LLM calls."""
+        assert await normalizer.normalize_batch([]) == []
+        normalizer.llm_client.complete.assert_not_called()
+
+    def test_extract_first_json_array(self, normalizer):
+        """JSON arrays are extracted from surrounding text and code fences."""
+        text = normalizer._strip_code_fence('```json\n[{"id": 0}, {"id": 1}]\n```')
+        assert normalizer._extract_first_json_array(f"Result: {text} done") == [
+            {"id": 0},
+            {"id": 1},
+        ]
@@ -1,17 +1,24 @@
 """Unit tests for topic collection pipeline."""
 
+import asyncio
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.models.series import Series
 from app.services.collector.base import NormalizedTopic, RawTopic
+from app.services.collector.near_duplicates import NearDuplicateDetector
 from app.services.collector.pipeline import (
     CollectionConfig,
     CollectionStats,
     TopicCollectionPipeline,
 )
+from app.services.collector.scorer import SOURCE_KEY
+from app.services.collector.series_detector import SeriesIndex
 
 
 class TestCollectionStats:
@@ -119,12 +126,14 @@ class TestCollectionConfig:
             "filtering": {
                 "include": ["ai"],
                 "exclude": ["spam"],
+                "match_mode": "hangul",
             },
         }
 
         config = CollectionConfig.from_channel_config(channel_config)
 
         assert config.target_language == "en"
+        assert config.match_mode == "hangul"
         assert "reddit" in config.sources
         assert "google_trends" in config.sources
 
@@ -136,6 +145,7 @@ class TestCollectionConfig:
 
         assert config.target_language == "ko"  # Default
         assert config.sources == []
+        assert config.match_mode == "substring"
 
 
 def _make_normalized_topic(**kwargs: object) -> NormalizedTopic:
@@ -362,8 +372,21 @@ class TestDeduplicateTopics:
         session.execute.assert_not_called()
 
 
-class TestCollectRawTopics:
-    """Tests for _collect_raw_topics."""
+def _fake_normalizer() -> MagicMock:
+    """Normalizer that normalizes each raw topic to its own title."""
+    normalizer = MagicMock()
+    normalizer.batch_size = 2
+    normalizer.max_concurrent_batches = 2
+
+    async def normalize_batch(items: list, target_language: str) -> list:
+        return [MagicMock(title_normalized=raw.title) for raw, _ in items]
+
+    normalizer.normalize_batch = AsyncMock(side_effect=normalize_batch)
+    return normalizer
+
+
+class TestCollectAndNormalize:
+    """Tests for _collect_and_normalize."""
 
     @pytest.mark.asyncio
     async def test_source_error_captured_in_stats(self) -> None:
@@ -371,14 +394,354 @@ class TestCollectRawTopics:
         session = AsyncMock()
         http_client = MagicMock()
         pipeline = TopicCollectionPipeline(
-            session=session, http_client=http_client, normalizer=MagicMock()
+            session=session, http_client=http_client, normalizer=_fake_normalizer()
         )
 
         config = CollectionConfig(sources=["nonexistent_source"])
         stats = CollectionStats()
 
-        result = await pipeline._collect_raw_topics(config, stats)
+        result = await pipeline._collect_and_normalize(config, stats)
 
         assert result == []
         assert len(stats.errors) == 1
         assert "nonexistent_source" in stats.errors[0]
+
+
+def _raw(title: str) -> RawTopic:
+    return RawTopic(source_id=str(uuid.uuid4()), source_url="https://example.com/a", title=title)
+
+
+class _StreamingSource:
+    """Fake source yielding batches after per-batch delays.
+
+    Optionally waits for ``wait_for`` before its first batch. Once it has
+    yielded everything it appends ``name`` to ``finished`` and sets ``done``.
+    """
+
+    def __init__(
+        self,
+        batches: list[tuple[float, list[str]]],
+        name: str = "",
+        wait_for: asyncio.Event | None = None,
+        finished: list[str] | None = None,
+        done: asyncio.Event | None = None,
+    ) -> None:
+        self.batches = batches
+        self.name = name
+        self.wait_for = wait_for
+        self.finished = finished
+        self.done = done
+
+    async def stream(self, params: Any = None) -> AsyncIterator[list[RawTopic]]:
+        if self.wait_for is not None:
+            await self.wait_for.wait()
+        for delay, titles in self.batches:
+            await asyncio.sleep(delay)
+            yield [_raw(title) for title in titles]
+        if self.finished is not None:
+            self.finished.append(self.name)
+        if self.done is not None:
+            self.done.set()
+
+
+def _patch_sources(sources: dict[str, _StreamingSource]) -> Any:
+    return patch(
+        "app.services.collector.pipeline.create_source",
+        side_effect=lambda name, http_client, overrides: sources[name],
+    )
+
+
+class TestConcurrentCollection:
+    """Tests for concurrent source collection with deadlines."""
+
+    @pytest.fixture
+    def pipeline(self) -> TopicCollectionPipeline:
+        return TopicCollectionPipeline(
+            session=AsyncMock(), http_client=MagicMock(), normalizer=_fake_normalizer()
+        )
+
+    @pytest.mark.asyncio
+    async def test_sources_collected_concurrently_in_source_order(
+        self, pipeline: TopicCollectionPipeline
+    ) -> None:
+        """Slow sources do not serialize collection; results keep source order."""
+        fast_done = asyncio.Event()
+        finished: list[str] = []
+
+        # The first source only finishes after the second, so collecting
+        # them one at a time would time out the first
+        sources = {
+            "slow": _StreamingSource(
+                [(0, ["s1"])], name="slow", wait_for=fast_done, finished=finished
+            ),
+            "fast": _StreamingSource(
+                [(0, ["f1", "f2"])], name="fast", finished=finished, done=fast_done
+            ),
+        }
+        config = CollectionConfig(sources=["slow", "fast"], source_timeout=5)
+        stats = CollectionStats()
+
+        with _patch_sources(sources):
+            result = await pipeline._collect_and_normalize(config, stats)
+
+        assert finished == ["fast", "slow"]
+        assert [raw.title for raw, _ in result] == ["s1", "f1", "f2"]
+        assert stats.source_counts == {"slow": 1, "fast": 2}
+        assert set(stats.source_latencies) == {"slow", "fast"}
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_partial_results(self, pipeline: TopicCollectionPipeline) -> None:
+        """A source past its deadline keeps batches that already arrived."""
+        sources = {"rss": _StreamingSource([(0, ["early"]), (1.0, ["late"])])}
+        config = CollectionConfig(sources=["rss"], source_timeout=0.05)
+        stats = CollectionStats()
+
+        with _patch_sources(sources):
+            result = await pipeline._collect_and_normalize(config, stats)
+
+        assert [raw.title for raw, _ in result] == ["early"]
+        assert stats.timed_out_sources == ["rss"]
+        assert "timed out" in stats.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_timeout_discards_partial_results_when_disabled(
+        self, pipeline: TopicCollectionPipeline
+    ) -> None:
+        """Without the partial-results policy a timed-out source contributes nothing."""
+        sources = {"rss": _StreamingSource([(0, ["early"]), (1.0, ["late"])])}
+        config = CollectionConfig(sources=["rss"], source_timeout=0.05, keep_partial_results=False)
+        stats = CollectionStats()
+
+        with _patch_sources(sources):
+            result = await pipeline._collect_and_normalize(config, stats)
+
+        assert result == []
+        assert stats.source_counts == {"rss": 0}
+
+    @pytest.mark.asyncio
+    async def test_per_source_timeout_override(self, pipeline: TopicCollectionPipeline) -> None:
+        """timeout_seconds in source overrides replaces the default deadline."""
+        sources = {"reddit": _StreamingSource([(0.1, ["post"])])}
+        config = CollectionConfig(
+            sources=["reddit"],
+            source_timeout=0.01,
+            source_overrides={"reddit": {"timeout_seconds": 5}},
+        )
+        stats = CollectionStats()
+
+        with _patch_sources(sources):
+            result = await pipeline._collect_and_normalize(config, stats)
+
+        assert [raw.title for raw, _ in result] == ["post"]
+        assert stats.timed_out_sources == []
+
+    @pytest.mark.asyncio
+    async def test_normalization_starts_before_slow_source_finishes(
+        self, pipeline: TopicCollectionPipeline
+    ) -> None:
+        """Full chunks are normalized while slower sources are still collecting."""
+        normalized = asyncio.Event()
+        events: list[str] = []
+        original = pipeline.normalizer.normalize_batch.side_effect
+
+        async def record(items: list, target_language: str) -> list:
+            events.append("normalized")
+            normalized.set()
+            return await original(items, target_language)
+
+        pipeline.normalizer.normalize_batch.side_effect = record
+        # The slow source only finishes once a chunk has been normalized
+        sources = {
+            "fast": _StreamingSource([(0, ["f1", "f2"])]),
+            "slow": _StreamingSource(
+                [(0, ["s1"])], name="slow", wait_for=normalized, finished=events
+            ),
+        }
+        config = CollectionConfig(sources=["slow", "fast"], source_timeout=5)
+        stats = CollectionStats()
+
+        with _patch_sources(sources):
+            result = await pipeline._collect_and_normalize(config, stats)
+
+        assert events[:2] == ["normalized", "slow"]
+        assert [raw.title for raw, _ in result] == ["s1", "f1", "f2"]
+        assert stats.total_collected == 3
+
+
+class TestRankTopics:
+    """Tests for scoring and top-K selection before saving."""
+
+    @pytest.mark.asyncio
+    async def test_saves_best_topics_first_with_scores(self) -> None:
+        """Only the top max_topics are saved, best first, with their scores."""
+        session = AsyncMock()
+        session.add = MagicMock()
+        pipeline = TopicCollectionPipeline(
+            session=session, http_client=MagicMock(), normalizer=MagicMock()
+        )
+        now = datetime.now(UTC)
+        topics = [
+            (
+                _make_raw_topic(title=f"Topic {age}", metrics={"score": 100}),
+                _make_normalized_topic(
+                    title_normalized=f"topic {age}", published_at=now - timedelta(hours=age)
+                ),
+            )
+            for age in (48, 1, 12, 200)
+        ]
+        config = CollectionConfig(sources=["reddit"], max_topics=2)
+        stats = CollectionStats()
+
+        ranked, scores = pipeline._rank_topics(topics, config, stats)
+        saved = await pipeline._save_topics(
+            MagicMock(id=uuid.uuid4()), ranked, config.max_topics, scores=scores
+        )
+
+        assert [t.title_normalized for t in saved] == ["topic 1", "topic 12"]
+        assert saved[0].score_total >= saved[1].score_total > 0
+        assert saved[0].score_total == stats.top_score
+        assert 0 < saved[0].score_freshness <= 1
+
+    def test_unscored_topic_defaults_to_zero(self) -> None:
+        """Topics created without scores keep zero score fields."""
+        pipeline = TopicCollectionPipeline(
+            session=MagicMock(), http_client=MagicMock(), normalizer=MagicMock()
+        )
+
+        topic = pipeline._create_topic_model(
+            MagicMock(id=uuid.uuid4()), _make_raw_topic(), _make_normalized_topic()
+        )
+
+        assert topic.score_total == 0
+        assert topic.score_relevance == 0.0
+
+    @pytest.mark.asyncio
+    async def test_raw_topics_tagged_with_source_name(self) -> None:
+        """Collected topics carry the configured source name for scoring."""
+        pipeline = TopicCollectionPipeline(
+            session=AsyncMock(), http_client=MagicMock(), normalizer=_fake_normalizer()
+        )
+        sources = {"hn_rss": _StreamingSource([(0, ["story"])])}
+        config = CollectionConfig(sources=["hn_rss"], source_timeout=5)
+
+        with _patch_sources(sources):
+            result = await pipeline._collect_and_normalize(config, CollectionStats())
+
+        raw, _ = result[0]
+        assert raw.metadata[SOURCE_KEY] == "hn_rss"
+
+
+class TestNearDuplicateMerge:
+    """Tests for merging near-duplicate reports before scoring."""
+
+    @staticmethod
+    def _pair(title: str, source: str) -> tuple[RawTopic, NormalizedTopic]:
+        return (
+            _make_raw_topic(title=title, metadata={SOURCE_KEY: source}),
+            _make_normalized_topic(title_normalized=title, terms=[]),
+        )
+
+    @pytest.mark.asyncio
+    async def test_merged_story_scores_multi_source_bonus(self) -> None:
+        """One report per story is kept and scored with its cluster's sources."""
+        pipeline = TopicCollectionPipeline(
+            session=AsyncMock(),
+            http_client=MagicMock(),
+            normalizer=MagicMock(),
+            near_duplicates=NearDuplicateDetector(num_perm=128, bands=32, threshold=0.5),
+        )
+        topics = [
+            self._pair("OpenAI releases GPT-5 reasoning model", "reddit"),
+            self._pair("OpenAI releases new GPT-5 reasoning model", "hn_rss"),
+            self._pair("Samsung unveils foldable phone", "reddit"),
+        ]
+        stats = CollectionStats()
+
+        merged, clusters = await pipeline._merge_near_duplicates(topics, uuid.uuid4(), stats)
+        ranked, scores = pipeline._rank_topics(
+            merged, CollectionConfig(sources=["reddit", "hn_rss"]), stats, clusters
+        )
+
+        assert merged == [topics[0], topics[2]]
+        assert stats.near_duplicate_count == 1
+        assert ranked[0][0] is topics[0][0]
+        assert scores[0]["score_trend"] > scores[1]["score_trend"]
+
+    @pytest.mark.asyncio
+    async def test_without_detector_topics_pass_through(self) -> None:
+        """Without a detector only exact hash deduplication applies."""
+        pipeline = TopicCollectionPipeline(
+            session=AsyncMock(), http_client=MagicMock(), normalizer=MagicMock()
+        )
+        topics = [self._pair("same", "reddit"), self._pair("same", "hn_rss")]
+
+        merged, clusters = await pipeline._merge_near_duplicates(
+            topics, uuid.uuid4(), CollectionStats()
+        )
+
+        assert merged == topics
+        assert clusters == {}
+
+
+class TestSeriesAssignment:
+    """Tests for series detection during scoring and saving."""
+
+    @staticmethod
+    def _series_index(avg_views: float = 1000.0) -> SeriesIndex:
+        index = SeriesIndex(uuid.uuid4(), min_similarity=0.5, max_keywords=5)
+        index.add_series(
+            Series(
+                id=uuid.uuid4(),
+                name="AI",
+                term_counts={"ai": 3},
+                min_similarity=0.5,
+                episode_count=3,
+                measured_episodes=3,
+                avg_views=avg_views,
+                auto_detected=True,
+                confirmed_by_user=False,
+            )
+        )
+        return index
+
+    @pytest.mark.asyncio
+    async def test_saved_topics_are_assigned_to_series(self) -> None:
+        """Topics matching a series get its ID when saved."""
+        session = AsyncMock()
+        session.add = MagicMock()
+        session.add_all = MagicMock()
+        pipeline = TopicCollectionPipeline(
+            session=session, http_client=MagicMock(), normalizer=MagicMock()
+        )
+        topics = [
+            (_make_raw_topic(), _make_normalized_topic(terms=["AI"])),
+            (_make_raw_topic(), _make_normalized_topic(terms=["weather"])),
+        ]
+        index = self._series_index()
+
+        saved = await pipeline._save_topics(
+            MagicMock(id=uuid.uuid4()), topics, 10, series_index=index
+        )
+
+        assert saved[0].series_id is not None
+        assert saved[1].series_id is None
+
+    def test_series_performance_raises_relevance(self) -> None:
+        """Topics continuing a well-performing series score higher relevance."""
+        pipeline = TopicCollectionPipeline(
+            session=MagicMock(), http_client=MagicMock(), normalizer=MagicMock()
+        )
+        topics = [
+            (_make_raw_topic(), _make_normalized_topic(title_normalized="a", terms=["weather"])),
+            (_make_raw_topic(), _make_normalized_topic(title_normalized="b", terms=["ai"])),
+        ]
+
+        ranked, scores = pipeline._rank_topics(
+            topics,
+            CollectionConfig(sources=["reddit"]),
+            CollectionStats(),
+            series_index=self._series_index(),
+        )
+
+        assert ranked[0] is topics[1]
+        assert scores[0]["score_relevance"] > scores[1]["score_relevance"]
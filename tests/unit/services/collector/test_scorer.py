@@ -0,0 +1,209 @@
+"""Unit tests for vectorized topic scoring."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import numpy as np
+import pytest
+
+from app.services.collector.base import NormalizedTopic, RawTopic
+from app.services.collector.scorer import SOURCE_KEY, ScoreBatch, TopicScorer
+
+NOW = datetime(2026, 10, 16, 12, tzinfo=UTC)
+
+SCORING: dict[str, Any] = {
+    "source_credibility_scale": 10.0,
+    "default_source_score": 0.5,
+    "freshness_decay_base": 2.0,
+    "freshness_half_life_hours": 24,
+    "relevance_saturation": 2,
+    "multi_source_bonuses": {2: 0.1, 3: 0.2, 4: 0.3},
+    "series_performance": {
+        "high_threshold": 0.8,
+        "high_bonus": 0.3,
+        "medium_threshold": 0.5,
+        "medium_bonus": 0.15,
+        "low_bonus": 0.05,
+    },
+    "weights": {"source": 0.25, "freshness": 0.25, "trend": 0.25, "relevance": 0.25},
+}
+
+
+def _topic(
+    title: str = "test title",
+    source: str = "reddit",
+    age_hours: float | None = 0.0,
+    metrics: dict[str, Any] | None = None,
+    terms: list[str] | None = None,
+) -> tuple[RawTopic, NormalizedTopic]:
+    published = NOW - timedelta(hours=age_hours) if age_hours is not None else None
+    raw = RawTopic(
+        source_id=str(uuid.uuid4()),
+        source_url="https://example.com/a",
+        title=title,
+        published_at=published,
+        metrics=metrics or {},
+        metadata={SOURCE_KEY: source},
+    )
+    norm = NormalizedTopic(
+        source_id=uuid.uuid4(),
+        source_url="https://example.com/a",
+        title_original=title,
+        title_normalized=title,
+        summary="",
+        terms=terms or [],
+        published_at=published,
+        content_hash="x",
+    )
+    return raw, norm
+
+
+def _scorer(**kwargs: Any) -> TopicScorer:
+    return TopicScorer(scoring=SCORING, **kwargs)
+
+
+class TestComponents:
+    """Tests for individual score components."""
+
+    def test_source_credibility_from_overrides(self) -> None:
+        """Credibility (1-10) is scaled; unknown sources get the default."""
+        scorer = _scorer(source_overrides={"reddit": {"credibility": 8}, "rss": {}})
+
+        batch = scorer.score([_topic(source="reddit"), _topic(source="rss")], now=NOW)
+
+        np.testing.assert_allclose(batch.source, [0.8, 0.5])
+
+    def test_freshness_halves_every_half_life(self) -> None:
+        """Freshness decays by the base per half-life; unknown age is one half-life."""
+        topics = [_topic(age_hours=0), _topic(age_hours=24), _topic(age_hours=48)]
+        topics.append(_topic(age_hours=None))
+
+        batch = _scorer().score(topics, now=NOW)
+
+        np.testing.assert_allclose(batch.freshness, [1.0, 0.5, 0.25, 0.5])
+
+    def test_trend_is_engagement_velocity_relative_to_batch(self) -> None:
+        """The fastest-growing topic scores 1; topics without engagement score 0."""
+        topics = [
+            _topic(title="a", age_hours=1, metrics={"score": 1000, "comments": 100}),
+            _topic(title="b", age_hours=10, metrics={"score": 1000, "comments": 100}),
+            _topic(title="c", age_hours=1, metrics={"trend_type": "daily"}),
+        ]
+
+        batch = _scorer().score(topics, now=NOW)
+
+        assert batch.trend[0] == pytest.approx(1.0)
+        assert 0 < batch.trend[1] < batch.trend[0]
+        assert batch.trend[2] == 0.0
+
+    def test_multi_source_bonus(self) -> None:
+        """Stories reported by several sources get the configured bonus."""
+        topics = [
+            _topic(title="Big  News", source="reddit"),
+            _topic(title="big news", source="hn_rss"),
+            _topic(title="big news", source="reddit"),
+            _topic(title="other", source="reddit"),
+        ]
+
+        batch = _scorer().score(topics, now=NOW)
+
+        np.testing.assert_allclose(batch.trend, [0.1, 0.1, 0.1, 0.0])
+
+    def test_multi_source_bonus_caps_at_last_level(self) -> None:
+        """Counts past the last configured level keep its bonus."""
+        topics = [_topic(title="x", source=f"s{i}") for i in range(6)]
+
+        batch = _scorer().score(topics, now=NOW)
+
+        np.testing.assert_allclose(batch.trend, 0.3)
+
+    def test_multi_source_bonus_from_cluster_counts(self) -> None:
+        """Explicit source counts (near-duplicate clusters) drive the bonus."""
+        topics = [_topic(title="a"), _topic(title="b"), _topic(title="c")]
+
+        batch = _scorer().score(topics, source_counts=[1, 3, 9], now=NOW)
+
+        np.testing.assert_allclose(batch.trend, [0.0, 0.2, 0.3])
+
+    def test_relevance_from_include_terms(self) -> None:
+        """Include-term matches raise relevance up to saturation."""
+        scorer = _scorer(include=["AI", "chip", "robot"])
+        topics = [
+            _topic(title="new ai chip", terms=["robot"]),
+            _topic(title="ai news"),
+            _topic(title="weather"),
+        ]
+
+        batch = scorer.score(topics, now=NOW)
+
+        np.testing.assert_allclose(batch.relevance, [1.0, 0.5, 0.0])
+
+    def test_relevance_neutral_without_include_terms(self) -> None:
+        """Without include terms relevance is neutral."""
+        batch = _scorer().score([_topic()], now=NOW)
+
+        np.testing.assert_allclose(batch.relevance, [0.5])
+
+    def test_series_bonus_tiers(self) -> None:
+        """Series performance adds a tiered relevance bonus."""
+        scorer = _scorer(include=["x"])
+        topics = [_topic(title="x") for _ in range(4)]
+
+        batch = scorer.score(topics, series_performance=[0.9, 0.6, 0.1, None], now=NOW)
+
+        np.testing.assert_allclose(batch.relevance, [0.8, 0.65, 0.55, 0.5])
+
+
+class TestTotal:
+    """Tests for the weighted total and top-K selection."""
+
+    def test_total_is_weighted_sum(self) -> None:
+        """score_total is the weighted component sum on a 0-100 scale."""
+        batch = _scorer().score([_topic(age_hours=24)], now=NOW)
+
+        # source 0.5, freshness 0.5, trend 0, relevance 0.5 at equal weights
+        assert batch.total.tolist() == [38]
+        assert batch.components(0)["score_total"] == 38
+
+    def test_empty_batch(self) -> None:
+        """An empty batch scores to empty arrays."""
+        batch = _scorer().score([], now=NOW)
+
+        assert len(batch) == 0
+        assert batch.top_k(5) == []
+
+    def test_top_k_partial_sort(self) -> None:
+        """top_k returns the best k, best first, ties in input order."""
+        empty = np.zeros(6)
+        batch = ScoreBatch(
+            source=empty,
+            freshness=empty,
+            trend=empty,
+            relevance=empty,
+            total=np.array([10, 90, 40, 90, 5, 70]),
+        )
+
+        assert batch.top_k(3) == [1, 3, 5]
+        assert batch.top_k(10) == [1, 3, 5, 2, 0, 4]
+        assert batch.top_k(0) == []
+
+    def test_top_k_ties_at_cutoff_keep_input_order(self) -> None:
+        """Among ties at the cutoff, the earliest topics are selected."""
+        size = 200
+        empty = np.zeros(size)
+        total = np.full(size, 50)
+        total[[150, 7]] = 80
+        batch = ScoreBatch(source=empty, freshness=empty, trend=empty, relevance=empty, total=total)
+
+        assert batch.top_k(5) == [7, 150, 0, 1, 2]
+        assert batch.top_k(1) == [7]
+
+    def test_weights_are_normalized(self) -> None:
+        """Weights that do not sum to 1 are normalized."""
+        scoring = {**SCORING, "weights": {"source": 2, "freshness": 2, "trend": 0, "relevance": 0}}
+        scorer = TopicScorer(scoring=scoring)
+
+        batch = scorer.score([_topic(age_hours=0)], now=NOW)
+
+        assert batch.total.tolist() == [75]
@@ -0,0 +1,246 @@
+"""Unit tests for incremental series detection."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.series import Series
+from app.models.topic import Topic
+from app.services.collector import series_detector
+from app.services.collector.series_detector import (
+    SeriesDetector,
+    SeriesIndex,
+    record_episode_performance,
+)
+
+CHANNEL_ID = uuid.uuid4()
+
+
+def _index(min_similarity: float = 0.5) -> SeriesIndex:
+    return SeriesIndex(CHANNEL_ID, min_similarity=min_similarity, max_keywords=3)
+
+
+def _topic(*terms: str) -> Topic:
+    return Topic(id=uuid.uuid4(), channel_id=CHANNEL_ID, terms=list(terms))
+
+
+def _series(**kwargs: object) -> Series:
+    defaults: dict = {
+        "id": uuid.uuid4(),
+        "channel_id": CHANNEL_ID,
+        "name": "series",
+        "min_similarity": 0.5,
+        "episode_count": 0,
+        "measured_episodes": 0,
+        "avg_views": 0.0,
+        "avg_engagement": 0.0,
+        "recent_engagement": 0.0,
+        "auto_detected": True,
+        "confirmed_by_user": False,
+    }
+    defaults.update(kwargs)
+    return Series(**defaults)
+
+
+class TestSeriesIndex:
+    """Tests for clustering topics into series."""
+
+    def test_similar_topics_start_a_series(self) -> None:
+        """A topic matching an unassigned topic creates a series of both."""
+        index = _index()
+        first = _topic("AI", "OpenAI", "GPT")
+        second = _topic("ai", "openai", "chatgpt")
+
+        assert index.assign(first) is None
+        series = index.assign(second)
+
+        assert series is not None
+        assert first.series_id == second.series_id == series.id
+        assert series.episode_count == 2
+        assert series.term_counts == {"ai": 2, "openai": 2, "gpt": 1, "chatgpt": 1}
+        assert series.criteria_keywords == ["ai", "openai", "chatgpt"]
+        assert series.name == "ai · openai · chatgpt"
+        assert series.auto_detected
+
+    def test_topics_join_existing_series(self) -> None:
+        """Matching topics are added to a series and its counts updated."""
+        index = _index()
+        series = _series(term_counts={"ai": 3, "openai": 2, "gpt": 1}, episode_count=3)
+        index.add_series(series)
+
+        topic = _topic("ai", "openai")
+        assert index.assign(topic) is series
+
+        assert topic.series_id == series.id
+        assert series.episode_count == 4
+        assert series.term_counts["ai"] == 4
+
+    def test_unrelated_topic_stays_unassigned(self) -> None:
+        """Topics below the similarity threshold only become candidates."""
+        index = _index()
+        index.assign(_topic("ai", "openai", "gpt"))
+        topic = _topic("samsung", "galaxy", "ai")
+
+        assert index.assign(topic) is None
+        assert topic.series_id is None
+        assert index.candidate_count == 2
+
+    def test_confirmed_series_keeps_its_name(self) -> None:
+        """User-confirmed series are not renamed as terms shift."""
+        index = _index()
+        series = _series(name="AI 뉴스", confirmed_by_user=True, criteria_keywords=["ai"])
+        index.add_series(series)
+
+        index.assign(_topic("ai"))
+
+        assert series.name == "AI 뉴스"
+
+    def test_series_without_term_counts_use_criteria_keywords(self) -> None:
+        """Hand-made series match on their criteria keywords."""
+        index = _index()
+        series = _series(term_counts={}, criteria_keywords=["Bitcoin", "crypto"])
+        index.add_series(series)
+
+        assert index.match(["bitcoin", "crypto"]) == (series, pytest.approx(1.0))
+
+    def test_only_clusters_sharing_a_term_are_compared(self) -> None:
+        """The inverted index limits comparisons to candidate clusters."""
+        index = _index()
+        for i in range(100):
+            index.add_series(_series(term_counts={f"term{i}": 1, f"other{i}": 1}))
+
+        with patch.object(
+            series_detector._Cluster,
+            "similarity",
+            autospec=True,
+            side_effect=series_detector._Cluster.similarity,
+        ) as similarity:
+            index.match(["term7", "unrelated"])
+
+        assert similarity.call_count == 1
+
+    def test_performance_relative_to_best_series(self) -> None:
+        """Series performance is scaled by the channel's best measured series."""
+        index = _index()
+        index.add_series(
+            _series(term_counts={"ai": 1}, measured_episodes=2, avg_views=500.0),
+        )
+        index.add_series(
+            _series(term_counts={"crypto": 1}, measured_episodes=1, avg_views=2000.0),
+        )
+        index.add_series(_series(term_counts={"games": 1}))
+
+        assert index.performance(["ai"]) == pytest.approx(0.25)
+        assert index.performance(["crypto"]) == pytest.approx(1.0)
+        assert index.performance(["games"]) is None  # Not measured yet
+        assert index.performance(["weather"]) is None
+
+    @pytest.mark.asyncio
+    async def test_persist_assigns_stored_candidates(self) -> None:
+        """Candidates loaded from the DB are updated when they start a series."""
+        index = _index()
+        stored_id = uuid.uuid4()
+        index.add_candidate(stored_id, ["ai", "openai"])
+        session = MagicMock()
+        session.flush = AsyncMock()
+        session.execute = AsyncMock()
+
+        series = index.assign(_topic("ai", "openai"))
+        await index.persist(session)
+
+        assert series is not None
+        session.add_all.assert_called_once_with([series])
+        session.flush.assert_awaited_once()
+        statement = session.execute.await_args.args[0]
+        assert statement.compile().params["series_id"] == series.id
+
+
+class TestSeriesDetector:
+    """Tests for loading a channel's index."""
+
+    @pytest.mark.asyncio
+    async def test_load_index(self) -> None:
+        """Active series and recent unassigned topics are indexed."""
+        series = _series(term_counts={"ai": 2})
+        series_result = MagicMock()
+        series_result.scalars.return_value.all.return_value = [series]
+        topic_result = MagicMock()
+        topic_result.all.return_value = [(uuid.uuid4(), ["crypto"]), (uuid.uuid4(), None)]
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=[series_result, topic_result])
+
+        index = await SeriesDetector(min_similarity=0.5).load_index(session, CHANNEL_ID)
+
+        assert index.series_count == 1
+        assert index.candidate_count == 2
+        assert index.match(["ai"])[0] is series
+
+
+class TestRecordEpisodePerformance:
+    """Tests for incremental series aggregates."""
+
+    def test_first_measurements_average(self) -> None:
+        """New episodes are added to the running averages."""
+        series = _series()
+
+        record_episode_performance(series, uuid.uuid4(), 1000, 0.04, smoothing=0.5, tolerance=0.1)
+        record_episode_performance(series, uuid.uuid4(), 3000, 0.06, smoothing=0.5, tolerance=0.1)
+
+        assert series.measured_episodes == 2
+        assert len(series.measured_uploads) == 2
+        assert series.avg_views == pytest.approx(2000)
+        assert series.avg_engagement == pytest.approx(0.05)
+        assert series.recent_engagement == pytest.approx(0.05)
+        assert series.trend == "stable"
+
+    def test_resync_replaces_previous_values(self) -> None:
+        """Re-syncing an episode replaces its earlier metrics."""
+        upload_id = uuid.uuid4()
+        series = _series(
+            measured_episodes=2,
+            measured_uploads=[str(uuid.uuid4()), str(upload_id)],
+            avg_views=2000.0,
+            avg_engagement=0.05,
+        )
+
+        record_episode_performance(series, upload_id, 5000, 0.05, previous=(3000, 0.05))
+
+        assert series.measured_episodes == 2
+        assert series.avg_views == pytest.approx(3000)
+
+    def test_measured_before_promotion_is_added(self) -> None:
+        """An episode measured before it joined the series is added on re-sync."""
+        empty = _series()
+        record_episode_performance(empty, uuid.uuid4(), 500, 0.02, previous=(300, 0.01))
+
+        assert empty.measured_episodes == 1
+        assert empty.avg_views == pytest.approx(500)
+        assert empty.avg_engagement == pytest.approx(0.02)
+
+        series = _series(
+            measured_episodes=1,
+            measured_uploads=[str(uuid.uuid4())],
+            avg_views=1000.0,
+            avg_engagement=0.04,
+        )
+        record_episode_performance(series, uuid.uuid4(), 3000, 0.06, previous=(2000, 0.05))
+
+        assert series.measured_episodes == 2
+        assert series.avg_views == pytest.approx(2000)
+        assert series.avg_engagement == pytest.approx(0.05)
+
+    def test_trend_follows_recent_engagement(self) -> None:
+        """Recent engagement above or below the average sets the trend."""
+        rising = _series(
+            measured_episodes=4, avg_views=1000.0, avg_engagement=0.05, recent_engagement=0.05
+        )
+        falling = _series(
+            measured_episodes=4, avg_views=1000.0, avg_engagement=0.05, recent_engagement=0.05
+        )
+
+        record_episode_performance(rising, uuid.uuid4(), 1000, 0.15, smoothing=0.5, tolerance=0.1)
+        record_episode_performance(falling, uuid.uuid4(), 1000, 0.0, smoothing=0.5, tolerance=0.1)
+
+        assert rising.trend == "up"
+        assert falling.trend == "down"
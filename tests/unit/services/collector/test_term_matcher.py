@@ -0,0 +1,55 @@
+"""Unit tests for the Aho-Corasick term matcher."""
+
+import random
+
+from app.services.collector.term_matcher import TermMatcher
+
+
+class TestSubstringMode:
+    """Tests for matching terms anywhere."""
+
+    def test_overlapping_terms(self):
+        """Overlapping and nested terms are all found in one pass."""
+        matcher = TermMatcher(["he", "she", "his", "hers"])
+
+        assert list(matcher.iter_matches("ushers")) == [("she", 1), ("he", 2), ("hers", 2)]
+
+    def test_find_all_distinct_in_order(self):
+        """Each term is reported once, in order of first occurrence."""
+        matcher = TermMatcher(["ai", "chip", "ai"])
+
+        assert matcher.find_all("chip ai chip ai") == ["chip", "ai"]
+        assert len(matcher) == 2
+
+    def test_no_terms(self):
+        """A matcher without terms finds nothing."""
+        assert TermMatcher(["", ""]).find_all("anything") == []
+
+    def test_same_as_naive_substring_search(self):
+        """Results agree with checking every term with ``in``."""
+        rng = random.Random(3)
+        alphabet = "ab가나 "
+        terms = ["".join(rng.choices(alphabet, k=rng.randint(1, 4))) for _ in range(300)]
+        matcher = TermMatcher(terms)
+
+        for _ in range(100):
+            text = "".join(rng.choices(alphabet, k=40))
+            assert set(matcher.find_all(text)) == {t for t in terms if t and t in text}
+
+
+class TestBoundaryModes:
+    """Tests for word and Hangul-aware matching."""
+
+    def test_word_mode(self):
+        """Terms must not be part of longer words."""
+        matcher = TermMatcher(["ai", "c++"], mode="word")
+
+        assert matcher.find_all("openai ai-driven c++17") == ["ai", "c++"]
+        assert matcher.find_all("ai가 said") == []
+
+    def test_hangul_mode(self):
+        """Terms may be followed by Hangul (particles), not by other letters."""
+        matcher = TermMatcher(["ai", "삼성"], mode="hangul")
+
+        assert matcher.find_all("삼성이 ai가") == ["삼성", "ai"]
+        assert matcher.find_all("openai aix 갤럭시삼성") == []
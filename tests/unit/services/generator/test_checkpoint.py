@@ -0,0 +1,238 @@
+"""Tests for generation stage checkpoints."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.models.generation_job import GenerationStage
+from app.services.generator.checkpoint import (
+    StageCheckpointer,
+    dump_composition,
+    dump_optional_path,
+    dump_scene_tts,
+    dump_scene_visuals,
+    dump_tts_result,
+    file_sha256,
+    load_composition,
+    load_optional_path,
+    load_scene_tts,
+    load_scene_visuals,
+    load_tts_result,
+)
+from app.services.generator.remotion_compositor import CompositionResult
+from app.services.generator.tts.base import SceneTTSResult, TTSResult, WordTimestamp
+from app.services.generator.visual.base import VisualAsset, VisualSourceType
+from app.services.generator.visual.manager import SceneVisualResult
+
+
+def _write(path: Path, content: bytes = b"data") -> Path:
+    path.write_bytes(content)
+    return path
+
+
+def _path_stage(path: Path) -> tuple[dict[str, Path], dict[str, Any]]:
+    return {"file": path}, {}
+
+
+def _load_path(checkpoint: dict[str, Any]) -> Path:
+    return Path(checkpoint["artifacts"]["file"]["path"])
+
+
+class TestStageCheckpointer:
+    """Tests for StageCheckpointer."""
+
+    @pytest.mark.asyncio
+    async def test_records_checksum_and_persists(self, tmp_path: Path) -> None:
+        """Completed stages are recorded with checksums and persisted."""
+        audio = _write(tmp_path / "a.mp3", b"audio")
+        persist = AsyncMock()
+        checkpointer = StageCheckpointer(persist=persist)
+
+        compute = AsyncMock(return_value=audio)
+        result = await checkpointer.run(GenerationStage.CONCAT, compute, _path_stage, _load_path)
+
+        assert result == audio
+        artifact = checkpointer.checkpoints["concat"]["artifacts"]["file"]
+        assert artifact == {"path": str(audio), "sha256": file_sha256(audio), "size": 5}
+        persist.assert_awaited_once_with(checkpointer.checkpoints)
+
+    @pytest.mark.asyncio
+    async def test_restores_intact_stage(self, tmp_path: Path) -> None:
+        """A stage with intact artifacts is restored instead of recomputed."""
+        audio = _write(tmp_path / "a.mp3")
+        first = StageCheckpointer()
+        await first.record(GenerationStage.CONCAT, {"file": audio})
+
+        second = StageCheckpointer(first.checkpoints)
+        compute = AsyncMock()
+        result = await second.run(GenerationStage.CONCAT, compute, _path_stage, _load_path)
+
+        assert result == audio
+        compute.assert_not_called()
+        assert second.restored == [GenerationStage.CONCAT]
+
+    @pytest.mark.asyncio
+    async def test_recomputes_when_artifact_changed(self, tmp_path: Path) -> None:
+        """A modified or missing artifact forces the stage to run again."""
+        audio = _write(tmp_path / "a.mp3", b"original")
+        first = StageCheckpointer()
+        await first.record(GenerationStage.CONCAT, {"file": audio})
+        _write(audio, b"tampered")
+
+        second = StageCheckpointer(first.checkpoints)
+        compute = AsyncMock(return_value=audio)
+        await second.run(GenerationStage.CONCAT, compute, _path_stage, _load_path)
+
+        compute.assert_awaited_once()
+        assert second.checkpoints["concat"]["artifacts"]["file"]["sha256"] == file_sha256(audio)
+
+    @pytest.mark.asyncio
+    async def test_later_stages_recomputed_after_rerun(self, tmp_path: Path) -> None:
+        """Once a stage reruns, later checkpoints are discarded and rerun too."""
+        audio = _write(tmp_path / "a.mp3")
+        video = _write(tmp_path / "v.mp4")
+        first = StageCheckpointer()
+        await first.record(GenerationStage.CONCAT, {"file": audio})
+        await first.record(GenerationStage.COMPOSE, {"file": video})
+        audio.unlink()
+
+        second = StageCheckpointer(first.checkpoints)
+        _write(audio, b"re-synthesized")
+        await second.run(
+            GenerationStage.CONCAT, AsyncMock(return_value=audio), _path_stage, _load_path
+        )
+        assert "compose" not in second.checkpoints
+
+        compose = AsyncMock(return_value=video)
+        await second.run(GenerationStage.COMPOSE, compose, _path_stage, _load_path)
+        compose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_compute_records_nothing(self, tmp_path: Path) -> None:
+        """A stage that raises is not checkpointed."""
+        persist = AsyncMock()
+        checkpointer = StageCheckpointer(persist=persist)
+
+        with pytest.raises(RuntimeError):
+            await checkpointer.run(
+                GenerationStage.TTS,
+                AsyncMock(side_effect=RuntimeError("tts down")),
+                _path_stage,
+                _load_path,
+            )
+
+        assert checkpointer.checkpoints == {}
+        persist.assert_not_called()
+
+
+class TestStageSerialization:
+    """Round trips of stage results through checkpoints."""
+
+    async def _round_trip(self, stage: GenerationStage, result: Any, dump: Any, load: Any) -> Any:
+        writer = StageCheckpointer()
+        artifacts, data = dump(result)
+        await writer.record(stage, artifacts, data)
+        reader = StageCheckpointer(writer.checkpoints)
+        return await reader.run(stage, AsyncMock(), dump, load)
+
+    @pytest.mark.asyncio
+    async def test_scene_tts(self, tmp_path: Path) -> None:
+        """Per-scene TTS results keep paths, durations and timestamps."""
+        results = [
+            SceneTTSResult(
+                scene_index=0,
+                scene_type="hook",
+                audio_path=_write(tmp_path / "s0.mp3"),
+                duration_seconds=1.5,
+                word_timestamps=[WordTimestamp(word="안녕", start=0.0, end=0.4)],
+            ),
+            SceneTTSResult(
+                scene_index=1,
+                scene_type="content",
+                audio_path=_write(tmp_path / "s1.mp3"),
+                duration_seconds=2.0,
+                start_offset=1.5,
+            ),
+        ]
+
+        restored = await self._round_trip(
+            GenerationStage.TTS, results, dump_scene_tts, load_scene_tts
+        )
+
+        assert restored == results
+
+    @pytest.mark.asyncio
+    async def test_combined_audio(self, tmp_path: Path) -> None:
+        """The combined TTS result survives a round trip."""
+        result = TTSResult(
+            audio_path=_write(tmp_path / "audio.mp3"),
+            duration_seconds=3.5,
+            word_timestamps=[WordTimestamp(word="a", start=0.0, end=0.1)],
+        )
+
+        restored = await self._round_trip(
+            GenerationStage.CONCAT, result, dump_tts_result, load_tts_result
+        )
+
+        assert restored == result
+
+    @pytest.mark.asyncio
+    async def test_scene_visuals_with_generated_asset(self, tmp_path: Path) -> None:
+        """File-backed and generated (file-less) visuals are both restored."""
+        results = [
+            SceneVisualResult(
+                scene_index=0,
+                scene_type="hook",
+                asset=VisualAsset(
+                    type=VisualSourceType.STOCK_VIDEO,
+                    path=_write(tmp_path / "clip.mp4"),
+                    source="pexels",
+                    source_id="42",
+                    keywords=["city"],
+                    metadata={"title": "City"},
+                ),
+                duration=1.5,
+                start_offset=0.0,
+            ),
+            SceneVisualResult(
+                scene_index=1,
+                scene_type="cta",
+                asset=VisualAsset(type=VisualSourceType.SOLID_COLOR, color="#000000"),
+                duration=2.0,
+                start_offset=1.5,
+            ),
+        ]
+
+        restored = await self._round_trip(
+            GenerationStage.VISUALS, results, dump_scene_visuals, load_scene_visuals
+        )
+
+        assert restored == results
+
+    @pytest.mark.asyncio
+    async def test_composition(self, tmp_path: Path) -> None:
+        """The composition result survives a round trip."""
+        result = CompositionResult(
+            video_path=_write(tmp_path / "video.mp4"),
+            duration_seconds=30.0,
+            file_size_bytes=4,
+            resolution="1080x1920",
+            fps=30,
+        )
+
+        restored = await self._round_trip(
+            GenerationStage.COMPOSE, result, dump_composition, load_composition
+        )
+
+        assert restored == result
+
+    @pytest.mark.asyncio
+    async def test_missing_subtitle_file(self) -> None:
+        """A stage that produced no file restores as None."""
+        restored = await self._round_trip(
+            GenerationStage.SUBTITLES, None, dump_optional_path, load_optional_path
+        )
+
+        assert restored is None
@@ -1,17 +1,70 @@
 """Tests for FFmpegWrapper."""
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
 from unittest.mock import MagicMock, patch
 
-import ffmpeg
 import pytest
 
 from app.services.generator.ffmpeg import (
     FFmpegError,
+    FFmpegProgress,
     FFmpegWrapper,
     ProbeResult,
 )
 
 
+class _FakeStream:
+    """Minimal asyncio StreamReader stand-in."""
+
+    def __init__(self, data: bytes, delay: float = 0.0) -> None:
+        self._data = data
+        self._delay = delay
+
+    async def read(self) -> bytes:
+        await asyncio.sleep(self._delay)
+        return self._data
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for line in self._data.splitlines(keepends=True):
+            await asyncio.sleep(self._delay)
+            yield line
+
+
+class _FakeProcess:
+    """Fake asyncio subprocess returning canned output."""
+
+    def __init__(
+        self,
+        returncode: int = 0,
+        stdout: bytes = b"",
+        stderr: bytes = b"",
+        delay: float = 0.0,
+    ) -> None:
+        self._final_returncode = returncode
+        self.returncode: int | None = None
+        self.stdout = _FakeStream(stdout)
+        self.stderr = _FakeStream(stderr, delay)
+        self.killed = False
+
+    async def wait(self) -> int:
+        self.returncode = -9 if self.killed else self._final_returncode
+        return self.returncode
+
+    def kill(self) -> None:
+        self.killed = True
+
+
+def _patch_subprocess(*processes: _FakeProcess) -> Any:
+    """Patch asyncio.create_subprocess_exec to return the given fake processes."""
+    return patch(
+        "app.services.generator.ffmpeg.asyncio.create_subprocess_exec",
+        side_effect=list(processes),
+    )
+
+
 class TestFFmpegError:
     """Tests for FFmpegError exception."""
 
@@ -138,7 +191,7 @@ class TestProbe:
             ],
         }
 
-        with patch("app.services.generator.ffmpeg.ffmpeg.probe", return_value=mock_probe_data):
+        with _patch_subprocess(_FakeProcess(stdout=json.dumps(mock_probe_data).encode())):
             result = await wrapper.probe("/path/to/video.mp4")
 
         assert result.duration == 120.5
@@ -163,7 +216,7 @@ class TestProbe:
             "streams": [{"codec_type": "audio"}],
         }
 
-        with patch("app.services.generator.ffmpeg.ffmpeg.probe", return_value=mock_probe_data):
+        with _patch_subprocess(_FakeProcess(stdout=json.dumps(mock_probe_data).encode())):
             result = await wrapper.probe("/path/to/audio.mp3")
 
         assert result.duration == 180.0
@@ -189,7 +242,7 @@ class TestProbe:
             ],
         }
 
-        with patch("app.services.generator.ffmpeg.ffmpeg.probe", return_value=mock_probe_data):
+        with _patch_subprocess(_FakeProcess(stdout=json.dumps(mock_probe_data).encode())):
             result = await wrapper.probe("/path/to/video.mp4")
 
         assert result.fps is not None
@@ -199,15 +252,29 @@ class TestProbe:
     @pytest.mark.asyncio
     async def test_probe_error(self, wrapper: FFmpegWrapper) -> None:
         """Test probe failure handling."""
-        mock_error = ffmpeg.Error("ffmpeg", b"", b"File not found")
+        process = _FakeProcess(returncode=1, stderr=b"/path/to/missing.mp4: No such file\n")
 
-        with (
-            patch("app.services.generator.ffmpeg.ffmpeg.probe", side_effect=mock_error),
-            pytest.raises(FFmpegError) as exc_info,
-        ):
+        with _patch_subprocess(process), pytest.raises(FFmpegError) as exc_info:
             await wrapper.probe("/path/to/missing.mp4")
 
         assert "Failed to probe" in str(exc_info.value)
+        assert exc_info.value.stderr == "/path/to/missing.mp4: No such file"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_probe_uses_ffprobe_json(self, wrapper: FFmpegWrapper) -> None:
+        """Test probe invokes ffprobe with JSON output."""
+        mock_probe_data = {"format": {"duration": "1.0"}, "streams": []}
+
+        with _patch_subprocess(
+            _FakeProcess(stdout=json.dumps(mock_probe_data).encode())
+        ) as mock_exec:
+            await wrapper.probe("/path/to/video.mp4")
+
+        args = mock_exec.call_args.args
+        assert args[0] == "ffprobe"
+        assert "json" in args
+        assert args[-1] == "/path/to/video.mp4"
 
 
 class TestGetDuration:
@@ -227,7 +294,7 @@ class TestGetDuration:
             "streams": [],
         }
 
-        with patch("app.services.generator.ffmpeg.ffmpeg.probe", return_value=mock_probe_data):
+        with _patch_subprocess(_FakeProcess(stdout=json.dumps(mock_probe_data).encode())):
             duration = await wrapper.get_duration("/path/to/video.mp4")
 
         assert duration == 45.5
@@ -595,41 +662,130 @@ class TestRun:
         """Create FFmpegWrapper instance."""
         return FFmpegWrapper()
 
+    @pytest.fixture
+    def mock_stream(self) -> MagicMock:
+        """Create a mock output stream."""
+        return MagicMock()
+
+    @pytest.fixture(autouse=True)
+    def mock_compile(self) -> Any:
+        """Compile any stream to a fixed command line."""
+        with patch(
+            "app.services.generator.ffmpeg.ffmpeg.compile",
+            return_value=["ffmpeg", "-i", "in.mp4", "out.mp4"],
+        ):
+            yield
+
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_run_success(self, wrapper: FFmpegWrapper) -> None:
-        """Test successful stream execution."""
-        mock_stream = MagicMock()
-        mock_stream.run = MagicMock()
+    async def test_run_success(self, wrapper: FFmpegWrapper, mock_stream: MagicMock) -> None:
+        """Test successful stream execution as a subprocess."""
+        with _patch_subprocess(_FakeProcess()) as mock_exec:
+            await wrapper.run(mock_stream)
 
-        await wrapper.run(mock_stream)
+        args = mock_exec.call_args.args
+        assert args[0] == "ffmpeg"
+        assert args[1:4] == ("-nostats", "-progress", "pipe:2")
+        assert args[-1] == "out.mp4"
+        assert wrapper.active_jobs == 0
 
-        mock_stream.run.assert_called_once_with(quiet=True, capture_stderr=True)
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_error(self, wrapper: FFmpegWrapper, mock_stream: MagicMock) -> None:
+        """Test stream execution error handling."""
+        process = _FakeProcess(returncode=1, stderr=b"frame=1\nEncoding failed\n")
+
+        with _patch_subprocess(process), pytest.raises(FFmpegError) as exc_info:
+            await wrapper.run(mock_stream)
+
+        assert "FFmpeg execution failed" in str(exc_info.value)
+        # Progress key/value lines are not part of the error output
+        assert exc_info.value.stderr == "Encoding failed"
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_run_verbose(self) -> None:
-        """Test verbose stream execution."""
-        wrapper = FFmpegWrapper(quiet=False)
-        mock_stream = MagicMock()
-        mock_stream.run = MagicMock()
+    async def test_run_missing_executable(
+        self, wrapper: FFmpegWrapper, mock_stream: MagicMock
+    ) -> None:
+        """Test missing ffmpeg binary raises FFmpegError."""
+        with (
+            patch(
+                "app.services.generator.ffmpeg.asyncio.create_subprocess_exec",
+                side_effect=FileNotFoundError("ffmpeg"),
+            ),
+            pytest.raises(FFmpegError, match="not found"),
+        ):
+            await wrapper.run(mock_stream)
 
-        await wrapper.run(mock_stream)
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_reports_progress(
+        self, wrapper: FFmpegWrapper, mock_stream: MagicMock
+    ) -> None:
+        """Test progress blocks are parsed and passed to the callback."""
+        stderr = (
+            b"frame=30\nfps=29.5\nout_time_us=1000000\nspeed=2.0x\nprogress=continue\n"
+            b"frame=60\nfps=30.0\nout_time_us=2000000\nspeed=N/A\nprogress=end\n"
+        )
+        reports: list[FFmpegProgress] = []
+
+        with _patch_subprocess(_FakeProcess(stderr=stderr)):
+            await wrapper.run(mock_stream, on_progress=reports.append)
 
-        mock_stream.run.assert_called_once_with()
+        assert len(reports) == 2
+        assert reports[0] == FFmpegProgress(
+            frame=30, fps=29.5, out_time_seconds=1.0, speed=2.0, is_final=False
+        )
+        assert reports[1].frame == 60
+        assert reports[1].speed is None
+        assert reports[1].is_final is True
 
     @pytest.mark.unit
     @pytest.mark.asyncio
-    async def test_run_error(self, wrapper: FFmpegWrapper) -> None:
-        """Test stream execution error handling."""
-        mock_stream = MagicMock()
-        mock_error = ffmpeg.Error("ffmpeg", b"", b"Encoding failed")
-        mock_stream.run = MagicMock(side_effect=mock_error)
+    async def test_run_timeout_kills_process(self, mock_stream: MagicMock) -> None:
+        """Test a job exceeding its timeout is killed."""
+        wrapper = FFmpegWrapper(timeout_seconds=0.05)
+        process = _FakeProcess(stderr=b"frame=1\n" * 100, delay=0.01)
 
-        with pytest.raises(FFmpegError) as exc_info:
+        with _patch_subprocess(process), pytest.raises(FFmpegError, match="timed out"):
             await wrapper.run(mock_stream)
 
-        assert "FFmpeg execution failed" in str(exc_info.value)
+        assert process.killed is True
+        assert wrapper.active_jobs == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_cancellation_kills_process(self, mock_stream: MagicMock) -> None:
+        """Test cancelling the awaiting task kills the FFmpeg process."""
+        wrapper = FFmpegWrapper(timeout_seconds=0)
+        process = _FakeProcess(stderr=b"frame=1\n" * 100, delay=0.01)
+
+        with _patch_subprocess(process):
+            task = asyncio.create_task(wrapper.run(mock_stream))
+            await asyncio.sleep(0.03)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert process.killed is True
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_bounded_worker_pool(self, mock_stream: MagicMock) -> None:
+        """Test no more than max_concurrent_jobs processes run at once."""
+        wrapper = FFmpegWrapper(max_concurrent_jobs=2)
+        peak = 0
+
+        def _track(_: FFmpegProgress) -> None:
+            nonlocal peak
+            peak = max(peak, wrapper.active_jobs)
+
+        processes = [_FakeProcess(stderr=b"frame=1\nprogress=end\n", delay=0.01) for _ in range(5)]
+        with _patch_subprocess(*processes):
+            await asyncio.gather(*(wrapper.run(mock_stream, on_progress=_track) for _ in range(5)))
+
+        assert peak == 2
+        assert wrapper.active_jobs == 0
 
 
 class TestGetCommand:
@@ -0,0 +1,258 @@
+"""Unit tests for FFmpegCompositor."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import ffmpeg
+import pytest
+
+from app.config.video import CompositionConfig
+from app.config.video_template import VideoTemplateConfig, VisualEffectsConfig
+from app.models.scene import Scene, SceneType, TransitionType
+from app.services.generator.ffmpeg import FFmpegError
+from app.services.generator.ffmpeg_compositor import FFmpegCompositor
+from app.services.generator.tts.base import SceneTTSResult
+from app.services.generator.visual.base import VisualAsset, VisualSourceType
+from app.services.generator.visual.manager import SceneVisualResult
+
+
+@pytest.fixture
+def ffmpeg_wrapper() -> MagicMock:
+    wrapper = MagicMock()
+    wrapper.overwrite = True
+    wrapper.run = AsyncMock()
+    return wrapper
+
+
+@pytest.fixture
+def compositor(ffmpeg_wrapper: MagicMock) -> FFmpegCompositor:
+    return FFmpegCompositor(
+        config=CompositionConfig(width=1080, height=1920, fps=30, background_music_volume=0.08),
+        ffmpeg_wrapper=ffmpeg_wrapper,
+        preset="veryfast",
+        fonts_dir=Path("/nonexistent"),
+    )
+
+
+@pytest.fixture
+def assets(tmp_path: Path) -> dict[str, Path]:
+    paths = {}
+    for name in ("image.png", "clip.mp4", "voice.mp3", "bgm.mp3", "subtitle.ass"):
+        paths[name] = tmp_path / name
+        paths[name].write_bytes(b"data")
+    return paths
+
+
+def _scenes() -> list[Scene]:
+    return [
+        Scene(scene_type=SceneType.HOOK, text="시작", visual_keyword="start"),
+        Scene(
+            scene_type=SceneType.CONTENT,
+            text="내용",
+            visual_keyword="content",
+            transition_in=TransitionType.SLIDE,
+        ),
+        Scene(scene_type=SceneType.CTA, text="구독", visual_keyword="cta"),
+    ]
+
+
+def _visuals(assets: dict[str, Path]) -> list[SceneVisualResult]:
+    return [
+        SceneVisualResult(
+            scene_index=0,
+            scene_type="hook",
+            asset=VisualAsset(type=VisualSourceType.STOCK_IMAGE, path=assets["image.png"]),
+            duration=2.0,
+            start_offset=0.0,
+        ),
+        SceneVisualResult(
+            scene_index=1,
+            scene_type="content",
+            asset=VisualAsset(type=VisualSourceType.STOCK_VIDEO, path=assets["clip.mp4"]),
+            duration=3.0,
+            start_offset=2.0,
+        ),
+        SceneVisualResult(
+            scene_index=2,
+            scene_type="cta",
+            asset=VisualAsset(type=VisualSourceType.SOLID_COLOR, color="#112233"),
+            duration=1.0,
+            start_offset=5.0,
+        ),
+    ]
+
+
+def _command(compositor: FFmpegCompositor, assets: dict[str, Path], **kwargs: object) -> list[str]:
+    options: dict = {
+        "scenes": _scenes(),
+        "scene_visuals": _visuals(assets),
+        "combined_audio_path": assets["voice.mp3"],
+        "subtitle_file": assets["subtitle.ass"],
+        "output_mp4": assets["image.png"].parent / "video.mp4",
+        "total_duration": 6.0,
+        "work_dir": assets["image.png"].parent,
+    }
+    options.update(kwargs)
+    return ffmpeg.compile(compositor.build_stream(**options))  # type: ignore[arg-type]
+
+
+def _filter_graph(command: list[str]) -> str:
+    return command[command.index("-filter_complex") + 1]
+
+
+class TestFilterGraph:
+    """Tests for the single-pass filter graph."""
+
+    def test_single_graph_with_one_input_per_asset(
+        self, compositor: FFmpegCompositor, assets: dict[str, Path]
+    ) -> None:
+        """All scenes, voice and BGM feed one filter graph."""
+        command = _command(compositor, assets, background_music_path=assets["bgm.mp3"])
+
+        assert command.count("-filter_complex") == 1
+        assert command.count("-i") == 5
+        assert command[command.index("-preset") + 1] == "veryfast"
+        assert command[command.index("-t") + 1] == "3.15"  # video input covers its transition
+
+    def test_transitions_start_at_scene_boundaries(
+        self, compositor: FFmpegCompositor, assets: dict[str, Path]
+    ) -> None:
+        """xfade offsets follow scene durations; scene transition_in wins."""
+        graph = _filter_graph(_command(compositor, assets))
+
+        assert "xfade=duration=0.15:offset=2.0:transition=slideleft" in graph
+        # Scene 2 keeps the default transition_in (fade)
+        assert "xfade=duration=0.15:offset=5.0:transition=fade" in graph
+
+    def test_scaling_and_ken_burns(
+        self, compositor: FFmpegCompositor, assets: dict[str, Path]
+    ) -> None:
+        """Images are cropped to fill the frame and zoomed; videos are not zoomed."""
+        graph = _filter_graph(_command(compositor, assets))
+
+        assert graph.count("force_original_aspect_ratio=increase") == 2
+        assert graph.count("zoompan=") == 1
+        assert "color=c=0x112233" not in graph  # lavfi sources are inputs, not filters
+
+    def test_static_images_without_ken_burns(
+        self, compositor: FFmpegCompositor, assets: dict[str, Path]
+    ) -> None:
+        """Disabling Ken Burns loops images instead of zooming them."""
+        template = VideoTemplateConfig(
+            name="plain",
+            visual_effects=VisualEffectsConfig(ken_burns_enabled=False, transition_type="none"),
+        )
+        command = _command(compositor, assets, video_template=template, scenes=[])
+        graph = _filter_graph(command)
+
+        assert "zoompan" not in graph
+        image_options = command[: command.index(str(assets["image.png"]))]
+        assert "-loop" in image_options
+        assert "-framerate" in image_options
+        # A cut is a one-frame fade
+        assert "xfade=duration=0.033:offset=2.0:transition=fade" in graph
+
+    def test_subtitles_and_headline(
+        self, compositor: FFmpegCompositor, assets: dict[str, Path], tmp_path: Path
+    ) -> None:
+        """ASS subtitles are burned in and headline lines are drawn from files."""
+        work_dir = tmp_path / "work"
+        work_dir.mkdir()
+        graph = _filter_graph(
+            _command(compositor, assets, headline="키워드\n설명 문장", work_dir=work_dir)
+        )
+
+        assert f"ass={assets['subtitle.ass']}" in graph
+        assert graph.count("drawtext=") == 2
+        assert (work_dir / "headline_line1.txt").read_text(encoding="utf-8") == "키워드"
+        assert (work_dir / "headline_line2.txt").read_text(encoding="utf-8") == "설명 문장"
+
+    def test_srt_subtitles_use_subtitles_filter(
+        self, compositor: FFmpegCompositor, assets: dict[str, Path], tmp_path: Path
+    ) -> None:
+        """Non-ASS subtitle files go through the generic subtitles filter."""
+        srt = tmp_path / "subtitle.srt"
+        srt.write_text("1\n")
+
+        graph = _filter_graph(_command(compositor, assets, subtitle_file=srt))
+
+        assert f"subtitles={srt}" in graph
+        assert "ass=" not in graph
+
+    def test_bgm_is_ducked_under_voice(
+        self, compositor: FFmpegCompositor, assets: dict[str, Path]
+    ) -> None:
+        """BGM is compressed by the voice sidechain and mixed without normalization."""
+        graph = _filter_graph(_command(compositor, assets, background_music_path=assets["bgm.mp3"]))
+
+        assert "asplit=2" in graph
+        assert "volume=0.08" in graph
+        assert "sidechaincompress=" in graph
+        assert "amix=duration=first:inputs=2:normalize=0" in graph
+
+    def test_voice_only_without_bgm(
+        self, compositor: FFmpegCompositor, assets: dict[str, Path]
+    ) -> None:
+        """Without BGM the voice track is mapped directly."""
+        command = _command(compositor, assets)
+
+        assert "sidechaincompress" not in _filter_graph(command)
+        assert "3:a" in command[command.index("-map", command.index("-map") + 1) + 1]
+
+
+class TestComposeScenes:
+    """Tests for compose_scenes."""
+
+    @pytest.mark.asyncio
+    async def test_runs_single_render(
+        self,
+        compositor: FFmpegCompositor,
+        ffmpeg_wrapper: MagicMock,
+        assets: dict[str, Path],
+        tmp_path: Path,
+    ) -> None:
+        """One FFmpeg run produces the video and its metadata."""
+
+        async def render(stream: object, **kwargs: object) -> None:
+            (tmp_path / "video.mp4").write_bytes(b"x" * 10)
+
+        ffmpeg_wrapper.run.side_effect = render
+        tts = [
+            SceneTTSResult(
+                scene_index=i,
+                scene_type="content",
+                audio_path=assets["voice.mp3"],
+                duration_seconds=d,
+            )
+            for i, d in enumerate((2.0, 3.0, 1.0))
+        ]
+
+        result = await compositor.compose_scenes(
+            scenes=_scenes(),
+            scene_tts_results=tts,
+            scene_visuals=_visuals(assets),
+            combined_audio_path=assets["voice.mp3"],
+            subtitle_file=assets["subtitle.ass"],
+            output_path=tmp_path / "video",
+        )
+
+        ffmpeg_wrapper.run.assert_awaited_once()
+        assert result.video_path == (tmp_path / "video.mp4").resolve()
+        assert result.duration_seconds == 6.0
+        assert result.file_size_bytes == 10
+        assert result.resolution == "1080x1920"
+
+    @pytest.mark.asyncio
+    async def test_missing_output_raises(
+        self, compositor: FFmpegCompositor, assets: dict[str, Path], tmp_path: Path
+    ) -> None:
+        """A render that writes nothing is an error."""
+        with pytest.raises(FFmpegError):
+            await compositor.compose_scenes(
+                scenes=_scenes(),
+                scene_tts_results=[],
+                scene_visuals=[],
+                combined_audio_path=assets["voice.mp3"],
+                subtitle_file=None,
+                output_path=tmp_path / "video",
+            )
@@ -0,0 +1,252 @@
+"""Database tests for GenerationJobQueue leasing."""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.exceptions import JobLeaseLostError
+from app.models.channel import Channel, ChannelStatus
+from app.models.generation_job import GenerationJob, JobStatus
+from app.models.script import Script
+from app.models.topic import Topic
+from app.services.generator.job_queue import GenerationJobQueue
+
+
+@pytest_asyncio.fixture
+async def session_factory(db_session: AsyncSession) -> async_sessionmaker[AsyncSession]:
+    """Session factory sharing the test transaction of ``db_session``."""
+    return async_sessionmaker(
+        bind=db_session.bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest_asyncio.fixture
+async def script(db_session: AsyncSession) -> Script:
+    """Script with its channel and topic persisted."""
+    channel = Channel(name="Queue Test", status=ChannelStatus.ACTIVE)
+    db_session.add(channel)
+    await db_session.flush()
+    topic = Topic(
+        channel_id=channel.id,
+        title_original="Queue topic",
+        title_normalized="queue topic",
+        summary="summary",
+        source_url="https://example.com/topic",
+        content_hash=uuid.uuid4().hex,
+        expires_at=datetime.now(tz=UTC) + timedelta(days=1),
+    )
+    db_session.add(topic)
+    await db_session.flush()
+    script = Script(
+        channel_id=channel.id,
+        topic_id=topic.id,
+        script_text="script",
+        estimated_duration=30,
+        word_count=1,
+        generation_model="test",
+    )
+    db_session.add(script)
+    await db_session.commit()
+    return script
+
+
+def _queue(session_factory: async_sessionmaker[AsyncSession], worker_id: str) -> GenerationJobQueue:
+    return GenerationJobQueue(
+        session_factory, lease_seconds=60, max_attempts=2, worker_id=worker_id
+    )
+
+
+async def _reload(db_session: AsyncSession, job_id: uuid.UUID) -> GenerationJob:
+    job = await db_session.get(GenerationJob, job_id, populate_existing=True)
+    assert job is not None
+    return job
+
+
+async def _expire_lease(db_session: AsyncSession, job_id: uuid.UUID) -> None:
+    await db_session.execute(
+        update(GenerationJob)
+        .where(GenerationJob.id == job_id)
+        .values(locked_until=datetime.now(tz=UTC) - timedelta(seconds=1))
+    )
+    await db_session.commit()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGenerationJobQueue:
+    """Lease lifecycle against a real database."""
+
+    async def test_claim_leases_job_once(self, db_session, session_factory, script):
+        """A claimed job is held by one worker until its lease expires."""
+        first = _queue(session_factory, "worker-1")
+        second = _queue(session_factory, "worker-2")
+        job = await first.enqueue(script)
+
+        claimed = await first.claim(job_id=job.id)
+
+        assert claimed is not None
+        assert claimed.status == JobStatus.RUNNING
+        assert claimed.locked_by == "worker-1"
+        assert claimed.attempts == 1
+        assert claimed.script.id == script.id
+        assert await second.claim(job_id=job.id) is None
+        assert await second.pending_job_ids() == []
+
+    async def test_enqueue_is_idempotent_per_script(self, session_factory, script):
+        """Enqueueing a script twice returns the existing job."""
+        queue = _queue(session_factory, "worker-1")
+
+        first = await queue.enqueue(script)
+        second = await queue.enqueue(script)
+
+        assert second.id == first.id
+
+    async def test_checkpoint_renews_lease(self, db_session, session_factory, script):
+        """Saving checkpoints extends the lease of the holding worker only."""
+        queue = _queue(session_factory, "worker-1")
+        job = await queue.enqueue(script)
+        await queue.claim(job_id=job.id)
+        await _expire_lease(db_session, job.id)
+
+        await queue.save_checkpoints(job.id, {"tts": {"artifacts": {}}})
+
+        reloaded = await _reload(db_session, job.id)
+        assert reloaded.locked_until is not None
+        assert reloaded.locked_until > datetime.now(tz=UTC)
+        assert reloaded.checkpoints == {"tts": {"artifacts": {}}}
+        with pytest.raises(JobLeaseLostError):
+            await _queue(session_factory, "worker-2").save_checkpoints(job.id, {})
+
+    async def test_renew_extends_lease_of_holder_only(self, db_session, session_factory, script):
+        """Renewing extends the holder's lease and rejects other workers."""
+        queue = _queue(session_factory, "worker-1")
+        job = await queue.enqueue(script)
+        await queue.claim(job_id=job.id)
+        await _expire_lease(db_session, job.id)
+
+        await queue.renew(job.id)
+
+        reloaded = await _reload(db_session, job.id)
+        assert reloaded.locked_until is not None
+        assert reloaded.locked_until > datetime.now(tz=UTC)
+        with pytest.raises(JobLeaseLostError):
+            await _queue(session_factory, "worker-2").renew(job.id)
+
+    async def test_fail_requeues_then_fails(self, db_session, session_factory, script):
+        """Failures requeue the job until max_attempts is reached."""
+        queue = _queue(session_factory, "worker-1")
+        job = await queue.enqueue(script)
+
+        await queue.claim(job_id=job.id)
+        await queue.fail(job.id, "first")
+        assert (await _reload(db_session, job.id)).status == JobStatus.QUEUED
+
+        await queue.claim(job_id=job.id)
+        await queue.fail(job.id, "second")
+        reloaded = await _reload(db_session, job.id)
+        assert reloaded.status == JobStatus.FAILED
+        assert reloaded.last_error == "second"
+        assert await queue.claim(job_id=job.id) is None
+
+    async def test_fail_without_lease_raises(self, session_factory, script):
+        """Only the holding worker may fail a job."""
+        queue = _queue(session_factory, "worker-1")
+        job = await queue.enqueue(script)
+        await queue.claim(job_id=job.id)
+
+        with pytest.raises(JobLeaseLostError):
+            await _queue(session_factory, "worker-2").fail(job.id, "boom")
+
+    async def test_release_does_not_count_attempt(self, db_session, session_factory, script):
+        """Released jobs go back to the queue with their attempt refunded."""
+        queue = _queue(session_factory, "worker-1")
+        job = await queue.enqueue(script)
+        await queue.claim(job_id=job.id)
+
+        await queue.release(job.id)
+
+        reloaded = await _reload(db_session, job.id)
+        assert reloaded.status == JobStatus.QUEUED
+        assert reloaded.attempts == 0
+        assert reloaded.locked_by is None
+        assert await queue.pending_job_ids() == [job.id]
+
+    async def test_expired_lease_is_reclaimed(self, db_session, session_factory, script):
+        """Another worker takes over an expired lease; the old holder loses it."""
+        first = _queue(session_factory, "worker-1")
+        second = _queue(session_factory, "worker-2")
+        job = await first.enqueue(script)
+        await first.claim(job_id=job.id)
+        await _expire_lease(db_session, job.id)
+
+        claimed = await second.claim(job_id=job.id)
+
+        assert claimed is not None
+        assert claimed.locked_by == "worker-2"
+        assert claimed.attempts == 2
+        with pytest.raises(JobLeaseLostError):
+            await first.save_checkpoints(job.id, {})
+
+    async def test_expired_lease_on_last_attempt_fails(self, db_session, session_factory, script):
+        """A job whose lease expired on its final attempt is failed, not reclaimed."""
+        queue = _queue(session_factory, "worker-1")
+        job = await queue.enqueue(script)
+        await queue.claim(job_id=job.id)
+        await _expire_lease(db_session, job.id)
+        await queue.claim(job_id=job.id)
+        await _expire_lease(db_session, job.id)
+
+        assert await queue.claim(job_id=job.id) is None
+
+        reloaded = await _reload(db_session, job.id)
+        assert reloaded.status == JobStatus.FAILED
+        assert reloaded.attempts == 2
+        assert reloaded.locked_by is None
+        assert await queue.pending_job_ids() == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHeartbeat:
+    """Lease renewal while a stage runs."""
+
+    async def test_renews_until_block_exits(self):
+        """The lease is renewed periodically and renewal stops after the block."""
+        queue = GenerationJobQueue(MagicMock(), worker_id="worker-1")
+        queue.heartbeat_seconds = 0
+        renewed = asyncio.Event()
+
+        async def renew(job_id: uuid.UUID) -> None:
+            renewed.set()
+
+        queue.renew = AsyncMock(side_effect=renew)  # type: ignore[method-assign]
+        job_id = uuid.uuid4()
+
+        async with queue.heartbeat(job_id):
+            await renewed.wait()
+        calls = queue.renew.await_count
+        await asyncio.sleep(0)
+
+        queue.renew.assert_awaited_with(job_id)
+        assert queue.renew.await_count == calls
+
+    async def test_stops_when_lease_is_lost(self):
+        """A lost lease ends the heartbeat without failing the block."""
+        queue = GenerationJobQueue(MagicMock(), worker_id="worker-1")
+        queue.heartbeat_seconds = 0
+        queue.renew = AsyncMock(side_effect=JobLeaseLostError(job_id="x"))  # type: ignore[method-assign]
+
+        async with queue.heartbeat(uuid.uuid4()):
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        queue.renew.assert_awaited_once()
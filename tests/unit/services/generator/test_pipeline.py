@@ -6,11 +6,21 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from app.config.video import VideoGenerationConfig
+from app.config.video_template import VideoTemplateConfig
+from app.models.generation_job import GenerationStage
 from app.models.scene import Scene, SceneScript, SceneType
+from app.services.generator.checkpoint import (
+    StageCheckpointer,
+    dump_composition,
+    dump_path,
+    dump_scene_tts,
+    dump_scene_visuals,
+    dump_tts_result,
+)
 from app.services.generator.pipeline import VideoGenerationPipeline, VideoGenerationResult
 from app.services.generator.remotion_compositor import CompositionResult
 from app.services.generator.subtitle import SubtitleFile
-from app.services.generator.tts.base import TTSResult, WordTimestamp
+from app.services.generator.tts.base import SceneTTSResult, TTSResult, WordTimestamp
 from app.services.generator.visual.base import VisualAsset, VisualSourceType
 from app.services.generator.visual.manager import SceneVisualResult
 
@@ -183,6 +193,44 @@ class TestVideoGenerationPipeline:
         mock_ffmpeg_wrapper.extract_frame.assert_called()
         mock_ffmpeg_wrapper.run.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_ffmpeg_template_uses_ffmpeg_compositor(
+        self,
+        pipeline: VideoGenerationPipeline,
+        configured_mocks: dict,
+        mock_script: MagicMock,
+        mock_scene_script: SceneScript,
+        mock_compositor: AsyncMock,
+        mock_template_loader: MagicMock,
+    ) -> None:
+        """Templates selecting the FFmpeg backend are rendered by it."""
+        ffmpeg_compositor = AsyncMock()
+        ffmpeg_compositor.compose_scenes = AsyncMock(
+            return_value=configured_mocks["composition_result"]
+        )
+        pipeline.ffmpeg_compositor = ffmpeg_compositor
+        template = VideoTemplateConfig(name="minimal", compositor="ffmpeg")
+        mock_template_loader.load.return_value = template
+
+        await pipeline.generate(
+            script=mock_script, scene_script=mock_scene_script, template_name="minimal"
+        )
+
+        ffmpeg_compositor.compose_scenes.assert_awaited_once()
+        assert ffmpeg_compositor.compose_scenes.call_args.kwargs["video_template"] is template
+        mock_compositor.compose_scenes.assert_not_called()
+
+    def test_ffmpeg_template_falls_back_to_remotion(
+        self,
+        pipeline: VideoGenerationPipeline,
+        mock_compositor: AsyncMock,
+    ) -> None:
+        """Without an FFmpeg compositor every template renders with Remotion."""
+        template = VideoTemplateConfig(name="minimal", compositor="ffmpeg")
+
+        assert pipeline._select_compositor(template) is mock_compositor
+        assert pipeline._select_compositor(None) is mock_compositor
+
     @pytest.mark.asyncio
     async def test_generate_returns_result(
         self,
@@ -214,6 +262,85 @@ class TestVideoGenerationPipeline:
         with pytest.raises(ValueError, match="at least 1"):
             SceneScript(scenes=[], headline="테스트")
 
+    @pytest.mark.asyncio
+    async def test_generate_restores_checkpointed_stages(
+        self,
+        pipeline: VideoGenerationPipeline,
+        configured_mocks: dict,
+        mock_script: MagicMock,
+        mock_scene_script: SceneScript,
+        mock_tts_factory: MagicMock,
+        mock_visual_manager: AsyncMock,
+        mock_compositor: AsyncMock,
+        mock_ffmpeg_wrapper: AsyncMock,
+        tmp_path: Path,
+    ) -> None:
+        """Stages completed by a previous attempt are not run again."""
+        tts = configured_mocks["tts_result"]
+        scene_results = [
+            SceneTTSResult(
+                scene_index=i,
+                scene_type=scene.scene_type.value,
+                audio_path=tts.audio_path,
+                duration_seconds=tts.duration_seconds,
+                word_timestamps=tts.word_timestamps,
+            )
+            for i, scene in enumerate(mock_scene_script.scenes)
+        ]
+        visuals = mock_visual_manager.source_visuals_for_scenes.return_value
+        composition = configured_mocks["composition_result"]
+
+        previous = StageCheckpointer()
+        await previous.record(GenerationStage.TTS, *dump_scene_tts(scene_results))
+        await previous.record(
+            GenerationStage.CONCAT, *dump_tts_result(configured_mocks["combined_tts_result"])
+        )
+        await previous.record(GenerationStage.SUBTITLES, *dump_path(tmp_path / "subtitle.ass"))
+        await previous.record(GenerationStage.VISUALS, *dump_scene_visuals(visuals))
+        await previous.record(GenerationStage.COMPOSE, *dump_composition(composition))
+        await previous.record(
+            GenerationStage.THUMBNAIL, *dump_path(configured_mocks["thumbnail_path"])
+        )
+
+        checkpointer = StageCheckpointer(previous.checkpoints)
+        result = await pipeline.generate(
+            script=mock_script,
+            scene_script=mock_scene_script,
+            checkpointer=checkpointer,
+        )
+
+        assert checkpointer.restored == list(GenerationStage)
+        mock_tts_factory.get_engine.return_value.synthesize_scenes.assert_not_called()
+        mock_visual_manager.source_visuals_for_scenes.assert_not_called()
+        mock_compositor.compose_scenes.assert_not_called()
+        mock_ffmpeg_wrapper.run.assert_not_called()
+        assert result.video_path == composition.video_path
+        assert result.thumbnail_path == configured_mocks["thumbnail_path"]
+
+    @pytest.mark.asyncio
+    async def test_generate_keeps_output_for_resume_on_failure(
+        self,
+        pipeline: VideoGenerationPipeline,
+        mock_script: MagicMock,
+        mock_scene_script: SceneScript,
+        mock_tts_factory: MagicMock,
+        video_generation_config: VideoGenerationConfig,
+    ) -> None:
+        """With a checkpointer, partial output survives a failed attempt."""
+        mock_tts_factory.get_engine.return_value.synthesize_scenes = AsyncMock(
+            side_effect=RuntimeError("tts down")
+        )
+
+        with pytest.raises(RuntimeError):
+            await pipeline.generate(
+                script=mock_script,
+                scene_script=mock_scene_script,
+                checkpointer=StageCheckpointer(),
+            )
+
+        assert (Path(video_generation_config.output_dir) / str(mock_script.id)).exists()
+        assert (Path(video_generation_config.temp_dir) / str(mock_script.id)).exists()
+
 
 class TestVideoGenerationResult:
     """Test VideoGenerationResult dataclass."""
@@ -1,5 +1,6 @@
 """Unit tests for RemotionCompositor."""
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -16,7 +17,11 @@ from app.config.video_template import (
     VideoTemplateConfig,
     VisualEffectsConfig,
 )
-from app.services.generator.remotion_compositor import RemotionCompositor
+from app.services.generator.remotion_compositor import (
+    RemotionCompositor,
+    StagingStats,
+    resolve_render_concurrency,
+)
 
 
 @pytest.fixture
@@ -50,7 +55,7 @@ def composition_config() -> CompositionConfig:
 
 @pytest.fixture
 def compositor(composition_config) -> RemotionCompositor:
-    return RemotionCompositor(config=composition_config)
+    return RemotionCompositor(config=composition_config, warm_bundle=False)
 
 
 def _make_tts_result(duration: float = 5.0) -> MagicMock:
@@ -315,6 +320,117 @@ class TestStageAsset:
         assert existing.read_bytes() == b"old data"
 
 
+class TestZeroCopyStaging:
+    """Tests for linking assets instead of copying them."""
+
+    def test_hard_links_when_possible(self, tmp_path):
+        src = tmp_path / "clip.mp4"
+        src.write_bytes(b"x" * 100)
+        public_dir = tmp_path / "public" / "_render_1"
+        public_dir.mkdir(parents=True)
+        stats = StagingStats()
+
+        RemotionCompositor._stage_asset(src, public_dir, "visual", "_render_1", stats=stats)
+
+        assert (public_dir / "visual.mp4").stat().st_ino == src.stat().st_ino
+        assert stats.linked_bytes == 100
+        assert stats.copied_bytes == 0
+
+    def test_symlinks_across_filesystems(self, tmp_path):
+        src = tmp_path / "clip.mp4"
+        src.write_bytes(b"x" * 100)
+        public_dir = tmp_path / "public" / "_render_1"
+        public_dir.mkdir(parents=True)
+        stats = StagingStats()
+
+        with patch("os.link", side_effect=OSError("cross-device link")):
+            RemotionCompositor._stage_asset(src, public_dir, "visual", "_render_1", stats=stats)
+
+        staged = public_dir / "visual.mp4"
+        assert staged.is_symlink()
+        assert staged.read_bytes() == src.read_bytes()
+        assert stats.linked_bytes == 100
+
+    def test_copies_when_linking_unsupported(self, tmp_path):
+        src = tmp_path / "clip.mp4"
+        src.write_bytes(b"x" * 100)
+        public_dir = tmp_path / "public" / "_render_1"
+        public_dir.mkdir(parents=True)
+        stats = StagingStats()
+
+        with (
+            patch("os.link", side_effect=OSError("unsupported")),
+            patch.object(Path, "symlink_to", side_effect=OSError("unsupported")),
+        ):
+            RemotionCompositor._stage_asset(src, public_dir, "visual", "_render_1", stats=stats)
+
+        assert (public_dir / "visual.mp4").read_bytes() == src.read_bytes()
+        assert stats.copied_bytes == 100
+        assert stats.bytes_saved == 0
+
+    def test_shared_asset_staged_once(self, tmp_path):
+        bgm = tmp_path / "track.mp3"
+        bgm.write_bytes(b"m" * 50)
+        public_root = tmp_path / "public"
+        first, second = StagingStats(), StagingStats()
+
+        rel1 = RemotionCompositor._stage_shared_asset(bgm, public_root, stats=first)
+        rel2 = RemotionCompositor._stage_shared_asset(bgm, public_root, stats=second)
+
+        assert rel1 == rel2
+        assert rel1.startswith("_render_shared/")
+        assert (public_root / rel1).read_bytes() == bgm.read_bytes()
+        assert first.linked_bytes == 50
+        assert second.shared_bytes == 50
+        assert second.linked_bytes == 0
+
+    def test_shared_asset_restaged_when_changed(self, tmp_path):
+        bgm = tmp_path / "track.mp3"
+        bgm.write_bytes(b"old")
+        public_root = tmp_path / "public"
+        rel1 = RemotionCompositor._stage_shared_asset(bgm, public_root)
+
+        bgm.unlink()
+        bgm.write_bytes(b"new track")
+        rel2 = RemotionCompositor._stage_shared_asset(bgm, public_root)
+
+        assert rel1 != rel2
+        assert (public_root / rel2).read_bytes() == b"new track"
+
+    def test_shared_asset_missing_returns_empty(self, tmp_path):
+        assert RemotionCompositor._stage_shared_asset(tmp_path / "none.mp3", tmp_path) == ""
+
+    @pytest.mark.asyncio
+    async def test_shared_assets_survive_render_cleanup(self, composition_config, tmp_path):
+        remotion_dir = tmp_path / "remotion"
+        compositor = RemotionCompositor(
+            config=composition_config, remotion_dir=remotion_dir, warm_bundle=False
+        )
+        bgm = tmp_path / "bgm.mp3"
+        bgm.write_bytes(b"music")
+
+        async def mock_communicate():
+            (tmp_path / "video.mp4").write_bytes(b"data")
+            return b"", b""
+
+        mock_proc = MagicMock(returncode=0, communicate=mock_communicate)
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_proc):
+            await compositor.compose_scenes(
+                scenes=[],
+                scene_tts_results=[_make_tts_result(5.0)],
+                scene_visuals=[],
+                combined_audio_path=tmp_path / "audio.mp3",
+                subtitle_file=None,
+                output_path=tmp_path / "video",
+                background_music_path=bgm,
+            )
+
+        public = remotion_dir / "public"
+        assert [p.name for p in public.iterdir()] == ["_render_shared"]
+        assert len(list((public / "_render_shared").iterdir())) == 1
+
+
 class TestRender:
     """Tests for RemotionCompositor._render()."""
 
@@ -445,6 +561,222 @@ class TestRender:
         assert str(props_path) in cmd_args
 
 
+class TestRenderConcurrency:
+    """Tests for sizing Remotion's --concurrency."""
+
+    def test_splits_cores_between_parallel_renders(self):
+        with (
+            patch("os.cpu_count", return_value=8),
+            patch(
+                "app.services.generator.remotion_compositor._available_memory_mb",
+                return_value=64_000,
+            ),
+        ):
+            assert resolve_render_concurrency(2, 1024) == 4
+
+    def test_capped_by_available_memory(self):
+        with (
+            patch("os.cpu_count", return_value=16),
+            patch(
+                "app.services.generator.remotion_compositor._available_memory_mb",
+                return_value=3_000,
+            ),
+        ):
+            assert resolve_render_concurrency(1, 1024) == 2
+
+    def test_at_least_one(self):
+        with (
+            patch("os.cpu_count", return_value=1),
+            patch(
+                "app.services.generator.remotion_compositor._available_memory_mb",
+                return_value=100,
+            ),
+        ):
+            assert resolve_render_concurrency(4, 1024) == 1
+
+    @pytest.mark.asyncio
+    async def test_render_passes_concurrency(self, composition_config, tmp_path):
+        compositor = RemotionCompositor(config=composition_config, warm_bundle=False, concurrency=6)
+        output_path = tmp_path / "output.mp4"
+
+        async def mock_communicate():
+            output_path.write_bytes(b"data")
+            return b"", b""
+
+        mock_proc = MagicMock(returncode=0, communicate=mock_communicate)
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_proc) as mock_exec:
+            await compositor._render(tmp_path / "props.json", output_path, 10.0)
+
+        cmd_args = list(mock_exec.call_args.args)
+        assert cmd_args[cmd_args.index("--concurrency") + 1] == "6"
+
+
+class TestWarmBundle:
+    """Tests for render service mode (bundle once, render many)."""
+
+    @pytest.fixture
+    def remotion_dir(self, tmp_path: Path) -> Path:
+        project = tmp_path / "remotion"
+        (project / "src").mkdir(parents=True)
+        (project / "src" / "index.ts").write_text("registerRoot(Root);")
+        (project / "public").mkdir()
+        return project
+
+    @pytest.fixture
+    def warm_compositor(self, composition_config, remotion_dir, tmp_path) -> RemotionCompositor:
+        return RemotionCompositor(
+            config=composition_config,
+            remotion_dir=remotion_dir,
+            warm_bundle=True,
+            bundle_dir=tmp_path / "bundles",
+            concurrency=2,
+        )
+
+    @staticmethod
+    def _fake_remotion(tmp_path: Path) -> tuple[list[list[str]], object]:
+        """Fake `remotion bundle` / `remotion render` subprocesses."""
+        calls: list[list[str]] = []
+
+        async def create_subprocess_exec(*cmd: str, **kwargs: object) -> MagicMock:
+            calls.append(list(cmd))
+
+            async def communicate() -> tuple[bytes, bytes]:
+                if cmd[2] == "bundle":
+                    out_dir = Path(cmd[cmd.index("--out-dir") + 1])
+                    (out_dir / "public").mkdir(parents=True)
+                    (out_dir / "index.html").write_text("<html></html>")
+                else:
+                    Path(cmd[5]).write_bytes(b"video")
+                return b"", b""
+
+            return MagicMock(returncode=0, communicate=communicate)
+
+        return calls, create_subprocess_exec
+
+    async def _compose(self, compositor: RemotionCompositor, tmp_path: Path) -> None:
+        await compositor.compose_scenes(
+            scenes=[],
+            scene_tts_results=[_make_tts_result(5.0)],
+            scene_visuals=[],
+            combined_audio_path=tmp_path / "audio.mp3",
+            subtitle_file=None,
+            output_path=tmp_path / "out" / "video",
+        )
+
+    @pytest.mark.asyncio
+    async def test_bundles_once_for_many_renders(self, warm_compositor, tmp_path):
+        calls, fake_exec = self._fake_remotion(tmp_path)
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            await self._compose(warm_compositor, tmp_path)
+            await self._compose(warm_compositor, tmp_path)
+
+        commands = [cmd[2] for cmd in calls]
+        assert commands == ["bundle", "render", "render"]
+        serve_dir = warm_compositor._bundle[1]
+        assert calls[1][3] == str(serve_dir)
+        assert calls[2][3] == str(serve_dir)
+
+    @pytest.mark.asyncio
+    async def test_rebundles_when_sources_change(self, warm_compositor, remotion_dir, tmp_path):
+        calls, fake_exec = self._fake_remotion(tmp_path)
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            await self._compose(warm_compositor, tmp_path)
+            (remotion_dir / "src" / "Template.tsx").write_text("export const T = 1;")
+            await self._compose(warm_compositor, tmp_path)
+
+        assert [cmd[2] for cmd in calls] == ["bundle", "render", "bundle", "render"]
+        bundles = list((tmp_path / "bundles").iterdir())
+        assert bundles == [warm_compositor._bundle[1]]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_keeps_bundle_in_use(self, warm_compositor, remotion_dir, tmp_path):
+        """Old bundles with a render still staging are not pruned."""
+        _, fake_exec = self._fake_remotion(tmp_path)
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            old_bundle = await warm_compositor._ensure_bundle()
+            (old_bundle / "public" / "_render_abc123").mkdir()
+            (remotion_dir / "src" / "Template.tsx").write_text("export const T = 1;")
+            new_bundle = await warm_compositor._ensure_bundle()
+
+        assert new_bundle != old_bundle
+        assert old_bundle.exists()
+
+    @pytest.mark.asyncio
+    async def test_reuses_bundle_from_previous_process(
+        self, composition_config, remotion_dir, tmp_path
+    ):
+        calls, fake_exec = self._fake_remotion(tmp_path)
+        kwargs = {
+            "config": composition_config,
+            "remotion_dir": remotion_dir,
+            "warm_bundle": True,
+            "bundle_dir": tmp_path / "bundles",
+        }
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            await RemotionCompositor(**kwargs)._ensure_bundle()
+            await RemotionCompositor(**kwargs)._ensure_bundle()
+
+        assert [cmd[2] for cmd in calls] == ["bundle"]
+
+    @pytest.mark.asyncio
+    async def test_assets_staged_into_bundle_public_dir(self, warm_compositor, tmp_path):
+        audio = tmp_path / "audio.mp3"
+        audio.write_bytes(b"audio")
+        staged: list[Path] = []
+        _, fake_exec = self._fake_remotion(tmp_path)
+
+        original_stage = RemotionCompositor._stage_asset
+
+        def record_stage(
+            src: Path, public_dir: Path, prefix: str, render_id: str, **kwargs: object
+        ) -> str:
+            staged.append(public_dir)
+            return original_stage(src, public_dir, prefix, render_id)
+
+        with (
+            patch("asyncio.create_subprocess_exec", side_effect=fake_exec),
+            patch.object(RemotionCompositor, "_stage_asset", side_effect=record_stage),
+        ):
+            await self._compose(warm_compositor, tmp_path)
+
+        assert staged[0].parent == warm_compositor._bundle[1] / "public"
+
+    @pytest.mark.asyncio
+    async def test_parallel_renders_are_bounded(self, composition_config, tmp_path):
+        compositor = RemotionCompositor(
+            config=composition_config, warm_bundle=False, max_parallel_renders=2
+        )
+        running = 0
+        peak = 0
+
+        async def create_subprocess_exec(*cmd: str, **kwargs: object) -> MagicMock:
+            async def communicate() -> tuple[bytes, bytes]:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                Path(cmd[5]).write_bytes(b"video")
+                return b"", b""
+
+            return MagicMock(returncode=0, communicate=communicate)
+
+        with patch("asyncio.create_subprocess_exec", side_effect=create_subprocess_exec):
+            await asyncio.gather(
+                *(
+                    compositor._render(tmp_path / "props.json", tmp_path / f"{i}.mp4", 1.0)
+                    for i in range(5)
+                )
+            )
+
+        assert peak == 2
+
+
 class TestComposeScenes:
     """Tests for RemotionCompositor.compose_scenes()."""
 
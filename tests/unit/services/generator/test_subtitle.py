@@ -726,6 +726,26 @@ class TestApplySceneStyling:
 
         assert result == "이것은 중요한 포인트입니다"
 
+    def test_emphasis_words_highlighted_once_without_nesting(
+        self, generator: SubtitleGenerator
+    ) -> None:
+        """Overlapping emphasis words do not nest tags; each word is highlighted once."""
+        from unittest.mock import MagicMock
+
+        from app.models.scene import VisualStyle
+
+        persona_style = MagicMock()
+        persona_style.secondary_color = "#FF0000"
+
+        result = generator._apply_scene_styling(
+            text="OpenAI 그리고 AI 그리고 AI",
+            visual_style=VisualStyle.PERSONA,
+            emphasis_words=["AI", "OpenAI"],
+            persona_style=persona_style,
+        )
+
+        assert result == ("{\\c&H0000FF&}OpenAI{\\c} 그리고 {\\c&H0000FF&}AI{\\c} 그리고 AI")
+
 
 class TestFindSceneIndex:
     """Test scene index lookup."""
@@ -0,0 +1,115 @@
+"""Unit tests for Korean subtitle segmentation."""
+
+import pytest
+
+from app.services.generator.subtitle_segmenter import (
+    AffixTable,
+    SubtitleSegmenter,
+    emphasis_pattern,
+    get_segmenter,
+)
+
+
+@pytest.fixture
+def segmenter() -> SubtitleSegmenter:
+    """Create a segmenter with a small rule set."""
+    return SubtitleSegmenter(
+        sentence_endings=["요.", "다.", "거든요"],
+        connectors=["근데", "그래서"],
+        complete_particles=["은", "는", "에서"],
+        punctuation=".!?,",
+        word_limit_overhead=2,
+    )
+
+
+def _texts(words: list[str], spans: list[tuple[int, int]]) -> list[str]:
+    return [" ".join(words[start:end]) for start, end in spans]
+
+
+class TestAffixTable:
+    """Tests for length-keyed affix matching."""
+
+    def test_suffix_and_prefix(self) -> None:
+        table = AffixTable.build(["요.", "거든요", ""])
+
+        assert table.lengths == (2, 3)
+        assert table.matches_suffix("좋아요.")
+        assert table.matches_suffix("있거든요")
+        assert not table.matches_suffix("요")
+        assert AffixTable.build(["근데"]).matches_prefix("근데요")
+        assert not AffixTable.build(["근데"]).matches_prefix("그")
+
+
+class TestSubtitleSegmenter:
+    """Tests for SubtitleSegmenter.segment."""
+
+    def test_breaks_after_sentence_endings_and_before_connectors(
+        self, segmenter: SubtitleSegmenter
+    ) -> None:
+        words = ["정말", "좋아요.", "근데", "가격이", "비싸거든요", "그래서", "고민이에요"]
+
+        spans = segmenter.segment(words, max_chars=40, max_words=10)
+
+        assert _texts(words, spans) == [
+            "정말 좋아요.",
+            "근데 가격이 비싸거든요",
+            "그래서 고민이에요",
+        ]
+
+    def test_breaks_after_punctuation(self, segmenter: SubtitleSegmenter) -> None:
+        words = ["하나,", "둘", "셋"]
+
+        assert _texts(words, segmenter.segment(words, 40, 10)) == ["하나,", "둘 셋"]
+
+    def test_max_chars_counts_spaces(self, segmenter: SubtitleSegmenter) -> None:
+        words = ["가나", "다라", "마바"]
+
+        # "가나 다라" is 5 characters; adding " 마바" would make 8
+        assert segmenter.segment(words, max_chars=5, max_words=10) == [(0, 2), (2, 3)]
+
+    def test_soft_word_limit_waits_for_particle(self, segmenter: SubtitleSegmenter) -> None:
+        words = ["a", "b", "오늘은", "c", "d", "e", "f", "g"]
+
+        spans = segmenter.segment(words, max_chars=100, max_words=2)
+
+        # Breaks after the particle, then at max_words + overhead
+        assert spans == [(0, 3), (3, 7), (7, 8)]
+
+    def test_empty_input(self, segmenter: SubtitleSegmenter) -> None:
+        assert segmenter.segment([], 10, 4) == []
+
+    def test_long_script_is_fully_covered(self, segmenter: SubtitleSegmenter) -> None:
+        words = ["단어", "좋아요.", "근데", "서울에서", "x"] * 2000
+
+        spans = segmenter.segment(words, max_chars=12, max_words=4)
+
+        assert spans[0][0] == 0
+        assert spans[-1][1] == len(words)
+        assert all(end == start for (_, end), (start, _) in zip(spans, spans[1:], strict=False))
+
+    def test_from_language_config(self) -> None:
+        korean = get_segmenter("korean")
+
+        assert korean is get_segmenter("korean")
+        assert korean.connectors.matches_prefix("그래서")
+        assert korean.sentence_endings.matches_suffix("있어요.")
+
+
+class TestEmphasisPattern:
+    """Tests for the compiled emphasis alternation."""
+
+    def test_longest_word_wins(self) -> None:
+        pattern = emphasis_pattern(("AI", "OpenAI"))
+
+        assert pattern is not None
+        assert pattern.findall("OpenAI 그리고 AI") == ["OpenAI", "AI"]
+
+    def test_words_are_escaped(self) -> None:
+        pattern = emphasis_pattern(("30%", "a.b"))
+
+        assert pattern is not None
+        assert pattern.findall("a.b axb 30%") == ["a.b", "30%"]
+
+    def test_no_words(self) -> None:
+        assert emphasis_pattern(()) is None
+        assert emphasis_pattern(("",)) is None
@@ -0,0 +1,159 @@
+"""Unit tests for the shared Whisper aligner."""
+
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.config.video import WhisperAlignerConfig
+from app.models.scene import Scene, SceneType
+from app.services.generator.tts.aligner import WhisperAligner, get_whisper_aligner
+from app.services.generator.tts.base import TTSResult, TTSSynthesisConfig, WordTimestamp
+from app.services.generator.tts.elevenlabs import ElevenLabsEngine
+
+
+def _whisper_result(*words: tuple[str, float, float]) -> dict[str, Any]:
+    return {
+        "segments": [
+            {"words": [{"word": f" {w}", "start": start, "end": end} for w, start, end in words]}
+        ]
+    }
+
+
+@pytest.fixture
+def fake_whisper(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Install a fake ``whisper`` module recording model loads."""
+    model = MagicMock()
+    model.transcribe.return_value = _whisper_result(("안녕", 0.0, 0.4), ("하세요", 0.4, 0.9))
+
+    module = ModuleType("whisper")
+    module.load_model = MagicMock(return_value=model)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "whisper", module)
+    return module.load_model  # type: ignore[attr-defined, no-any-return]
+
+
+class TestWhisperAligner:
+    """Tests for WhisperAligner."""
+
+    @pytest.mark.asyncio
+    async def test_align_returns_word_timestamps(self, fake_whisper: MagicMock) -> None:
+        """Should convert Whisper segments into stripped word timestamps."""
+        aligner = WhisperAligner(WhisperAlignerConfig())
+
+        result = await aligner.align(Path("a.mp3"), "ko")
+
+        assert result is not None
+        assert [w.word for w in result] == ["안녕", "하세요"]
+        assert result[1].start == 0.4
+        model = fake_whisper.return_value
+        model.transcribe.assert_called_once_with(
+            "a.mp3", word_timestamps=True, language="ko", fp16=False
+        )
+        aligner.close()
+
+    @pytest.mark.asyncio
+    async def test_model_loaded_once(self, fake_whisper: MagicMock) -> None:
+        """Should load the model a single time across calls."""
+        aligner = WhisperAligner(WhisperAlignerConfig(model_size="tiny"))
+
+        await aligner.align(Path("a.mp3"))
+        await aligner.align_batch([(Path("b.mp3"), "en"), (Path("c.mp3"), "en")])
+
+        fake_whisper.assert_called_once_with("tiny", device="cpu")
+        assert fake_whisper.return_value.transcribe.call_count == 3
+        assert aligner.is_loaded
+        aligner.close()
+
+    @pytest.mark.asyncio
+    async def test_inference_runs_off_event_loop(self, fake_whisper: MagicMock) -> None:
+        """Should transcribe on the worker thread, not the loop thread."""
+        threads: list[str] = []
+        model = fake_whisper.return_value
+        model.transcribe.side_effect = lambda *a, **k: (
+            threads.append(threading.current_thread().name) or _whisper_result(("x", 0, 1))
+        )
+        aligner = WhisperAligner(WhisperAlignerConfig())
+
+        await aligner.align(Path("a.mp3"))
+
+        assert threads and threads[0].startswith("whisper")
+        aligner.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_isolates_failures(self, fake_whisper: MagicMock) -> None:
+        """Should return None only for the item whose transcription failed."""
+        model = fake_whisper.return_value
+        model.transcribe.side_effect = [RuntimeError("bad audio"), _whisper_result(("x", 0, 1))]
+        aligner = WhisperAligner(WhisperAlignerConfig())
+
+        results = await aligner.align_batch([(Path("a.mp3"), None), (Path("b.mp3"), None)])
+
+        assert results[0] is None
+        assert results[1] is not None
+        aligner.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_whisper_returns_none(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should degrade to None when Whisper is not installed."""
+        monkeypatch.setitem(sys.modules, "whisper", None)
+        aligner = WhisperAligner(WhisperAlignerConfig())
+
+        assert await aligner.align(Path("a.mp3")) is None
+        assert not aligner.is_loaded
+        aligner.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self) -> None:
+        """Should return an empty list without touching the worker."""
+        aligner = WhisperAligner(WhisperAlignerConfig())
+        assert await aligner.align_batch([]) == []
+        aligner.close()
+
+
+class TestGetWhisperAligner:
+    """Tests for the process-wide aligner accessor."""
+
+    def test_shared_per_config(self) -> None:
+        """Should return the same aligner for equal model settings."""
+        first = get_whisper_aligner(WhisperAlignerConfig(model_size="small"))
+        second = get_whisper_aligner(WhisperAlignerConfig(model_size="small", max_queue_size=4))
+        other = get_whisper_aligner(WhisperAlignerConfig(model_size="tiny"))
+
+        assert first is second
+        assert first is not other
+
+
+class TestElevenLabsBatchAlignment:
+    """Tests for ElevenLabsEngine scene alignment through the aligner."""
+
+    @pytest.mark.asyncio
+    async def test_scenes_aligned_in_one_batch(self, tmp_path: Path) -> None:
+        """Should synthesize audio per scene but align all scenes in one call."""
+        aligner = MagicMock(spec=WhisperAligner)
+        aligner.align_batch = AsyncMock(
+            return_value=[[WordTimestamp("가", 0.0, 0.5)], [WordTimestamp("b", 0.0, 0.3)]]
+        )
+        engine = ElevenLabsEngine(api_key="key", aligner=aligner)
+
+        async def fake_audio(text: str, config: Any, output_path: Path) -> TTSResult:
+            return TTSResult(audio_path=output_path.with_suffix(".mp3"), duration_seconds=1.0)
+
+        engine._synthesize_audio = fake_audio  # type: ignore[method-assign]
+        scenes = [
+            Scene(scene_type=SceneType.HOOK, text="가나다"),
+            Scene(scene_type=SceneType.CONTENT, text="hello"),
+        ]
+
+        results = await engine.synthesize_scenes(
+            scenes, TTSSynthesisConfig(voice_id="v"), tmp_path, concurrent=True
+        )
+
+        aligner.align_batch.assert_awaited_once_with(
+            [(tmp_path / "scene_000.mp3", "ko"), (tmp_path / "scene_001.mp3", "en")]
+        )
+        assert results[0].word_timestamps == [WordTimestamp("가", 0.0, 0.5)]
+        assert results[1].start_offset == 1.0
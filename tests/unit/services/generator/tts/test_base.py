@@ -1,12 +1,17 @@
 """Unit tests for TTS base module."""
 
+import asyncio
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.config.video import TTSConcurrencyConfig
+from app.models.scene import Scene, SceneType
 from app.services.generator.tts.base import (
     EDGE_TTS_VOICES_EN,
     EDGE_TTS_VOICES_KO,
+    BaseTTSEngine,
     SceneTTSResult,
     TTSResult,
     TTSSynthesisConfig,
@@ -275,3 +280,126 @@ class TestEdgeTTSVoiceConstants:
 
         for voice_id, voice in EDGE_TTS_VOICES_EN.items():
             assert voice.voice_id == voice_id
+
+
+class _FakeTTSEngine(BaseTTSEngine):
+    """TTS engine whose latency and duration depend on the text length."""
+
+    def __init__(self, concurrency: TTSConcurrencyConfig | None = None) -> None:
+        super().__init__(concurrency)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.fail_on: str | None = None
+
+    async def synthesize(
+        self,
+        text: str,
+        config: TTSSynthesisConfig,
+        output_path: Path,
+    ) -> TTSResult:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            # Longer scenes finish later, so completion order differs from scene order
+            await asyncio.sleep(0.01 * len(text))
+            if text == self.fail_on:
+                raise RuntimeError("synthesis failed")
+            return TTSResult(
+                audio_path=output_path.with_suffix(".mp3"),
+                duration_seconds=float(len(text)),
+            )
+        finally:
+            self.in_flight -= 1
+
+    def get_available_voices(self, language: str | None = None) -> list[VoiceInfo]:
+        return []
+
+    async def get_audio_duration(self, audio_path: Path) -> float:
+        return 0.0
+
+
+class TestSynthesizeScenes:
+    """Tests for BaseTTSEngine.synthesize_scenes."""
+
+    @pytest.fixture
+    def scenes(self) -> list[Scene]:
+        """Scenes with decreasing text length."""
+        return [
+            Scene(scene_type=SceneType.HOOK, text="aaaa"),
+            Scene(scene_type=SceneType.CONTENT, text="bbb"),
+            Scene(scene_type=SceneType.CONTENT, text="cc"),
+            Scene(scene_type=SceneType.CTA, text="d"),
+        ]
+
+    @pytest.fixture
+    def config(self) -> TTSSynthesisConfig:
+        """Synthesis config."""
+        return TTSSynthesisConfig(voice_id="ko-KR-InJoonNeural")
+
+    async def test_sequential_offsets(
+        self, scenes: list[Scene], config: TTSSynthesisConfig, tmp_path: Path
+    ) -> None:
+        """Test sequential mode computes cumulative offsets."""
+        engine = _FakeTTSEngine()
+
+        results = await engine.synthesize_scenes(scenes, config, tmp_path)
+
+        assert [r.start_offset for r in results] == [0.0, 4.0, 7.0, 9.0]
+        assert engine.peak_in_flight == 1
+
+    async def test_concurrent_preserves_order_and_offsets(
+        self, scenes: list[Scene], config: TTSSynthesisConfig, tmp_path: Path
+    ) -> None:
+        """Test concurrent mode returns scenes in order with recomputed offsets."""
+        engine = _FakeTTSEngine()
+
+        results = await engine.synthesize_scenes(scenes, config, tmp_path, concurrent=True)
+
+        assert [r.scene_index for r in results] == [0, 1, 2, 3]
+        assert [r.scene_type for r in results] == ["hook", "content", "content", "cta"]
+        assert [r.audio_path.name for r in results] == [
+            "scene_000.mp3",
+            "scene_001.mp3",
+            "scene_002.mp3",
+            "scene_003.mp3",
+        ]
+        assert [r.start_offset for r in results] == [0.0, 4.0, 7.0, 9.0]
+        assert engine.peak_in_flight == 4
+
+    async def test_concurrent_respects_max_concurrency(
+        self, scenes: list[Scene], config: TTSSynthesisConfig, tmp_path: Path
+    ) -> None:
+        """Test in-flight requests never exceed the provider limit."""
+        engine = _FakeTTSEngine(TTSConcurrencyConfig(max_concurrency=2))
+
+        await engine.synthesize_scenes(scenes, config, tmp_path, concurrent=True)
+
+        assert engine.peak_in_flight == 2
+
+    async def test_concurrent_cached_scenes_skip_rate_limit(
+        self, scenes: list[Scene], config: TTSSynthesisConfig, tmp_path: Path
+    ) -> None:
+        """Test only cache misses wait for the provider's rate limiter."""
+        engine = _FakeTTSEngine()
+        engine.cache = MagicMock()
+        engine.cache.make_key.side_effect = lambda namespace, text, cfg: text
+        engine.cache.contains.side_effect = lambda key, fmt: key in {"aaaa", "bbb"}
+        engine._rate_limiter = MagicMock()
+        engine._rate_limiter.acquire = AsyncMock()
+
+        results = await engine.synthesize_scenes(scenes, config, tmp_path, concurrent=True)
+
+        assert [r.start_offset for r in results] == [0.0, 4.0, 7.0, 9.0]
+        assert engine._rate_limiter.acquire.await_count == 2
+
+    async def test_concurrent_failure_propagates(
+        self, scenes: list[Scene], config: TTSSynthesisConfig, tmp_path: Path
+    ) -> None:
+        """Test a failing scene raises and cancels the rest."""
+        engine = _FakeTTSEngine()
+        engine.fail_on = "d"
+
+        with pytest.raises(RuntimeError, match="synthesis failed"):
+            await engine.synthesize_scenes(scenes, config, tmp_path, concurrent=True)
+
+        assert engine.in_flight == 0
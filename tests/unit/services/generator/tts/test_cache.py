@@ -0,0 +1,216 @@
+"""Unit tests for TTS audio cache."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.config.video import TTSCacheConfig
+from app.services.generator.ffmpeg import FFmpegWrapper
+from app.services.generator.tts.base import TTSResult, TTSSynthesisConfig, WordTimestamp
+from app.services.generator.tts.cache import TTSCache
+from app.services.generator.tts.edge import EdgeTTSEngine
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> TTSCache:
+    """Create a cache rooted in a temp directory."""
+    return TTSCache(TTSCacheConfig(cache_dir=str(tmp_path / "cache")))
+
+
+@pytest.fixture
+def synthesis_config() -> TTSSynthesisConfig:
+    """Create a synthesis config."""
+    return TTSSynthesisConfig(voice_id="ko-KR-InJoonNeural", speed=1.1, pitch=2)
+
+
+def _make_result(tmp_path: Path, name: str = "scene", data: bytes = b"audio") -> TTSResult:
+    audio_path = tmp_path / f"{name}.mp3"
+    audio_path.write_bytes(data)
+    return TTSResult(
+        audio_path=audio_path,
+        duration_seconds=1.5,
+        word_timestamps=[
+            WordTimestamp(word="안녕", start=0.0, end=0.6),
+            WordTimestamp(word="하세요", start=0.6, end=1.4),
+        ],
+    )
+
+
+class TestMakeKey:
+    """Tests for TTSCache.make_key."""
+
+    def test_same_request_same_key(self, synthesis_config: TTSSynthesisConfig) -> None:
+        """Test identical requests map to the same key."""
+        key1 = TTSCache.make_key("edge-tts", "안녕하세요", synthesis_config)
+        key2 = TTSCache.make_key("edge-tts", "안녕하세요", synthesis_config)
+
+        assert key1 == key2
+        assert len(key1) == 64
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"voice_id": "ko-KR-SunHiNeural"},
+            {"speed": 1.2},
+            {"pitch": 3},
+            {"volume": 5},
+            {"output_format": "wav"},
+        ],
+    )
+    def test_prosody_changes_key(
+        self, synthesis_config: TTSSynthesisConfig, changes: dict[str, object]
+    ) -> None:
+        """Test every synthesis parameter is part of the key."""
+        params = {
+            "voice_id": synthesis_config.voice_id,
+            "speed": synthesis_config.speed,
+            "pitch": synthesis_config.pitch,
+            "volume": synthesis_config.volume,
+            "output_format": synthesis_config.output_format,
+            **changes,
+        }
+        other = TTSSynthesisConfig(**params)  # type: ignore[arg-type]
+
+        assert TTSCache.make_key("edge-tts", "text", synthesis_config) != TTSCache.make_key(
+            "edge-tts", "text", other
+        )
+
+    def test_text_and_namespace_change_key(self, synthesis_config: TTSSynthesisConfig) -> None:
+        """Test text and provider namespace are part of the key."""
+        base = TTSCache.make_key("edge-tts", "text", synthesis_config)
+
+        assert base != TTSCache.make_key("edge-tts", "other", synthesis_config)
+        assert base != TTSCache.make_key("elevenlabs:v2", "text", synthesis_config)
+
+
+class TestGetPut:
+    """Tests for storing and retrieving entries."""
+
+    def test_miss_then_hit(self, cache: TTSCache, tmp_path: Path) -> None:
+        """Test a stored entry is served with its timestamps."""
+        assert cache.get("k" * 64, tmp_path / "out" / "scene_000", "mp3") is None
+
+        cache.put("k" * 64, _make_result(tmp_path, data=b"audio-bytes"))
+        result = cache.get("k" * 64, tmp_path / "out" / "scene_000", "mp3")
+
+        assert result is not None
+        assert result.audio_path == tmp_path / "out" / "scene_000.mp3"
+        assert result.audio_path.read_bytes() == b"audio-bytes"
+        assert result.duration_seconds == 1.5
+        assert result.word_timestamps is not None
+        assert [w.word for w in result.word_timestamps] == ["안녕", "하세요"]
+        assert result.word_timestamps[1].start == 0.6
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.stores == 1
+        assert cache.stats.hit_ratio == 0.5
+
+    def test_served_file_is_independent_copy(self, cache: TTSCache, tmp_path: Path) -> None:
+        """Test overwriting a served file does not corrupt the cache."""
+        cache.put("a" * 64, _make_result(tmp_path, data=b"original"))
+        first = cache.get("a" * 64, tmp_path / "one", "mp3")
+        assert first is not None
+        first.audio_path.write_bytes(b"overwritten")
+
+        second = cache.get("a" * 64, tmp_path / "two", "mp3")
+
+        assert second is not None
+        assert second.audio_path.read_bytes() == b"original"
+
+    def test_expired_entry_is_miss(self, tmp_path: Path) -> None:
+        """Test entries older than max_age_days are evicted on lookup."""
+        cache = TTSCache(TTSCacheConfig(cache_dir=str(tmp_path / "cache"), max_age_days=1))
+        cache.put("b" * 64, _make_result(tmp_path))
+        meta_path = tmp_path / "cache" / "bb" / f"{'b' * 64}.json"
+        old = time.time() - 2 * 86400
+        os.utime(meta_path, (old, old))
+
+        assert cache._get_total_bytes() > 0
+
+        assert cache.get("b" * 64, tmp_path / "out", "mp3") is None
+        assert not meta_path.exists()
+        assert cache.stats.evictions == 1
+        assert cache._get_total_bytes() == 0
+
+    def test_contains_does_not_count_lookups(self, cache: TTSCache, tmp_path: Path) -> None:
+        """Test contains() reports fresh entries without touching hit/miss stats."""
+        assert cache.contains("c" * 64, "mp3") is False
+        cache.put("c" * 64, _make_result(tmp_path))
+
+        assert cache.contains("c" * 64, "mp3") is True
+        assert cache.stats.hits == 0
+        assert cache.stats.misses == 0
+
+
+class TestEviction:
+    """Tests for size-based LRU eviction."""
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Test the oldest-accessed entries are removed first."""
+        cache = TTSCache(TTSCacheConfig(cache_dir=str(tmp_path / "cache"), max_size_mb=16))
+        for i, key in enumerate(["c" * 64, "d" * 64, "e" * 64]):
+            cache.put(key, _make_result(tmp_path, name=key[0], data=b"x" * 1000))
+            meta_path = tmp_path / "cache" / key[:2] / f"{key}.json"
+            stamp = time.time() - 100 + i
+            os.utime(meta_path, (stamp, stamp))
+
+        # Touch the oldest entry so it becomes most recently used
+        assert cache.get("c" * 64, tmp_path / "out", "mp3") is not None
+
+        # Shrink the limit so only two entries fit (metadata sizes vary slightly)
+        entry_size = max(
+            sum(p.stat().st_size for p in (tmp_path / "cache" / key).iterdir())
+            for key in ("cc", "dd", "ee")
+        )
+        cache.max_bytes = entry_size * 2
+
+        assert cache.evict() == 1
+        assert cache.get("d" * 64, tmp_path / "out", "mp3") is None
+        assert cache.get("c" * 64, tmp_path / "out", "mp3") is not None
+        assert cache.get("e" * 64, tmp_path / "out", "mp3") is not None
+
+    def test_overwrite_replaces_entry_size(self, tmp_path: Path) -> None:
+        """Test storing the same key twice does not count the old entry's bytes."""
+        cache_dir = tmp_path / "cache"
+        cache = TTSCache(TTSCacheConfig(cache_dir=str(cache_dir)))
+        assert cache._get_total_bytes() == 0
+
+        cache.put("f" * 64, _make_result(tmp_path, data=b"x" * 1000))
+        cache.put("f" * 64, _make_result(tmp_path, data=b"y" * 400))
+
+        on_disk = sum(p.stat().st_size for p in cache_dir.glob("*/*") if p.is_file())
+        assert cache._get_total_bytes() == on_disk
+
+
+class TestEngineIntegration:
+    """Tests for the cache in front of EdgeTTSEngine.synthesize."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_synthesis(
+        self,
+        cache: TTSCache,
+        synthesis_config: TTSSynthesisConfig,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a cached request never reaches Edge TTS."""
+        ffmpeg_wrapper = MagicMock(spec=FFmpegWrapper)
+        ffmpeg_wrapper.get_duration = AsyncMock(return_value=1.5)
+        engine = EdgeTTSEngine(ffmpeg_wrapper=ffmpeg_wrapper, cache=cache)
+
+        key = cache.make_key(engine.cache_namespace, "안녕하세요", synthesis_config)
+        cache.put(key, _make_result(tmp_path))
+
+        import edge_tts
+
+        communicate = MagicMock(side_effect=AssertionError("should not synthesize"))
+        monkeypatch.setattr(edge_tts, "Communicate", communicate)
+
+        result = await engine.synthesize("안녕하세요", synthesis_config, tmp_path / "scene_000")
+
+        assert result.audio_path == tmp_path / "scene_000.mp3"
+        assert result.duration_seconds == 1.5
+        ffmpeg_wrapper.get_duration.assert_not_called()
@@ -0,0 +1,190 @@
+"""Unit tests for VisualAssetCache."""
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.generator.visual.base import VisualAsset, VisualSourceType
+from app.services.generator.visual.cache import VisualAssetCache
+from app.services.generator.visual.pexels import PexelsClient
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> VisualAssetCache:
+    return VisualAssetCache(tmp_path / "cache", ttl_hours=1, max_size_mb=1)
+
+
+class TestSearchCache:
+    """Tests for cached search responses."""
+
+    def test_round_trip(self, cache: VisualAssetCache) -> None:
+        data = {"videos": [{"id": 1}]}
+        cache.put_search("videos", "City Night", "portrait", 10, data)
+
+        assert cache.get_search("videos", "city  night", "portrait", 10) == data
+        assert cache.stats.search_hits == 1
+
+    def test_keyed_by_media_type_and_orientation(self, cache: VisualAssetCache) -> None:
+        cache.put_search("videos", "city", "portrait", 10, {"videos": []})
+
+        assert cache.get_search("photos", "city", "portrait", 10) is None
+        assert cache.get_search("videos", "city", "landscape", 10) is None
+
+    def test_expired_entry_is_miss(self, cache: VisualAssetCache) -> None:
+        cache.put_search("videos", "city", "portrait", 10, {"videos": []})
+        path = cache._search_path("videos", "city", "portrait")
+        entry = json.loads(path.read_text())
+        entry["fetched_at"] = time.time() - 7200
+        path.write_text(json.dumps(entry))
+
+        assert cache.get_search("videos", "city", "portrait", 10) is None
+        assert cache.stats.search_misses == 1
+
+    def test_evict_removes_expired_searches(self, cache: VisualAssetCache) -> None:
+        cache.put_search("videos", "old", "portrait", 10, {"videos": []})
+        cache.put_search("videos", "new", "portrait", 10, {"videos": []})
+        old_path = cache._search_path("videos", "old", "portrait")
+        entry = json.loads(old_path.read_text())
+        entry["fetched_at"] = time.time() - 7200
+        old_path.write_text(json.dumps(entry))
+
+        assert cache.evict() == 1
+        assert not old_path.exists()
+        assert cache._search_path("videos", "new", "portrait").exists()
+
+    def test_first_store_sweeps_expired_searches(self, tmp_path: Path) -> None:
+        first = VisualAssetCache(tmp_path / "cache", ttl_hours=1)
+        first.put_search("videos", "old", "portrait", 10, {"videos": []})
+        old_path = first._search_path("videos", "old", "portrait")
+        entry = json.loads(old_path.read_text())
+        entry["fetched_at"] = time.time() - 7200
+        old_path.write_text(json.dumps(entry))
+
+        # A later process removes it without ever looking the query up
+        second = VisualAssetCache(tmp_path / "cache", ttl_hours=1)
+        second.put_search("videos", "new", "portrait", 10, {"videos": []})
+
+        assert not old_path.exists()
+        assert second.stats.evictions == 1
+
+    def test_needs_enough_stored_results(self, cache: VisualAssetCache) -> None:
+        cache.put_search("photos", "city", "portrait", 10, {"photos": []})
+
+        assert cache.get_search("photos", "city", "portrait", 5) is not None
+        assert cache.get_search("photos", "city", "portrait", 20) is None
+
+
+class TestMediaCache:
+    """Tests for the content-addressed media store."""
+
+    def test_put_then_link_shares_inode(self, cache: VisualAssetCache, tmp_path: Path) -> None:
+        downloaded = tmp_path / "render1" / "pexels_1.mp4"
+        downloaded.parent.mkdir()
+        downloaded.write_bytes(b"clip")
+        cache.put_media("pexels", "1", "https://x/1.mp4", downloaded)
+
+        dest = tmp_path / "render2" / "pexels_1.mp4"
+        dest.parent.mkdir()
+
+        assert cache.link_media("pexels", "1", "https://x/1.mp4", dest)
+        assert dest.read_bytes() == b"clip"
+        assert os.stat(dest).st_ino == os.stat(downloaded).st_ino
+
+    def test_variant_is_part_of_key(self, cache: VisualAssetCache, tmp_path: Path) -> None:
+        downloaded = tmp_path / "pexels_1.mp4"
+        downloaded.write_bytes(b"hd")
+        cache.put_media("pexels", "1", "https://x/1-hd.mp4", downloaded)
+
+        dest = tmp_path / "out" / "pexels_1.mp4"
+        dest.parent.mkdir()
+
+        assert not cache.link_media("pexels", "1", "https://x/1-sd.mp4", dest)
+        assert not dest.exists()
+        assert cache.stats.media_misses == 1
+
+    def test_overwrite_replaces_media_size(self, cache: VisualAssetCache, tmp_path: Path) -> None:
+        assert cache._get_media_bytes() == 0
+        first = tmp_path / "first.mp4"
+        first.write_bytes(b"x" * 1000)
+        cache.put_media("pexels", "1", "u", first)
+        second = tmp_path / "second.mp4"
+        second.write_bytes(b"y" * 400)
+        cache.put_media("pexels", "1", "u", second)
+
+        assert cache._get_media_bytes() == 400
+
+    def test_media_total_skips_temp_files(self, cache: VisualAssetCache, tmp_path: Path) -> None:
+        stored = cache._media_path("pexels", "1", "u", ".mp4")
+        stored.parent.mkdir(parents=True)
+        stored.write_bytes(b"x" * 100)
+        stored.with_name(f".{stored.name}.123.tmp").write_bytes(b"y" * 50)
+
+        assert cache._get_media_bytes() == 100
+
+    def test_evicts_least_recently_used(self, cache: VisualAssetCache, tmp_path: Path) -> None:
+        old = tmp_path / "old.mp4"
+        old.write_bytes(b"x" * 700_000)
+        cache.put_media("pexels", "old", "u-old", old)
+        stored_old = cache._media_path("pexels", "old", "u-old", ".mp4")
+        os.utime(stored_old, (time.time() - 100, time.time() - 100))
+
+        new = tmp_path / "new.mp4"
+        new.write_bytes(b"y" * 700_000)
+        cache.put_media("pexels", "new", "u-new", new)
+
+        assert not stored_old.exists()
+        assert cache._media_path("pexels", "new", "u-new", ".mp4").exists()
+        assert cache.stats.evictions == 1
+        # Evicting the store entry leaves already-linked render files intact
+        assert old.read_bytes() == b"x" * 700_000
+
+
+class TestPexelsClientCaching:
+    """Tests for PexelsClient integration with the cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_hits_api_once(self, cache: VisualAssetCache) -> None:
+        client = PexelsClient(api_key="test-key", cache=cache)
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json.return_value = {
+            "photos": [{"id": 7, "src": {"large2x": "https://img/7.jpg"}, "url": "u"}]
+        }
+        http = AsyncMock()
+        http.get = AsyncMock(return_value=response)
+        http.is_closed = False
+        client._client = http
+
+        first = await client.search_images("nature", max_results=3)
+        second = await client.search_images("nature", max_results=3)
+
+        assert http.get.await_count == 1
+        assert [a.source_id for a in first] == [a.source_id for a in second] == ["7"]
+
+    @pytest.mark.asyncio
+    async def test_download_served_from_cache(
+        self, cache: VisualAssetCache, tmp_path: Path
+    ) -> None:
+        client = PexelsClient(api_key="test-key", cache=cache)
+        seed = tmp_path / "seed.jpg"
+        seed.write_bytes(b"image")
+        cache.put_media("pexels", "9", "https://img/9.jpg", seed)
+        http = AsyncMock()
+        http.is_closed = False
+        client._client = http
+
+        asset = VisualAsset(
+            type=VisualSourceType.STOCK_IMAGE,
+            url="https://img/9.jpg",
+            source="pexels",
+            source_id="9",
+        )
+        result = await client.download(asset, tmp_path / "render")
+
+        assert result.path == tmp_path / "render" / "pexels_9.jpg"
+        assert result.path.read_bytes() == b"image"
+        http.stream.assert_not_called()
@@ -1,7 +1,8 @@
 """Unit tests for VisualSourcingManager."""
 
+import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -368,6 +369,234 @@ class TestSourceVisualsForScenes:
         assert call_kwargs["query"] == "Some long text for the scene"
 
 
+class TestSourceVisualsConcurrent:
+    """Tests for concurrent scene sourcing."""
+
+    @pytest.mark.asyncio
+    async def test_searches_run_in_parallel(
+        self, manager: VisualSourcingManager, mock_pexels: MagicMock, tmp_path: Path
+    ) -> None:
+        """All scene searches are in flight at the same time."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_search(query: str, **_kwargs: object) -> list[VisualAsset]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [_make_asset(source_id=query, metadata_score=0.9)]
+
+        mock_pexels.search_images.side_effect = slow_search
+        scenes = [_make_scene(visual_keyword=f"kw{i}") for i in range(4)]
+        tts_results = [_make_tts_result(index=i, start_offset=i * 5.0) for i in range(4)]
+
+        results = await manager.source_visuals_for_scenes(
+            scenes, tts_results, tmp_path, concurrent=True
+        )
+
+        assert peak == 4
+        assert [r.asset.source_id for r in results] == ["kw0", "kw1", "kw2", "kw3"]
+        assert [r.start_offset for r in results] == [0.0, 5.0, 10.0, 15.0]
+
+    @pytest.mark.asyncio
+    async def test_search_concurrency_capped(
+        self,
+        mock_http_client: MagicMock,
+        mock_pexels: MagicMock,
+        mock_wan: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """No more than max_concurrent_searches scenes search at once."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_search(query: str, **_kwargs: object) -> list[VisualAsset]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        mock_pexels.search_images.side_effect = slow_search
+        manager = VisualSourcingManager(
+            http_client=mock_http_client,
+            config=VisualConfig(max_concurrent_searches=2),
+            pexels_client=mock_pexels,
+            wan_video_source=mock_wan,
+        )
+        scenes = [_make_scene(visual_keyword=f"kw{i}") for i in range(5)]
+        tts_results = [_make_tts_result(index=i) for i in range(5)]
+
+        await manager.source_visuals_for_scenes(scenes, tts_results, tmp_path, concurrent=True)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_dedup_assigns_in_scene_order(
+        self, manager: VisualSourcingManager, mock_pexels: MagicMock, tmp_path: Path
+    ) -> None:
+        """Scenes with identical candidates get distinct assets, earlier scenes first."""
+        asset_a = _make_asset(source_id="AAA", metadata_score=0.9)
+        asset_b = _make_asset(source_id="BBB", metadata_score=0.7)
+        mock_pexels.search_images.return_value = [asset_b, asset_a]
+        mock_pexels.search_videos.return_value = [
+            _make_asset(source_id="VID", asset_type=VisualSourceType.STOCK_VIDEO)
+        ]
+
+        scenes = [_make_scene(), _make_scene(), _make_scene()]
+        tts_results = [_make_tts_result(index=i) for i in range(3)]
+
+        results = await manager.source_visuals_for_scenes(
+            scenes, tts_results, tmp_path, concurrent=True
+        )
+
+        assert [r.asset.source_id for r in results] == ["AAA", "BBB", "VID"]
+        assert mock_pexels.download.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cta_reuses_previous_asset(
+        self, manager: VisualSourcingManager, mock_pexels: MagicMock, tmp_path: Path
+    ) -> None:
+        """CTA scenes are not searched and reuse the previous scene's asset."""
+        mock_pexels.search_images.return_value = [_make_asset()]
+        scenes = [_make_scene(), _make_scene(scene_type=SceneType.CTA)]
+        tts_results = [
+            _make_tts_result(index=0, duration=5.0),
+            _make_tts_result(index=1, duration=2.0, start_offset=5.0),
+        ]
+
+        results = await manager.source_visuals_for_scenes(
+            scenes, tts_results, tmp_path, concurrent=True
+        )
+
+        assert mock_pexels.search_images.await_count == 1
+        assert results[1].asset.source_id == results[0].asset.source_id
+        assert results[1].duration == 2.0
+
+    @pytest.mark.asyncio
+    async def test_failed_download_falls_back_per_scene(
+        self,
+        manager: VisualSourcingManager,
+        mock_pexels: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A scene whose download fails gets a fallback; other scenes are unaffected."""
+        mock_pexels.search_images.side_effect = [
+            [_make_asset(source_id="AAA")],
+            [_make_asset(source_id="BBB")],
+        ]
+
+        async def download(asset: VisualAsset, _dir: Path) -> VisualAsset:
+            if asset.source_id == "BBB":
+                raise OSError("disk full")
+            return asset
+
+        mock_pexels.download.side_effect = download
+        scenes = [_make_scene(), _make_scene()]
+        tts_results = [_make_tts_result(index=i) for i in range(2)]
+
+        results = await manager.source_visuals_for_scenes(
+            scenes, tts_results, tmp_path, concurrent=True
+        )
+
+        assert results[0].asset.source_id == "AAA"
+        assert results[1].asset.type == VisualSourceType.SOLID_COLOR
+
+    @pytest.mark.asyncio
+    async def test_search_and_download_share_scene_deadline(
+        self,
+        manager: VisualSourcingManager,
+        mock_pexels: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A scene whose search and download together overrun the deadline falls back."""
+
+        async def search(*_args: object, **_kwargs: object) -> list[VisualAsset]:
+            await asyncio.sleep(0.2)
+            return [_make_asset(source_id="AAA")]
+
+        async def download(asset: VisualAsset, _dir: Path) -> VisualAsset:
+            await asyncio.sleep(0.2)
+            return asset
+
+        mock_pexels.search_images.side_effect = search
+        mock_pexels.download.side_effect = download
+        scenes = [_make_scene(), _make_scene()]
+        tts_results = [_make_tts_result(index=i) for i in range(2)]
+
+        with patch("app.services.generator.visual.manager._SCENE_TIMEOUT_SECONDS", 0.3):
+            results = await manager.source_visuals_for_scenes(
+                scenes, tts_results, tmp_path, concurrent=True
+            )
+
+        assert [r.asset.type for r in results] == [VisualSourceType.SOLID_COLOR] * 2
+
+    @pytest.mark.asyncio
+    async def test_failed_download_tries_next_candidate(
+        self,
+        manager: VisualSourcingManager,
+        mock_pexels: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A failed download moves on to the scene's next ranked candidate."""
+        mock_pexels.search_images.side_effect = [
+            [_make_asset(source_id="AAA", metadata_score=0.9), _make_asset(source_id="CCC")],
+            [_make_asset(source_id="BBB")],
+        ]
+
+        async def download(asset: VisualAsset, _dir: Path) -> VisualAsset:
+            if asset.source_id == "AAA":
+                raise OSError("connection reset")
+            return asset
+
+        mock_pexels.download.side_effect = download
+        scenes = [_make_scene(), _make_scene()]
+        tts_results = [_make_tts_result(index=i) for i in range(2)]
+
+        results = await manager.source_visuals_for_scenes(
+            scenes, tts_results, tmp_path, concurrent=True
+        )
+
+        assert [r.asset.source_id for r in results] == ["CCC", "BBB"]
+
+    @pytest.mark.asyncio
+    async def test_next_candidate_skips_assigned(
+        self,
+        manager: VisualSourcingManager,
+        mock_pexels: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Alternates already assigned to another scene are not reused."""
+        failing = _make_asset(source_id="AAA")
+        taken = _make_asset(source_id="BBB")
+        free = _make_asset(source_id="CCC")
+        used = {("pexels", "AAA"), ("pexels", "BBB")}
+
+        async def download(asset: VisualAsset, _dir: Path) -> VisualAsset:
+            if asset is failing:
+                raise OSError("connection reset")
+            return asset
+
+        mock_pexels.download.side_effect = download
+
+        asset = await manager._download_or_generate(
+            failing,
+            "cat",
+            5.0,
+            tmp_path / "scene_000",
+            "portrait",
+            alternates=[taken, free],
+            used_keys=used,
+        )
+
+        assert asset is free
+        assert ("pexels", "CCC") in used
+        assert mock_pexels.download.await_count == 2
+
+
 class TestSourceForScene:
     """Tests for _source_for_scene internal method."""
 
@@ -502,6 +731,164 @@ class TestSourceForScene:
         assert result.path == tmp_path / "downloaded.jpg"
 
 
+class TestClipRerank:
+    """Tests for re-ranking stock candidates by CLIP preview similarity."""
+
+    @staticmethod
+    def _candidates(*ids: str) -> list[VisualAsset]:
+        assets = []
+        for source_id in ids:
+            asset = _make_asset(source_id=source_id)
+            asset.metadata["preview_url"] = f"https://images.pexels.com/{source_id}/medium.jpg"
+            assets.append(asset)
+        return assets
+
+    @staticmethod
+    def _previews(mock_http_client: MagicMock) -> None:
+        async def _get(url: str, **_: object) -> MagicMock:
+            response = MagicMock()
+            response.content = url.encode()
+            return response
+
+        mock_http_client.get = AsyncMock(side_effect=_get)
+
+    @pytest.mark.asyncio
+    async def test_top_candidates_reordered_in_one_call(
+        self,
+        manager: VisualSourcingManager,
+        mock_http_client: MagicMock,
+        mock_wan: MagicMock,
+    ) -> None:
+        """The top-N previews are scored in one request and sorted by CLIP score."""
+        manager.config.clip_rerank_top_n = 3
+        candidates = self._candidates("a", "b", "c", "d")
+        self._previews(mock_http_client)
+        mock_wan.is_available.return_value = True
+        mock_wan.evaluate_images = AsyncMock(return_value=[[0.2], [0.9], [0.5]])
+
+        ranked = await manager._rank_by_clip("cat", candidates)
+
+        assert [a.source_id for a in ranked] == ["b", "c", "a", "d"]
+        assert ranked[0].metadata["clip_score"] == pytest.approx(0.9)
+        assert "clip_score" not in ranked[3].metadata
+        mock_wan.evaluate_images.assert_awaited_once()
+        images, keywords = mock_wan.evaluate_images.await_args.args
+        assert len(images) == 3
+        assert keywords == ["cat"]
+
+    @pytest.mark.asyncio
+    async def test_candidates_without_preview_keep_order_behind(
+        self,
+        manager: VisualSourcingManager,
+        mock_http_client: MagicMock,
+        mock_wan: MagicMock,
+    ) -> None:
+        """Candidates whose preview is missing are not scored."""
+        candidates = self._candidates("a", "b", "c")
+        del candidates[0].metadata["preview_url"]
+        self._previews(mock_http_client)
+        mock_wan.is_available.return_value = True
+        mock_wan.evaluate_images = AsyncMock(return_value=[[0.1], [0.8]])
+
+        ranked = await manager._rank_by_clip("cat", candidates)
+
+        assert [a.source_id for a in ranked] == ["c", "b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_order_unchanged_without_wan(
+        self,
+        manager: VisualSourcingManager,
+        mock_http_client: MagicMock,
+        mock_wan: MagicMock,
+    ) -> None:
+        """Without the Wan service no previews are fetched."""
+        candidates = self._candidates("a", "b")
+        mock_http_client.get = AsyncMock()
+        mock_wan.is_available.return_value = False
+
+        ranked = await manager._rank_by_clip("cat", candidates)
+
+        assert ranked == candidates
+        mock_http_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_order_unchanged_when_evaluation_fails(
+        self,
+        manager: VisualSourcingManager,
+        mock_http_client: MagicMock,
+        mock_wan: MagicMock,
+    ) -> None:
+        """A failed CLIP request keeps the metadata order."""
+        candidates = self._candidates("a", "b")
+        self._previews(mock_http_client)
+        mock_wan.is_available.return_value = True
+        mock_wan.evaluate_images = AsyncMock(return_value=None)
+
+        assert await manager._rank_by_clip("cat", candidates) == candidates
+
+    @pytest.mark.asyncio
+    async def test_order_unchanged_when_rerank_times_out(
+        self,
+        manager: VisualSourcingManager,
+        mock_http_client: MagicMock,
+        mock_wan: MagicMock,
+    ) -> None:
+        """A slow CLIP request keeps the found candidates in metadata order."""
+        candidates = self._candidates("a", "b")
+        self._previews(mock_http_client)
+        mock_wan.is_available.return_value = True
+
+        async def _slow_evaluate(*_: object) -> list[list[float]]:
+            await asyncio.sleep(1)
+            return [[0.1], [0.9]]
+
+        mock_wan.evaluate_images = AsyncMock(side_effect=_slow_evaluate)
+
+        with patch("app.services.generator.visual.manager._CLIP_RERANK_TIMEOUT_SECONDS", 0.01):
+            ranked = await manager._rank_by_clip("cat", candidates)
+
+        assert ranked == candidates
+        assert all("clip_score" not in asset.metadata for asset in ranked)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_config(
+        self,
+        manager: VisualSourcingManager,
+        mock_wan: MagicMock,
+    ) -> None:
+        """clip_rerank_top_n = 0 turns re-ranking off."""
+        manager.config.clip_rerank_top_n = 0
+        mock_wan.is_available.return_value = True
+        candidates = self._candidates("a", "b")
+
+        assert await manager._rank_by_clip("cat", candidates) == candidates
+        mock_wan.is_available.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scene_picks_best_clip_candidate(
+        self,
+        manager: VisualSourcingManager,
+        mock_http_client: MagicMock,
+        mock_pexels: MagicMock,
+        mock_wan: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """_source_for_scene downloads the candidate CLIP ranks first."""
+        mock_pexels.search_images.return_value = self._candidates("a", "b")
+        self._previews(mock_http_client)
+        mock_wan.is_available.return_value = True
+        mock_wan.evaluate_images = AsyncMock(return_value=[[0.3], [0.6]])
+
+        result = await manager._source_for_scene(
+            keyword="cat",
+            duration=5.0,
+            output_dir=tmp_path / "scene_000",
+            orientation="portrait",
+        )
+
+        assert result.source_id == "b"
+
+
 class TestCreateFallback:
     """Tests for _create_fallback solid color generation."""
 
@@ -201,6 +201,7 @@ class TestSearchImages:
                         "large2x": "https://images.pexels.com/456/large2x.jpg",
                         "large": "https://images.pexels.com/456/large.jpg",
                         "original": "https://images.pexels.com/456/original.jpg",
+                        "medium": "https://images.pexels.com/456/medium.jpg",
                     },
                 }
             ]
@@ -223,6 +224,7 @@ class TestSearchImages:
         assert asset.height == 1920
         assert asset.metadata["photographer"] == "Jane Doe"
         assert asset.metadata["avg_color"] == "#AABBCC"
+        assert asset.metadata["preview_url"] == "https://images.pexels.com/456/medium.jpg"
 
     @pytest.mark.asyncio
     async def test_excludes_ids_in_exclude_set(self, client: PexelsClient) -> None:
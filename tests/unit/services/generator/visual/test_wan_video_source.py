@@ -1,8 +1,7 @@
 """Unit tests for WanVideoSource."""
 
-import base64
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -131,21 +130,35 @@ class TestGenerate:
 
         assert results == []
 
-    @pytest.mark.asyncio
-    async def test_generate_returns_ai_video_assets(self, source, mock_http_client):
-        video_b64 = base64.b64encode(b"fake mp4 data").decode()
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "video": video_b64,
+    @staticmethod
+    def _response(data: dict, status_code: int = 200) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status_code
+        response.json.return_value = data
+        response.raise_for_status = MagicMock()
+        return response
+
+    def _submitted(self, job_id: str = "job1") -> MagicMock:
+        return self._response({"job_id": job_id, "status": "queued", "queue_position": 0})
+
+    def _finished(self, job_id: str = "job1", seed: int = 12345, **overrides) -> MagicMock:
+        data = {
+            "job_id": job_id,
+            "status": "succeeded",
             "duration_seconds": 5.0,
             "width": 480,
             "height": 832,
             "fps": 16,
-            "seed": 12345,
+            "seed": seed,
             "num_frames": 81,
         }
-        mock_response.raise_for_status = MagicMock()
-        mock_http_client.post.return_value = mock_response
+        data.update(overrides)
+        return self._response(data)
+
+    @pytest.mark.asyncio
+    async def test_generate_returns_ai_video_assets(self, source, mock_http_client):
+        mock_http_client.post.return_value = self._submitted()
+        mock_http_client.get.return_value = self._finished()
 
         results = await source.generate("dramatic city skyline", count=1)
 
@@ -156,44 +169,51 @@ class TestGenerate:
         assert asset.duration == 5.0
         assert asset.width == 480
         assert asset.height == 832
-        assert asset.metadata["video_base64"] == video_b64
+        assert asset.metadata["job_id"] == "job1"
         assert asset.metadata["seed"] == 12345
+        assert mock_http_client.post.call_args.args[0] == "http://wan:7861/jobs"
 
     @pytest.mark.asyncio
-    async def test_generate_multiple_clips(self, source, mock_http_client):
-        def make_response(seed_val: int) -> MagicMock:
-            r = MagicMock()
-            r.json.return_value = {
-                "video": base64.b64encode(b"data").decode(),
-                "duration_seconds": 5.0,
-                "width": 480,
-                "height": 832,
-                "fps": 16,
-                "seed": seed_val,
-            }
-            r.raise_for_status = MagicMock()
-            return r
+    async def test_generate_long_polls_until_finished(self, source, mock_http_client):
+        mock_http_client.post.return_value = self._submitted()
+        mock_http_client.get.side_effect = [
+            self._response({"job_id": "job1", "status": "queued"}),
+            self._response({"job_id": "job1", "status": "running"}),
+            self._finished(),
+        ]
+
+        results = await source.generate("test", count=1)
 
-        mock_http_client.post.side_effect = [make_response(1), make_response(2)]
+        assert len(results) == 1
+        assert mock_http_client.get.call_count == 3
+        call = mock_http_client.get.call_args
+        assert call.args[0] == "http://wan:7861/jobs/job1"
+        assert call.kwargs["params"]["wait"] > 0
+
+    @pytest.mark.asyncio
+    async def test_generate_queues_all_clips_before_waiting(self, source, mock_http_client):
+        events: list[str] = []
+
+        async def post(url, **kwargs):
+            events.append("submit")
+            return self._submitted(f"job{len(events)}")
+
+        async def get(url, **kwargs):
+            events.append("wait")
+            return self._finished(url.rsplit("/", 1)[-1])
+
+        mock_http_client.post.side_effect = post
+        mock_http_client.get.side_effect = get
 
         results = await source.generate("nature", count=2)
 
         assert len(results) == 2
-        assert mock_http_client.post.call_count == 2
+        assert events == ["submit", "submit", "wait", "wait"]
 
     @pytest.mark.asyncio
     async def test_generate_uses_portrait_dimensions_by_default(self, source, mock_http_client):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "video": base64.b64encode(b"d").decode(),
-            "seed": 1,
-            "duration_seconds": 5.0,
-            "width": 480,
-            "height": 832,
-            "fps": 16,
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_http_client.post.return_value = mock_response
+        mock_http_client.post.return_value = self._submitted()
+        mock_http_client.get.return_value = self._finished()
 
         await source.generate("test", count=1, orientation="portrait")
 
@@ -203,17 +223,8 @@ class TestGenerate:
 
     @pytest.mark.asyncio
     async def test_generate_landscape_swaps_dimensions(self, source, mock_http_client):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "video": base64.b64encode(b"d").decode(),
-            "seed": 1,
-            "duration_seconds": 5.0,
-            "width": 832,
-            "height": 480,
-            "fps": 16,
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_http_client.post.return_value = mock_response
+        mock_http_client.post.return_value = self._submitted()
+        mock_http_client.get.return_value = self._finished(width=832, height=480)
 
         await source.generate("test", count=1, orientation="landscape")
 
@@ -232,22 +243,59 @@ class TestGenerate:
         assert results == []
         assert source._service_available is False
 
+    @pytest.mark.asyncio
+    async def test_generate_skips_failed_jobs(self, source, mock_http_client):
+        mock_http_client.post.side_effect = [self._submitted("job1"), self._submitted("job2")]
+        mock_http_client.get.side_effect = [
+            self._response({"job_id": "job1", "status": "failed", "error": "CUDA OOM"}),
+            self._finished("job2"),
+        ]
+
+        results = await source.generate("test", count=2)
+
+        assert [asset.metadata["job_id"] for asset in results] == ["job2"]
+        assert source._service_available is True
+
+    @pytest.mark.asyncio
+    async def test_generate_stops_submitting_when_queue_full(self, source, mock_http_client):
+        import httpx
+
+        full = self._response({"detail": "Job queue full"}, status_code=429)
+        full.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "429", request=MagicMock(), response=full
+        )
+        mock_http_client.post.side_effect = [self._submitted(), full]
+        mock_http_client.get.return_value = self._finished()
+
+        results = await source.generate("test", count=3)
+
+        assert len(results) == 1
+        assert mock_http_client.post.call_count == 2
+        assert source._service_available is True
+
+    @pytest.mark.asyncio
+    async def test_generate_times_out_waiting(self, mock_http_client):
+        import time
+
+        source = WanVideoSource(http_client=mock_http_client, config=WanConfig(timeout=30.0))
+        source._service_available = True
+        source._availability_checked_at = time.monotonic()
+        mock_http_client.post.return_value = self._submitted()
+        mock_http_client.get.return_value = self._response({"job_id": "job1", "status": "running"})
+
+        with patch(
+            "app.services.generator.visual.wan_video_source.time.monotonic",
+            side_effect=[0.0, 0.0, 0.0, 20.0, 40.0],  # Availability check, then polling
+        ):
+            results = await source.generate("test", count=1)
+
+        assert results == []
+        assert mock_http_client.get.call_count == 2
+
     @pytest.mark.asyncio
     async def test_generate_uses_seed_increments(self, source, mock_http_client):
-        def make_response() -> MagicMock:
-            r = MagicMock()
-            r.json.return_value = {
-                "video": base64.b64encode(b"d").decode(),
-                "seed": 100,
-                "duration_seconds": 5.0,
-                "width": 480,
-                "height": 832,
-                "fps": 16,
-            }
-            r.raise_for_status = MagicMock()
-            return r
-
-        mock_http_client.post.side_effect = [make_response(), make_response()]
+        mock_http_client.post.side_effect = [self._submitted("job1"), self._submitted("job2")]
+        mock_http_client.get.return_value = self._finished()
 
         await source.generate("test", count=2, seed=100)
 
@@ -293,44 +341,59 @@ class TestSearch:
 class TestDownload:
     """Tests for WanVideoSource.download()."""
 
-    def _make_asset(self, video_b64: str | None = None) -> VisualAsset:
+    def _make_asset(self, job_id: str | None = "job1") -> VisualAsset:
         return VisualAsset(
             type=VisualSourceType.AI_VIDEO,
             source="wan_video",
             source_id="wan_12345",
-            metadata={"video_base64": video_b64} if video_b64 else {},
+            metadata={"job_id": job_id} if job_id else {},
         )
 
+    @staticmethod
+    def _stream(mock_http_client: MagicMock, *chunks: bytes) -> MagicMock:
+        async def aiter_bytes():
+            for chunk in chunks:
+                yield chunk
+
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.aiter_bytes = aiter_bytes
+        stream = MagicMock()
+        stream.__aenter__ = AsyncMock(return_value=response)
+        stream.__aexit__ = AsyncMock(return_value=None)
+        mock_http_client.stream = MagicMock(return_value=stream)
+        mock_http_client.delete = AsyncMock()
+        return mock_http_client.stream
+
     @pytest.mark.asyncio
-    async def test_download_saves_mp4(self, source, tmp_path):
-        video_data = b"fake mp4 content"
-        video_b64 = base64.b64encode(video_data).decode()
-        asset = self._make_asset(video_b64)
+    async def test_download_streams_mp4(self, source, mock_http_client, tmp_path):
+        stream = self._stream(mock_http_client, b"fake mp4 ", b"content")
+        asset = self._make_asset()
 
         result = await source.download(asset, tmp_path)
 
         assert result.path is not None
-        assert result.path.exists()
         assert result.path.suffix == ".mp4"
-        assert result.path.read_bytes() == video_data
+        assert result.path.read_bytes() == b"fake mp4 content"
+        assert stream.call_args.args == ("GET", "http://wan:7861/jobs/job1/video")
+        assert not list(tmp_path.glob("*.part"))
 
     @pytest.mark.asyncio
-    async def test_download_filename_contains_source_id(self, source, tmp_path):
-        video_b64 = base64.b64encode(b"data").decode()
-        asset = self._make_asset(video_b64)
+    async def test_download_filename_contains_source_id(self, source, mock_http_client, tmp_path):
+        self._stream(mock_http_client, b"data")
+        asset = self._make_asset()
 
         result = await source.download(asset, tmp_path)
 
         assert "wan_12345" in result.path.name
 
     @pytest.mark.asyncio
-    async def test_download_clears_base64_from_metadata(self, source, tmp_path):
-        video_b64 = base64.b64encode(b"data").decode()
-        asset = self._make_asset(video_b64)
+    async def test_download_deletes_server_job(self, source, mock_http_client, tmp_path):
+        self._stream(mock_http_client, b"data")
 
-        result = await source.download(asset, tmp_path)
+        await source.download(self._make_asset(), tmp_path)
 
-        assert "video_base64" not in result.metadata
+        assert mock_http_client.delete.call_args.args[0] == "http://wan:7861/jobs/job1"
 
     @pytest.mark.asyncio
     async def test_download_raises_when_no_video_data(self, source, tmp_path):
@@ -340,28 +403,39 @@ class TestDownload:
             await source.download(asset, tmp_path)
 
     @pytest.mark.asyncio
-    async def test_download_creates_output_dir(self, source, tmp_path):
+    async def test_download_creates_output_dir(self, source, mock_http_client, tmp_path):
+        self._stream(mock_http_client, b"data")
         nested_dir = tmp_path / "nested" / "output"
-        video_b64 = base64.b64encode(b"data").decode()
-        asset = self._make_asset(video_b64)
 
-        await source.download(asset, nested_dir)
+        await source.download(self._make_asset(), nested_dir)
 
         assert nested_dir.exists()
 
     @pytest.mark.asyncio
-    async def test_download_skips_if_already_exists(self, source, tmp_path):
-        video_b64 = base64.b64encode(b"original").decode()
-        asset = self._make_asset(video_b64)
+    async def test_download_skips_if_already_exists(self, source, mock_http_client, tmp_path):
+        stream = self._stream(mock_http_client, b"new")
 
         # Create file manually first
         existing = tmp_path / "wan_wan_12345.mp4"
         existing.write_bytes(b"already there")
 
-        result = await source.download(asset, tmp_path)
+        result = await source.download(self._make_asset(), tmp_path)
 
         # Should return immediately without overwriting
         assert result.path.read_bytes() == b"already there"
+        stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_download_removes_partial_file_on_error(self, source, mock_http_client, tmp_path):
+        self._stream(mock_http_client, b"x" * 10, b"y" * 10)
+
+        with (
+            patch("app.services.generator.visual.wan_video_source._MAX_VIDEO_BYTES", 15),
+            pytest.raises(RuntimeError, match="too large"),
+        ):
+            await source.download(self._make_asset(), tmp_path)
+
+        assert list(tmp_path.iterdir()) == []
 
 
 class TestEvaluate:
@@ -417,6 +491,60 @@ class TestEvaluate:
         assert source._service_available is False
 
 
+class TestEvaluateImages:
+    """Tests for WanVideoSource.evaluate_images()."""
+
+    @pytest.fixture(autouse=True)
+    def mock_available(self, source):
+        import time
+
+        source._service_available = True
+        source._availability_checked_at = time.monotonic()
+
+    @pytest.mark.asyncio
+    async def test_returns_score_matrix_in_one_request(self, source, mock_http_client):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"scores": [[0.9, 0.1], [0.2, 0.7]]}
+        mock_response.raise_for_status = MagicMock()
+        mock_http_client.post.return_value = mock_response
+
+        scores = await source.evaluate_images([b"one", b"two"], ["cat", "dog"])
+
+        assert scores == [[0.9, 0.1], [0.2, 0.7]]
+        mock_http_client.post.assert_awaited_once()
+        call = mock_http_client.post.await_args
+        assert call.args[0].endswith("/evaluate_images")
+        assert call.kwargs["json"] == {"images": ["b25l", "dHdv"], "texts": ["cat", "dog"]}
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_request(self, source, mock_http_client):
+        assert await source.evaluate_images([], ["cat"]) == []
+        mock_http_client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_unavailable(self, mock_http_client):
+        source = WanVideoSource(http_client=mock_http_client, config=WanConfig(enabled=False))
+
+        assert await source.evaluate_images([b"one"], ["cat"]) is None
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_mismatched_rows(self, source, mock_http_client):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"scores": [[0.9]]}
+        mock_response.raise_for_status = MagicMock()
+        mock_http_client.post.return_value = mock_response
+
+        assert await source.evaluate_images([b"one", b"two"], ["cat"]) is None
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_api_error(self, source, mock_http_client):
+        import httpx
+
+        mock_http_client.post.side_effect = httpx.ConnectError("API error")
+
+        assert await source.evaluate_images([b"one"], ["cat"]) is None
+
+
 class TestGetDimensions:
     """Tests for WanVideoSource._get_dimensions()."""
 
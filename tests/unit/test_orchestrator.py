@@ -1,16 +1,20 @@
 """Unit tests for orchestrator module."""
 
+import asyncio
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.config.persona import PersonaConfig
+from app.infrastructure.resource_pools import ResourceClass, ResourcePools
 from app.orchestrator import (
     _build_persona_config,
     _get_tts_provider,
     _get_voice_id,
     _process_topic,
+    _run_channel,
+    _run_job,
     get_active_channels,
     process_channel,
     run_once,
@@ -185,6 +189,7 @@ class TestProcessChannel:
         return channel
 
     @pytest.mark.asyncio
+    @patch("app.orchestrator.create_generation_job_queue")
     @patch("app.orchestrator.create_video_pipeline")
     @patch("app.orchestrator.create_script_generator")
     @patch("app.orchestrator._collect_topics")
@@ -199,6 +204,7 @@ class TestProcessChannel:
         mock_collect: AsyncMock,
         mock_script_gen: MagicMock,
         mock_video_pipe: MagicMock,
+        mock_job_queue: MagicMock,
     ) -> None:
         """Test full pipeline: collect → script → video."""
         channel = self._make_channel()
@@ -227,14 +233,21 @@ class TestProcessChannel:
         mock_video_pipe.return_value.generate = AsyncMock(return_value=video_result)
         mock_video_pipe.return_value.close = AsyncMock()
 
+        queue = _mock_job_queue(mock_job_queue)
+
         # Mock DB session for script save
         with patch("app.orchestrator.async_session_maker") as mock_session_maker:
             _mock_async_session_maker(mock_session_maker)
             count = await process_channel(channel)
 
         assert count == 1
+        queue.enqueue.assert_awaited_once()
+        queue.complete.assert_awaited_once()
+        generate_kwargs = mock_video_pipe.return_value.generate.call_args.kwargs
+        assert generate_kwargs["checkpointer"] is queue.checkpointer.return_value
 
     @pytest.mark.asyncio
+    @patch("app.orchestrator.create_generation_job_queue")
     @patch("app.orchestrator._collect_topics")
     @patch("app.orchestrator.create_prompt_manager")
     @patch("app.orchestrator.create_llm_client")
@@ -245,16 +258,19 @@ class TestProcessChannel:
         mock_llm: MagicMock,
         mock_pm: MagicMock,
         mock_collect: AsyncMock,
+        mock_job_queue: MagicMock,
     ) -> None:
         """Test returns 0 when no topics collected."""
         channel = self._make_channel()
         mock_collect.return_value = []
+        _mock_job_queue(mock_job_queue)
 
         count = await process_channel(channel)
 
         assert count == 0
 
     @pytest.mark.asyncio
+    @patch("app.orchestrator.create_generation_job_queue")
     @patch("app.orchestrator._process_topic")
     @patch("app.orchestrator._collect_topics")
     @patch("app.orchestrator.create_video_pipeline")
@@ -271,9 +287,11 @@ class TestProcessChannel:
         mock_video_pipe: MagicMock,
         mock_collect: AsyncMock,
         mock_process: AsyncMock,
+        mock_job_queue: MagicMock,
     ) -> None:
         """Test that one topic failure doesn't stop other topics."""
         channel = self._make_channel()
+        _mock_job_queue(mock_job_queue)
 
         topic1 = MagicMock()
         topic1.title_normalized = "Topic 1"
@@ -290,6 +308,102 @@ class TestProcessChannel:
         assert count == 1
         assert mock_process.call_count == 2
 
+    @pytest.mark.asyncio
+    @patch("app.orchestrator.create_generation_job_queue")
+    @patch("app.orchestrator._collect_topics")
+    @patch("app.orchestrator.create_video_pipeline")
+    @patch("app.orchestrator.create_script_generator")
+    @patch("app.orchestrator.create_prompt_manager")
+    @patch("app.orchestrator.create_llm_client")
+    @patch("app.orchestrator.create_http_client")
+    async def test_resumes_unfinished_jobs(
+        self,
+        mock_http: MagicMock,
+        mock_llm: MagicMock,
+        mock_pm: MagicMock,
+        mock_script_gen: MagicMock,
+        mock_video_pipe: MagicMock,
+        mock_collect: AsyncMock,
+        mock_job_queue: MagicMock,
+    ) -> None:
+        """Jobs left by a previous run are resumed even without new topics."""
+        channel = self._make_channel()
+        mock_collect.return_value = []
+        job = MagicMock(id=uuid.uuid4(), attempts=2, payload={"voice_id": "v1"})
+        job.completed_stages = []
+        queue = _mock_job_queue(mock_job_queue, pending=[job.id], claimed=job)
+        video_result = MagicMock(duration_seconds=30, video_path="/tmp/test.mp4")
+        mock_video_pipe.return_value.generate = AsyncMock(return_value=video_result)
+        mock_video_pipe.return_value.close = AsyncMock()
+
+        count = await process_channel(channel)
+
+        assert count == 1
+        queue.claim.assert_awaited_once_with(job_id=job.id)
+        generate_kwargs = mock_video_pipe.return_value.generate.call_args.kwargs
+        assert generate_kwargs["script"] is job.script
+        assert generate_kwargs["voice_id"] == "v1"
+        queue.complete.assert_awaited_once_with(job.id)
+
+
+class TestRunJob:
+    """Tests for running a claimed generation job."""
+
+    @pytest.mark.asyncio
+    async def test_failure_marks_job_failed(self) -> None:
+        """A failed attempt is recorded so the job can be retried."""
+        queue = _mock_job_queue(MagicMock())
+        job = MagicMock(id=uuid.uuid4(), payload={})
+        video_pipeline = MagicMock()
+        video_pipeline.generate = AsyncMock(side_effect=RuntimeError("render failed"))
+
+        with pytest.raises(RuntimeError):
+            await _run_job(queue, job, MagicMock(), MagicMock(), video_pipeline)
+
+        queue.fail.assert_awaited_once_with(job.id, "render failed")
+        queue.complete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cancellation_releases_job(self) -> None:
+        """A cancelled job goes back to the queue instead of failing."""
+        queue = _mock_job_queue(MagicMock())
+        job = MagicMock(id=uuid.uuid4(), payload={})
+        started = asyncio.Event()
+
+        async def generate(**kwargs: object) -> MagicMock:
+            started.set()
+            await asyncio.sleep(10)
+            return MagicMock()
+
+        video_pipeline = MagicMock()
+        video_pipeline.generate = AsyncMock(side_effect=generate)
+
+        task = asyncio.create_task(_run_job(queue, job, MagicMock(), MagicMock(), video_pipeline))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        queue.release.assert_awaited_once_with(job.id)
+        queue.fail.assert_not_called()
+
+
+def _mock_job_queue(
+    mock_factory: MagicMock,
+    pending: list[uuid.UUID] | None = None,
+    claimed: MagicMock | None = None,
+) -> MagicMock:
+    """Configure create_generation_job_queue mock and return the mock queue."""
+    queue = mock_factory.return_value
+    queue.pending_job_ids = AsyncMock(return_value=pending or [])
+    queue.enqueue = AsyncMock(return_value=MagicMock(id=uuid.uuid4()))
+    queue.claim = AsyncMock(return_value=claimed or MagicMock(id=uuid.uuid4(), payload={}))
+    queue.complete = AsyncMock()
+    queue.fail = AsyncMock()
+    queue.release = AsyncMock()
+    queue.checkpointer = MagicMock()
+    return queue
+
 
 def _mock_async_session_maker(mock_session_maker: MagicMock) -> AsyncMock:
     """Configure async_session_maker mock and return the mock session."""
@@ -322,13 +436,13 @@ class TestRunOnce:
     @patch("app.orchestrator.process_channel")
     @patch("app.orchestrator.get_active_channels")
     @patch("app.orchestrator.async_session_maker")
-    async def test_channel_timeout(
+    async def test_stage_timeout_does_not_abort_run(
         self,
         mock_session_maker: MagicMock,
         mock_get_channels: AsyncMock,
         mock_process: AsyncMock,
     ) -> None:
-        """Test timeout handling for slow channels."""
+        """Test a channel failing on a stage timeout does not abort the run."""
         _mock_async_session_maker(mock_session_maker)
 
         channel = MagicMock()
@@ -341,6 +455,31 @@ class TestRunOnce:
         # Should not raise
         await run_once()
 
+    @pytest.mark.asyncio
+    @patch("app.orchestrator.process_channel")
+    async def test_channel_timeout_starts_after_channel_slot(self, mock_process: AsyncMock) -> None:
+        """Test the channel deadline bounds the channel but not its wait for a slot."""
+        channel = MagicMock(id=uuid.uuid4())
+        channel.name = "Slow Channel"
+        hang = asyncio.Event()
+
+        async def process(channel: MagicMock, pools: ResourcePools) -> int:
+            await hang.wait()
+            return 1
+
+        mock_process.side_effect = process
+        channel_slots = asyncio.Semaphore(1)
+
+        await channel_slots.acquire()
+        task = asyncio.create_task(_run_channel(channel, ResourcePools(), channel_slots, 0.02))
+        # Queue for the channel slot longer than the channel timeout
+        await asyncio.sleep(0.05)
+        mock_process.assert_not_called()
+        channel_slots.release()
+
+        assert await task is None
+        mock_process.assert_called_once()
+
 
 class TestProcessTopicValidation:
     """Tests for _process_topic input validation."""
@@ -380,3 +519,71 @@ class TestProcessTopicValidation:
             video_pipeline=MagicMock(),
         )
         assert result is False
+
+
+class TestConcurrentScheduling:
+    """Tests for concurrent channel/topic scheduling."""
+
+    @pytest.mark.asyncio
+    @patch("app.orchestrator.process_channel")
+    @patch("app.orchestrator.get_active_channels")
+    @patch("app.orchestrator.async_session_maker")
+    async def test_channels_run_concurrently(
+        self,
+        mock_session_maker: MagicMock,
+        mock_get_channels: AsyncMock,
+        mock_process: AsyncMock,
+    ) -> None:
+        """Channels overlap instead of running one after another."""
+        _mock_async_session_maker(mock_session_maker)
+        channels = [MagicMock(id=uuid.uuid4()) for _ in range(3)]
+        mock_get_channels.return_value = channels
+        running = 0
+        peak = 0
+
+        async def process(channel: MagicMock, pools: ResourcePools) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return 1
+
+        mock_process.side_effect = process
+
+        await run_once()
+
+        assert peak == 3
+        assert mock_process.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_script_generation_holds_llm_slot(self) -> None:
+        """Script generation waits for a free LLM slot."""
+        pools = ResourcePools(llm=1)
+        channel = MagicMock()
+        channel.persona = None
+        topic = MagicMock(summary="Summary", terms=[])
+
+        async def generate(**kwargs: object) -> MagicMock:
+            raise RuntimeError("stop after script")
+
+        script_generator = MagicMock()
+        script_generator.generate = AsyncMock(side_effect=generate)
+
+        async with pools.slot(ResourceClass.LLM):
+            task = asyncio.create_task(
+                _process_topic(
+                    channel=channel,
+                    topic=topic,
+                    script_generator=script_generator,
+                    http_client=MagicMock(),
+                    video_pipeline=MagicMock(),
+                    resource_pools=pools,
+                )
+            )
+            await asyncio.sleep(0.01)
+            script_generator.generate.assert_not_called()
+
+        with pytest.raises(RuntimeError):
+            await task
+        script_generator.generate.assert_called_once()